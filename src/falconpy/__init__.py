@@ -19,6 +19,8 @@
                                                         |::.|     CrowdStrike Falcon      |::.|
                                                         `---' OAuth2 API SDK for Python 3 `---'
 """
+from importlib import import_module
+from typing import TYPE_CHECKING
 from ._version import _VERSION, _MAINTAINER, _AUTHOR, _AUTHOR_EMAIL
 from ._version import _CREDITS, _DESCRIPTION, _TITLE, _PROJECT_URL
 from ._version import _DOCS_URL, _KEYWORDS, version
@@ -27,10 +29,18 @@ from ._auth_object import (
     BearerToken,
     FalconInterface,
     UberInterface,
-    InterfaceConfiguration
+    InterfaceConfiguration,
+    ConnectionPool,
+    RateLimiter,
+    ResponseCache,
+    RequestCoalescer,
+    AsyncConnectionPool,
+    AsyncFalconInterface,
+    TokenStore,
+    FileTokenStore
     )
-from ._service_class import BaseServiceClass, ServiceClass
-from ._util import confirm_base_region, confirm_base_url
+from ._service_class import BaseServiceClass, ServiceClass, AsyncServiceClass, async_service_class
+from ._util import confirm_base_region, confirm_base_url, JSONCodec, MultipartEncoder
 from ._constant import (
     MAX_DEBUG_RECORDS,
     ALLOWED_METHODS,
@@ -71,7 +81,10 @@ from ._error import (
     UnnecessaryEncodingUsed,
     DeprecatedClass,
     DeprecatedOperation,
-    SDKDeprecationWarning
+    SDKDeprecationWarning,
+    DependencyNotInstalled,
+    DownloadVerificationError,
+    DownloadIncompleteError
     )
 from ._result import (
     Result,
@@ -94,108 +107,238 @@ from ._api_request import (
     RequestPayloads,
     RequestValidator
     )
-from ._ngsiem import (
-    HTTPEventCollector,
-    HEC,
-    IngestPayload,
-    IngestConfig,
-    SessionManager
-)
 from ._helper import random_string, Indicator, Color
-from .alerts import Alerts
-from .api_integrations import APIIntegrations
-from .api_complete import APIHarness, APIHarnessV2
-from .aspm import ASPM
-from .cao_hunting import CAOHunting
-from .certificate_based_exclusions import CertificateBasedExclusions
-from .cloud_aws_registration import CloudAWSRegistration
-from .cloud_azure_registration import CloudAzureRegistration
-from .cloud_oci_registration import CloudOCIRegistration
-from .cloud_security_assets import CloudSecurityAssets
-from .cloud_snapshots import CloudSnapshots
-from .container_image_compliance import ContainerImageCompliance, ComplianceAssessments
-from .configuration_assessment_evaluation_logic import ConfigurationAssessmentEvaluationLogic
-from .configuration_assessment import ConfigurationAssessment
-from .container_alerts import ContainerAlerts
-from .container_detections import ContainerDetections
-from .container_images import ContainerImages
-from .container_packages import ContainerPackages
-from .container_vulnerabilities import ContainerVulnerabilities
-from .correlation_rules import CorrelationRules
-from .cloud_connect_aws import CloudConnectAWS
-from .content_update_policies import ContentUpdatePolicies
-from .cspm_registration import CSPMRegistration
-from .custom_ioa import CustomIOA
-from .custom_storage import CustomStorage
-from .d4c_registration import D4CRegistration
-from .datascanner import DataScanner
-from .delivery_settings import DeliverySettings
-from .deployments import Deployments
-from .detects import Detects
-from .device_content import DeviceContent
-from .device_control_policies import DeviceControlPolicies
-from .discover import Discover
-from .downloads import Downloads
-from .drift_indicators import DriftIndicators
-from .event_streams import EventStreams
-from .exposure_management import ExposureManagement
-from .faas_execution import FaaSExecution
-from .falcon_complete_dashboard import CompleteDashboard
-from .falcon_container import FalconContainer
-from .falconx_sandbox import FalconXSandbox
-from .fdr import FDR
-from .filevantage import FileVantage
-from .firewall_management import FirewallManagement
-from .firewall_policies import FirewallPolicies
-from .foundry_logscale import FoundryLogScale
-from .host_group import HostGroup
-from .hosts import Hosts
-from .host_migration import HostMigration
-from .identity_protection import IdentityProtection
-from .image_assessment_policies import ImageAssessmentPolicies
-from .incidents import Incidents
-from .intelligence_indicator_graph import IntelligenceIndicatorGraph
-from .installation_tokens import InstallationTokens
-from .intel import Intel
-from .intelligence_feeds import IntelligenceFeeds
-from .ioa_exclusions import IOAExclusions
-from .ioc import IOC
-from .iocs import Iocs
-from .kubernetes_protection import KubernetesProtection
-from .malquery import MalQuery
-from .message_center import MessageCenter
-from .ml_exclusions import MLExclusions
-from .mobile_enrollment import MobileEnrollment
-from .mssp import FlightControl
-from .ngsiem import NGSIEM
-from .oauth2 import OAuth2
-from .ods import ODS
-from .overwatch_dashboard import OverwatchDashboard
-from .prevention_policy import PreventionPolicy, PreventionPolicies
-from .quarantine import Quarantine
-from .quick_scan import QuickScan
-from .quick_scan_pro import QuickScanPro
-from .real_time_response_admin import RealTimeResponseAdmin
-from .real_time_response_audit import RealTimeResponseAudit
-from .real_time_response import RealTimeResponse
-from .recon import Recon
-from .report_executions import ReportExecutions
-from .response_policies import ResponsePolicies
-from .sample_uploads import SampleUploads
-from .scheduled_reports import ScheduledReports
-from .sensor_download import SensorDownload
-from .sensor_update_policy import SensorUpdatePolicy, SensorUpdatePolicies
-from .sensor_usage import SensorUsage
-from .sensor_visibility_exclusions import SensorVisibilityExclusions
-from .serverless_vulnerabilities import ServerlessVulnerabilities
-from .spotlight_vulnerabilities import SpotlightVulnerabilities
-from .spotlight_evaluation_logic import SpotlightEvaluationLogic
-from .tailored_intelligence import TailoredIntelligence
-from .threatgraph import ThreatGraph
-from .unidentified_containers import UnidentifiedContainers
-from .user_management import UserManagement
-from .workflows import Workflows
-from .zero_trust_assessment import ZeroTrustAssessment
+# Service Classes and helper classes are imported when they are first requested, so only
+# the modules (and endpoint tables) actually used by an application are loaded.
+if TYPE_CHECKING:  # pragma: no cover
+    from ._ngsiem import (
+        HTTPEventCollector,
+        HEC,
+        IngestPayload,
+        IngestConfig,
+        IngestBatch,
+        IngestCompressor,
+        IngestProducer,
+        IngestSpool,
+        SessionManager,
+        SearchJob,
+        SearchRunner
+    )
+    from ._event_streams import StreamConsumer, OffsetCheckpoint
+    from ._mssp import ChildAuthPool, MSSPFanOut
+    from ._lookup import EntityBatcher, HostLookup
+    from .alerts import Alerts
+    from .api_integrations import APIIntegrations
+    from .api_complete import APIHarness, APIHarnessV2
+    from .aspm import ASPM
+    from .cao_hunting import CAOHunting
+    from .certificate_based_exclusions import CertificateBasedExclusions
+    from .cloud_aws_registration import CloudAWSRegistration
+    from .cloud_azure_registration import CloudAzureRegistration
+    from .cloud_oci_registration import CloudOCIRegistration
+    from .cloud_security_assets import CloudSecurityAssets
+    from .cloud_snapshots import CloudSnapshots
+    from .container_image_compliance import ContainerImageCompliance, ComplianceAssessments
+    from .configuration_assessment_evaluation_logic import ConfigurationAssessmentEvaluationLogic
+    from .configuration_assessment import ConfigurationAssessment
+    from .container_alerts import ContainerAlerts
+    from .container_detections import ContainerDetections
+    from .container_images import ContainerImages
+    from .container_packages import ContainerPackages
+    from .container_vulnerabilities import ContainerVulnerabilities
+    from .correlation_rules import CorrelationRules
+    from .cloud_connect_aws import CloudConnectAWS
+    from .content_update_policies import ContentUpdatePolicies
+    from .cspm_registration import CSPMRegistration
+    from .custom_ioa import CustomIOA
+    from .custom_storage import CustomStorage
+    from .d4c_registration import D4CRegistration
+    from .datascanner import DataScanner
+    from .delivery_settings import DeliverySettings
+    from .deployments import Deployments
+    from .detects import Detects
+    from .device_content import DeviceContent
+    from .device_control_policies import DeviceControlPolicies
+    from .discover import Discover
+    from .downloads import Downloads
+    from .drift_indicators import DriftIndicators
+    from .event_streams import EventStreams
+    from .exposure_management import ExposureManagement
+    from .faas_execution import FaaSExecution
+    from .falcon_complete_dashboard import CompleteDashboard
+    from .falcon_container import FalconContainer
+    from .falconx_sandbox import FalconXSandbox
+    from .fdr import FDR
+    from .filevantage import FileVantage
+    from .firewall_management import FirewallManagement
+    from .firewall_policies import FirewallPolicies
+    from .foundry_logscale import FoundryLogScale
+    from .host_group import HostGroup
+    from .hosts import Hosts
+    from .host_migration import HostMigration
+    from .identity_protection import IdentityProtection
+    from .image_assessment_policies import ImageAssessmentPolicies
+    from .incidents import Incidents
+    from .intelligence_indicator_graph import IntelligenceIndicatorGraph
+    from .installation_tokens import InstallationTokens
+    from .intel import Intel
+    from .intelligence_feeds import IntelligenceFeeds
+    from .ioa_exclusions import IOAExclusions
+    from .ioc import IOC
+    from .iocs import Iocs
+    from .kubernetes_protection import KubernetesProtection
+    from .malquery import MalQuery
+    from .message_center import MessageCenter
+    from .ml_exclusions import MLExclusions
+    from .mobile_enrollment import MobileEnrollment
+    from .mssp import FlightControl
+    from .ngsiem import NGSIEM
+    from .oauth2 import OAuth2
+    from .ods import ODS
+    from .overwatch_dashboard import OverwatchDashboard
+    from .prevention_policy import PreventionPolicy, PreventionPolicies
+    from .quarantine import Quarantine
+    from .quick_scan import QuickScan
+    from .quick_scan_pro import QuickScanPro
+    from .real_time_response_admin import RealTimeResponseAdmin
+    from .real_time_response_audit import RealTimeResponseAudit
+    from .real_time_response import RealTimeResponse
+    from .recon import Recon
+    from .report_executions import ReportExecutions
+    from .response_policies import ResponsePolicies
+    from .sample_uploads import SampleUploads
+    from .scheduled_reports import ScheduledReports
+    from .sensor_download import SensorDownload
+    from .sensor_update_policy import SensorUpdatePolicy, SensorUpdatePolicies
+    from .sensor_usage import SensorUsage
+    from .sensor_visibility_exclusions import SensorVisibilityExclusions
+    from .serverless_vulnerabilities import ServerlessVulnerabilities
+    from .spotlight_vulnerabilities import SpotlightVulnerabilities
+    from .spotlight_evaluation_logic import SpotlightEvaluationLogic
+    from .tailored_intelligence import TailoredIntelligence
+    from .threatgraph import ThreatGraph
+    from .unidentified_containers import UnidentifiedContainers
+    from .user_management import UserManagement
+    from .workflows import Workflows
+    from .zero_trust_assessment import ZeroTrustAssessment
+
+_LAZY_IMPORTS = {
+    "Alerts": "alerts",
+    "APIIntegrations": "api_integrations",
+    "APIHarness": "api_complete",
+    "APIHarnessV2": "api_complete",
+    "ASPM": "aspm",
+    "CAOHunting": "cao_hunting",
+    "CertificateBasedExclusions": "certificate_based_exclusions",
+    "CloudAWSRegistration": "cloud_aws_registration",
+    "CloudAzureRegistration": "cloud_azure_registration",
+    "CloudOCIRegistration": "cloud_oci_registration",
+    "CloudSecurityAssets": "cloud_security_assets",
+    "CloudSnapshots": "cloud_snapshots",
+    "ContainerImageCompliance": "container_image_compliance",
+    "ComplianceAssessments": "container_image_compliance",
+    "ConfigurationAssessmentEvaluationLogic": "configuration_assessment_evaluation_logic",
+    "ConfigurationAssessment": "configuration_assessment",
+    "ContainerAlerts": "container_alerts",
+    "ContainerDetections": "container_detections",
+    "ContainerImages": "container_images",
+    "ContainerPackages": "container_packages",
+    "ContainerVulnerabilities": "container_vulnerabilities",
+    "CorrelationRules": "correlation_rules",
+    "CloudConnectAWS": "cloud_connect_aws",
+    "ContentUpdatePolicies": "content_update_policies",
+    "CSPMRegistration": "cspm_registration",
+    "CustomIOA": "custom_ioa",
+    "CustomStorage": "custom_storage",
+    "D4CRegistration": "d4c_registration",
+    "DataScanner": "datascanner",
+    "DeliverySettings": "delivery_settings",
+    "Deployments": "deployments",
+    "Detects": "detects",
+    "DeviceContent": "device_content",
+    "DeviceControlPolicies": "device_control_policies",
+    "Discover": "discover",
+    "Downloads": "downloads",
+    "DriftIndicators": "drift_indicators",
+    "EventStreams": "event_streams",
+    "ExposureManagement": "exposure_management",
+    "FaaSExecution": "faas_execution",
+    "CompleteDashboard": "falcon_complete_dashboard",
+    "FalconContainer": "falcon_container",
+    "FalconXSandbox": "falconx_sandbox",
+    "FDR": "fdr",
+    "FileVantage": "filevantage",
+    "FirewallManagement": "firewall_management",
+    "FirewallPolicies": "firewall_policies",
+    "FoundryLogScale": "foundry_logscale",
+    "HostGroup": "host_group",
+    "Hosts": "hosts",
+    "HostMigration": "host_migration",
+    "IdentityProtection": "identity_protection",
+    "ImageAssessmentPolicies": "image_assessment_policies",
+    "Incidents": "incidents",
+    "IntelligenceIndicatorGraph": "intelligence_indicator_graph",
+    "InstallationTokens": "installation_tokens",
+    "Intel": "intel",
+    "IntelligenceFeeds": "intelligence_feeds",
+    "IOAExclusions": "ioa_exclusions",
+    "IOC": "ioc",
+    "Iocs": "iocs",
+    "KubernetesProtection": "kubernetes_protection",
+    "MalQuery": "malquery",
+    "MessageCenter": "message_center",
+    "MLExclusions": "ml_exclusions",
+    "MobileEnrollment": "mobile_enrollment",
+    "FlightControl": "mssp",
+    "NGSIEM": "ngsiem",
+    "OAuth2": "oauth2",
+    "ODS": "ods",
+    "OverwatchDashboard": "overwatch_dashboard",
+    "PreventionPolicy": "prevention_policy",
+    "PreventionPolicies": "prevention_policy",
+    "Quarantine": "quarantine",
+    "QuickScan": "quick_scan",
+    "QuickScanPro": "quick_scan_pro",
+    "RealTimeResponseAdmin": "real_time_response_admin",
+    "RealTimeResponseAudit": "real_time_response_audit",
+    "RealTimeResponse": "real_time_response",
+    "Recon": "recon",
+    "ReportExecutions": "report_executions",
+    "ResponsePolicies": "response_policies",
+    "SampleUploads": "sample_uploads",
+    "ScheduledReports": "scheduled_reports",
+    "SensorDownload": "sensor_download",
+    "SensorUpdatePolicy": "sensor_update_policy",
+    "SensorUpdatePolicies": "sensor_update_policy",
+    "SensorUsage": "sensor_usage",
+    "SensorVisibilityExclusions": "sensor_visibility_exclusions",
+    "ServerlessVulnerabilities": "serverless_vulnerabilities",
+    "SpotlightVulnerabilities": "spotlight_vulnerabilities",
+    "SpotlightEvaluationLogic": "spotlight_evaluation_logic",
+    "TailoredIntelligence": "tailored_intelligence",
+    "ThreatGraph": "threatgraph",
+    "UnidentifiedContainers": "unidentified_containers",
+    "UserManagement": "user_management",
+    "Workflows": "workflows",
+    "ZeroTrustAssessment": "zero_trust_assessment",
+    "HTTPEventCollector": "_ngsiem",
+    "HEC": "_ngsiem",
+    "IngestPayload": "_ngsiem",
+    "IngestConfig": "_ngsiem",
+    "IngestBatch": "_ngsiem",
+    "IngestCompressor": "_ngsiem",
+    "IngestProducer": "_ngsiem",
+    "IngestSpool": "_ngsiem",
+    "SessionManager": "_ngsiem",
+    "SearchJob": "_ngsiem",
+    "SearchRunner": "_ngsiem",
+    "StreamConsumer": "_event_streams",
+    "OffsetCheckpoint": "_event_streams",
+    "ChildAuthPool": "_mssp",
+    "MSSPFanOut": "_mssp",
+    "EntityBatcher": "_lookup",
+    "HostLookup": "_lookup"
+    }
 
 __version__ = _VERSION
 __maintainer__ = _MAINTAINER
@@ -227,7 +370,8 @@ __all__ = [
     "ExpandedResult", "CannotRevokeToken", "Headers", "Meta", "Resources",
     "ResponseComponent", "BaseDictionary", "Errors", "BaseResource", "RawBody", "BinaryFile",
     "FunctionalityNotImplemented", "BearerToken", "LogFacility", "InvalidBaseURL",
-    "InterfaceConfiguration", "RequestBehavior", "RequestConnection", "RequestMeta",
+    "InterfaceConfiguration", "ConnectionPool", "RateLimiter", "ResponseCache", "RequestCoalescer",
+    "RequestBehavior", "RequestConnection", "RequestMeta",
     "RequestPayloads", "RequestValidator", "PayloadValidationError", "MIN_TOKEN_RENEW_WINDOW",
     "MAX_TOKEN_RENEW_WINDOW", "GLOBAL_API_MAX_RETURN", "MOCK_OPERATIONS", "CloudSnapshots",
     "NoAuthenticationMechanism", "InvalidIndex", "version", "InvalidCredentialFormat",
@@ -243,8 +387,13 @@ __all__ = [
     "CloudOCIRegistration", "CloudSecurityAssets", "Deployments", "ServerlessVulnerabilities",
     "DeviceContent", "IntelligenceIndicatorGraph", "ContentUpdatePolicies", "CAOHunting",
     "ContainerImageCompliance", "FaaSExecution", "HEC", "IngestBaseURL", "IngestFormat",
-    "IngestPayload", "HTTPEventCollector", "IngestConfig", "SessionManager", "TimeUnit",
-    "Color", "Indicator", "random_string"
+    "IngestPayload", "HTTPEventCollector", "IngestConfig", "IngestBatch", "IngestCompressor",
+    "IngestProducer", "IngestSpool", "SessionManager", "SearchJob", "SearchRunner", "TimeUnit", "Color",
+    "Indicator", "random_string", "DependencyNotInstalled", "AsyncConnectionPool",
+    "AsyncFalconInterface", "AsyncServiceClass", "async_service_class", "TokenStore", "FileTokenStore",
+    "JSONCodec", "DownloadVerificationError", "DownloadIncompleteError", "MultipartEncoder",
+    "StreamConsumer", "OffsetCheckpoint", "ChildAuthPool", "MSSPFanOut",
+    "EntityBatcher", "HostLookup"
     ]
 """
 This is free and unencumbered software released into the public domain.
@@ -302,3 +451,26 @@ For more information, please refer to <https://unlicense.org>
                                                              ⢻⣿⣄      ⠈⠈
                                                                ⠈⠉ FalconPy
 """
+
+
+def __getattr__(name: str):
+    """Import Service Classes, helper classes and their modules when they are first requested.
+
+    Asynchronous Service Classes (AsyncHosts, AsyncDetects, etc.) are also created on demand.
+    """
+    if name in _LAZY_IMPORTS:
+        returned = getattr(import_module(f".{_LAZY_IMPORTS[name]}", __name__), name)
+        globals()[name] = returned
+        return returned
+    if name in _LAZY_IMPORTS.values():
+        return import_module(f".{name}", __name__)
+    sync_class = __getattr__(name[5:]) if name.startswith("Async") and name[5:] in _LAZY_IMPORTS else None
+    if isinstance(sync_class, type) and issubclass(sync_class, ServiceClass):
+        return async_service_class(sync_class)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include Service Classes that have not been imported yet."""
+    return sorted(set(globals()) | set(__all__))
@@ -35,7 +35,7 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-from typing import Union, Dict, Optional, List, Any
+from typing import Union, Dict, Optional, List, Any, Callable
 from logging import Logger
 from ._request_behavior import RequestBehavior
 from ._request_connection import RequestConnection
@@ -44,7 +44,7 @@ from ._request_payloads import RequestPayloads
 from .._log import LogFacility
 
 
-class APIRequest:
+class APIRequest:  # pylint: disable=R0904
     """This class represents a request made to the CrowdStrike API."""
 
     # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
@@ -58,7 +58,7 @@ class APIRequest:
         """Construct an instance of the APIRequest class."""
         if initializer:
             # Key metadata regarding this API request
-            self._meta = RequestMeta(endpoint, initializer.get("method", "GET"))
+            self._meta = RequestMeta(endpoint, initializer.get("method", "GET"), initializer.get("operation", None))
             # Payloads for the request
             self._payloads = RequestPayloads(params=initializer.get("params", None),
                                              body=initializer.get("body", None),
@@ -69,16 +69,26 @@ class APIRequest:
             self._connection = RequestConnection(user_agent=initializer.get("user_agent", None),
                                                  proxy=initializer.get("proxy", {}),
                                                  timeout=initializer.get("timeout", None),
-                                                 verify=initializer.get("verify", True)
+                                                 verify=initializer.get("verify", True),
+                                                 session=initializer.get("session", None),
+                                                 rate_limit=initializer.get("rate_limit", None),
+                                                 codec=initializer.get("codec", None),
+                                                 cache=initializer.get("cache", None),
+                                                 coalescer=initializer.get("coalescer", None)
                                                  )
             # Behavioral flags that alter the behavior of request processing
             self._behavior = RequestBehavior(expand_result=initializer.get("expand_result", False),
                                              container=initializer.get("container", False),
-                                             stream=initializer.get("stream", False),
+                                             stream=bool(initializer.get("stream", False)
+                                                         or initializer.get("download_to", None) is not None
+                                                         ),
                                              authenticating=initializer.get("authenticating", False),
                                              perform=initializer.get("perform", True),
                                              body_validator=initializer.get("body_validator", None),
-                                             body_required=initializer.get("body_required", None)
+                                             body_required=initializer.get("body_required", None),
+                                             download_to=initializer.get("download_to", None),
+                                             download_sha256=initializer.get("download_sha256", None),
+                                             upload_progress=initializer.get("upload_progress", None)
                                              )
             # Logging functionality
             self._request_log = LogFacility(log=initializer.get("log_util", None),
@@ -134,6 +144,11 @@ class APIRequest:
         """Return the method attribute."""
         return self.meta.method
 
+    @property
+    def operation(self) -> Optional[str]:
+        """Return the operation ID."""
+        return self.meta.operation
+
     @property
     def debug_headers(self) -> Optional[Dict[str, Optional[Union[str, int, float]]]]:
         """Return the debug headers."""
@@ -204,6 +219,21 @@ class APIRequest:
         """Return a boolean indicating if this is an authentication request."""
         return self.behavior.authenticating
 
+    @property
+    def download_to(self) -> Optional[Any]:
+        """Return the path or file object this download is written to."""
+        return self.behavior.download_to
+
+    @property
+    def download_sha256(self) -> Optional[str]:
+        """Return the SHA256 the downloaded content is expected to match."""
+        return self.behavior.download_sha256
+
+    @property
+    def upload_progress(self) -> Optional[Callable[[Any], Any]]:
+        """Return the callback provided the progress of streaming uploads."""
+        return self.behavior.upload_progress
+
     @property
     def perform(self) -> bool:
         """Return the perform boolean."""
@@ -274,3 +304,28 @@ class APIRequest:
     def verify(self) -> bool:
         """Return the SSL verification setting."""
         return self.connection.verify
+
+    @property
+    def session(self) -> Optional[Any]:
+        """Return the pooled connection used to perform this request."""
+        return self.connection.session
+
+    @property
+    def rate_limit(self) -> Optional[Any]:
+        """Return the rate limit budget tracker used to schedule this request."""
+        return self.connection.rate_limit
+
+    @property
+    def codec(self) -> Optional[Any]:
+        """Return the JSON codec used to encode and decode this request."""
+        return self.connection.codec
+
+    @property
+    def cache(self) -> Optional[Any]:
+        """Return the response cache scope used for this request."""
+        return self.connection.cache
+
+    @property
+    def coalescer(self) -> Optional[Any]:
+        """Return the request coalescing scope used for this request."""
+        return self.connection.coalescer
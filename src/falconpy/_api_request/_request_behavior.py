@@ -35,7 +35,7 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-from typing import Optional, Any, Dict, List
+from typing import Optional, Any, Callable, Dict, List
 from ._request_validator import RequestValidator
 
 
@@ -53,7 +53,10 @@ class RequestBehavior:
                  authenticating: Optional[bool] = False,
                  perform: Optional[bool] = True,
                  body_validator: Optional[Dict[str, Any]] = None,
-                 body_required: Optional[List[str]] = None
+                 body_required: Optional[List[str]] = None,
+                 download_to: Optional[Any] = None,
+                 download_sha256: Optional[str] = None,
+                 upload_progress: Optional[Callable[[Any], Any]] = None
                  ):
         """Construct an instance of RequestBehavior class."""
         self._expand_result = False
@@ -72,6 +75,17 @@ class RequestBehavior:
         if isinstance(authenticating, bool):
             self._authenticating = authenticating
 
+        # Path or file object the response is streamed into, and the SHA256 it is expected to match.
+        self._download_to = download_to
+        self._download_sha256 = None
+        if isinstance(download_sha256, str) and download_sha256:
+            self._download_sha256 = download_sha256.lower()
+
+        # Callback provided the streaming upload encoder as each chunk of the request body is sent.
+        self._upload_progress = None
+        if callable(upload_progress):
+            self._upload_progress = upload_progress
+
         self._perform = True
         if isinstance(perform, bool):
             self._perform = perform
@@ -127,6 +141,36 @@ class RequestBehavior:
         """Specify if this is an authenticating request."""
         self._authenticating = value
 
+    @property
+    def download_to(self) -> Optional[Any]:
+        """Return the path or file object this download is written to."""
+        return self._download_to
+
+    @download_to.setter
+    def download_to(self, value: Optional[Any]):
+        """Change the download destination."""
+        self._download_to = value
+
+    @property
+    def download_sha256(self) -> Optional[str]:
+        """Return the SHA256 the downloaded content is expected to match."""
+        return self._download_sha256
+
+    @download_sha256.setter
+    def download_sha256(self, value: Optional[str]):
+        """Change the expected SHA256."""
+        self._download_sha256 = value
+
+    @property
+    def upload_progress(self) -> Optional[Callable[[Any], Any]]:
+        """Return the upload progress callback."""
+        return self._upload_progress
+
+    @upload_progress.setter
+    def upload_progress(self, value: Optional[Callable[[Any], Any]]):
+        """Change the upload progress callback."""
+        self._upload_progress = value
+
     @property
     def perform(self) -> bool:
         """Flag indicating if this request should be performed. (Set by the payload validation)."""
@@ -36,7 +36,7 @@ OTHER DEALINGS IN THE SOFTWARE.
 For more information, please refer to <https://unlicense.org>
 """
 from dataclasses import dataclass
-from typing import Optional, Dict, Union
+from typing import Optional, Dict, Union, Any
 
 
 @dataclass
@@ -51,3 +51,8 @@ class RequestConnection:
     verify: bool = True
     timeout: Optional[Union[int, tuple]] = None
     proxy: Optional[Dict[str, str]] = None
+    session: Optional[Any] = None
+    rate_limit: Optional[Any] = None
+    codec: Optional[Any] = None
+    cache: Optional[Any] = None
+    coalescer: Optional[Any] = None
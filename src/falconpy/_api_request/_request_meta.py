@@ -48,11 +48,13 @@ class RequestMeta:
     def __init__(self,
                  endpoint: Optional[str] = None,
                  method: str = "GET",
+                 operation: Optional[str] = None,
                  debug_headers: Optional[Dict[str, Optional[Union[str, int, float]]]] = None
                  ):
         """Construct an instance of RequestMeta class."""
         self._endpoint: Optional[str] = endpoint
         self._method: str = method
+        self._operation: Optional[str] = operation
 
         self._debug_headers: Optional[Dict[str, Optional[Union[str, int, float]]]] = debug_headers
         if debug_headers is None:
@@ -82,6 +84,11 @@ class RequestMeta:
         """Set the method attribute."""
         self._method = value
 
+    @property
+    def operation(self) -> Optional[str]:
+        """Return the operation ID."""
+        return self._operation
+
     @property
     def debug_headers(self) -> Optional[Dict[str, Optional[Union[str, int, float]]]]:
         """Return the debug headers."""
@@ -40,7 +40,18 @@ from ._falcon_interface import FalconInterface
 from ._uber_interface import UberInterface
 from ._bearer_token import BearerToken
 from ._interface_config import InterfaceConfiguration
+from ._connection_pool import ConnectionPool
+from ._rate_limiter import RateLimiter, RateLimitBucket
+from ._response_cache import ResponseCache, ResponseCacheScope
+from ._request_coalescer import RequestCoalescer, RequestCoalescerScope
+from ._token_store import TokenStore, FileTokenStore
+from ._async_connection_pool import AsyncConnectionPool
+from ._async_falcon_interface import AsyncFalconInterface
 
 __all__ = ["BaseFalconAuth", "FalconInterface", "UberInterface",
-           "BearerToken", "InterfaceConfiguration"
+           "BearerToken", "InterfaceConfiguration", "ConnectionPool",
+           "RateLimiter", "RateLimitBucket", "AsyncConnectionPool",
+           "AsyncFalconInterface", "TokenStore", "FileTokenStore",
+           "ResponseCache", "ResponseCacheScope", "RequestCoalescer",
+           "RequestCoalescerScope"
            ]
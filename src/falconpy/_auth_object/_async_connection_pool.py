@@ -0,0 +1,271 @@
+"""Asynchronous connection pool class.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from ._connection_pool import ConnectionPool
+from .._error import DependencyNotInstalled
+if TYPE_CHECKING:  # pragma: no cover
+    import asyncio
+    import aiohttp
+
+
+class AsyncConnectionPool(ConnectionPool):
+    """This class represents the pooled asynchronous HTTP connections used by an interface.
+
+    A single aiohttp ClientSession is created on first use within the running event loop
+    and shared by every request performed through the interface. Responses are returned
+    as requests Response objects so they may be processed by the standard result handlers.
+    Requires the aiohttp package.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 pool_connections: Optional[int] = 10,
+                 pool_maxsize: Optional[int] = 100,
+                 pool_block: Optional[bool] = True,
+                 keep_alive: Optional[bool] = True
+                 ):
+        """Construct an instance of the AsyncConnectionPool class.
+
+        Keyword arguments
+        ----
+        pool_connections : int
+            Number of individual hosts to keep connections open to. Defaults to 10.
+        pool_maxsize : int
+            Maximum number of simultaneous connections per host. Defaults to 100.
+        pool_block : bool
+            Asynchronous requests always wait for a free connection. Retained for compatibility.
+        keep_alive : bool
+            Keep connections open between requests. Defaults to True.
+        """
+        aiohttp_module()  # Confirm asynchronous support is available
+        super().__init__(pool_connections=pool_connections,
+                         pool_maxsize=pool_maxsize,
+                         pool_block=pool_block,
+                         keep_alive=keep_alive
+                         )
+        self._loop: Optional["asyncio.AbstractEventLoop"] = None
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    # pylint: disable=R0913,R0914,W0221,W0236
+    async def request(self,
+                      method: str,
+                      url: str,
+                      headers: Optional[Dict[str, str]] = None,
+                      params: Optional[Dict[str, Any]] = None,
+                      json: Optional[Any] = None,
+                      data: Optional[Union[Dict[str, Any], bytes, str]] = None,
+                      files: Optional[List[Tuple[str, Tuple[str, Any, Optional[str]]]]] = None,
+                      verify: bool = True,
+                      allow_redirects: bool = True,
+                      proxies: Optional[Dict[str, str]] = None,
+                      timeout: Optional[Union[float, tuple]] = None,
+                      stream: bool = False
+                      ) -> Response:
+        """Perform a request using the pooled session.
+
+        Accepts the same arguments as requests.request. Files must be provided as a list of
+        (field, (filename, content, content type)) tuples. Content is provided as bytes, or as an
+        upload source that is opened for each attempt and streamed. The entire response body is
+        read before returning, including streamed downloads.
+        """
+        _ = stream
+        if not self.keep_alive:
+            headers = {**headers} if headers else {}
+            headers["Connection"] = "close"
+
+        request_args = {
+            "headers": headers,
+            "params": query_string(params),
+            "allow_redirects": allow_redirects,
+            "ssl": None if verify else False,
+            "proxy": (proxies or {}).get(url.split(":", 1)[0]),
+            "timeout": client_timeout(timeout)
+        }
+        sources = []
+        if files:
+            request_args["data"] = form_data(data, files, sources)
+        elif json is not None:
+            request_args["json"] = json
+        elif data is not None:
+            request_args["data"] = data
+
+        try:
+            async with self.session.request(method, url, **request_args) as response:
+                returned = Response()
+                returned.status_code = response.status
+                returned.headers = CaseInsensitiveDict(response.headers)
+                returned.url = str(response.url)
+                returned.reason = response.reason
+                returned.encoding = response.get_encoding() if response.content_type.startswith("text") else None
+                returned._content = await response.read()  # pylint: disable=W0212
+                returned._content_consumed = True  # pylint: disable=W0212
+        finally:
+            for source in sources:
+                source.release()
+
+        return returned
+
+    async def aclose(self):
+        """Close the pooled session and release all open connections."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+    def close(self):
+        """Discard the pooled session. Use aclose when called from within the event loop."""
+        session = self._session
+        self._session = None
+        self._loop = None
+        if session and not session.closed:
+            import asyncio  # pylint: disable=C0415
+            try:
+                asyncio.get_running_loop().create_task(session.close())
+            except RuntimeError:
+                # No running event loop, release the connections directly.
+                session.connector.close()
+
+    def _create_session(self) -> "aiohttp.ClientSession":
+        """Create a new session with our pool settings."""
+        aiohttp = aiohttp_module()
+        connector = aiohttp.TCPConnector(limit=self.pool_connections * self.pool_maxsize,
+                                         limit_per_host=self.pool_maxsize,
+                                         force_close=not self.keep_alive
+                                         )
+        return aiohttp.ClientSession(connector=connector)
+
+    async def __aenter__(self):
+        """Allow for entry as an asynchronous context manager."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Release our connections when we exit the context."""
+        await self.aclose()
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """Return the pooled session for the running event loop, creating it if necessary."""
+        import asyncio  # pylint: disable=C0415
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            # Sessions are bound to the event loop they were created within.
+            self._session = self._create_session()
+            self._loop = loop
+
+        return self._session
+
+    @classmethod
+    def create(cls, provided: Optional[Union["AsyncConnectionPool", Dict[str, Union[int, bool]]]] = None
+               ) -> "AsyncConnectionPool":
+        """Return the provided pool, or a new pool built from a dictionary of settings."""
+        returned = provided
+        if not isinstance(provided, AsyncConnectionPool):
+            returned = cls(**provided) if isinstance(provided, dict) else cls()
+
+        return returned
+
+
+@lru_cache(maxsize=None)
+def aiohttp_module():
+    """Import aiohttp when it is first needed. Asynchronous support is optional."""
+    try:
+        return import_module("aiohttp")
+    except ImportError as not_installed:
+        raise DependencyNotInstalled(message="The aiohttp package is required for asynchronous requests."
+                                     ) from not_installed
+
+
+def query_string(params: Optional[Dict[str, Any]]) -> Optional[List[Tuple[str, str]]]:
+    """Convert a query string dictionary into the format expected by aiohttp.
+
+    List values are expanded into repeated keys and empty values are dropped, matching requests.
+    """
+    returned = None
+    if params:
+        returned = []
+        for key, value in params.items():
+            for item in (value if isinstance(value, (list, tuple)) else [value]):
+                if item is not None:
+                    returned.append((key, item if isinstance(item, str) else str(item)))
+
+    return returned
+
+
+def client_timeout(timeout: Optional[Union[float, tuple]]) -> "aiohttp.ClientTimeout":
+    """Convert a requests style timeout into an aiohttp timeout."""
+    if isinstance(timeout, (tuple, list)):
+        returned = aiohttp_module().ClientTimeout(total=None, sock_connect=timeout[0], sock_read=timeout[1])
+    else:
+        returned = aiohttp_module().ClientTimeout(total=timeout)
+
+    return returned
+
+
+def form_data(data: Optional[Dict[str, Any]],
+              files: List[Tuple[str, Tuple[str, Any, Optional[str]]]],
+              sources: Optional[List[Any]] = None
+              ) -> "aiohttp.FormData":
+    """Create a multipart form payload from the provided form fields and files.
+
+    Upload sources are opened and streamed, and added to the provided list so they can be released.
+    """
+    returned = aiohttp_module().FormData()
+    for key, value in (data.items() if isinstance(data, dict) else []):
+        returned.add_field(key, str(value))
+    for field, (filename, content, content_type) in files:
+        if callable(getattr(content, "release", None)):
+            if sources is not None:
+                sources.append(content)
+            content = content.open()
+        returned.add_field(field, content, filename=filename, content_type=content_type)
+
+    return returned
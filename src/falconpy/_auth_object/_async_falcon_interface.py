@@ -0,0 +1,243 @@
+"""Falcon asynchronous authentication interface.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from typing import Any, Awaitable, Dict, Optional, Union, TYPE_CHECKING
+from ._async_connection_pool import AsyncConnectionPool
+from ._bearer_token import BearerToken
+from ._falcon_interface import FalconInterface
+from ._rate_limiter import RateLimiter
+from .._enum import TokenFailReason
+from .._error import InvalidCredentials
+from .._util import async_perform_request, confirm_base_url, login_payloads, logout_payloads, JSONCodec
+if TYPE_CHECKING:  # pragma: no cover
+    import asyncio
+
+
+class AsyncFalconInterface(FalconInterface):
+    """Asynchronous Falcon API interface used by asynchronous Service Classes.
+
+    Requests are performed using aiohttp and return awaitables, allowing many
+    requests to be in flight on a single event loop. Tokens are generated and
+    refreshed when the first request requiring them is awaited.
+    """
+
+    # _______  _____  __   _ _______ _______  ______ _     _ _______ _______  _____   ______
+    # |       |     | | \  | |______    |    |_____/ |     | |          |    |     | |_____/
+    # |_____  |_____| |  \_| ______|    |    |    \_ |_____| |_____     |    |_____| |    \_
+    #
+    # pylint: disable=R0913,R0914,R0917
+    def __init__(self,
+                 access_token: Optional[Union[str, bool]] = False,
+                 base_url: Optional[str] = "https://api.crowdstrike.com",
+                 creds: Optional[Dict[str, str]] = None,
+                 client_id: Optional[str] = None,
+                 client_secret: Optional[str] = None,
+                 member_cid: Optional[str] = None,
+                 ssl_verify: Optional[bool] = True,
+                 proxy: Optional[Dict[str, str]] = None,
+                 timeout: Optional[Union[float, tuple]] = None,
+                 user_agent: Optional[str] = None,
+                 renew_window: Optional[int] = 120,
+                 debug: Optional[bool] = False,
+                 debug_record_count: Optional[int] = None,
+                 sanitize_log: Optional[bool] = None,
+                 pythonic: Optional[bool] = False,
+                 environment: Optional[Dict[str, str]] = None,
+                 connection_pool: Optional[Union[AsyncConnectionPool, Dict[str, Union[int, bool]]]] = None,
+                 rate_limit: Optional[Union[RateLimiter, Dict[str, Union[int, float]], bool]] = None,
+                 json_codec: Optional[Union[JSONCodec, str]] = None,
+                 background_refresh: Optional[bool] = False,
+                 token_store: Optional[Any] = None,
+                 response_cache: Optional[Any] = None,
+                 request_coalescer: Optional[Any] = None
+                 ) -> "AsyncFalconInterface":
+        """Construct an instance of the AsyncFalconInterface class.
+
+        Accepts the same keywords as FalconInterface. The connection_pool keyword accepts an
+        AsyncConnectionPool or a dictionary of pool settings, pool_maxsize sets the maximum
+        number of simultaneous connections per host. Requires the aiohttp package.
+        Upload files are streamed, while downloads are received completely before they are written.
+
+        The background_refresh, token_store, response_cache and request_coalescer keywords are
+        not supported by asynchronous interfaces, and ValueError is raised when they are enabled.
+        """
+        requested = {"background_refresh": background_refresh, "token_store": token_store,
+                     "response_cache": response_cache, "request_coalescer": request_coalescer
+                     }
+        unsupported = [name for name, value in requested.items() if value]
+        if unsupported:
+            raise ValueError(f"Not supported by asynchronous interfaces: {', '.join(unsupported)}.")
+        super().__init__(access_token=access_token,
+                         base_url=confirm_base_url(base_url),
+                         creds=creds,
+                         client_id=client_id,
+                         client_secret=client_secret,
+                         member_cid=member_cid,
+                         ssl_verify=ssl_verify,
+                         proxy=proxy,
+                         timeout=timeout,
+                         user_agent=user_agent,
+                         renew_window=renew_window,
+                         debug=debug,
+                         debug_record_count=debug_record_count,
+                         sanitize_log=sanitize_log,
+                         pythonic=pythonic,
+                         environment=environment,
+                         connection_pool=AsyncConnectionPool.create(connection_pool),
+                         rate_limit=rate_limit,
+                         json_codec=json_codec
+                         )
+        # Ensures only one token request is performed when concurrent requests find the token stale.
+        self._refresh_lock: Optional["asyncio.Lock"] = None
+        self._refresh_loop: Optional["asyncio.AbstractEventLoop"] = None
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def request(self, **kwargs) -> Awaitable[Any]:
+        """Prepare a request using this interface and return an awaitable that performs it.
+
+        Accepts the same keywords as perform_request.
+        """
+        kwargs["session"] = self.connection_pool
+        kwargs["codec"] = self.json_codec
+        return async_perform_request(interface=self, **kwargs)
+
+    async def login(self) -> dict:  # pylint: disable=W0236,W0221
+        """Login to the Falcon API by requesting a new token."""
+        return await self._async_login_handler()
+
+    async def logout(self) -> dict:  # pylint: disable=W0236,W0221
+        """Log out of the Falcon API by revoking the current token and releasing our connections."""
+        returned = await self._async_logout_handler()
+        await self.connection_pool.aclose()
+
+        return returned
+
+    async def async_auth_headers(self) -> Dict[str, str]:
+        """Return a Bearer token baked into an Authorization header, refreshing the token if it is stale."""
+        if self.token_stale and self.refreshable:
+            import asyncio  # pylint: disable=C0415
+            loop = asyncio.get_running_loop()
+            if self._refresh_lock is None or self._refresh_loop is not loop:
+                self._refresh_lock = asyncio.Lock()
+                self._refresh_loop = loop
+            async with self._refresh_lock:
+                # Another request may have refreshed the token while we were waiting.
+                if self.token_stale:
+                    await self.login()
+
+        return {"Authorization": f"Bearer {self.token_value}"}
+
+    async def _async_login_handler(self) -> dict:
+        """Login by requesting a new token."""
+        try:
+            if self.cred_format_valid:
+                operation, target_url, data_payload = login_payloads(self.creds, self.base_url)
+                # Log the call to this operation if debugging is enabled.
+                if self.log:
+                    self.log.debug("OPERATION: %s", operation)
+                returned = await self.request(method="POST", endpoint=target_url, data=data_payload,
+                                              headers={}, verify=self.ssl_verify, proxy=self.proxy,
+                                              timeout=self.timeout, user_agent=self.user_agent,
+                                              log_util=self.log, authenticating=True,
+                                              sanitize=self.sanitize_log
+                                              )
+                self._update_token(returned)
+            else:
+                self.bearer_token.fail_token(403, TokenFailReason["INVALID"])
+                raise InvalidCredentials
+
+        except InvalidCredentials as bad_creds:
+            returned = bad_creds.result
+            if self.log:
+                self.log.error(bad_creds.message)
+
+        return returned
+
+    async def _async_logout_handler(self) -> dict:
+        """Log out by revoking the current token."""
+        try:
+            if self.cred_format_valid:
+                operation, target_url, data_payload, header_payload = logout_payloads(creds=self.creds,
+                                                                                      base=self.base_url,
+                                                                                      token_val=self.token_value
+                                                                                      )
+                # Log the call to this operation if debugging is enabled.
+                if self.log:
+                    self.log.debug("OPERATION: %s", operation)
+                returned = await self.request(method="POST", endpoint=target_url, data=data_payload,
+                                              headers=header_payload, verify=self.ssl_verify,
+                                              proxy=self.proxy, timeout=self.timeout,
+                                              user_agent=self.user_agent, log_util=self.log,
+                                              sanitize=self.sanitize_log
+                                              )
+                self.bearer_token = BearerToken()
+            else:
+                raise InvalidCredentials
+        except InvalidCredentials as bad_creds:
+            returned = bad_creds.result
+            if self.log:
+                self.log.error(bad_creds.message)
+
+        return returned
+
+    async def __aenter__(self):
+        """Allow for entry as an asynchronous context manager."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Discard our token and release our connections when we exit the context."""
+        if self.token_value and self.refreshable:
+            await self.logout()
+        await self.connection_pool.aclose()
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def asynchronous(self) -> bool:
+        """Return a boolean indicating requests made using this interface are asynchronous."""
+        return True
+
+    # Tokens are refreshed when an asynchronous request is awaited, never while building headers.
+    @property
+    def auth_headers(self) -> Dict[str, str]:
+        """Return the current Bearer token baked into an Authorization header."""
+        return {"Authorization": f"Bearer {self.token_value}"}
@@ -0,0 +1,208 @@
+"""Connection pool class.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from threading import Lock
+from typing import Dict, Optional, Union
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+
+
+class ConnectionPool:
+    """This class represents the pooled HTTP connections used by an interface.
+
+    A single requests Session is created on first use and shared by every request
+    performed through the interface, allowing TCP and TLS connections to be reused.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 pool_connections: Optional[int] = 10,
+                 pool_maxsize: Optional[int] = 10,
+                 pool_block: Optional[bool] = False,
+                 keep_alive: Optional[bool] = True
+                 ):
+        """Construct an instance of the ConnectionPool class.
+
+        Keyword arguments
+        ----
+        pool_connections : int
+            Number of individual host connection pools to cache. Defaults to 10.
+        pool_maxsize : int
+            Maximum number of connections to keep open per host. Defaults to 10.
+        pool_block : bool
+            Block and wait for a free connection when the per host limit is reached. Defaults to False.
+        keep_alive : bool
+            Keep connections open between requests. Defaults to True.
+        """
+        self._lock: Lock = Lock()
+        self._session: Optional[Session] = None
+
+        self._pool_connections: int = 10
+        if isinstance(pool_connections, int) and pool_connections > 0:
+            self._pool_connections = pool_connections
+
+        self._pool_maxsize: int = 10
+        if isinstance(pool_maxsize, int) and pool_maxsize > 0:
+            self._pool_maxsize = pool_maxsize
+
+        self._pool_block: bool = False
+        if isinstance(pool_block, bool):
+            self._pool_block = pool_block
+
+        self._keep_alive: bool = True
+        if isinstance(keep_alive, bool):
+            self._keep_alive = keep_alive
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> Response:
+        """Perform a request using the pooled session.
+
+        Accepts the same arguments as requests.request.
+        """
+        if not self.keep_alive:
+            headers = {**headers} if headers else {}
+            headers["Connection"] = "close"
+
+        return self.session.request(method, url, headers=headers, **kwargs)
+
+    def close(self):
+        """Close the pooled session and release all open connections.
+
+        The pool is recreated automatically on the next request.
+        """
+        with self._lock:
+            if self._session:
+                self._session.close()
+            self._session = None
+
+    def _create_session(self) -> Session:
+        """Create a new session with our pool settings mounted for both schemes."""
+        new_session = Session()
+        for scheme in ["https://", "http://"]:
+            new_session.mount(scheme, HTTPAdapter(pool_connections=self.pool_connections,
+                                                  pool_maxsize=self.pool_maxsize,
+                                                  pool_block=self.pool_block
+                                                  ))
+        return new_session
+
+    def __enter__(self):
+        """Allow for entry as a context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Release our connections when we exit the context."""
+        self.close()
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def session(self) -> Session:
+        """Return the pooled session, creating it if necessary."""
+        returned = self._session
+        if returned is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+                returned = self._session
+
+        return returned
+
+    @property
+    def active(self) -> bool:
+        """Return a boolean indicating if the pooled session is currently open."""
+        return self._session is not None
+
+    # Changing a pool setting closes the current session so the change takes effect on the next request.
+    @property
+    def pool_connections(self) -> int:
+        """Return the number of host connection pools to cache."""
+        return self._pool_connections
+
+    @pool_connections.setter
+    def pool_connections(self, value: int):
+        """Set the number of host connection pools to cache."""
+        self._pool_connections = value
+        self.close()
+
+    @property
+    def pool_maxsize(self) -> int:
+        """Return the maximum number of connections kept per host."""
+        return self._pool_maxsize
+
+    @pool_maxsize.setter
+    def pool_maxsize(self, value: int):
+        """Set the maximum number of connections kept per host."""
+        self._pool_maxsize = value
+        self.close()
+
+    @property
+    def pool_block(self) -> bool:
+        """Return the pool blocking setting."""
+        return self._pool_block
+
+    @pool_block.setter
+    def pool_block(self, value: bool):
+        """Enable or disable blocking when the per host limit is reached."""
+        self._pool_block = value
+        self.close()
+
+    @property
+    def keep_alive(self) -> bool:
+        """Return the keep alive setting."""
+        return self._keep_alive
+
+    @keep_alive.setter
+    def keep_alive(self, value: bool):
+        """Enable or disable connection keep alive."""
+        self._keep_alive = value
+
+    @classmethod
+    def create(cls, provided: Optional[Union["ConnectionPool", Dict[str, Union[int, bool]]]] = None) -> "ConnectionPool":
+        """Return the provided pool, or a new pool built from a dictionary of settings."""
+        returned = provided
+        if not isinstance(provided, ConnectionPool):
+            returned = cls(**provided) if isinstance(provided, dict) else cls()
+
+        return returned
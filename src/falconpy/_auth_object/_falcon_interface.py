@@ -41,13 +41,21 @@ For more information, please refer to <https://unlicense.org>
 import time
 import os
 import warnings
+import weakref
 from contextvars import copy_context
+from hashlib import sha256
+from threading import Lock, Timer
 from logging import Logger, getLogger
-from typing import Dict, Optional, Union
+from typing import Any, Dict, Optional, Union
 from ._base_falcon_auth import BaseFalconAuth
 from ._bearer_token import BearerToken
+from ._connection_pool import ConnectionPool
+from ._rate_limiter import RateLimiter, RateLimitBucket
+from ._response_cache import ResponseCache, ResponseCacheScope
+from ._request_coalescer import RequestCoalescer, RequestCoalescerScope
+from ._token_store import TokenStore
 from .._log import LogFacility
-from .._constant import MIN_TOKEN_RENEW_WINDOW, MAX_TOKEN_RENEW_WINDOW
+from .._constant import MIN_TOKEN_RENEW_WINDOW, MAX_TOKEN_RENEW_WINDOW, REFRESH_BACKOFF_MAX
 from ._interface_config import InterfaceConfiguration
 from .._enum import TokenFailReason
 from .._util import (
@@ -57,7 +65,8 @@ from .._util import (
     log_class_startup,
     login_payloads,
     logout_payloads,
-    review_provided_credentials
+    review_provided_credentials,
+    JSONCodec
     )
 from .._error import InvalidCredentials, NoAuthenticationMechanism
 
@@ -72,7 +81,7 @@ class FalconInterface(BaseFalconAuth):
     #
     # The default constructor for all authentication objects. Ingests provided credentials
     # and sets the necessary class attributes based upon the authentication detail received.
-    # pylint: disable=R0912,R0913,R0914
+    # pylint: disable=R0912,R0913,R0914,R0915,R0917
     def __init__(self,  # noqa: C901
                  access_token: Optional[Union[str, bool]] = False,
                  base_url: Optional[str] = "https://api.crowdstrike.com",
@@ -89,7 +98,15 @@ class FalconInterface(BaseFalconAuth):
                  debug_record_count: Optional[int] = None,
                  sanitize_log: Optional[bool] = None,
                  pythonic: Optional[bool] = False,
-                 environment: Optional[Dict[str, str]] = None
+                 environment: Optional[Dict[str, str]] = None,
+                 connection_pool: Optional[Union[ConnectionPool, Dict[str, Union[int, bool]]]] = None,
+                 rate_limit: Optional[Union[RateLimiter, Dict[str, Union[int, float]], bool]] = None,
+                 background_refresh: Optional[bool] = False,
+                 token_store: Optional[Union[TokenStore, str, bool]] = None,
+                 json_codec: Optional[Union[JSONCodec, str]] = None,
+                 response_cache: Optional[Union[ResponseCache, Dict[str, Any], bool]] = None,
+                 request_coalescer: Optional[Union[RequestCoalescer, Dict[str, Any], bool]] = None,
+                 revoke_on_logout: Optional[bool] = False
                  ) -> "FalconInterface":
         """Construct an instance of the FalconInterface class."""
         # Set the pythonic behavior mode.
@@ -104,6 +121,33 @@ class FalconInterface(BaseFalconAuth):
                                                                       user_agent=user_agent,
                                                                       ssl_verify=ssl_verify
                                                                       )            # \ o /
+        # Pooled HTTP session shared by every request made using this interface.
+        self._pool: ConnectionPool = ConnectionPool.create(connection_pool)
+        # Rate limit aware request scheduler, disabled unless requested.
+        self._rate_limiter: Optional[RateLimiter] = RateLimiter.create(rate_limit)
+        # Only one thread refreshes a stale token, the others wait for or skip the refresh.
+        self._token_lock: Lock = Lock()
+        # Incremented whenever a token is received, allows waiting threads to skip duplicate refreshes.
+        self._token_generation: int = 0
+        # Optional timer used to renew the token before it becomes stale.
+        self._background_refresh: bool = False
+        if isinstance(background_refresh, bool):
+            self._background_refresh = background_refresh
+        self._refresh_timer: Optional[Timer] = None
+        # Consecutive failed background refreshes, used to back off the next attempt.
+        self._refresh_failures: int = 0
+        # Tokens shared with other authentication objects and processes, disabled unless requested.
+        self._token_store: Optional[TokenStore] = TokenStore.create(token_store)
+        # Shared tokens are only revoked on logout when requested, other objects may still be using them.
+        self._revoke_on_logout: bool = False
+        if isinstance(revoke_on_logout, bool):
+            self._revoke_on_logout = revoke_on_logout
+        # JSON encoder and decoder used for request and response payloads.
+        self._json_codec: JSONCodec = JSONCodec.create(json_codec)
+        # Cached responses for idempotent operations, disabled unless requested.
+        self._response_cache: Optional[ResponseCache] = ResponseCache.create(response_cache)
+        # Identical in-flight idempotent requests are shared, disabled unless requested.
+        self._request_coalescer: Optional[RequestCoalescer] = RequestCoalescer.create(request_coalescer)
         # ____ _  _ ___ _  _ ____ _  _ ___ _ ____ ____ ___ _ ____ _  _                 |
         # |__| |  |  |  |__| |___ |\ |  |  | |    |__|  |  | |  | |\ |                / \
         # |  | |__|  |  |  | |___ | \|  |  | |___ |  |  |  | |__| | \|
@@ -204,6 +248,18 @@ class FalconInterface(BaseFalconAuth):
                                      MIN_TOKEN_RENEW_WINDOW
                                      )
 
+        # ____ _  _ ____ ____ ____ ___     ___ ____ _  _ ____ _  _
+        # [__  |__| |__| |__/ |___ |  \     |  |  | |_/  |___ |\ |
+        # ___] |  | |  | |  \ |___ |__/     |  |__| | \_ |___ | \|
+        #
+        # Shared tokens are stored using the client ID, member CID and the base URL provided.
+        # When a token store is in use, a token previously generated by another authentication
+        # object or process using the same credentials is loaded automatically.
+        # A login event is unnecessary when a valid shared token is found.
+        self._token_key: str = TokenStore.token_key(self.creds, self.base_url)
+        if self.token_store and self.cred_format_valid:
+            self._adopt_stored_token(self.token_store.load(self._token_key))
+
         # _    ____ ____ ____ _ _  _ ____
         # |    |  | | __ | __ | |\ | | __
         # |___ |__| |__] |__] | | \| |__]
@@ -270,36 +326,13 @@ class FalconInterface(BaseFalconAuth):
         _returned_headers = {}
         try:
             if self.cred_format_valid:
-                operation, target_url, data_payload = login_payloads(self.creds, self.base_url)
-                # Log the call to this operation if debugging is enabled.
-                if self.log:
-                    self.log.debug("OPERATION: %s", operation)
-                returned = perform_request(method="POST", endpoint=target_url, data=data_payload,
-                                           headers={}, verify=self.ssl_verify, proxy=self.proxy,
-                                           timeout=self.timeout, user_agent=self.user_agent,
-                                           log_util=self.log, authenticating=True,
-                                           sanitize=self.sanitize_log
-                                           )
+                if stateful and self.token_store:
+                    returned = self._shared_login()
+                else:
+                    returned = self._request_token()
+                    if stateful:
+                        self._update_token(returned)
                 _returned_headers = returned["headers"]
-                if stateful:
-                    self.token_status = returned["status_code"]
-                    if self.token_status == 201:
-                        # Token generation was successful.
-                        self.bearer_token = BearerToken(token_value=returned["body"]["access_token"],
-                                                        expiration=returned["body"]["expires_in"],
-                                                        status=201
-                                                        )
-                        # Cloud Region auto discovery.
-                        self.base_url = autodiscover_region(self.base_url, returned)
-                    else:
-                        # Token generation failure, reset the current token and check for an error response.
-                        self.bearer_token = BearerToken(status=returned["status_code"])
-                        # Retrieve the list of errors, there should only be one item in the list.
-                        error_list = returned["body"].get("errors", [])
-                        if error_list:
-                            self.bearer_token.fail_token(returned["status_code"],
-                                                         error_list[0]["message"]
-                                                         )
             else:
                 if stateful:
                     self.bearer_token.fail_token(403, TokenFailReason["INVALID"])
@@ -312,13 +345,106 @@ class FalconInterface(BaseFalconAuth):
 
         return returned
 
+    def _request_token(self) -> dict:
+        """Request a new token from the API using our credentials."""
+        operation, target_url, data_payload = login_payloads(self.creds, self.base_url)
+        # Log the call to this operation if debugging is enabled.
+        if self.log:
+            self.log.debug("OPERATION: %s", operation)
+
+        return perform_request(method="POST", endpoint=target_url, data=data_payload,
+                               headers={}, verify=self.ssl_verify, proxy=self.proxy,
+                               timeout=self.timeout, user_agent=self.user_agent,
+                               log_util=self.log, authenticating=True,
+                               sanitize=self.sanitize_log, session=self.connection_pool,
+                               codec=self.json_codec
+                               )
+
+    # Token requests are coordinated using the token store renewal lock. While one process
+    # requests a new token, the others wait and then reuse the token it stored.
+    def _shared_login(self) -> dict:
+        """Login using a token from the token store, requesting and storing a new token if necessary."""
+        with self.token_store.lock(self._token_key):
+            returned = self._adopt_stored_token(self.token_store.load(self._token_key))
+            if not returned:
+                returned = self._request_token()
+                self._update_token(returned)
+                if self.token_status == 201:
+                    self.token_store.save(self._token_key, {"access_token": self.token_value,
+                                                            "expires_at": self.token_time + self.token_expiration,
+                                                            "base_url": self.base_url
+                                                            })
+
+        return returned
+
+    def _adopt_stored_token(self, stored: Optional[dict]) -> Optional[dict]:
+        """Use a stored token that is not stale, returning a token response for the token."""
+        returned = None
+        if stored and (stored["expires_at"] - time.time()) > self.renew_window:
+            returned = {
+                "status_code": 201,
+                "headers": {},
+                "body": {
+                    "access_token": stored["access_token"],
+                    "expires_in": int(stored["expires_at"] - time.time()),
+                    "token_type": "bearer"
+                }
+            }
+            self._update_token(returned)
+            # Reuse the region discovered when this token was generated.
+            self.base_url = stored["base_url"]
+
+        return returned
+
+    def _update_token(self, returned: dict):
+        """Update our bearer token using the results of a token request."""
+        self._token_generation += 1
+        self.token_status = returned["status_code"]
+        if self.token_status == 201:
+            # Token generation was successful.
+            self.bearer_token = BearerToken(token_value=returned["body"]["access_token"],
+                                            expiration=returned["body"]["expires_in"],
+                                            status=201
+                                            )
+            # Cloud Region auto discovery.
+            self.base_url = autodiscover_region(self.base_url, returned)
+            # Renew this token in the background before it becomes stale if requested.
+            self._schedule_refresh()
+        else:
+            # Token generation failure, reset the current token and check for an error response.
+            self.bearer_token = BearerToken(status=returned["status_code"])
+            # Retrieve the list of errors, there should only be one item in the list.
+            error_list = returned["body"].get("errors", [])
+            if error_list:
+                self.bearer_token.fail_token(returned["status_code"],
+                                             error_list[0]["message"]
+                                             )
+
+    def _identity(self, token_digest: bool = False) -> str:
+        """Return the client ID, and the member CID when present, that requests are performed as.
+
+        When requested, interfaces without a client ID are identified by a digest of their token.
+        """
+        returned = self.creds.get("client_id", self.auth_style)
+        if self.creds.get("member_cid", None):
+            returned = f"{returned}|{self.creds['member_cid']}"
+        if token_digest and not self.creds.get("client_id", None):
+            returned = f"{returned}|{sha256(str(self.token_value).encode()).hexdigest()}"
+
+        return returned
+
     def _logout_handler(self, token_value: str = None, stateful: bool = True, client_id: str = None) -> dict:
         """Log out by revoking the current token.
 
         This method can also be leveraged to revoke other tokens.
         """
         try:
-            if self.cred_format_valid:
+            if self.cred_format_valid and stateful and not token_value and self._shares_token():
+                # Other authentication objects and processes may still be using the shared
+                # token, so only this object's handle is released and the token is left to expire.
+                self._release_token()
+                returned = {"status_code": 200, "headers": {}, "body": {"meta": {}, "resources": [], "errors": []}}
+            elif self.cred_format_valid:
                 if not token_value:
                     token_value = self.token_value
                 operation, target_url, data_payload, header_payload = logout_payloads(
@@ -334,10 +460,14 @@ class FalconInterface(BaseFalconAuth):
                                            headers=header_payload, verify=self.ssl_verify,
                                            proxy=self.proxy, timeout=self.timeout,
                                            user_agent=self.user_agent, log_util=self.log,
-                                           sanitize=self.sanitize_log
+                                           sanitize=self.sanitize_log, session=self.connection_pool,
+                                           codec=self.json_codec
                                            )
                 if stateful:
-                    self.bearer_token: BearerToken = BearerToken()
+                    # Remove the revoked token from the token store so it is not reused.
+                    if self.token_store:
+                        self.token_store.discard(self._token_key, token_value)
+                    self._release_token()
             else:
                 raise InvalidCredentials
         except InvalidCredentials as bad_creds:
@@ -347,6 +477,97 @@ class FalconInterface(BaseFalconAuth):
 
         return returned
 
+    def _shares_token(self) -> bool:
+        """Return a boolean indicating if logging out leaves the token shared through the token store."""
+        return bool(self.token_store) and not self.revoke_on_logout
+
+    def _release_token(self):
+        """Drop the current token and release the resources used by this object."""
+        self.bearer_token: BearerToken = BearerToken()
+        self._cancel_refresh()
+        # Release our pooled connections, they are recreated on the next request.
+        self.connection_pool.close()
+
+    # Token refreshes are single-flight. When many threads find the token stale at the same
+    # time, only one of them requests a new token. The others continue to use the current
+    # token while it has not expired, or wait for the refresh to complete when it has.
+    def _refresh_token(self):
+        """Refresh a stale token, ensuring only one thread performs the token request."""
+        generation = self._token_generation
+        if self._token_lock.acquire(blocking=self.token_remaining <= 0):  # pylint: disable=R1732
+            try:
+                # Skip the request when another thread received a token while we were waiting.
+                if generation == self._token_generation and self.token_stale:
+                    self.login()
+            finally:
+                self._token_lock.release()
+
+    def _preemptive_refresh(self):
+        """Refresh the token before it becomes stale unless a refresh is already in progress."""
+        if self._token_lock.acquire(blocking=False):  # pylint: disable=R1732
+            try:
+                if self.log:
+                    self.log.debug("Performing background token refresh")
+                current = self.bearer_token
+                self.login()
+                if self.token_status == 201:
+                    self._refresh_failures = 0
+                else:
+                    self._refresh_failed(current)
+            finally:
+                self._token_lock.release()
+
+    def _refresh_failed(self, current: BearerToken):
+        """Keep using the current token while it has not expired and retry the refresh with a backoff.
+
+        Once the current token expires the next request requests a new token instead.
+        """
+        self._refresh_failures += 1
+        status = self.token_status
+        remaining = current.expiration - (time.time() - current.token_time)
+        if current.value and remaining > 1:
+            self.bearer_token = current
+            self.token_status = 201
+            delay = min(2 ** (self._refresh_failures - 1), REFRESH_BACKOFF_MAX, remaining / 2)
+            if self.log:
+                self.log.warning("Background token refresh failed with status %s, retrying in %.2f seconds",
+                                 status, delay
+                                 )
+            self._schedule_refresh(delay)
+        elif self.log:
+            self.log.warning("Background token refresh failed with status %s, the current token has expired",
+                             status
+                             )
+
+    @staticmethod
+    def _refresh_in_background(refresh: weakref.WeakMethod):
+        """Refresh the token for an interface that still exists. Executed by the refresh timer."""
+        preemptive_refresh = refresh()
+        if preemptive_refresh:
+            preemptive_refresh()
+
+    def _schedule_refresh(self, delay: Optional[float] = None):
+        """Start a timer to refresh the token when it becomes stale, if background refresh is enabled.
+
+        The timer fires once the token enters the renew window unless a delay is provided.
+        """
+        self._cancel_refresh()
+        if self.background_refresh and self.refreshable and not self.asynchronous and self.token_value:
+            if delay is None:
+                delay = max(self.token_remaining - self.renew_window, 0)
+            # The timer only holds a weak reference so it does not keep this interface alive.
+            self._refresh_timer = Timer(delay, self._refresh_in_background,
+                                        args=(weakref.WeakMethod(self._preemptive_refresh),)
+                                        )
+            self._refresh_timer.daemon = True
+            self._refresh_timer.start()
+
+    def _cancel_refresh(self):
+        """Cancel any pending background token refresh."""
+        if self._refresh_timer:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+
     #  _____   ______  _____   _____  _______  ______ _______ _____ _______ _______
     # |_____] |_____/ |     | |_____] |______ |_____/    |      |   |______ |______
     # |       |    \_ |_____| |       |______ |    \_    |    __|__ |______ ______|
@@ -500,6 +721,128 @@ class FalconInterface(BaseFalconAuth):
     def token_value(self, value: str):
         self.bearer_token.value = value
 
+    @property
+    def connection_pool(self) -> ConnectionPool:
+        """Return the pooled HTTP session used by this interface."""
+        return self._pool
+
+    @connection_pool.setter
+    def connection_pool(self, value: ConnectionPool):
+        """Set the pooled HTTP session used by this interface."""
+        self._pool = value
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """Return the rate limit scheduler used by this interface."""
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, value: Optional[RateLimiter]):
+        """Set the rate limit scheduler used by this interface."""
+        self._rate_limiter = value
+
+    @property
+    def background_refresh(self) -> bool:
+        """Return a boolean indicating if tokens are refreshed in the background before they become stale."""
+        return self._background_refresh
+
+    @background_refresh.setter
+    def background_refresh(self, value: bool):
+        """Enable or disable background token refresh."""
+        self._background_refresh = value
+        self._schedule_refresh()
+
+    @property
+    def token_store(self) -> Optional[TokenStore]:
+        """Return the token store used to share tokens with other authentication objects."""
+        return self._token_store
+
+    @token_store.setter
+    def token_store(self, value: Optional[TokenStore]):
+        """Set the token store used by this interface."""
+        self._token_store = value
+
+    @property
+    def revoke_on_logout(self) -> bool:
+        """Return a boolean indicating if tokens shared through the token store are revoked on logout."""
+        return self._revoke_on_logout
+
+    @revoke_on_logout.setter
+    def revoke_on_logout(self, value: bool):
+        """Enable or disable revocation of shared tokens on logout."""
+        self._revoke_on_logout = value
+
+    @property
+    def token_key(self) -> str:
+        """Return the key this interface's token is shared under within the token store."""
+        return self._token_key
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        """Return the JSON codec used to encode request bodies and decode responses."""
+        return self._json_codec
+
+    @json_codec.setter
+    def json_codec(self, value: Union[JSONCodec, str]):
+        """Set the JSON codec used by this interface, accepts a codec or the name of a JSON library."""
+        self._json_codec = JSONCodec.create(value)
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """Return the response cache used by this interface."""
+        return self._response_cache
+
+    @response_cache.setter
+    def response_cache(self, value: Optional[Union[ResponseCache, Dict[str, Any], bool]]):
+        """Set the response cache used by this interface."""
+        self._response_cache = ResponseCache.create(value)
+
+    @property
+    def request_coalescer(self) -> Optional[RequestCoalescer]:
+        """Return the request coalescer used by this interface."""
+        return self._request_coalescer
+
+    @request_coalescer.setter
+    def request_coalescer(self, value: Optional[Union[RequestCoalescer, Dict[str, Any], bool]]):
+        """Set the request coalescer used by this interface."""
+        self._request_coalescer = RequestCoalescer.create(value)
+
+    @property
+    def rate_limit(self) -> Optional[RateLimitBucket]:
+        """Return the rate limit budget for our client ID, member CID and base URL.
+
+        Child CIDs have separate budgets, so MSSP member authentications are tracked individually.
+        """
+        _returned = None
+        if self._rate_limiter:
+            _returned = self._rate_limiter.bucket(self._identity(), self.base_url)
+
+        return _returned
+
+    @property
+    def cache_scope(self) -> Optional[ResponseCacheScope]:
+        """Return the cached responses for our client ID, member CID and base URL.
+
+        Interfaces authenticated using a provided token are scoped to a digest of the token.
+        """
+        _returned = None
+        if self._response_cache is not None:
+            _returned = self._response_cache.scope(self._identity(token_digest=True), self.base_url)
+
+        return _returned
+
+    @property
+    def coalescer_scope(self) -> Optional[RequestCoalescerScope]:
+        """Return the request coalescing scope for our client ID, member CID and base URL.
+
+        Interfaces authenticated using a provided token are scoped to a digest of the token.
+        """
+        _returned = None
+        if self._request_coalescer is not None:
+            _returned = self._request_coalescer.scope(self._identity(token_digest=True), self.base_url)
+
+        return _returned
+
     @property
     def pythonic(self) -> bool:
         """Return a boolean if we are in a pythonic mode."""
@@ -511,6 +854,11 @@ class FalconInterface(BaseFalconAuth):
         self._pythonic = value
 
     # All properties defined here are by design IMMUTABLE.
+    @property
+    def asynchronous(self) -> bool:
+        """Return a boolean indicating if requests made using this interface are asynchronous."""
+        return False
+
     @property
     def refreshable(self) -> bool:
         """Return a boolean if this interface can automatically refresh tokens when they expire."""
@@ -521,6 +869,11 @@ class FalconInterface(BaseFalconAuth):
         """Return whether the token is ready to be renewed."""
         return (time.time() - self.token_time) >= (self.token_expiration - self.renew_window)
 
+    @property
+    def token_remaining(self) -> float:
+        """Return the number of seconds remaining before the token expires."""
+        return self.token_expiration - (time.time() - self.token_time)
+
     @property
     def token_valid(self) -> bool:
         """Return if we are authenticated by retrieving the inverse of token_expired."""
@@ -551,7 +904,7 @@ class FalconInterface(BaseFalconAuth):
     def auth_headers(self) -> Dict[str, str]:
         """Return a Bearer token baked into an Authorization header ready for an HTTP request."""
         if self.token_stale and self.refreshable:
-            self.login()
+            self._refresh_token()
 
         return {"Authorization": f"Bearer {self.token_value}"}
 
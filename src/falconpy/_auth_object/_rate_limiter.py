@@ -0,0 +1,308 @@
+"""Rate limit scheduler class.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import time
+from email.utils import parsedate_to_datetime
+from logging import Logger
+from random import uniform
+from threading import Lock
+from typing import Awaitable, Callable, Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
+from requests import Response
+
+
+class RateLimitBucket:
+    """This class tracks the rate limit budget for a single client ID and base URL combination.
+
+    Budget details are updated from the X-Ratelimit headers returned by every API response.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, scheduler: "RateLimiter"):
+        """Construct an instance of the RateLimitBucket class."""
+        self._scheduler: RateLimiter = scheduler
+        self._lock: Lock = Lock()
+        self._limit: Optional[int] = None
+        self._remaining: Optional[int] = None
+        self._next_slot: float = 0.0
+        self._blocked_until: float = 0.0
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def acquire(self) -> float:
+        """Wait until a request may be sent without exhausting the remaining budget.
+
+        Returns the number of seconds spent waiting.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+        return delay
+
+    async def acquire_async(self) -> float:
+        """Wait without blocking the event loop until a request may be sent."""
+        import asyncio  # pylint: disable=C0415
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        return delay
+
+    def _reserve(self) -> float:
+        """Reserve budget for the next request and return how long to wait before sending it."""
+        with self._lock:
+            now = time.monotonic()
+            delay = max(self._blocked_until - now, 0.0)
+            if self._limit and self._remaining is not None:
+                if self._remaining <= self._limit * self._scheduler.reserve:
+                    # Running low, spread the remaining calls evenly across the rate limit window.
+                    slot = max(self._next_slot, now + delay)
+                    self._next_slot = slot + (self._scheduler.window / self._limit)
+                    delay = slot - now
+                # Assume this request consumes budget until the response tells us otherwise.
+                self._remaining = max(self._remaining - 1, 0)
+
+        return delay
+
+    def update(self, response: Response) -> Optional[float]:
+        """Update the budget from the response headers.
+
+        Returns the number of seconds the API asked us to wait, if any.
+        """
+        headers = response.headers
+        retry_after = None
+        with self._lock:
+            try:
+                self._limit = int(headers["X-Ratelimit-Limit"])
+                self._remaining = int(headers["X-Ratelimit-Remaining"])
+            except (KeyError, TypeError, ValueError):
+                pass
+            if response.status_code in self._scheduler.retry_status:
+                retry_after = retry_after_seconds(headers)
+                if retry_after is None and response.status_code == 429:
+                    # Rate limited without guidance, wait for the rate limit window to roll over.
+                    retry_after = self._scheduler.window / max(self._limit or 1, 1)
+                if retry_after is not None:
+                    self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+        return retry_after
+
+    def perform(self, requester: Callable[..., Response], method: str, url: str,
+                log_util: Optional[Logger] = None, **kwargs
+                ) -> Response:
+        """Perform the request, pacing and retrying as necessary."""
+        attempt = 0
+        while True:
+            self.acquire()
+            response = requester(method, url, **kwargs)
+            retry_after = self.update(response)
+            if not self._scheduler.retryable(response.status_code, method) or attempt >= self._scheduler.max_retries:
+                break
+            delay = self._scheduler.backoff(attempt, retry_after)
+            if log_util:
+                log_util.debug("RATE LIMIT: Received %s, retrying in %.2f seconds (attempt %s of %s)",
+                               response.status_code, delay, attempt + 1, self._scheduler.max_retries
+                               )
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+        return response
+
+    async def perform_async(self, requester: Callable[..., Awaitable[Response]], method: str, url: str,
+                            log_util: Optional[Logger] = None, **kwargs
+                            ) -> Response:
+        """Perform the asynchronous request, pacing and retrying as necessary."""
+        import asyncio  # pylint: disable=C0415
+        attempt = 0
+        while True:
+            await self.acquire_async()
+            response = await requester(method, url, **kwargs)
+            retry_after = self.update(response)
+            if not self._scheduler.retryable(response.status_code, method) or attempt >= self._scheduler.max_retries:
+                break
+            delay = self._scheduler.backoff(attempt, retry_after)
+            if log_util:
+                log_util.debug("RATE LIMIT: Received %s, retrying in %.2f seconds (attempt %s of %s)",
+                               response.status_code, delay, attempt + 1, self._scheduler.max_retries
+                               )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        return response
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def limit(self) -> Optional[int]:
+        """Return the last reported rate limit."""
+        return self._limit
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Return the estimated remaining budget."""
+        return self._remaining
+
+
+class RateLimiter:
+    """This class represents a rate limit aware request scheduler.
+
+    Requests are paced once the remaining budget reported by the API falls below the reserve,
+    and throttled (429) or unavailable (503) responses are retried using jittered exponential
+    backoff that honors any Retry-After value provided. Throttled requests were not processed
+    by the API and are retried for every HTTP method, while other statuses are only retried for
+    safe methods, as a POST or PATCH may have been applied before the error was returned.
+    Budgets are tracked separately for every client ID and base URL combination.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 max_retries: Optional[int] = 5,
+                 backoff_base: Optional[float] = 0.5,
+                 backoff_max: Optional[float] = 60.0,
+                 reserve: Optional[float] = 0.1,
+                 window: Optional[float] = 60.0,
+                 retry_status: Optional[Tuple[int, ...]] = (429, 503),
+                 safe_methods: Optional[Tuple[str, ...]] = ("GET", "HEAD")
+                 ):
+        """Construct an instance of the RateLimiter class.
+
+        Keyword arguments
+        ----
+        max_retries : int
+            Maximum number of times a throttled request is retried. Defaults to 5.
+        backoff_base : float
+            Initial backoff delay in seconds, doubled with every retry. Defaults to 0.5.
+        backoff_max : float
+            Maximum backoff delay in seconds. Defaults to 60.
+        reserve : float
+            Fraction of the rate limit remaining at which requests start being paced. Defaults to 0.1.
+        window : float
+            Length of the rate limit window in seconds. Defaults to 60.
+        retry_status : tuple
+            HTTP status codes that are retried. Defaults to (429, 503).
+        safe_methods : tuple
+            HTTP methods retried for statuses other than 429. Defaults to ("GET", "HEAD").
+        """
+        self._lock: Lock = Lock()
+        self._buckets: Dict[Tuple[str, str], RateLimitBucket] = {}
+        self.max_retries: int = max_retries if isinstance(max_retries, int) and max_retries >= 0 else 5
+        self.backoff_base: float = float(backoff_base) if isinstance(backoff_base, (int, float)) else 0.5
+        self.backoff_max: float = float(backoff_max) if isinstance(backoff_max, (int, float)) else 60.0
+        self.reserve: float = min(max(float(reserve), 0.0), 1.0) if isinstance(reserve, (int, float)) else 0.1
+        self.window: float = float(window) if isinstance(window, (int, float)) and window > 0 else 60.0
+        self.retry_status: Tuple[int, ...] = tuple(retry_status) if retry_status else (429, 503)
+        self.safe_methods: Tuple[str, ...] = tuple(meth.upper() for meth in safe_methods) if safe_methods else ("GET", "HEAD")
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def bucket(self, client_id: str, base_url: str) -> RateLimitBucket:
+        """Return the budget tracker for the provided client ID and base URL."""
+        key = (str(client_id), urlparse(base_url).netloc or base_url)
+        returned = self._buckets.get(key)
+        if returned is None:
+            with self._lock:
+                returned = self._buckets.setdefault(key, RateLimitBucket(self))
+
+        return returned
+
+    def retryable(self, status_code: int, method: str) -> bool:
+        """Return a boolean indicating if a response with this status should be retried for the HTTP method."""
+        return bool(status_code in self.retry_status
+                    and (status_code == 429 or method.upper() in self.safe_methods)
+                    )
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Calculate the delay before the next retry attempt.
+
+        Uses exponential backoff with full jitter. When the API provides a Retry-After
+        value, the delay is never shorter than the requested wait.
+        """
+        delay = uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        if retry_after is not None:
+            delay = min(retry_after, self.backoff_max) + delay / 2
+
+        return delay
+
+    @classmethod
+    def create(cls, provided: Optional[Union["RateLimiter", Dict[str, Union[int, float]], bool]] = None
+               ) -> Optional["RateLimiter"]:
+        """Return the provided scheduler, or a new scheduler if requested. Disabled by default."""
+        returned = None
+        if isinstance(provided, RateLimiter):
+            returned = provided
+        elif isinstance(provided, dict):
+            returned = cls(**provided)
+        elif provided is True:
+            returned = cls()
+
+        return returned
+
+
+def retry_after_seconds(headers: Dict[str, str]) -> Optional[float]:
+    """Return the number of seconds to wait as specified by the response headers."""
+    returned = None
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            returned = max(float(retry_after), 0.0)
+        except ValueError:
+            try:
+                returned = max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+            except (TypeError, ValueError):
+                pass
+    if returned is None:
+        # The Falcon API provides the epoch time the rate limit resets.
+        try:
+            returned = max(float(headers["X-Ratelimit-Retryafter"]) - time.time(), 0.0)
+        except (KeyError, TypeError, ValueError):
+            pass
+
+    return returned
@@ -0,0 +1,199 @@
+"""Single-flight coalescing of identical in-flight requests.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from threading import Event, Lock
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+from urllib.parse import urlparse
+from requests import Response
+from ._response_cache import request_key
+
+# POST operations that only retrieve data, and can be coalesced in addition to GET operations.
+READ_ONLY_OPERATIONS = frozenset({
+    "PostDeviceDetailsV2", "GetDeviceDetails", "GetEntityIDsByQueryPOST", "GetDetectSummaries",
+    "GetAggregateDetects", "GetBehaviors", "GetIncidents", "GetIntelIndicatorEntities", "GetVulnerabilities",
+    "GetSensorDetails", "GetSensorAggregates", "getChildrenV2", "GetCaseEntitiesByIDs", "GetCaseActivityByIds",
+    "GetEventsEntities", "GetRulesEntities", "GetAggregateFiles", "GetQuarantineFiles", "GetScansAggregates",
+    "GetServicesCount", "GetHostMigrationsV1", "GetMigrationDestinationsV1", "PostEntitiesAlertsV1",
+    "PostEntitiesAlertsV2", "retrieveUsersGETV1"
+    })
+
+
+class InFlightRequest:  # pylint: disable=R0903
+    """This class represents a request that is being performed on behalf of every waiting caller."""
+
+    __slots__ = ("done", "response", "error")
+
+    def __init__(self):
+        """Construct an instance of the InFlightRequest class."""
+        self.done: Event = Event()
+        self.response: Optional[Response] = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescerScope:
+    """This class coalesces the identical requests performed by a single client ID and base URL combination."""
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, coalescer: "RequestCoalescer", identity: Tuple[str, str]):
+        """Construct an instance of the RequestCoalescerScope class."""
+        self._coalescer: RequestCoalescer = coalescer
+        self._identity: Tuple[str, str] = identity
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def coalescable(self, api: Any) -> bool:
+        """Return a boolean indicating if this request may be shared with identical concurrent requests."""
+        return bool(api.operation
+                    and not api.stream
+                    and not api.files
+                    and not api.data_payload
+                    and (api.method.upper() == "GET" or api.operation in self._coalescer.operations)
+                    )
+
+    def perform(self, fetch: Callable[[], Response], api: Any) -> Response:
+        """Perform the request, or wait for an identical request that is already being performed.
+
+        Every caller receives the same response, or the same exception, and decodes its own result.
+        """
+        return self._coalescer.perform(request_key(self._identity, api), fetch)
+
+
+class RequestCoalescer:
+    """This class represents a single-flight layer for idempotent requests.
+
+    While a request is being performed, identical requests (same identity, operation ID, URL
+    and normalized payloads) wait for it to complete instead of being sent to the API.
+    GET operations and the POST operations that only retrieve data are coalesced.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, operations: Optional[Iterable[str]] = None):
+        """Construct an instance of the RequestCoalescer class.
+
+        Keyword arguments
+        ----
+        operations : list of str
+            Additional non-GET operation IDs that are safe to coalesce.
+        """
+        self._lock: Lock = Lock()
+        self._in_flight: Dict[Tuple[Any, ...], InFlightRequest] = {}
+        self._scopes: Dict[Tuple[str, str], RequestCoalescerScope] = {}
+        self._counters: Dict[str, int] = {"performed": 0, "coalesced": 0}
+        self.operations: frozenset = READ_ONLY_OPERATIONS.union(operations or [])
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def scope(self, client_id: str, base_url: str) -> RequestCoalescerScope:
+        """Return the coalescing scope for the provided client ID and base URL."""
+        key = (str(client_id), urlparse(base_url).netloc or base_url)
+        returned = self._scopes.get(key)
+        if returned is None:
+            with self._lock:
+                returned = self._scopes.setdefault(key, RequestCoalescerScope(self, key))
+
+        return returned
+
+    def perform(self, key: Tuple[Any, ...], fetch: Callable[[], Response]) -> Response:
+        """Return the response for the key, performing the request only if it is not already in flight."""
+        with self._lock:
+            flight = self._in_flight.get(key, None)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[key] = InFlightRequest()
+                self._counters["performed"] += 1
+            else:
+                self._counters["coalesced"] += 1
+
+        if leader:
+            try:
+                flight.response = fetch()
+            except BaseException as err:  # Shared with the waiting callers, then raised
+                flight.error = err
+                raise
+            finally:
+                with self._lock:
+                    del self._in_flight[key]
+                flight.done.set()
+        else:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+
+        return flight.response
+
+    @classmethod
+    def create(cls, provided: Optional[Union["RequestCoalescer", Dict[str, Any], bool]] = None
+               ) -> Optional["RequestCoalescer"]:
+        """Return the provided coalescer, or a new coalescer if requested. Disabled by default."""
+        returned = None
+        if isinstance(provided, RequestCoalescer):
+            returned = provided
+        elif isinstance(provided, dict):
+            returned = cls(**provided)
+        elif provided is True:
+            returned = cls()
+
+        return returned
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests currently being performed."""
+        return len(self._in_flight)
+
+    @property
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Return the number of requests performed and coalesced."""
+        with self._lock:
+            returned = {**self._counters, "in_flight": len(self._in_flight)}
+        total = returned["performed"] + returned["coalesced"]
+        returned["coalesced_ratio"] = round(returned["coalesced"] / total, 4) if total else 0.0
+
+        return returned
@@ -0,0 +1,294 @@
+"""Response cache for idempotent API operations.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import json
+import time
+from collections import OrderedDict
+from logging import Logger
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+
+def request_key(identity: Tuple[str, str], api: Any) -> Tuple[Any, ...]:
+    """Return a key identifying identical requests performed by the same identity."""
+    return (*identity,
+            api.operation,
+            api.endpoint,
+            json.dumps(api.param_payload, sort_keys=True, default=str) if api.param_payload else None,
+            json.dumps(api.body_payload, sort_keys=True, default=str) if api.body_payload else None
+            )
+
+
+class CachedResponse:  # pylint: disable=R0903
+    """This class represents a response retained by the response cache."""
+
+    __slots__ = ("status_code", "headers", "content", "etag", "expires", "size")
+
+    def __init__(self, response: Response, ttl: float):
+        """Construct an instance of the CachedResponse class."""
+        self.status_code: int = response.status_code
+        self.headers: Dict[str, str] = dict(response.headers)
+        self.content: bytes = response.content or b""
+        self.etag: Optional[str] = response.headers.get("ETag", None)
+        self.expires: float = time.monotonic() + ttl
+        self.size: int = len(self.content) + sum(len(key) + len(str(val)) for key, val in self.headers.items())
+
+    def response(self, url: str) -> Response:
+        """Return a new response object containing the cached content."""
+        returned = Response()
+        returned.status_code = self.status_code
+        returned.headers = CaseInsensitiveDict(self.headers)
+        returned._content = self.content  # pylint: disable=W0212
+        returned.url = url
+
+        return returned
+
+
+class ResponseCacheScope:
+    """This class provides access to the responses cached for a single client ID and base URL combination.
+
+    Responses are never shared between client IDs or child CIDs.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, cache: "ResponseCache", identity: Tuple[str, str]):
+        """Construct an instance of the ResponseCacheScope class."""
+        self._cache: ResponseCache = cache
+        self._identity: Tuple[str, str] = identity
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def cacheable(self, api: Any) -> bool:
+        """Return a boolean indicating if the response to this request may be cached."""
+        return bool(api.operation
+                    and not api.stream
+                    and not api.files
+                    and not api.data_payload
+                    and self._cache.ttl_for(api.operation, api.method) > 0
+                    )
+
+    def perform(self, requester: Callable[..., Response], api: Any, headers: Dict[str, str],
+                log_util: Optional[Logger] = None
+                ) -> Response:
+        """Return the cached response for this request, performing the request when necessary.
+
+        Fresh responses are returned without contacting the API. Expired responses that provided
+        an ETag are revalidated using If-None-Match, and are returned when the API reports they
+        have not been modified (304).
+        """
+        key = request_key(self._identity, api)
+        entry = self._cache.lookup(key)
+        if entry and entry.expires > time.monotonic():
+            self._cache.record("hits")
+            if log_util:
+                log_util.debug("CACHE: Returning cached response for %s", api.operation)
+            return entry.response(api.endpoint)
+
+        if entry and entry.etag:
+            response = requester(headers={**headers, "If-None-Match": entry.etag})
+            if response.status_code == 304:
+                response.close()
+                self._cache.refresh(key, entry, self._cache.ttl_for(api.operation, api.method))
+                self._cache.record("revalidated")
+                if log_util:
+                    log_util.debug("CACHE: Revalidated cached response for %s", api.operation)
+                return entry.response(api.endpoint)
+        else:
+            response = requester(headers=headers)
+
+        self._cache.record("misses")
+        if response.status_code == 200:
+            self._cache.store(key, CachedResponse(response, self._cache.ttl_for(api.operation, api.method)))
+
+        return response
+
+
+class ResponseCache:
+    """This class represents a least recently used cache of responses to idempotent operations.
+
+    Successful responses to GET operations are cached by operation ID, URL and the normalized query
+    string and body payloads. Other operations, such as POST entity lookups, are cached when a TTL
+    is specified for the operation. The cache is limited by the total size of the retained responses.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 ttl: Optional[float] = 60.0,
+                 ttls: Optional[Dict[str, float]] = None,
+                 max_bytes: Optional[int] = 64 * 1024 * 1024
+                 ):
+        """Construct an instance of the ResponseCache class.
+
+        Keyword arguments
+        ----
+        ttl : float
+            Number of seconds GET responses are considered fresh. Defaults to 60.
+            Provide 0 to only cache the operations specified in ttls.
+        ttls : dict
+            Number of seconds responses are considered fresh, by operation ID. Operations
+            listed here are cached regardless of HTTP method, provide 0 to disable caching
+            for an operation. (Example: {"PostDeviceDetailsV2": 300, "QueryDevicesByFilter": 0})
+        max_bytes : int
+            Maximum total size of the cached responses. Defaults to 64 MiB.
+        """
+        self._lock: Lock = Lock()
+        self._entries: "OrderedDict[Tuple[Any, ...], CachedResponse]" = OrderedDict()
+        self._scopes: Dict[Tuple[str, str], ResponseCacheScope] = {}
+        self._size: int = 0
+        self._counters: Dict[str, int] = {"hits": 0, "misses": 0, "revalidated": 0, "evicted": 0}
+        self.ttl: float = max(float(ttl), 0.0) if isinstance(ttl, (int, float)) else 60.0
+        self.ttls: Dict[str, float] = dict(ttls) if isinstance(ttls, dict) else {}
+        self.max_bytes: int = int(max_bytes) if isinstance(max_bytes, int) and max_bytes > 0 else 64 * 1024 * 1024
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def scope(self, client_id: str, base_url: str) -> ResponseCacheScope:
+        """Return the cache scope for the provided client ID and base URL."""
+        key = (str(client_id), urlparse(base_url).netloc or base_url)
+        returned = self._scopes.get(key)
+        if returned is None:
+            with self._lock:
+                returned = self._scopes.setdefault(key, ResponseCacheScope(self, key))
+
+        return returned
+
+    def ttl_for(self, operation: str, method: str) -> float:
+        """Return the number of seconds responses to this operation are considered fresh."""
+        returned = self.ttls.get(operation, None)
+        if returned is None:
+            returned = self.ttl if method.upper() == "GET" else 0.0
+
+        return returned
+
+    def lookup(self, key: Tuple[Any, ...]) -> Optional[CachedResponse]:
+        """Return the cached response for the key, marking it as recently used."""
+        with self._lock:
+            returned = self._entries.get(key, None)
+            if returned is not None:
+                self._entries.move_to_end(key)
+
+        return returned
+
+    def store(self, key: Tuple[Any, ...], entry: CachedResponse):
+        """Cache the response, evicting the least recently used responses as necessary."""
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+                self._counters["evicted"] += 1
+
+    def refresh(self, key: Tuple[Any, ...], entry: CachedResponse, ttl: float):
+        """Extend the lifetime of a cached response that was successfully revalidated."""
+        entry.expires = time.monotonic() + ttl
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+
+    def record(self, counter: str):
+        """Increment the specified counter."""
+        with self._lock:
+            self._counters[counter] += 1
+
+    def invalidate(self, operation: Optional[str] = None):
+        """Remove the cached responses for the specified operation ID, or every cached response."""
+        with self._lock:
+            for key in [key for key in self._entries if operation is None or key[2] == operation]:
+                self._size -= self._entries.pop(key).size
+
+    def clear(self):
+        """Remove every cached response and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._counters = {counter: 0 for counter in self._counters}
+
+    @classmethod
+    def create(cls, provided: Optional[Union["ResponseCache", Dict[str, Any], bool]] = None
+               ) -> Optional["ResponseCache"]:
+        """Return the provided cache, or a new cache if requested. Disabled by default."""
+        returned = None
+        if isinstance(provided, ResponseCache):
+            returned = provided
+        elif isinstance(provided, dict):
+            returned = cls(**provided)
+        elif provided is True:
+            returned = cls()
+
+        return returned
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def size(self) -> int:
+        """Return the total size of the cached responses in bytes."""
+        return self._size
+
+    @property
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Return the cache hit, miss, revalidation and eviction counts along with the current usage."""
+        with self._lock:
+            returned = {**self._counters, "entries": len(self._entries), "bytes": self._size}
+        lookups = returned["hits"] + returned["revalidated"] + returned["misses"]
+        returned["hit_ratio"] = round((returned["hits"] + returned["revalidated"]) / lookups, 4) if lookups else 0.0
+
+        return returned
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
@@ -0,0 +1,214 @@
+"""Shared token store classes.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import json
+import os
+import time
+from contextlib import contextmanager
+from hashlib import sha256
+from tempfile import NamedTemporaryFile
+from threading import Lock, RLock
+from typing import Dict, Iterator, Optional, Union
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # File locking is unavailable on this platform, only threads within this process are coordinated.
+    fcntl = None
+
+
+class TokenStore:
+    """This class represents a store of bearer tokens shared by multiple authentication objects.
+
+    Tokens are stored by key, which is derived from the client ID, member CID and base URL
+    used to generate the token. Client secrets are never stored. This base implementation
+    keeps tokens in memory and shares them within a single process. Inheriting classes
+    override the load, save, discard and lock methods to share tokens between processes.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self):
+        """Construct an instance of the TokenStore class."""
+        self._tokens: Dict[str, Dict[str, Union[str, float]]] = {}
+        self._locks: Dict[str, RLock] = {}
+        self._lock: Lock = Lock()
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def load(self, key: str) -> Optional[Dict[str, Union[str, float]]]:
+        """Return the stored token record for this key if it has not expired."""
+        return self.usable(self._tokens.get(key))
+
+    def save(self, key: str, record: Dict[str, Union[str, float]]):
+        """Store a token record (access_token, expires_at, base_url) for this key."""
+        self._tokens[key] = record
+
+    def discard(self, key: str, token_value: Optional[str] = None):
+        """Remove the stored token for this key, only if it matches the token value when provided."""
+        record = self._tokens.get(key)
+        if record and (not token_value or record.get("access_token") == token_value):
+            del self._tokens[key]
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold the renewal lock for this key, allowing only one token request at a time."""
+        with self._lock:
+            key_lock = self._locks.setdefault(key, RLock())
+        with key_lock:
+            yield
+
+    @staticmethod
+    def usable(record: Optional[dict]) -> Optional[Dict[str, Union[str, float]]]:
+        """Return the token record provided if it contains a token that has not expired."""
+        returned = None
+        try:
+            if record["access_token"] and float(record["expires_at"]) > time.time():
+                returned = record
+        except (KeyError, TypeError, ValueError):
+            # Missing or malformed token record.
+            pass
+
+        return returned
+
+    @staticmethod
+    def token_key(creds: Dict[str, str], base_url: str) -> str:
+        """Return the store key for the client ID, member CID and base URL provided."""
+        identity = "|".join([creds.get("client_id", ""), creds.get("member_cid", ""), base_url])
+
+        return sha256(identity.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def create(cls, provided: Optional[Union["TokenStore", str, bool]] = None) -> Optional["TokenStore"]:
+        """Return the provided store, or a new file store if requested. Disabled by default.
+
+        Provide True to use the default token directory, or a string to specify the directory.
+        """
+        returned = None
+        if isinstance(provided, TokenStore):
+            returned = provided
+        elif isinstance(provided, str):
+            returned = FileTokenStore(provided)
+        elif provided is True:
+            returned = FileTokenStore()
+
+        return returned
+
+
+class FileTokenStore(TokenStore):
+    """This class represents a token store shared by every process on the same host.
+
+    Each token is stored as a JSON file within the token directory, readable only by the
+    current user. Token renewal is coordinated between processes using a lock file per key,
+    so sibling workers reuse a single token instead of requesting their own.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, path: Optional[str] = None):
+        """Construct an instance of the FileTokenStore class.
+
+        Keyword arguments
+        ----
+        path : str
+            Directory used to store tokens. Defaults to ~/.falconpy/tokens.
+        """
+        super().__init__()
+        self._path: str = os.path.expanduser(path if path else os.path.join("~", ".falconpy", "tokens"))
+        os.makedirs(self._path, mode=0o700, exist_ok=True)
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def load(self, key: str) -> Optional[Dict[str, Union[str, float]]]:
+        """Return the stored token record for this key if it has not expired."""
+        try:
+            with open(self._file(key), "r", encoding="utf-8") as token_file:
+                record = json.load(token_file)
+        except (OSError, ValueError):
+            # No token has been stored or the file is unreadable.
+            record = None
+
+        return self.usable(record)
+
+    def save(self, key: str, record: Dict[str, Union[str, float]]):
+        """Store a token record for this key, replacing the token file atomically."""
+        with NamedTemporaryFile("w", dir=self._path, prefix=f".{key}.", delete=False, encoding="utf-8") as temp:
+            json.dump(record, temp)
+        os.chmod(temp.name, 0o600)
+        os.replace(temp.name, self._file(key))
+
+    def discard(self, key: str, token_value: Optional[str] = None):
+        """Remove the stored token for this key, only if it matches the token value when provided."""
+        record = self.load(key)
+        if record and (not token_value or record.get("access_token") == token_value):
+            try:
+                os.remove(self._file(key))
+            except OSError:
+                pass
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold the renewal lock for this key across every process using this token directory."""
+        with super().lock(key):
+            descriptor = os.open(self._file(key, "lock"), os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                if fcntl:
+                    fcntl.flock(descriptor, fcntl.LOCK_EX)
+                yield
+            finally:
+                # Closing the descriptor releases the file lock.
+                os.close(descriptor)
+
+    def _file(self, key: str, extension: str = "json") -> str:
+        """Return the path to the token file for this key."""
+        return os.path.join(self._path, f"{key}.{extension}")
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def path(self) -> str:
+        """Return the directory used to store tokens."""
+        return self._path
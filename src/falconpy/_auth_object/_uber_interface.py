@@ -35,11 +35,17 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
+from ._connection_pool import ConnectionPool
+from ._rate_limiter import RateLimiter
+from ._response_cache import ResponseCache
+from ._request_coalescer import RequestCoalescer
+from ._token_store import TokenStore
 from ._falcon_interface import FalconInterface
 from .._constant import MAX_DEBUG_RECORDS
-from .._endpoint import api_endpoints
-from .._util import confirm_base_url
+from .. import _endpoint
+from .._endpoint._registry import Endpoint
+from .._util import confirm_base_url, JSONCodec
 
 
 class UberInterface(FalconInterface):
@@ -51,8 +57,8 @@ class UberInterface(FalconInterface):
     #
     # Attributes present only within the Uber Class.
     #
-    # A dictionary of every available API operation provided by the library.
-    commands: List[List[Union[str, bool, int, List[dict]]]] = []
+    # A list of every available API operation provided by the library.
+    commands: List[Union[Endpoint, List[Union[str, List[dict]]]]] = []
 
     # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
     # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
@@ -61,7 +67,7 @@ class UberInterface(FalconInterface):
     # Starting in v1.3.0, the Uber Class constructs itself leveraging the generic
     # FalconAuth constructor. This results in the Uber Class benefiting from a new
     # authentication style; Legacy / Token authentication.
-    # pylint: disable=R0913
+    # pylint: disable=R0913,R0914,R0917
     def __init__(self,
                  access_token: Optional[Union[str, bool]] = False,
                  base_url: Optional[str] = "https://api.crowdstrike.com",
@@ -78,7 +84,15 @@ class UberInterface(FalconInterface):
                  debug_record_count: Optional[int] = MAX_DEBUG_RECORDS,
                  sanitize_log: Optional[bool] = None,
                  pythonic: Optional[bool] = None,
-                 environment: Optional[Dict[str, str]] = None
+                 environment: Optional[Dict[str, str]] = None,
+                 connection_pool: Optional[Union[ConnectionPool, Dict[str, Union[int, bool]]]] = None,
+                 rate_limit: Optional[Union[RateLimiter, Dict[str, Union[int, float]], bool]] = None,
+                 background_refresh: Optional[bool] = False,
+                 token_store: Optional[Union[TokenStore, str, bool]] = None,
+                 json_codec: Optional[Union[JSONCodec, str]] = None,
+                 response_cache: Optional[Union[ResponseCache, Dict[str, Any], bool]] = None,
+                 request_coalescer: Optional[Union[RequestCoalescer, Dict[str, Any], bool]] = None,
+                 revoke_on_logout: Optional[bool] = False
                  ):
         """Construct an instance of the UberInterface class.
 
@@ -111,6 +125,23 @@ class UberInterface(FalconInterface):
                             Max: 5000
         sanitize_log: Enable / Disable log sanitization of client IDs, secrets and tokens.
                       Boolean. Defaults to enabled.
+        connection_pool: Pooled HTTP session shared by all requests made with this object. ConnectionPool or
+                         a dictionary of pool settings (pool_connections, pool_maxsize, pool_block, keep_alive).
+        rate_limit: Enables rate limit aware pacing and retries of throttled requests. Boolean (default settings),
+                    a dictionary of settings, or an existing RateLimiter to share its budgets. Disabled by default.
+        background_refresh: Refresh the token in a background thread before it becomes stale. Boolean.
+                            Defaults to disabled.
+        token_store: Shares tokens with other authentication objects and processes using the same credentials.
+                     Boolean (default token directory), a directory path, or a TokenStore. Disabled by default.
+        json_codec: JSON library used to encode request bodies and decode responses. JSONCodec or the name
+                    of a library ("orjson", "ujson" or "json"). Defaults to the fastest installed library.
+        response_cache: Caches responses to idempotent operations. Boolean (default settings), a dictionary
+                        of settings (ttl, ttls, max_bytes), or an existing ResponseCache. Disabled by default.
+        request_coalescer: Shares identical in-flight idempotent requests between threads. Boolean (default
+                           settings), a dictionary of settings (operations), or an existing RequestCoalescer.
+                           Disabled by default.
+        revoke_on_logout: Revoke tokens shared through the token store when logging out. Boolean. Shared tokens
+                          are left to expire for other authentication objects by default.
         This method only accepts keywords to specify arguments.
         """
         super().__init__(base_url=confirm_base_url(base_url),
@@ -128,11 +159,19 @@ class UberInterface(FalconInterface):
                          debug_record_count=debug_record_count,
                          sanitize_log=sanitize_log,
                          pythonic=pythonic,
-                         environment=environment
+                         environment=environment,
+                         connection_pool=connection_pool,
+                         rate_limit=rate_limit,
+                         background_refresh=background_refresh,
+                         token_store=token_store,
+                         json_codec=json_codec,
+                         response_cache=response_cache,
+                         request_coalescer=request_coalescer,
+                         revoke_on_logout=revoke_on_logout
                          )
 
         # Complete list of available API operations.
-        self.commands = api_endpoints
+        self.commands = _endpoint.api_endpoints
 
     # _  _ ____ ___ _  _ ____ ___  ____
     # |\/| |___  |  |__| |  | |  \ [__
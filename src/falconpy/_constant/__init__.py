@@ -35,7 +35,7 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-from typing import List
+from typing import Dict, List
 from .._version import version
 PREFER_NONETYPE: List[str] = [
     "report_executions_download_get", "report_executions_download.get",
@@ -51,6 +51,10 @@ PREFER_IDS_IN_BODY: List[str] = [
 MOCK_OPERATIONS: List[str] = [
     "GetImageAssessmentReport", "DeleteImageDetails", "ImageMatchesPolicy"
 ]
+# Download operations with a parameter containing the SHA256 of the returned file
+DOWNLOAD_DIGEST_PARAMETERS: Dict[str, str] = {
+    "DownloadSensorInstallerById": "id", "DownloadSensorInstallerByIdV2": "id", "GetMalQueryDownloadV1": "ids"
+}
 # Restrict requests to only allowed HTTP methods
 ALLOWED_METHODS: List[str] = ['GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'UPDATE']
 # Default user-agent string
@@ -59,7 +63,29 @@ USER_AGENT: str = version(agent_string=True)
 MAX_DEBUG_RECORDS: int = 100
 # Global maximum number of records returned from any endpoint across all service collections
 GLOBAL_API_MAX_RETURN: int = 5000
+# Default number of IDs provided to each entity request when hydrating query results
+HYDRATE_CHUNK_SIZE: int = 100
+# Size (in bytes) of the chunks written to the destination by streaming downloads
+DOWNLOAD_CHUNK_SIZE: int = 65536
+# Maximum number of times an interrupted download is resumed using a Range request
+MAX_DOWNLOAD_RESUMES: int = 5
+# Size (in bytes) of the chunks read from the source by streaming multipart uploads
+UPLOAD_CHUNK_SIZE: int = 65536
+# Maximum size (in bytes) of the newline aligned chunks sent to the HEC raw ingest endpoint
+RAW_INGEST_CHUNK_SIZE: int = 10_240_000
+# Maximum number of seconds the HEC producer waits before retrying an unavailable collector
+MAX_INGEST_RETRY_DELAY: int = 60
+# Default number of seconds the HEC producer waits for enqueued events to be sent when it is closed
+INGEST_CLOSE_TIMEOUT: int = 30
+# Default event stream session refresh interval (in seconds) when one is not provided by the API
+STREAM_REFRESH_INTERVAL: int = 1800
+# Number of seconds before an event stream session expires that it is refreshed
+STREAM_REFRESH_MARGIN: int = 300
+# Maximum number of seconds to wait between event stream reconnection attempts
+MAX_STREAM_RECONNECT_DELAY: int = 60
 # Largest available token renew window (in seconds).
 MAX_TOKEN_RENEW_WINDOW: int = 1200
 # Minimum available token renew window (in seconds).
 MIN_TOKEN_RENEW_WINDOW: int = 120
+# Maximum delay (in seconds) between background token refresh attempts after a failure.
+REFRESH_BACKOFF_MAX: int = 60
@@ -0,0 +1,152 @@
+"""Compact endpoint registry.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from importlib import import_module
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Positions within an endpoint definition that are held by the compact record.
+_COMPACT_FIELDS = {
+    0: "operation_id", 1: "method", 2: "route", 4: "collection",
+    -6: "operation_id", -5: "method", -4: "route", -2: "collection"
+    }
+
+# Complete endpoint definitions, keyed by table and then operation ID.
+_DEFINITIONS: Dict[str, Dict[str, List[Any]]] = {}
+
+
+class Endpoint:
+    """This class represents a single API operation within the compact endpoint registry.
+
+    Records support the same positional access as the endpoint tables: [0] operation ID,
+    [1] HTTP method, [2] route, [3] description, [4] collection and [5] parameters. Only the
+    values needed to perform requests are kept resident. The description and the complete
+    parameter definitions are loaded from the endpoint table when they are first requested.
+    """
+
+    __slots__ = ["operation_id", "method", "route", "collection", "parameters", "table"]
+
+    def __init__(self,
+                 table: str,
+                 operation_id: str,
+                 method: str,
+                 route: str,
+                 collection: str,
+                 parameters: Tuple[Tuple[str, Optional[str], Optional[str]], ...]
+                 ):
+        """Construct an instance of the Endpoint class.
+
+        Arguments
+        ----
+        table : str
+            Endpoint table containing the complete definition, relative to this package.
+        operation_id : str
+            Operation ID.
+        method : str
+            HTTP method.
+        route : str
+            Endpoint route.
+        collection : str
+            Service collection name.
+        parameters : tuple
+            Tuple of (name, type, location) tuples describing the accepted parameters.
+        """
+        self.table = table
+        self.operation_id = operation_id
+        self.method = method
+        self.route = route
+        self.collection = collection
+        self.parameters = parameters
+
+    def __getitem__(self, index: Any) -> Any:
+        """Return the value at the requested position of the endpoint definition."""
+        try:
+            return getattr(self, _COMPACT_FIELDS[index])
+        except (KeyError, TypeError):  # Descriptions, complete parameter definitions and slices
+            return self.definition[index]
+
+    def __len__(self) -> int:
+        """Return the length of an endpoint definition."""
+        return 6
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the complete endpoint definition."""
+        return iter(self.definition)
+
+    def __repr__(self) -> str:
+        """Return a printable representation of the record."""
+        return f"Endpoint({self.operation_id!r}, {self.method!r}, {self.route!r}, {self.collection!r})"
+
+    @property
+    def definition(self) -> List[Any]:
+        """Return the complete endpoint definition from the endpoint table."""
+        return table_definitions(self.table)[self.operation_id]
+
+    @property
+    def description(self) -> str:
+        """Return the operation description."""
+        return self.definition[3]
+
+
+def table_definitions(table: str) -> Dict[str, List[Any]]:
+    """Return the complete definitions contained within an endpoint table, loading the table on first use."""
+    returned = _DEFINITIONS.get(table, None)
+    if returned is None:
+        returned = {}
+        definitions = getattr(import_module(f".{table}", __package__), f"{table.rsplit('.', 1)[-1]}_endpoints")
+        for definition in definitions:
+            returned.setdefault(definition[0], definition)
+        _DEFINITIONS[table] = returned
+
+    return returned
+
+
+def registry_name(table: str) -> str:
+    """Return the name of the compiled registry entry for an endpoint table."""
+    if table.startswith("deprecated."):
+        return f"{table[len('deprecated.'):]}_deprecated"
+
+    return f"{table}_endpoints"
+
+
+def compiled_endpoints(tables: Tuple[str, ...]) -> List[Endpoint]:
+    """Return the compact endpoint records for the provided endpoint tables, in order."""
+    registry = import_module("._registry_data", __package__)
+    returned: List[Endpoint] = []
+    for table in tables:
+        returned.extend(Endpoint(table, *entry) for entry in getattr(registry, registry_name(table)))
+
+    return returned
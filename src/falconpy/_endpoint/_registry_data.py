@@ -0,0 +1,5702 @@
+"""Compiled endpoint registry.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+# pylint: disable=C0302
+# This file is generated by util/build_registry.py from the endpoint tables. Do not edit it directly.
+# Operations are stored as (operation ID, method, route, collection, parameters) and
+# parameters as (name, type, location). Body payload parameters do not have a type.
+
+_alerts_endpoints = (
+    ("PostAggregatesAlertsV1", "POST", "/alerts/aggregates/alerts/v1", "alerts", (
+        ("body", None, "body"),
+    )),
+    ("PostAggregatesAlertsV2", "POST", "/alerts/aggregates/alerts/v2", "alerts", (
+        ("include_hidden", "boolean", "query"),
+        ("body", None, "body"),
+    )),
+    ("PostCombinedAlertsV1", "POST", "/alerts/combined/alerts/v1", "alerts", (
+        ("body", None, "body"),
+    )),
+    ("PostEntitiesAlertsV1", "POST", "/alerts/entities/alerts/v1", "alerts", (
+        ("body", None, "body"),
+    )),
+    ("PatchEntitiesAlertsV1", "PATCH", "/alerts/entities/alerts/v1", "alerts", (
+        ("body", None, "body"),
+    )),
+    ("PostEntitiesAlertsV2", "POST", "/alerts/entities/alerts/v2", "alerts", (
+        ("include_hidden", "boolean", "query"),
+        ("body", None, "body"),
+    )),
+    ("PatchEntitiesAlertsV2", "PATCH", "/alerts/entities/alerts/v2", "alerts", (
+        ("body", None, "body"),
+    )),
+    ("PatchEntitiesAlertsV3", "PATCH", "/alerts/entities/alerts/v3", "alerts", (
+        ("include_hidden", "boolean", "query"),
+        ("body", None, "body"),
+    )),
+    ("GetQueriesAlertsV1", "GET", "/alerts/queries/alerts/v1", "alerts", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+    )),
+    ("GetQueriesAlertsV2", "GET", "/alerts/queries/alerts/v2", "alerts", (
+        ("include_hidden", "boolean", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+    )),
+)
+
+_api_integrations_endpoints = (
+    ("GetCombinedPluginConfigs", "GET", "/plugins/combined/configs/v1", "api_integrations", (
+        ("filter", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("ExecuteCommandProxy", "POST", "/plugins/entities/execute-proxy/v1", "api_integrations", (
+        ("body", None, "body"),
+    )),
+    ("ExecuteCommand", "POST", "/plugins/entities/execute/v1", "api_integrations", (
+        ("body", None, "body"),
+    )),
+)
+
+_aspm_endpoints = (
+    ("ExecuteFunctionDataCount", "POST", "/application-security/aggregates/function-data/count/v1", "aspm", (
+        ("query_name", "string", "query"),
+        ("cloud_provider", "string", "query"),
+        ("aws_lambda_arn", "string", "query"),
+        ("gcp_cloud_function_url", "string", "query"),
+        ("azure_site_subscription_id", "string", "query"),
+        ("azure_site_resource_group", "string", "query"),
+        ("azure_function_app_name", "string", "query"),
+    )),
+    ("ExecuteFunctionsCount", "POST", "/application-security/aggregates/functions/count/v1", "aspm", (
+        ("query_name", "string", "query"),
+        ("cloud_provider", "array", "query"),
+        ("cloud_account_id", "array", "query"),
+        ("region", "array", "query"),
+        ("cid", "array", "query"),
+    )),
+    ("ExecuteFunctionDataQueryCount", "GET", "/application-security/aggregates/query-function-data-count/v1", "aspm", (
+        ("field", "string", "query"),
+    )),
+    ("ExecuteFunctionsQueryCount", "GET", "/application-security/aggregates/query-functions-count/v1", "aspm", (
+        ("field", "string", "query"),
+    )),
+    ("ExecuteFunctionData", "GET", "/application-security/combined/function-data/v1", "aspm", (
+        ("field", "string", "query"),
+    )),
+    ("ExecuteFunctionsOvertime", "GET", "/application-security/combined/functions-overtime/v1", "aspm", (
+        ("field", "string", "query"),
+    )),
+    ("ExecuteFunctions", "GET", "/application-security/combined/functions/v1", "aspm", (
+        ("field", "string", "query"),
+    )),
+    ("ExecuteFunctionDataQuery", "GET", "/application-security/combined/query-function-data/v1", "aspm", (
+        ("field", "string", "query"),
+    )),
+    ("ExecuteFunctionsQueryOvertime", "GET", "/application-security/combined/query-functions-overtime/v1", "aspm", (
+        ("field", "string", "query"),
+    )),
+    ("ExecuteFunctionsQuery", "GET", "/application-security/combined/query-functions/v1", "aspm", (
+        ("field", "string", "query"),
+    )),
+    ("getServiceArtifacts", "GET", "/aspm-api-gateway/api/v1/artifacts", "aspm", (
+        ("persistentSignature", "string", "query"),
+        ("optionalTime", "integer", "query"),
+        ("revisionId", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("orderBy", "array", "query"),
+        ("direction", "string", "query"),
+    )),
+    ("UpsertBusinessApplications", "PUT", "/aspm-api-gateway/api/v1/business_applications", "aspm", (
+        ("body", None, "body"),
+    )),
+    ("GetCloudSecurityIntegrationState", "GET", "/aspm-api-gateway/api/v1/cloud_security_config", "aspm", (
+    )),
+    ("SetCloudSecurityIntegrationState", "POST", "/aspm-api-gateway/api/v1/cloud_security_config", "aspm", (
+        ("body", None, "body"),
+    )),
+    ("GetExecutorNodes", "GET", "/aspm-api-gateway/api/v1/executor_nodes", "aspm", (
+        ("node_type", "string", "query"),
+        ("integration_type", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("order_by", "string", "query"),
+        ("direction", "string", "query"),
+        ("executor_node_ids", "array", "query"),
+        ("executor_node_names", "array", "query"),
+        ("executor_node_states", "array", "query"),
+        ("executor_node_types", "array", "query"),
+    )),
+    ("UpdateExecutorNode", "PUT", "/aspm-api-gateway/api/v1/executor_nodes", "aspm", (
+        ("body", None, "body"),
+    )),
+    ("CreateExecutorNode", "POST", "/aspm-api-gateway/api/v1/executor_nodes", "aspm", (
+        ("body", None, "body"),
+    )),
+    ("GetExecutorNodesMetadata", "GET", "/aspm-api-gateway/api/v1/executor_nodes/metadata", "aspm", (
+        ("executor_node_ids", "array", "query"),
+        ("executor_node_names", "array", "query"),
+        ("executor_node_states", "array", "query"),
+        ("executor_node_types", "array", "query"),
+    )),
+    ("DeleteExecutorNode", "DELETE", "/aspm-api-gateway/api/v1/executor_nodes/{}", "aspm", (
+        ("ID", "integer", "path"),
+    )),
+    ("RetrieveRelayInstances", "GET", "/aspm-api-gateway/api/v1/executor_nodes/{}/instances/csv", "aspm", (
+        ("ID", "integer", "path"),
+        ("body", None, "body"),
+    )),
+    ("GetIntegrationTasks", "GET", "/aspm-api-gateway/api/v1/integration_tasks", "aspm", (
+        ("integration_task_type", "integer", "query"),
+        ("category", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("orderBy", "string", "query"),
+        ("direction", "string", "query"),
+        ("integration_task_types", "integer", "query"),
+        ("ids", "integer", "query"),
+        ("names", "string", "query"),
+    )),
+    ("CreateIntegrationTask", "POST", "/aspm-api-gateway/api/v1/integration_tasks", "aspm", (
+        ("body", None, "body"),
+    )),
+    ("GetIntegrationTasksAdmin", "GET", "/aspm-api-gateway/api/v1/integration_tasks/admin", "aspm", (
+        ("integration_task_type", "integer", "query"),
+        ("category", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("orderBy", "string", "query"),
+        ("direction", "string", "query"),
+        ("integration_task_types", "integer", "query"),
+        ("ids", "integer", "query"),
+        ("names", "string", "query"),
+    )),
+    ("GetIntegrationTasksMetadata", "GET", "/aspm-api-gateway/api/v1/integration_tasks/metadata", "aspm", (
+        ("category", "string", "query"),
+        ("integration_task_types", "integer", "query"),
+        ("ids", "integer", "query"),
+        ("names", "string", "query"),
+    )),
+    ("GetIntegrationTasksV2", "GET", "/aspm-api-gateway/api/v1/integration_tasks/v2", "aspm", (
+        ("integration_task_type", "integer", "query"),
+        ("category", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("orderBy", "string", "query"),
+        ("direction", "string", "query"),
+        ("integration_task_types", "integer", "query"),
+        ("ids", "integer", "query"),
+        ("names", "string", "query"),
+    )),
+    ("UpdateIntegrationTask", "PUT", "/aspm-api-gateway/api/v1/integration_tasks/{}", "aspm", (
+        ("ID", "integer", "path"),
+        ("body", None, "body"),
+    )),
+    ("DeleteIntegrationTask", "DELETE", "/aspm-api-gateway/api/v1/integration_tasks/{}", "aspm", (
+        ("ID", "integer", "path"),
+    )),
+    ("RunIntegrationTask", "POST", "/aspm-api-gateway/api/v1/integration_tasks/{}/run", "aspm", (
+        ("ID", "integer", "path"),
+        ("category", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("RunIntegrationTaskAdmin", "POST", "/aspm-api-gateway/api/v1/integration_tasks/{}/run/admin", "aspm", (
+        ("ID", "integer", "path"),
+        ("category", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("RunIntegrationTaskV2", "POST", "/aspm-api-gateway/api/v1/integration_tasks/{}/run/v2", "aspm", (
+        ("ID", "integer", "path"),
+        ("category", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("GetIntegrationTypes", "GET", "/aspm-api-gateway/api/v1/integration_types", "aspm", (
+    )),
+    ("GetIntegrations", "GET", "/aspm-api-gateway/api/v1/integrations", "aspm", (
+        ("integration_type", "integer", "query"),
+        ("category", "string", "query"),
+    )),
+    ("CreateIntegration", "POST", "/aspm-api-gateway/api/v1/integrations", "aspm", (
+        ("body", None, "body"),
+    )),
+    ("GetIntegrationsV2", "GET", "/aspm-api-gateway/api/v1/integrations/v2", "aspm", (
+        ("integration_type", "integer", "query"),
+        ("category", "string", "query"),
+    )),
+    ("UpdateIntegration", "PUT", "/aspm-api-gateway/api/v1/integrations/{}", "aspm", (
+        ("ID", "integer", "path"),
+        ("body", None, "body"),
+    )),
+    ("DeleteIntegration", "DELETE", "/aspm-api-gateway/api/v1/integrations/{}", "aspm", (
+        ("ID", "integer", "path"),
+    )),
+    ("ExecuteQuery", "POST", "/aspm-api-gateway/api/v1/query", "aspm", (
+        ("body", None, "body"),
+    )),
+    ("ServiceNowGetDeployments", "GET", "/aspm-api-gateway/api/v1/servicenow/deployments", "aspm", (
+        ("ql_filters", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("orderBy", "string", "query"),
+        ("direction", "string", "query"),
+    )),
+    ("ServiceNowGetServices", "GET", "/aspm-api-gateway/api/v1/servicenow/services", "aspm", (
+        ("ql_filters", "string", "query"),
+        ("exclude_artifacts", "boolean", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("orderBy", "string", "query"),
+        ("direction", "string", "query"),
+    )),
+    ("GetServicesCount", "POST", "/aspm-api-gateway/api/v1/services/count", "aspm", (
+        ("body", None, "body"),
+    )),
+    ("GetServiceViolationTypes", "GET", "/aspm-api-gateway/api/v1/services/violations/types", "aspm", (
+        ("body", None, "body"),
+    )),
+    ("GetTags", "GET", "/aspm-api-gateway/api/v1/tags", "aspm", (
+        ("isUnique", "boolean", "query"),
+        ("tagName", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("name", "array", "query"),
+    )),
+    ("UpsertTags", "PUT", "/aspm-api-gateway/api/v1/tags", "aspm", (
+        ("body", None, "body"),
+    )),
+    ("DeleteTags", "POST", "/aspm-api-gateway/api/v1/tags", "aspm", (
+        ("body", None, "body"),
+    )),
+)
+
+_cao_hunting_endpoints = (
+    ("AggregateIntelligenceQueries", "POST", "/hunting/aggregates/intelligence-queries/v1", "cao_hunting", (
+        ("body", None, "body"),
+    )),
+    ("GetArchiveExport", "GET", "/hunting/entities/archive-exports/v1", "cao_hunting", (
+        ("language", "string", "query"),
+        ("filter", "string", "query"),
+        ("archive_type", "string", "query"),
+    )),
+    ("GetIntelligenceQueries", "GET", "/hunting/entities/intelligence-queries/v1", "cao_hunting", (
+        ("ids", "array", "query"),
+    )),
+    ("SearchIntelligenceQueries", "GET", "/hunting/queries/intelligence-queries/v1", "cao_hunting", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+    )),
+)
+
+_certificate_based_exclusions_endpoints = (
+    ("cb_exclusions_get_v1", "GET", "/exclusions/entities/cert-based-exclusions/v1", "certificate_based_exclusions", (
+        ("ids", "array", "query"),
+    )),
+    ("cb_exclusions_create_v1", "POST", "/exclusions/entities/cert-based-exclusions/v1", "certificate_based_exclusions", (
+        ("body", None, "body"),
+    )),
+    ("cb_exclusions_update_v1", "PATCH", "/exclusions/entities/cert-based-exclusions/v1", "certificate_based_exclusions", (
+        ("body", None, "body"),
+    )),
+    ("cb_exclusions_delete_v1", "DELETE", "/exclusions/entities/cert-based-exclusions/v1", "certificate_based_exclusions", (
+        ("ids", "array", "query"),
+        ("comment", "string", "query"),
+    )),
+    ("certificates_get_v1", "GET", "/exclusions/entities/certificates/v1", "certificate_based_exclusions", (
+        ("ids", "string", "query"),
+    )),
+    ("cb_exclusions_query_v1", "GET", "/exclusions/queries/cert-based-exclusions/v1", "certificate_based_exclusions", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_cloud_connect_aws_endpoints = (
+    ("QueryAWSAccounts", "GET", "/cloud-connect-aws/combined/accounts/v1", "cloud_connect_aws", (
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("GetAWSSettings", "GET", "/cloud-connect-aws/combined/settings/v1", "cloud_connect_aws", (
+    )),
+    ("GetAWSAccounts", "GET", "/cloud-connect-aws/entities/accounts/v1", "cloud_connect_aws", (
+        ("ids", "array", "query"),
+    )),
+    ("ProvisionAWSAccounts", "POST", "/cloud-connect-aws/entities/accounts/v1", "cloud_connect_aws", (
+        ("mode", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("UpdateAWSAccounts", "PATCH", "/cloud-connect-aws/entities/accounts/v1", "cloud_connect_aws", (
+        ("body", None, "body"),
+    )),
+    ("DeleteAWSAccounts", "DELETE", "/cloud-connect-aws/entities/accounts/v1", "cloud_connect_aws", (
+        ("ids", "array", "query"),
+    )),
+    ("CreateOrUpdateAWSSettings", "POST", "/cloud-connect-aws/entities/settings/v1", "cloud_connect_aws", (
+        ("body", None, "body"),
+    )),
+    ("VerifyAWSAccountAccess", "POST", "/cloud-connect-aws/entities/verify-account-access/v1", "cloud_connect_aws", (
+        ("ids", "array", "query"),
+    )),
+    ("QueryAWSAccountsForIDs", "GET", "/cloud-connect-aws/queries/accounts/v1", "cloud_connect_aws", (
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+)
+
+_cloud_aws_registration_endpoints = (
+    ("cloud_registration_aws_get_accounts", "GET",
+     "/cloud-security-registration-aws/entities/account/v1", "cloud_aws_registration", (
+         ("ids", "array", "query"),
+     )),
+    ("cloud_registration_aws_create_account", "POST",
+     "/cloud-security-registration-aws/entities/account/v1", "cloud_aws_registration", (
+         ("body", None, "body"),
+     )),
+    ("cloud_registration_aws_update_account", "PATCH",
+     "/cloud-security-registration-aws/entities/account/v1", "cloud_aws_registration", (
+         ("body", None, "body"),
+     )),
+    ("cloud_registration_aws_delete_account", "DELETE",
+     "/cloud-security-registration-aws/entities/account/v1", "cloud_aws_registration", (
+         ("ids", "array", "query"),
+         ("organization-ids", "array", "query"),
+     )),
+    ("cloud_registration_aws_query_accounts", "GET",
+     "/cloud-security-registration-aws/queries/account/v1", "cloud_aws_registration", (
+         ("organization-ids", "array", "query"),
+         ("products", "array", "query"),
+         ("features", "array", "query"),
+         ("account-status", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+         ("group_by", "string", "query"),
+     )),
+)
+
+_cloud_azure_registration_endpoints = (
+    ("cloud_registration_azure_download_script", "POST",
+     "/cloud-security-registration-azure/entities/scripts/v1", "cloud_azure_registration", (
+         ("body", None, "body"),
+     )),
+)
+
+_cloud_oci_registration_endpoints = (
+    ("cloud_security_registration_oci_get_account", "GET",
+     "/cloud-security-registration-oci/combined/accounts/v1", "cloud_oci_registration", (
+         ("filter", "string", "query"),
+         ("sort", "string", "query"),
+         ("next_token", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+     )),
+    ("cloud_security_registration_oci_rotate_key", "POST",
+     "/cloud-security-registration-oci/entities/account-rotate-keys/v1", "cloud_oci_registration", (
+         ("body", None, "body"),
+     )),
+    ("cloud_security_registration_oci_validate_tenancy", "POST",
+     "/cloud-security-registration-oci/entities/account-validate/v1", "cloud_oci_registration", (
+         ("body", None, "body"),
+     )),
+    ("cloud_security_registration_oci_create_account", "POST",
+     "/cloud-security-registration-oci/entities/accounts/v1", "cloud_oci_registration", (
+         ("body", None, "body"),
+     )),
+    ("cloud_security_registration_oci_update_account", "PATCH",
+     "/cloud-security-registration-oci/entities/accounts/v1", "cloud_oci_registration", (
+         ("body", None, "body"),
+     )),
+    ("cloud_security_registration_oci_delete_account", "DELETE",
+     "/cloud-security-registration-oci/entities/accounts/v1", "cloud_oci_registration", (
+         ("ids", "array", "query"),
+     )),
+    ("cloud_security_registration_oci_download_script", "POST",
+     "/cloud-security-registration-oci/entities/scripts/v1", "cloud_oci_registration", (
+         ("body", None, "body"),
+     )),
+)
+
+_cloud_security_assets_endpoints = (
+    ("cloud_security_assets_combined_compliance_by_account", "GET",
+     "/cloud-security-assets/combined/compliance-controls/by-account-region-and-resource-type/v1", "cloud_security_assets", (
+         ("filter", "string", "query"),
+         ("sort", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+         ("after", "string", "query"),
+         ("include_failing_iom_severity_counts", "boolean", "query"),
+     )),
+    ("cloud_security_assets_entities_get", "GET", "/cloud-security-assets/entities/resources/v1", "cloud_security_assets", (
+        ("ids", "array", "query"),
+    )),
+    ("cloud_security_assets_queries", "GET", "/cloud-security-assets/queries/resources/v1", "cloud_security_assets", (
+        ("after", "string", "query"),
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+)
+
+_cloud_snapshots_endpoints = (
+    ("GetCredentialsIAC", "GET", "/iac/entities/image-registry-credentials/v1", "cloud_snapshots", (
+    )),
+    ("ReadDeploymentsCombined", "GET", "/snapshots/combined/deployments/v1", "cloud_snapshots", (
+        ("filter", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("RegisterCspmSnapshotAccount", "POST", "/snapshots/entities/accounts/v1", "cloud_snapshots", (
+        ("body", None, "body"),
+    )),
+    ("ReadDeploymentsEntities", "GET", "/snapshots/entities/deployments/v1", "cloud_snapshots", (
+        ("ids", "array", "query"),
+    )),
+    ("CreateDeploymentEntity", "POST", "/snapshots/entities/deployments/v1", "cloud_snapshots", (
+        ("body", None, "body"),
+    )),
+    ("GetCredentialsMixin0", "GET", "/snapshots/entities/image-registry-credentials/v1", "cloud_snapshots", (
+    )),
+    ("CreateInventory", "POST", "/snapshots/entities/inventories/v1", "cloud_snapshots", (
+        ("body", None, "body"),
+    )),
+    ("GetScanReport", "GET", "/snapshots/entities/scanreports/v1", "cloud_snapshots", (
+        ("ids", "array", "query"),
+    )),
+)
+
+_container_image_compliance_endpoints = (
+    ("extAggregateClusterAssessments", "GET",
+     "/container-compliance/aggregates/compliance-by-clusters/v2", "container_image_compliance", (
+         ("filter", "string", "query"),
+     )),
+    ("extAggregateImageAssessments", "GET",
+     "/container-compliance/aggregates/compliance-by-images/v2", "container_image_compliance", (
+         ("filter", "string", "query"),
+         ("after", "string", "query"),
+         ("limit", "string", "query"),
+     )),
+    ("extAggregateRulesAssessments", "GET",
+     "/container-compliance/aggregates/compliance-by-rules/v2", "container_image_compliance", (
+         ("filter", "string", "query"),
+     )),
+    ("extAggregateFailedContainersByRulesPath", "GET",
+     "/container-compliance/aggregates/failed-containers-by-rules/v2", "container_image_compliance", (
+         ("filter", "string", "query"),
+     )),
+    ("extAggregateFailedContainersCountBySeverity", "GET",
+     "/container-compliance/aggregates/failed-containers-count-by-severity/v2", "container_image_compliance", (
+         ("filter", "string", "query"),
+     )),
+    ("extAggregateFailedImagesByRulesPath", "GET",
+     "/container-compliance/aggregates/failed-images-by-rules/v2", "container_image_compliance", (
+         ("filter", "string", "query"),
+     )),
+    ("extAggregateFailedImagesCountBySeverity", "GET",
+     "/container-compliance/aggregates/failed-images-count-by-severity/v2", "container_image_compliance", (
+         ("filter", "string", "query"),
+     )),
+    ("extAggregateFailedRulesByClusters", "GET",
+     "/container-compliance/aggregates/failed-rules-by-clusters/v2", "container_image_compliance", (
+         ("filter", "string", "query"),
+     )),
+    ("extAggregateFailedRulesByImages", "GET",
+     "/container-compliance/aggregates/failed-rules-by-images/v2", "container_image_compliance", (
+         ("filter", "string", "query"),
+     )),
+    ("extAggregateFailedRulesCountBySeverity", "GET",
+     "/container-compliance/aggregates/failed-rules-count-by-severity/v2", "container_image_compliance", (
+         ("filter", "string", "query"),
+     )),
+    ("extAggregateRulesByStatus", "GET", "/container-compliance/aggregates/rules-by-status/v2", "container_image_compliance", (
+        ("filter", "string", "query"),
+    )),
+)
+
+_configuration_assessment_evaluation_logic_endpoints = (
+    ("getEvaluationLogicMixin0", "GET",
+     "/configuration-assessment/entities/evaluation-logic/v1", "configuration_assessment_evaluation_logic", (
+         ("ids", "array", "query"),
+     )),
+)
+
+_configuration_assessment_endpoints = (
+    ("getCombinedAssessmentsQuery", "GET", "/configuration-assessment/combined/assessments/v1", "configuration_assessment", (
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("facet", "array", "query"),
+    )),
+    ("getRuleDetails", "GET", "/configuration-assessment/entities/rule-details/v1", "configuration_assessment", (
+        ("ids", "array", "query"),
+    )),
+)
+
+_container_alerts_endpoints = (
+    ("ReadContainerAlertsCountBySeverity", "GET",
+     "/container-security/aggregates/container-alerts/count-by-severity/v1", "container_alerts", (
+         ("filter", "string", "query"),
+     )),
+    ("ReadContainerAlertsCount", "GET", "/container-security/aggregates/container-alerts/count/v1", "container_alerts", (
+        ("filter", "string", "query"),
+    )),
+    ("SearchAndReadContainerAlerts", "GET", "/container-security/combined/container-alerts/v1", "container_alerts", (
+        ("filter", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_container_detections_endpoints = (
+    ("ReadDetectionsCountBySeverity", "GET",
+     "/container-security/aggregates/detections/count-by-severity/v1", "container_detections", (
+         ("filter", "string", "query"),
+     )),
+    ("ReadDetectionsCountByType", "GET",
+     "/container-security/aggregates/detections/count-by-type/v1", "container_detections", (
+         ("filter", "string", "query"),
+     )),
+    ("ReadDetectionsCount", "GET", "/container-security/aggregates/detections/count/v1", "container_detections", (
+        ("filter", "string", "query"),
+    )),
+    ("ReadCombinedDetections", "GET", "/container-security/combined/detections/v1", "container_detections", (
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("GetRuntimeDetectionsCombinedV2", "GET", "/container-security/combined/runtime-detections/v2", "container_detections", (
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("ReadDetections", "GET", "/container-security/entities/detections/v1", "container_detections", (
+        ("filter", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("SearchDetections", "GET", "/container-security/queries/detections/v1", "container_detections", (
+        ("filter", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+)
+
+_container_images_endpoints = (
+    ("AggregateImageAssessmentHistory", "GET",
+     "/container-security/aggregates/images/assessment-history/v1", "container_images", (
+         ("filter", "string", "query"),
+     )),
+    ("AggregateImageCountByBaseOS", "GET",
+     "/container-security/aggregates/images/count-by-os-distribution/v1", "container_images", (
+         ("filter", "string", "query"),
+     )),
+    ("AggregateImageCountByState", "GET", "/container-security/aggregates/images/count-by-state/v1", "container_images", (
+        ("filter", "string", "query"),
+    )),
+    ("AggregateImageCount", "GET", "/container-security/aggregates/images/count/v1", "container_images", (
+        ("filter", "string", "query"),
+    )),
+    ("CombinedBaseImages", "GET", "/container-security/combined/base-images/v1", "container_images", (
+        ("filter", "string", "query"),
+    )),
+    ("GetCombinedImages", "GET", "/container-security/combined/image-assessment/images/v1", "container_images", (
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("CombinedImageByVulnerabilityCount", "GET",
+     "/container-security/combined/images/by-vulnerability-count/v1", "container_images", (
+         ("filter", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+     )),
+    ("CombinedImageDetail", "GET", "/container-security/combined/images/detail/v1", "container_images", (
+        ("filter", "string", "query"),
+        ("with_config", "boolean", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("ReadCombinedImagesExport", "GET", "/container-security/combined/images/export/v1", "container_images", (
+        ("filter", "string", "query"),
+        ("expand_vulnerabilities", "boolean", "query"),
+        ("expand_detections", "boolean", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("CombinedImageIssuesSummary", "GET", "/container-security/combined/images/issues-summary/v1", "container_images", (
+        ("cid", "string", "query"),
+        ("registry", "string", "query"),
+        ("repository", "string", "query"),
+        ("tag", "string", "query"),
+        ("image_digest", "string", "query"),
+        ("include_base_image_vuln", "boolean", "query"),
+    )),
+    ("CombinedImageVulnerabilitySummary", "GET",
+     "/container-security/combined/images/vulnerabilities-summary/v1", "container_images", (
+         ("cid", "string", "query"),
+         ("registry", "string", "query"),
+         ("repository", "string", "query"),
+         ("tag", "string", "query"),
+         ("image_digest", "string", "query"),
+         ("include_base_image_vuln", "boolean", "query"),
+     )),
+    ("CreateBaseImagesEntities", "POST", "/container-security/entities/base-images/v1", "container_images", (
+        ("body", None, "body"),
+    )),
+    ("DeleteBaseImages", "DELETE", "/container-security/entities/base-images/v1", "container_images", (
+        ("ids", "array", "query"),
+    )),
+)
+
+_container_packages_endpoints = (
+    ("ReadPackagesByImageCount", "GET", "/container-security/aggregates/packages/by-image-count/v1", "container_packages", (
+        ("filter", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("ReadPackagesCountByZeroDay", "GET",
+     "/container-security/aggregates/packages/count-by-zero-day/v1", "container_packages", (
+         ("filter", "string", "query"),
+     )),
+    ("ReadPackagesByFixableVulnCount", "GET",
+     "/container-security/combined/packages/app-by-fixable-vulnerability-count/v1", "container_packages", (
+         ("filter", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+     )),
+    ("ReadPackagesByVulnCount", "GET",
+     "/container-security/combined/packages/by-vulnerability-count/v1", "container_packages", (
+         ("filter", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+     )),
+    ("ReadPackagesCombinedExport", "GET", "/container-security/combined/packages/export/v1", "container_packages", (
+        ("filter", "string", "query"),
+        ("only_zero_day_affected", "boolean", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("ReadPackagesCombined", "GET", "/container-security/combined/packages/v1", "container_packages", (
+        ("filter", "string", "query"),
+        ("only_zero_day_affected", "boolean", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("ReadPackagesCombinedV2", "GET", "/container-security/combined/packages/v2", "container_packages", (
+        ("filter", "string", "query"),
+        ("only_zero_day_affected", "boolean", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+)
+
+_container_vulnerabilities_endpoints = (
+    ("ReadVulnerabilityCountByActivelyExploited", "GET",
+     "/container-security/aggregates/vulnerabilities/count-by-actively-exploited/v1", "container_vulnerabilities", (
+         ("filter", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+     )),
+    ("ReadVulnerabilityCountByCPSRating", "GET",
+     "/container-security/aggregates/vulnerabilities/count-by-cps-rating/v1", "container_vulnerabilities", (
+         ("filter", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+     )),
+    ("ReadVulnerabilityCountByCVSSScore", "GET",
+     "/container-security/aggregates/vulnerabilities/count-by-cvss-score/v1", "container_vulnerabilities", (
+         ("filter", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+     )),
+    ("ReadVulnerabilityCountBySeverity", "GET",
+     "/container-security/aggregates/vulnerabilities/count-by-severity/v1", "container_vulnerabilities", (
+         ("filter", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+     )),
+    ("ReadVulnerabilityCount", "GET", "/container-security/aggregates/vulnerabilities/count/v1", "container_vulnerabilities", (
+        ("filter", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("ReadVulnerabilitiesByImageCount", "GET",
+     "/container-security/combined/vulnerabilities/by-image-count/v1", "container_vulnerabilities", (
+         ("filter", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+     )),
+    ("ReadVulnerabilitiesPublicationDate", "GET",
+     "/container-security/combined/vulnerabilities/by-published-date/v1", "container_vulnerabilities", (
+         ("filter", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+     )),
+    ("ReadCombinedVulnerabilitiesDetails", "GET",
+     "/container-security/combined/vulnerabilities/details/v1", "container_vulnerabilities", (
+         ("id", "string", "query"),
+         ("filter", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+     )),
+    ("ReadCombinedVulnerabilitiesInfo", "GET",
+     "/container-security/combined/vulnerabilities/info/v1", "container_vulnerabilities", (
+         ("cve_id", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+     )),
+    ("ReadCombinedVulnerabilities", "GET", "/container-security/combined/vulnerabilities/v1", "container_vulnerabilities", (
+        ("filter", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_content_update_policies_endpoints = (
+    ("queryCombinedContentUpdatePolicyMembers", "GET",
+     "/policy/combined/content-update-members/v1", "content_update_policies", (
+         ("id", "string", "query"),
+         ("filter", "string", "query"),
+         ("offset", "integer", "query"),
+         ("limit", "integer", "query"),
+         ("sort", "string", "query"),
+     )),
+    ("queryCombinedContentUpdatePolicies", "GET", "/policy/combined/content-update/v1", "content_update_policies", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("performContentUpdatePoliciesAction", "POST", "/policy/entities/content-update-actions/v1", "content_update_policies", (
+        ("action_name", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("setContentUpdatePoliciesPrecedence", "POST",
+     "/policy/entities/content-update-precedence/v1", "content_update_policies", (
+         ("body", None, "body"),
+     )),
+    ("getContentUpdatePolicies", "GET", "/policy/entities/content-update/v1", "content_update_policies", (
+        ("ids", "array", "query"),
+    )),
+    ("createContentUpdatePolicies", "POST", "/policy/entities/content-update/v1", "content_update_policies", (
+        ("body", None, "body"),
+    )),
+    ("updateContentUpdatePolicies", "PATCH", "/policy/entities/content-update/v1", "content_update_policies", (
+        ("body", None, "body"),
+    )),
+    ("deleteContentUpdatePolicies", "DELETE", "/policy/entities/content-update/v1", "content_update_policies", (
+        ("ids", "array", "query"),
+    )),
+    ("queryContentUpdatePolicyMembers", "GET", "/policy/queries/content-update-members/v1", "content_update_policies", (
+        ("id", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("queryPinnableContentVersions", "GET", "/policy/queries/content-update-pin-versions/v1", "content_update_policies", (
+        ("category", "string", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("queryContentUpdatePolicies", "GET", "/policy/queries/content-update/v1", "content_update_policies", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_correlation_rules_endpoints = (
+    ("aggregates_rule_versions_post_v1", "POST", "/correlation-rules/aggregates/rule-versions/v1", "correlation_rules", (
+        ("ids", "array", "query"),
+        ("body", None, "body"),
+        ("filter", "string", "query"),
+    )),
+    ("combined_rules_get_v1", "GET", "/correlation-rules/combined/rules/v1", "correlation_rules", (
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("sort", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("combined_rules_get_v2", "GET", "/correlation-rules/combined/rules/v2", "correlation_rules", (
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("sort", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("entities_latest_rules_get_v1", "GET", "/correlation-rules/entities/latest-rules/v1", "correlation_rules", (
+        ("rule_ids", "array", "query"),
+    )),
+    ("entities_rule_versions_export_post_v1", "POST",
+     "/correlation-rules/entities/rule-versions/export/v1", "correlation_rules", (
+         ("body", None, "body"),
+     )),
+    ("entities_rule_versions_import_post_v1", "POST",
+     "/correlation-rules/entities/rule-versions/import/v1", "correlation_rules", (
+     )),
+    ("entities_rule_versions_publish_patch_v1", "PATCH",
+     "/correlation-rules/entities/rule-versions/publish/v1", "correlation_rules", (
+         ("body", None, "body"),
+     )),
+    ("entities_rule_versions_delete_v1", "DELETE", "/correlation-rules/entities/rule-versions/v1", "correlation_rules", (
+        ("ids", "array", "query"),
+    )),
+    ("entities_rules_get_v1", "GET", "/correlation-rules/entities/rules/v1", "correlation_rules", (
+        ("ids", "array", "query"),
+    )),
+    ("entities_rules_post_v1", "POST", "/correlation-rules/entities/rules/v1", "correlation_rules", (
+        ("body", None, "body"),
+    )),
+    ("entities_rules_patch_v1", "PATCH", "/correlation-rules/entities/rules/v1", "correlation_rules", (
+        ("body", None, "body"),
+    )),
+    ("entities_rules_delete_v1", "DELETE", "/correlation-rules/entities/rules/v1", "correlation_rules", (
+        ("ids", "array", "query"),
+    )),
+    ("entities_rules_get_v2", "GET", "/correlation-rules/entities/rules/v2", "correlation_rules", (
+        ("ids", "array", "query"),
+    )),
+    ("queries_rules_get_v1", "GET", "/correlation-rules/queries/rules/v1", "correlation_rules", (
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("sort", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("queries_rules_get_v2", "GET", "/correlation-rules/queries/rules/v2", "correlation_rules", (
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("sort", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+    )),
+)
+
+_cspm_registration_endpoints = (
+    ("GetCSPMAwsAccount", "GET", "/cloud-connect-cspm-aws/entities/account/v1", "cspm_registration", (
+        ("scan-type", "string", "query"),
+        ("ids", "array", "query"),
+        ("iam_role_arns", "array", "query"),
+        ("organization-ids", "array", "query"),
+        ("status", "string", "query"),
+        ("limit", "integer", "query"),
+        ("cspm_lite", "string", "query"),
+        ("migrated", "string", "query"),
+        ("offset", "integer", "query"),
+        ("group_by", "string", "query"),
+    )),
+    ("CreateCSPMAwsAccount", "POST", "/cloud-connect-cspm-aws/entities/account/v1", "cspm_registration", (
+        ("body", None, "body"),
+    )),
+    ("PatchCSPMAwsAccount", "PATCH", "/cloud-connect-cspm-aws/entities/account/v1", "cspm_registration", (
+        ("body", None, "body"),
+    )),
+    ("DeleteCSPMAwsAccount", "DELETE", "/cloud-connect-cspm-aws/entities/account/v1", "cspm_registration", (
+        ("ids", "array", "query"),
+        ("organization-ids", "array", "query"),
+    )),
+    ("GetCSPMAwsConsoleSetupURLs", "GET", "/cloud-connect-cspm-aws/entities/console-setup-urls/v1", "cspm_registration", (
+        ("ids", "array", "query"),
+        ("use_existing_cloudtrail", "string", "query"),
+        ("region", "string", "query"),
+        ("tags", "string", "query"),
+        ("template", "string", "query"),
+    )),
+    ("GetCSPMAwsAccountScriptsAttachment", "GET",
+     "/cloud-connect-cspm-aws/entities/user-scripts-download/v1", "cspm_registration", (
+         ("ids", "array", "query"),
+         ("template", "string", "query"),
+         ("account_type", "string", "query"),
+         ("accounts", "array", "query"),
+         ("behavior_assessment_enabled", "string", "query"),
+         ("sensor_management_enabled", "string", "query"),
+         ("dspm_enabled", "string", "query"),
+         ("dspm_regions", "array", "query"),
+         ("dspm_role", "string", "query"),
+         ("use_existing_cloudtrail", "string", "query"),
+         ("organization_id", "string", "query"),
+         ("aws_profile", "string", "query"),
+         ("custom_role_name", "string", "query"),
+     )),
+    ("GetCSPMAzureAccount", "GET", "/cloud-connect-cspm-azure/entities/account/v1", "cspm_registration", (
+        ("ids", "array", "query"),
+        ("tenant_ids", "array", "query"),
+        ("scan-type", "string", "query"),
+        ("status", "string", "query"),
+        ("cspm_lite", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("CreateCSPMAzureAccount", "POST", "/cloud-connect-cspm-azure/entities/account/v1", "cspm_registration", (
+        ("body", None, "body"),
+    )),
+    ("UpdateCSPMAzureAccount", "PATCH", "/cloud-connect-cspm-azure/entities/account/v1", "cspm_registration", (
+        ("body", None, "body"),
+    )),
+    ("DeleteCSPMAzureAccount", "DELETE", "/cloud-connect-cspm-azure/entities/account/v1", "cspm_registration", (
+        ("ids", "array", "query"),
+        ("tenant_ids", "array", "query"),
+        ("retain_tenant", "string", "query"),
+    )),
+    ("UpdateCSPMAzureAccountClientID", "PATCH", "/cloud-connect-cspm-azure/entities/client-id/v1", "cspm_registration", (
+        ("id", "string", "query"),
+        ("tenant-id", "string", "query"),
+    )),
+    ("UpdateCSPMAzureTenantDefaultSubscriptionID", "PATCH",
+     "/cloud-connect-cspm-azure/entities/default-subscription-id/v1", "cspm_registration", (
+         ("tenant-id", "string", "query"),
+         ("subscription_id", "string", "query"),
+     )),
+    ("AzureDownloadCertificate", "GET", "/cloud-connect-cspm-azure/entities/download-certificate/v1", "cspm_registration", (
+        ("tenant_id", "array", "query"),
+    )),
+    ("GetCSPMAzureManagementGroup", "GET", "/cloud-connect-cspm-azure/entities/management-group/v1", "cspm_registration", (
+        ("tenant_ids", "array", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("CreateCSPMAzureManagementGroup", "POST", "/cloud-connect-cspm-azure/entities/management-group/v1", "cspm_registration", (
+        ("body", None, "body"),
+    )),
+    ("DeleteCSPMAzureManagementGroup", "DELETE",
+     "/cloud-connect-cspm-azure/entities/management-group/v1", "cspm_registration", (
+         ("tenant_ids", "array", "query"),
+     )),
+    ("AzureRefreshCertificate", "POST", "/cloud-connect-cspm-azure/entities/refresh-certificate/v1", "cspm_registration", (
+        ("tenant_id", "array", "query"),
+        ("years_valid", "string", "query"),
+    )),
+    ("GetCSPMAzureUserScriptsAttachment", "GET",
+     "/cloud-connect-cspm-azure/entities/user-scripts-download/v1", "cspm_registration", (
+         ("tenant-id", "string", "query"),
+         ("subscription_ids", "array", "query"),
+         ("account_type", "string", "query"),
+         ("template", "string", "query"),
+         ("azure_management_group", "boolean", "query"),
+     )),
+    ("GetCSPMCGPAccount", "GET", "/cloud-connect-cspm-gcp/entities/account/v1", "cspm_registration", (
+        ("parent_type", "string", "query"),
+        ("ids", "array", "query"),
+        ("scan-type", "string", "query"),
+        ("status", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("CreateCSPMGCPAccount", "POST", "/cloud-connect-cspm-gcp/entities/account/v1", "cspm_registration", (
+        ("body", None, "body"),
+    )),
+    ("UpdateCSPMGCPAccount", "PATCH", "/cloud-connect-cspm-gcp/entities/account/v1", "cspm_registration", (
+        ("body", None, "body"),
+    )),
+    ("DeleteCSPMGCPAccount", "DELETE", "/cloud-connect-cspm-gcp/entities/account/v1", "cspm_registration", (
+        ("ids", "array", "query"),
+    )),
+    ("ConnectCSPMGCPAccount", "POST", "/cloud-connect-cspm-gcp/entities/account/v2", "cspm_registration", (
+        ("body", None, "body"),
+    )),
+    ("GetCSPMGCPValidateAccountsExt", "POST", "/cloud-connect-cspm-gcp/entities/account/validate/v1", "cspm_registration", (
+        ("body", None, "body"),
+    )),
+    ("GetCSPMGCPServiceAccountsExt", "GET", "/cloud-connect-cspm-gcp/entities/service-accounts/v1", "cspm_registration", (
+        ("id", "string", "query"),
+    )),
+    ("UpdateCSPMGCPServiceAccountsExt", "PATCH", "/cloud-connect-cspm-gcp/entities/service-accounts/v1", "cspm_registration", (
+        ("body", None, "body"),
+    )),
+    ("ValidateCSPMGCPServiceAccountExt", "POST",
+     "/cloud-connect-cspm-gcp/entities/service-accounts/validate/v1", "cspm_registration", (
+         ("body", None, "body"),
+     )),
+    ("GetCSPMGCPUserScriptsAttachment", "GET",
+     "/cloud-connect-cspm-gcp/entities/user-scripts-download/v1", "cspm_registration", (
+         ("parent_type", "string", "query"),
+         ("ids", "array", "query"),
+     )),
+    ("GetBehaviorDetections", "GET", "/detects/entities/ioa/v1", "cspm_registration", (
+        ("cloud_provider", "string", "query"),
+        ("service", "string", "query"),
+        ("account_id", "string", "query"),
+        ("aws_account_id", "string", "query"),
+        ("azure_subscription_id", "string", "query"),
+        ("azure_tenant_id", "string", "query"),
+        ("state", "string", "query"),
+        ("date_time_since", "string", "query"),
+        ("since", "string", "query"),
+        ("severity", "string", "query"),
+        ("next_token", "string", "query"),
+        ("limit", "integer", "query"),
+        ("resource_id", "array", "query"),
+        ("resource_uuid", "array", "query"),
+    )),
+    ("GetConfigurationDetections", "GET", "/detects/entities/iom/v1", "cspm_registration", (
+        ("cloud_provider", "string", "query"),
+        ("account_id", "string", "query"),
+        ("azure_subscription_id", "string", "query"),
+        ("azure_tenant_id", "string", "query"),
+        ("status", "string", "query"),
+        ("region", "string", "query"),
+        ("severity", "string", "query"),
+        ("service", "string", "query"),
+        ("next_token", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("GetConfigurationDetectionEntities", "GET", "/detects/entities/iom/v2", "cspm_registration", (
+        ("ids", "array", "query"),
+    )),
+    ("GetConfigurationDetectionIDsV2", "GET", "/detects/queries/iom/v2", "cspm_registration", (
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("next_token", "string", "query"),
+    )),
+    ("GetIOAEvents", "GET", "/ioa/entities/events/v1", "cspm_registration", (
+        ("policy_id", "string", "query"),
+        ("cloud_provider", "string", "query"),
+        ("account_id", "string", "query"),
+        ("aws_account_id", "string", "query"),
+        ("azure_subscription_id", "string", "query"),
+        ("azure_tenant_id", "string", "query"),
+        ("user_ids", "array", "query"),
+        ("state", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("GetIOAUsers", "GET", "/ioa/entities/users/v1", "cspm_registration", (
+        ("policy_id", "string", "query"),
+        ("state", "string", "query"),
+        ("cloud_provider", "string", "query"),
+        ("account_id", "string", "query"),
+        ("aws_account_id", "string", "query"),
+        ("azure_subscription_id", "string", "query"),
+        ("azure_tenant_id", "string", "query"),
+    )),
+    ("GetCSPMPolicy", "GET", "/settings/entities/policy-details/v1", "cspm_registration", (
+        ("ids", "integer", "query"),
+    )),
+    ("GetCSPMPoliciesDetails", "GET", "/settings/entities/policy-details/v2", "cspm_registration", (
+        ("ids", "array", "query"),
+    )),
+    ("GetCSPMPolicySettings", "GET", "/settings/entities/policy/v1", "cspm_registration", (
+        ("service", "string", "query"),
+        ("policy-id", "string", "query"),
+        ("cloud-platform", "string", "query"),
+    )),
+    ("UpdateCSPMPolicySettings", "PATCH", "/settings/entities/policy/v1", "cspm_registration", (
+        ("body", None, "body"),
+    )),
+    ("GetCSPMScanSchedule", "GET", "/settings/scan-schedule/v1", "cspm_registration", (
+        ("cloud-platform", "array", "query"),
+    )),
+    ("UpdateCSPMScanSchedule", "POST", "/settings/scan-schedule/v1", "cspm_registration", (
+        ("body", None, "body"),
+    )),
+)
+
+_custom_ioa_endpoints = (
+    ("get_patterns", "GET", "/ioarules/entities/pattern-severities/v1", "custom_ioa", (
+        ("ids", "array", "query"),
+    )),
+    ("get_platformsMixin0", "GET", "/ioarules/entities/platforms/v1", "custom_ioa", (
+        ("ids", "array", "query"),
+    )),
+    ("get_rule_groupsMixin0", "GET", "/ioarules/entities/rule-groups/v1", "custom_ioa", (
+        ("ids", "array", "query"),
+    )),
+    ("create_rule_groupMixin0", "POST", "/ioarules/entities/rule-groups/v1", "custom_ioa", (
+        ("body", None, "body"),
+    )),
+    ("update_rule_groupMixin0", "PATCH", "/ioarules/entities/rule-groups/v1", "custom_ioa", (
+        ("body", None, "body"),
+    )),
+    ("delete_rule_groupsMixin0", "DELETE", "/ioarules/entities/rule-groups/v1", "custom_ioa", (
+        ("comment", "string", "query"),
+        ("ids", "array", "query"),
+    )),
+    ("get_rule_types", "GET", "/ioarules/entities/rule-types/v1", "custom_ioa", (
+        ("ids", "array", "query"),
+    )),
+    ("get_rules_get", "POST", "/ioarules/entities/rules/GET/v1", "custom_ioa", (
+        ("body", None, "body"),
+    )),
+    ("get_rulesMixin0", "GET", "/ioarules/entities/rules/v1", "custom_ioa", (
+        ("ids", "array", "query"),
+    )),
+    ("create_rule", "POST", "/ioarules/entities/rules/v1", "custom_ioa", (
+        ("body", None, "body"),
+    )),
+    ("update_rules", "PATCH", "/ioarules/entities/rules/v1", "custom_ioa", (
+        ("body", None, "body"),
+    )),
+    ("delete_rules", "DELETE", "/ioarules/entities/rules/v1", "custom_ioa", (
+        ("rule_group_id", "string", "query"),
+        ("comment", "string", "query"),
+        ("ids", "array", "query"),
+    )),
+    ("update_rules_v2", "PATCH", "/ioarules/entities/rules/v2", "custom_ioa", (
+        ("body", None, "body"),
+    )),
+    ("validate", "POST", "/ioarules/entities/rules/validate/v1", "custom_ioa", (
+        ("body", None, "body"),
+    )),
+    ("query_patterns", "GET", "/ioarules/queries/pattern-severities/v1", "custom_ioa", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query_platformsMixin0", "GET", "/ioarules/queries/platforms/v1", "custom_ioa", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query_rule_groups_full", "GET", "/ioarules/queries/rule-groups-full/v1", "custom_ioa", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query_rule_groupsMixin0", "GET", "/ioarules/queries/rule-groups/v1", "custom_ioa", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query_rule_types", "GET", "/ioarules/queries/rule-types/v1", "custom_ioa", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query_rulesMixin0", "GET", "/ioarules/queries/rules/v1", "custom_ioa", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+)
+
+_custom_storage_endpoints = (
+    ("ListCollections", "GET", "/customobjects/v1/collections", "custom_storage", (
+        ("end", "string", "query"),
+        ("limit", "integer", "query"),
+        ("start", "string", "query"),
+    )),
+    ("DescribeCollections", "PUT", "/customobjects/v1/collections", "custom_storage", (
+        ("names", "array", "query"),
+    )),
+    ("DescribeCollection", "GET", "/customobjects/v1/collections/{collection_name}", "custom_storage", (
+        ("collection_name", "string", "path"),
+    )),
+    ("ListObjects", "GET", "/customobjects/v1/collections/{collection_name}/objects", "custom_storage", (
+        ("collection_name", "string", "path"),
+        ("end", "string", "query"),
+        ("limit", "integer", "query"),
+        ("start", "string", "query"),
+    )),
+    ("SearchObjects", "POST", "/customobjects/v1/collections/{collection_name}/objects", "custom_storage", (
+        ("collection_name", "string", "path"),
+        ("filter", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("GetObject", "GET", "/customobjects/v1/collections/{collection_name}/objects/{object_key}", "custom_storage", (
+        ("collection_name", "string", "path"),
+        ("object_key", "string", "path"),
+    )),
+    ("PutObject", "PUT", "/customobjects/v1/collections/{collection_name}/objects/{object_key}", "custom_storage", (
+        ("body", None, "body"),
+        ("collection_name", "string", "path"),
+        ("dry_run", "boolean", "query"),
+        ("object_key", "string", "path"),
+        ("schema_version", "string", "query"),
+    )),
+    ("DeleteObject", "DELETE", "/customobjects/v1/collections/{collection_name}/objects/{object_key}", "custom_storage", (
+        ("collection_name", "string", "path"),
+        ("dry_run", "boolean", "query"),
+        ("object_key", "string", "path"),
+    )),
+    ("GetObjectMetadata", "GET",
+     "/customobjects/v1/collections/{collection_name}/objects/{object_key}/metadata", "custom_storage", (
+         ("collection_name", "string", "path"),
+         ("object_key", "string", "path"),
+     )),
+    ("ListSchemas", "GET", "/customobjects/v1/collections/{collection_name}/schemas", "custom_storage", (
+        ("collection_name", "string", "path"),
+        ("end", "string", "query"),
+        ("limit", "integer", "query"),
+        ("start", "string", "query"),
+    )),
+    ("GetSchema", "GET", "/customobjects/v1/collections/{collection_name}/schemas/{schema_version}", "custom_storage", (
+        ("collection_name", "string", "path"),
+        ("schema_version", "string", "path"),
+    )),
+    ("GetSchemaMetadata", "GET",
+     "/customobjects/v1/collections/{collection_name}/schemas/{schema_version}/metadata", "custom_storage", (
+         ("collection_name", "string", "path"),
+         ("schema_version", "string", "path"),
+     )),
+    ("ListObjectsByVersion", "GET",
+     "/customobjects/v1/collections/{collection_name}/{collection_version}/objects", "custom_storage", (
+         ("collection_name", "string", "path"),
+         ("collection_version", "string", "path"),
+         ("end", "string", "query"),
+         ("limit", "integer", "query"),
+         ("start", "string", "query"),
+     )),
+    ("SearchObjectsByVersion", "POST",
+     "/customobjects/v1/collections/{collection_name}/{collection_version}/objects", "custom_storage", (
+         ("collection_name", "string", "path"),
+         ("collection_version", "string", "path"),
+         ("filter", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+         ("sort", "string", "query"),
+     )),
+    ("GetVersionedObject", "GET",
+     "/customobjects/v1/collections/{collection_name}/{collection_version}/objects/{object_key}", "custom_storage", (
+         ("collection_name", "string", "path"),
+         ("collection_version", "string", "path"),
+         ("object_key", "string", "path"),
+     )),
+    ("PutObjectByVersion", "PUT",
+     "/customobjects/v1/collections/{collection_name}/{collection_version}/objects/{object_key}", "custom_storage", (
+         ("body", None, "body"),
+         ("collection_name", "string", "path"),
+         ("collection_version", "string", "path"),
+         ("dry_run", "boolean", "query"),
+         ("object_key", "string", "path"),
+     )),
+    ("DeleteVersionedObject", "DELETE",
+     "/customobjects/v1/collections/{collection_name}/{collection_version}/objects/{object_key}", "custom_storage", (
+         ("collection_name", "string", "path"),
+         ("collection_version", "string", "path"),
+         ("dry_run", "boolean", "query"),
+         ("object_key", "string", "path"),
+     )),
+    ("GetVersionedObjectMetadata", "GET",
+     "/customobjects/v1/collections/{collection_name}/{collection_version}/objects/{object_key}/metadata", "custom_storage", (
+         ("collection_name", "string", "path"),
+         ("collection_version", "string", "path"),
+         ("object_key", "string", "path"),
+     )),
+)
+
+_d4c_registration_endpoints = (
+    ("GetD4CAwsAccount", "GET", "/cloud-connect-aws/entities/account/v2", "d4c_registration", (
+        ("scan-type", "string", "query"),
+        ("ids", "array", "query"),
+        ("organization-ids", "array", "query"),
+        ("status", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("migrated", "string", "query"),
+    )),
+    ("CreateD4CAwsAccount", "POST", "/cloud-connect-aws/entities/account/v2", "d4c_registration", (
+        ("body", None, "body"),
+    )),
+    ("DeleteD4CAwsAccount", "DELETE", "/cloud-connect-aws/entities/account/v2", "d4c_registration", (
+        ("ids", "array", "query"),
+        ("organization-ids", "array", "query"),
+    )),
+    ("GetD4CAwsConsoleSetupURLs", "GET", "/cloud-connect-aws/entities/console-setup-urls/v1", "d4c_registration", (
+        ("region", "string", "query"),
+    )),
+    ("GetD4CAWSAccountScriptsAttachment", "GET", "/cloud-connect-aws/entities/user-scripts-download/v1", "d4c_registration", (
+        ("ids", "array", "query"),
+        ("template", "string", "query"),
+        ("accounts", "array", "query"),
+        ("behavior_assessment_enabled", "string", "query"),
+        ("sensor_management_enabled", "string", "query"),
+        ("dspm_enabled", "string", "query"),
+        ("dspm_regions", "array", "query"),
+        ("dspm_role", "string", "query"),
+        ("use_existing_cloudtrail", "string", "query"),
+        ("organization_id", "string", "query"),
+        ("organizational_unit_ids", "array", "query"),
+        ("aws_profile", "string", "query"),
+        ("aws_region", "string", "query"),
+        ("iam_role_arn", "string", "query"),
+        ("falcon_client_id", "string", "query"),
+        ("idp_enabled", "string", "query"),
+        ("tags", "string", "query"),
+    )),
+    ("GetDiscoverCloudAzureAccount", "GET", "/cloud-connect-azure/entities/account/v1", "d4c_registration", (
+        ("ids", "array", "query"),
+        ("tenant_ids", "array", "query"),
+        ("scan-type", "string", "query"),
+        ("status", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("CreateDiscoverCloudAzureAccount", "POST", "/cloud-connect-azure/entities/account/v1", "d4c_registration", (
+        ("body", None, "body"),
+    )),
+    ("UpdateDiscoverCloudAzureAccountClientID", "PATCH", "/cloud-connect-azure/entities/client-id/v1", "d4c_registration", (
+        ("id", "string", "query"),
+        ("object_id", "string", "query"),
+        ("tenant-id", "string", "query"),
+    )),
+    ("DiscoverCloudAzureDownloadCertificate", "GET",
+     "/cloud-connect-azure/entities/download-certificate/v1", "d4c_registration", (
+         ("tenant_id", "array", "query"),
+         ("refresh", "boolean", "query"),
+         ("years_valid", "string", "query"),
+     )),
+    ("GetDiscoverCloudAzureTenantIDs", "GET", "/cloud-connect-azure/entities/tenant-id/v1", "d4c_registration", (
+    )),
+    ("GetDiscoverCloudAzureUserScriptsAttachment", "GET",
+     "/cloud-connect-azure/entities/user-scripts-download/v1", "d4c_registration", (
+         ("tenant-id", "array", "query"),
+         ("subscription_ids", "array", "query"),
+         ("template", "string", "query"),
+         ("azure_management_group", "boolean", "query"),
+     )),
+    ("GetDiscoverCloudAzureUserScripts", "GET", "/cloud-connect-azure/entities/user-scripts/v1", "d4c_registration", (
+    )),
+    ("GetD4CCGPAccount", "GET", "/cloud-connect-gcp/entities/account/v1", "d4c_registration", (
+        ("parent_type", "string", "query"),
+        ("ids", "array", "query"),
+        ("scan-type", "string", "query"),
+        ("status", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("CreateD4CGCPAccount", "POST", "/cloud-connect-gcp/entities/account/v1", "d4c_registration", (
+        ("body", None, "body"),
+    )),
+    ("GetCSPMGCPUserScriptsAttachment", "GET", "/cloud-connect-gcp/entities/user-scripts-download/v1", "d4c_registration", (
+    )),
+    ("DeleteD4CGCPAccount", "DELETE", "/cloud-connect-gcp/entities/account/v1", "d4c_registration", (
+        ("ids", "array", "query"),
+    )),
+    ("ConnectD4CGCPAccount", "POST", "/cloud-connect-gcp/entities/account/v2", "d4c_registration", (
+        ("body", None, "body"),
+    )),
+    ("GetD4CGCPServiceAccountsExt", "GET", "/cloud-connect-gcp/entities/service-accounts/v1", "d4c_registration", (
+        ("id", "string", "query"),
+    )),
+    ("UpdateD4CGCPServiceAccountsExt", "PATCH", "/cloud-connect-gcp/entities/service-accounts/v1", "d4c_registration", (
+        ("body", None, "body"),
+    )),
+    ("GetD4CGCPUserScriptsAttachment", "GET", "/cloud-connect-gcp/entities/user-scripts-download/v1", "d4c_registration", (
+        ("parent_type", "string", "query"),
+        ("ids", "array", "query"),
+        ("status", "string", "query"),
+    )),
+    ("GetD4CGCPUserScripts", "GET", "/cloud-connect-gcp/entities/user-scripts/v1", "d4c_registration", (
+        ("parent_type", "string", "query"),
+    )),
+    ("GetHorizonD4CScripts", "GET", "/settings-discover/entities/gen/scripts/v1", "d4c_registration", (
+        ("single_account", "string", "query"),
+        ("organization-id", "string", "query"),
+        ("delete", "string", "query"),
+        ("account_type", "string", "query"),
+    )),
+)
+
+_datascanner_endpoints = (
+    ("get_image_registry_credentials", "GET", "/data-security-dspm/entities/image-registry-credentials/v1", "datascanner", (
+    )),
+    ("handle", "POST", "/data-security-dspm/entities/kafka-rest-produce/v1", "datascanner", (
+    )),
+    ("get_data_scanner_tasks", "GET", "/data-security-dspm/entities/scanner-tasks/v1", "datascanner", (
+        ("X-Scanner-Id", "string", "header"),
+    )),
+    ("update_data_scanner_tasks", "PATCH", "/data-security-dspm/entities/scanner-tasks/v1", "datascanner", (
+        ("X-Scanner-Id", "string", "header"),
+        ("X-Machine-Id", "string", "header"),
+    )),
+)
+
+_delivery_settings_endpoints = (
+    ("GetDeliverySettings", "GET", "/delivery-settings/entities/delivery-settings/v1", "delivery_settings", (
+    )),
+    ("PostDeliverySettings", "POST", "/delivery-settings/entities/delivery-settings/v1", "delivery_settings", (
+        ("body", None, "body"),
+    )),
+)
+
+_detects_endpoints = (
+    ("GetAggregateDetects", "POST", "/detects/aggregates/detects/GET/v1", "detects", (
+        ("body", None, "body"),
+    )),
+    ("UpdateDetectsByIdsV2", "PATCH", "/detects/entities/detects/v2", "detects", (
+        ("body", None, "body"),
+    )),
+    ("GetDetectSummaries", "POST", "/detects/entities/summaries/GET/v1", "detects", (
+        ("body", None, "body"),
+    )),
+    ("QueryDetects", "GET", "/detects/queries/detects/v1", "detects", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+    )),
+)
+
+_device_content_endpoints = (
+    ("entities_states_v1", "GET", "/device-content/entities/states/v1", "device_content", (
+        ("ids", "array", "query"),
+    )),
+    ("queries_states_v1", "GET", "/device-content/queries/states/v1", "device_content", (
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("offset", "integer", "query"),
+        ("filter", "string", "query"),
+    )),
+)
+
+_device_control_policies_endpoints = (
+    ("queryCombinedDeviceControlPolicyMembers", "GET",
+     "/policy/combined/device-control-members/v1", "device_control_policies", (
+         ("id", "string", "query"),
+         ("filter", "string", "query"),
+         ("offset", "integer", "query"),
+         ("limit", "integer", "query"),
+         ("sort", "string", "query"),
+     )),
+    ("queryCombinedDeviceControlPolicies", "GET", "/policy/combined/device-control/v1", "device_control_policies", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("getDefaultDeviceControlPolicies", "GET", "/policy/entities/default-device-control/v1", "device_control_policies", (
+    )),
+    ("updateDefaultDeviceControlPolicies", "PATCH", "/policy/entities/default-device-control/v1", "device_control_policies", (
+        ("body", None, "body"),
+    )),
+    ("performDeviceControlPoliciesAction", "POST", "/policy/entities/device-control-actions/v1", "device_control_policies", (
+        ("action_name", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("patchDeviceControlPoliciesClassesV1", "PATCH", "/policy/entities/device-control-classes/v1", "device_control_policies", (
+        ("body", None, "body"),
+    )),
+    ("getDefaultDeviceControlSettings", "GET",
+     "/policy/entities/device-control-default-settings/v1", "device_control_policies", (
+     )),
+    ("updateDefaultDeviceControlSettings", "PATCH",
+     "/policy/entities/device-control-default-settings/v1", "device_control_policies", (
+         ("body", None, "body"),
+     )),
+    ("setDeviceControlPoliciesPrecedence", "POST",
+     "/policy/entities/device-control-precedence/v1", "device_control_policies", (
+         ("body", None, "body"),
+     )),
+    ("getDeviceControlPolicies", "GET", "/policy/entities/device-control/v1", "device_control_policies", (
+        ("ids", "array", "query"),
+    )),
+    ("createDeviceControlPolicies", "POST", "/policy/entities/device-control/v1", "device_control_policies", (
+        ("body", None, "body"),
+    )),
+    ("updateDeviceControlPolicies", "PATCH", "/policy/entities/device-control/v1", "device_control_policies", (
+        ("body", None, "body"),
+    )),
+    ("deleteDeviceControlPolicies", "DELETE", "/policy/entities/device-control/v1", "device_control_policies", (
+        ("ids", "array", "query"),
+    )),
+    ("getDeviceControlPoliciesV2", "GET", "/policy/entities/device-control/v2", "device_control_policies", (
+        ("ids", "array", "query"),
+    )),
+    ("postDeviceControlPoliciesV2", "POST", "/policy/entities/device-control/v2", "device_control_policies", (
+        ("body", None, "body"),
+    )),
+    ("patchDeviceControlPoliciesV2", "PATCH", "/policy/entities/device-control/v2", "device_control_policies", (
+        ("body", None, "body"),
+    )),
+    ("queryDeviceControlPolicyMembers", "GET", "/policy/queries/device-control-members/v1", "device_control_policies", (
+        ("id", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("queryDeviceControlPolicies", "GET", "/policy/queries/device-control/v1", "device_control_policies", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_discover_endpoints = (
+    ("combined_applications", "GET", "/discover/combined/applications/v1", "discover", (
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("facet", "array", "query"),
+    )),
+    ("combined_hosts", "GET", "/discover/combined/hosts/v1", "discover", (
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("facet", "array", "query"),
+    )),
+    ("get_accounts", "GET", "/discover/entities/accounts/v1", "discover", (
+        ("ids", "array", "query"),
+    )),
+    ("get_applications", "GET", "/discover/entities/applications/v1", "discover", (
+        ("ids", "array", "query"),
+    )),
+    ("get_hosts", "GET", "/discover/entities/hosts/v1", "discover", (
+        ("ids", "array", "query"),
+    )),
+    ("get_iot_hosts", "GET", "/discover/entities/iot-hosts/v1", "discover", (
+        ("ids", "array", "query"),
+    )),
+    ("get_logins", "GET", "/discover/entities/logins/v1", "discover", (
+        ("ids", "array", "query"),
+    )),
+    ("query_accounts", "GET", "/discover/queries/accounts/v1", "discover", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("query_applications", "GET", "/discover/queries/applications/v1", "discover", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("query_hosts", "GET", "/discover/queries/hosts/v1", "discover", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("query_iot_hosts", "GET", "/discover/queries/iot-hosts/v1", "discover", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("query_iot_hostsV2", "GET", "/discover/queries/iot-hosts/v2", "discover", (
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("query_logins", "GET", "/discover/queries/logins/v1", "discover", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+)
+
+_deployments_endpoints = (
+    ("CombinedReleaseNotesV1", "GET", "/deployment-coordinator/combined/release-notes/v1", "deployments", (
+        ("Authorization", "string", "header"),
+        ("filter", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "string", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("CombinedReleasesV1Mixin0", "GET", "/deployment-coordinator/combined/releases/v1", "deployments", (
+        ("Authorization", "string", "header"),
+        ("filter", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "string", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("GetDeploymentsExternalV1", "GET", "/deployment-coordinator/entities/deployments/external/v1", "deployments", (
+        ("Authorization", "string", "header"),
+        ("ids", "array", "query"),
+    )),
+    ("GetEntityIDsByQueryPOST", "POST", "/deployment-coordinator/entities/release-notes/GET/v1", "deployments", (
+        ("Authorization", "string", "header"),
+        ("body", None, "body"),
+    )),
+    ("QueryReleaseNotesV1", "GET", "/deployment-coordinator/queries/release-notes/v1", "deployments", (
+        ("Authorization", "string", "header"),
+        ("filter", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "string", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_downloads_endpoints = (
+    ("DownloadFile", "GET", "/csdownloads/entities/files/download/v1", "downloads", (
+        ("file_name", "string", "query"),
+        ("file_version", "string", "query"),
+    )),
+    ("EnumerateFile", "GET", "/csdownloads/entities/files/enumerate/v1", "downloads", (
+        ("file_name", "string", "query"),
+        ("file_version", "string", "query"),
+        ("platform", "string", "query"),
+        ("os", "string", "query"),
+        ("arch", "string", "query"),
+        ("category", "string", "query"),
+    )),
+)
+
+_drift_indicators_endpoints = (
+    ("GetDriftIndicatorsValuesByDate", "GET",
+     "/container-security/aggregates/drift-indicators/count-by-date/v1", "drift_indicators", (
+         ("filter", "string", "query"),
+         ("limit", "integer", "query"),
+     )),
+    ("ReadDriftIndicatorsCount", "GET", "/container-security/aggregates/drift-indicators/count/v1", "drift_indicators", (
+        ("filter", "string", "query"),
+    )),
+    ("SearchAndReadDriftIndicatorEntities", "GET", "/container-security/combined/drift-indicators/v1", "drift_indicators", (
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("ReadDriftIndicatorEntities", "GET", "/container-security/entities/drift-indicators/v1", "drift_indicators", (
+        ("ids", "array", "query"),
+    )),
+    ("SearchDriftIndicators", "GET", "/container-security/queries/drift-indicators/v1", "drift_indicators", (
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+)
+
+_event_streams_endpoints = (
+    ("refreshActiveStreamSession", "POST", "/sensors/entities/datafeed-actions/v1/{}", "event_streams", (
+        ("action_name", "string", "query"),
+        ("appId", "string", "query"),
+        ("partition", "integer", "path"),
+    )),
+    ("listAvailableStreamsOAuth2", "GET", "/sensors/entities/datafeed/v2", "event_streams", (
+        ("appId", "string", "query"),
+        ("format", "string", "query"),
+    )),
+)
+
+_exposure_management_endpoints = (
+    ("aggregate_external_assets", "POST", "/fem/aggregates/external-assets/v1", "exposure_management", (
+        ("body", None, "body"),
+    )),
+    ("combined_ecosystem_subsidiaries", "GET", "/fem/combined/ecosystem-subsidiaries/v1", "exposure_management", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("version_id", "string", "query"),
+    )),
+    ("blob_download_external_assets", "GET", "/fem/entities/blobs-download/v1", "exposure_management", (
+        ("assetId", "string", "query"),
+        ("hash", "string", "query"),
+    )),
+    ("blob_preview_external_assets", "GET", "/fem/entities/blobs-preview/v1", "exposure_management", (
+        ("assetId", "string", "query"),
+        ("hash", "string", "query"),
+    )),
+    ("get_ecosystem_subsidiaries", "GET", "/fem/entities/ecosystem-subsidiaries/v1", "exposure_management", (
+        ("ids", "array", "query"),
+        ("version_id", "string", "query"),
+    )),
+    ("post_external_assets_inventory_v1", "POST", "/fem/entities/external-asset-inventory/v1", "exposure_management", (
+        ("body", None, "body"),
+    )),
+    ("get_external_assets", "GET", "/fem/entities/external-assets/v1", "exposure_management", (
+        ("ids", "array", "query"),
+    )),
+    ("patch_external_assets", "PATCH", "/fem/entities/external-assets/v1", "exposure_management", (
+        ("body", None, "body"),
+    )),
+    ("delete_external_assets", "DELETE", "/fem/entities/external-assets/v1", "exposure_management", (
+        ("ids", "array", "query"),
+        ("body", None, "body"),
+    )),
+    ("query_ecosystem_subsidiaries", "GET", "/fem/queries/ecosystem-subsidiaries/v1", "exposure_management", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("version_id", "string", "query"),
+    )),
+    ("query_external_assets", "GET", "/fem/queries/external-assets/v1", "exposure_management", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+)
+
+_faas_execution_endpoints = (
+    ("ReadRequestBody", "GET", "/faas-gateway/entities/execution-request-body/v2", "faas_execution", (
+        ("id", "string", "query"),
+        ("fn", "string", "query"),
+        ("filename", "string", "query"),
+        ("sha256", "string", "query"),
+    )),
+)
+
+_falcon_complete_dashboard_endpoints = (
+    ("AggregateAlerts", "POST", "/falcon-complete-dashboards/aggregates/alerts/GET/v1", "falcon_complete_dashboard", (
+        ("body", None, "body"),
+    )),
+    ("AggregateAllowList", "POST", "/falcon-complete-dashboards/aggregates/allowlist/GET/v1", "falcon_complete_dashboard", (
+        ("body", None, "body"),
+    )),
+    ("AggregateBlockList", "POST", "/falcon-complete-dashboards/aggregates/blocklist/GET/v1", "falcon_complete_dashboard", (
+        ("body", None, "body"),
+    )),
+    ("AggregateDetections", "POST", "/falcon-complete-dashboards/aggregates/detects/GET/v1", "falcon_complete_dashboard", (
+        ("body", None, "body"),
+    )),
+    ("AggregateDeviceCountCollection", "POST",
+     "/falcon-complete-dashboards/aggregates/devicecount-collections/GET/v1", "falcon_complete_dashboard", (
+         ("body", None, "body"),
+     )),
+    ("AggregateEscalations", "POST",
+     "/falcon-complete-dashboards/aggregates/escalations/GET/v1", "falcon_complete_dashboard", (
+         ("body", None, "body"),
+     )),
+    ("AggregateFCIncidents", "POST", "/falcon-complete-dashboards/aggregates/incidents/GET/v1", "falcon_complete_dashboard", (
+        ("body", None, "body"),
+    )),
+    ("AggregatePreventionPolicy", "POST",
+     "/falcon-complete-dashboards/aggregates/prevention-policies/v1", "falcon_complete_dashboard", (
+         ("body", None, "body"),
+     )),
+    ("AggregateRemediations", "POST",
+     "/falcon-complete-dashboards/aggregates/remediations/GET/v1", "falcon_complete_dashboard", (
+         ("body", None, "body"),
+     )),
+    ("AggregateSensorUpdatePolicy", "POST",
+     "/falcon-complete-dashboards/aggregates/sensor-update-policies/v1", "falcon_complete_dashboard", (
+         ("body", None, "body"),
+     )),
+    ("AggregateSupportIssues", "POST",
+     "/falcon-complete-dashboards/aggregates/support-issues/v1", "falcon_complete_dashboard", (
+         ("body", None, "body"),
+     )),
+    ("AggregateTotalDeviceCounts", "POST",
+     "/falcon-complete-dashboards/aggregates/total-device-counts/v1", "falcon_complete_dashboard", (
+         ("body", None, "body"),
+     )),
+    ("QueryAlertIdsByFilter", "GET", "/falcon-complete-dashboards/queries/alerts/v1", "falcon_complete_dashboard", (
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+    )),
+    ("QueryAllowListFilter", "GET", "/falcon-complete-dashboards/queries/allowlist/v1", "falcon_complete_dashboard", (
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+    )),
+    ("QueryBlockListFilter", "GET", "/falcon-complete-dashboards/queries/blocklist/v1", "falcon_complete_dashboard", (
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+    )),
+    ("QueryDetectionIdsByFilter", "GET", "/falcon-complete-dashboards/queries/detects/v1", "falcon_complete_dashboard", (
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+    )),
+    ("GetDeviceCountCollectionQueriesByFilter", "GET",
+     "/falcon-complete-dashboards/queries/devicecount-collections/v1", "falcon_complete_dashboard", (
+         ("limit", "integer", "query"),
+         ("sort", "string", "query"),
+         ("filter", "string", "query"),
+         ("offset", "string", "query"),
+     )),
+    ("QueryEscalationsFilter", "GET", "/falcon-complete-dashboards/queries/escalations/v1", "falcon_complete_dashboard", (
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+    )),
+    ("QueryIncidentIdsByFilter", "GET", "/falcon-complete-dashboards/queries/incidents/v1", "falcon_complete_dashboard", (
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+    )),
+    ("QueryRemediationsFilter", "GET", "/falcon-complete-dashboards/queries/remediations/v1", "falcon_complete_dashboard", (
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+    )),
+)
+
+_falcon_container_endpoints = (
+    ("DownloadExportFile", "GET", "/container-security/entities/exports/files/v1", "falcon_container", (
+        ("id", "string", "query"),
+    )),
+    ("ReadExportJobs", "GET", "/container-security/entities/exports/v1", "falcon_container", (
+        ("ids", "array", "query"),
+    )),
+    ("LaunchExportJob", "POST", "/container-security/entities/exports/v1", "falcon_container", (
+        ("body", None, "body"),
+    )),
+    ("GetCredentials", "GET", "/container-security/entities/image-registry-credentials/v1", "falcon_container", (
+    )),
+    ("ReadRegistryEntitiesByUUID", "GET", "/container-security/entities/registries/v1", "falcon_container", (
+        ("ids", "string", "query"),
+    )),
+    ("CreateRegistryEntities", "POST", "/container-security/entities/registries/v1", "falcon_container", (
+        ("body", None, "body"),
+    )),
+    ("UpdateRegistryEntities", "PATCH", "/container-security/entities/registries/v1", "falcon_container", (
+        ("id", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("DeleteRegistryEntities", "DELETE", "/container-security/entities/registries/v1", "falcon_container", (
+        ("ids", "string", "query"),
+    )),
+    ("QueryExportJobs", "GET", "/container-security/queries/exports/v1", "falcon_container", (
+        ("filter", "string", "query"),
+    )),
+    ("ReadRegistryEntities", "GET", "/container-security/queries/registries/v1", "falcon_container", (
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("ReadImageVulnerabilities", "POST", "/image-assessment/combined/vulnerability-lookups/v1", "falcon_container", (
+        ("body", None, "body"),
+    )),
+    ("GetCombinedImages", "GET", "/container-security/combined/image-assessment/images/v1", "falcon_container_image", (
+        ("filter", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("GetImageAssessmentReport", "GET", "/reports", "falcon_container", (
+        ("digest", "string", "query"),
+        ("image_id", "string", "query"),
+        ("repository", "string", "query"),
+        ("tag", "string", "query"),
+    )),
+    ("DeleteImageDetails", "DELETE", "/images/{}", "falcon_container", (
+        ("image_id", "string", "path"),
+    )),
+    ("ImageMatchesPolicy", "GET", "/policy-checks", "falcon_container", (
+        ("repository", "string", "query"),
+        ("tag", "string", "query"),
+    )),
+)
+
+_falconx_sandbox_endpoints = (
+    ("GetArtifacts", "GET", "/falconx/entities/artifacts/v1", "falconx_sandbox", (
+        ("id", "string", "query"),
+        ("name", "string", "query"),
+        ("Accept-Encoding", "string", "header"),
+    )),
+    ("GetMemoryDumpExtractedStrings", "GET", "/falconx/entities/memory-dump/extracted-strings/v1", "falconx_sandbox", (
+        ("id", "string", "query"),
+        ("name", "string", "query"),
+        ("Accept-Encoding", "string", "header"),
+    )),
+    ("GetMemoryDumpHexDump", "GET", "/falconx/entities/memory-dump/hex-dump/v1", "falconx_sandbox", (
+        ("id", "string", "query"),
+        ("name", "string", "query"),
+        ("Accept-Encoding", "string", "header"),
+    )),
+    ("GetMemoryDump", "GET", "/falconx/entities/memory-dump/v1", "falconx_sandbox", (
+        ("id", "string", "query"),
+        ("name", "string", "query"),
+        ("Accept-Encoding", "string", "header"),
+    )),
+    ("GetSummaryReports", "GET", "/falconx/entities/report-summaries/v1", "falconx_sandbox", (
+        ("ids", "array", "query"),
+    )),
+    ("GetReports", "GET", "/falconx/entities/reports/v1", "falconx_sandbox", (
+        ("ids", "array", "query"),
+    )),
+    ("DeleteReport", "DELETE", "/falconx/entities/reports/v1", "falconx_sandbox", (
+        ("ids", "string", "query"),
+    )),
+    ("GetSubmissions", "GET", "/falconx/entities/submissions/v1", "falconx_sandbox", (
+        ("ids", "array", "query"),
+    )),
+    ("Submit", "POST", "/falconx/entities/submissions/v1", "falconx_sandbox", (
+        ("aid", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("QueryReports", "GET", "/falconx/queries/reports/v1", "falconx_sandbox", (
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("QuerySubmissions", "GET", "/falconx/queries/submissions/v1", "falconx_sandbox", (
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("GetSampleV2", "GET", "/samples/entities/samples/v2", "falconx_sandbox", (
+        ("ids", "string", "query"),
+        ("password_protected", "boolean", "query"),
+    )),
+    ("UploadSampleV2", "POST", "/samples/entities/samples/v2", "falconx_sandbox", (
+        ("sample", "file", "formData"),
+        ("file_name", "string", "formData"),
+        ("comment", "string", "formData"),
+        ("is_confidential", "boolean", "formData"),
+    )),
+    ("DeleteSampleV2", "DELETE", "/samples/entities/samples/v2", "falconx_sandbox", (
+        ("ids", "string", "query"),
+    )),
+    ("QuerySampleV1", "POST", "/samples/queries/samples/GET/v1", "falconx_sandbox", (
+        ("body", None, "body"),
+    )),
+)
+
+_filevantage_endpoints = (
+    ("getActionsMixin0", "GET", "/filevantage/entities/actions/v1", "filevantage", (
+        ("ids", "array", "query"),
+    )),
+    ("startActions", "POST", "/filevantage/entities/actions/v1", "filevantage", (
+        ("body", None, "body"),
+    )),
+    ("getContents", "GET", "/filevantage/entities/change-content/v1", "filevantage", (
+        ("id", "string", "query"),
+        ("Accept-Encoding", "string", "header"),
+    )),
+    ("getChanges", "GET", "/filevantage/entities/changes/v2", "filevantage", (
+        ("ids", "array", "query"),
+    )),
+    ("updatePolicyHostGroups", "PATCH", "/filevantage/entities/policies-host-groups/v1", "filevantage", (
+        ("policy_id", "string", "query"),
+        ("action", "string", "query"),
+        ("ids", "array", "query"),
+    )),
+    ("updatePolicyPrecedence", "PATCH", "/filevantage/entities/policies-precedence/v1", "filevantage", (
+        ("ids", "array", "query"),
+        ("type", "string", "query"),
+    )),
+    ("updatePolicyRuleGroups", "PATCH", "/filevantage/entities/policies-rule-groups/v1", "filevantage", (
+        ("policy_id", "string", "query"),
+        ("action", "string", "query"),
+        ("ids", "array", "query"),
+    )),
+    ("getPolicies", "GET", "/filevantage/entities/policies/v1", "filevantage", (
+        ("ids", "array", "query"),
+    )),
+    ("createPolicies", "POST", "/filevantage/entities/policies/v1", "filevantage", (
+        ("body", None, "body"),
+    )),
+    ("updatePolicies", "PATCH", "/filevantage/entities/policies/v1", "filevantage", (
+        ("body", None, "body"),
+    )),
+    ("deletePolicies", "DELETE", "/filevantage/entities/policies/v1", "filevantage", (
+        ("ids", "array", "query"),
+    )),
+    ("getScheduledExclusions", "GET", "/filevantage/entities/policy-scheduled-exclusions/v1", "filevantage", (
+        ("policy_id", "string", "query"),
+        ("ids", "array", "query"),
+    )),
+    ("createScheduledExclusions", "POST", "/filevantage/entities/policy-scheduled-exclusions/v1", "filevantage", (
+        ("body", None, "body"),
+    )),
+    ("updateScheduledExclusions", "PATCH", "/filevantage/entities/policy-scheduled-exclusions/v1", "filevantage", (
+        ("body", None, "body"),
+    )),
+    ("deleteScheduledExclusions", "DELETE", "/filevantage/entities/policy-scheduled-exclusions/v1", "filevantage", (
+        ("policy_id", "string", "query"),
+        ("ids", "array", "query"),
+    )),
+    ("updateRuleGroupPrecedence", "PATCH", "/filevantage/entities/rule-groups-rule-precedence/v1", "filevantage", (
+        ("rule_group_id", "string", "query"),
+        ("ids", "array", "query"),
+    )),
+    ("getRules", "GET", "/filevantage/entities/rule-groups-rules/v1", "filevantage", (
+        ("rule_group_id", "string", "query"),
+        ("ids", "array", "query"),
+    )),
+    ("createRules", "POST", "/filevantage/entities/rule-groups-rules/v1", "filevantage", (
+        ("body", None, "body"),
+    )),
+    ("updateRules", "PATCH", "/filevantage/entities/rule-groups-rules/v1", "filevantage", (
+        ("body", None, "body"),
+    )),
+    ("deleteRules", "DELETE", "/filevantage/entities/rule-groups-rules/v1", "filevantage", (
+        ("rule_group_id", "string", "query"),
+        ("ids", "array", "query"),
+    )),
+    ("getRuleGroups", "GET", "/filevantage/entities/rule-groups/v1", "filevantage", (
+        ("ids", "array", "query"),
+    )),
+    ("createRuleGroups", "POST", "/filevantage/entities/rule-groups/v1", "filevantage", (
+        ("body", None, "body"),
+    )),
+    ("updateRuleGroups", "PATCH", "/filevantage/entities/rule-groups/v1", "filevantage", (
+        ("body", None, "body"),
+    )),
+    ("deleteRuleGroups", "DELETE", "/filevantage/entities/rule-groups/v1", "filevantage", (
+        ("ids", "array", "query"),
+    )),
+    ("signalChangesExternal", "POST", "/filevantage/entities/workflow/v1", "filevantage", (
+        ("body", None, "body"),
+    )),
+    ("queryActionsMixin0", "GET", "/filevantage/queries/actions/v1", "filevantage", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("queryChanges", "GET", "/filevantage/queries/changes/v2", "filevantage", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("highVolumeQueryChanges", "GET", "/filevantage/queries/changes/v3", "filevantage", (
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("queryPolicies", "GET", "/filevantage/queries/policies/v1", "filevantage", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("type", "string", "query"),
+    )),
+    ("queryScheduledExclusions", "GET", "/filevantage/queries/policy-scheduled-exclusions/v1", "filevantage", (
+        ("policy_id", "string", "query"),
+    )),
+    ("queryRuleGroups", "GET", "/filevantage/queries/rule-groups/v1", "filevantage", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("type", "string", "query"),
+    )),
+)
+
+_firewall_management_endpoints = (
+    ("aggregate_events", "POST", "/fwmgr/aggregates/events/GET/v1", "firewall_management", (
+        ("body", None, "body"),
+    )),
+    ("aggregate_policy_rules", "POST", "/fwmgr/aggregates/policy-rules/GET/v1", "firewall_management", (
+        ("body", None, "body"),
+    )),
+    ("aggregate_rule_groups", "POST", "/fwmgr/aggregates/rule-groups/GET/v1", "firewall_management", (
+        ("body", None, "body"),
+    )),
+    ("aggregate_rules", "POST", "/fwmgr/aggregates/rules/GET/v1", "firewall_management", (
+        ("body", None, "body"),
+    )),
+    ("get_events", "GET", "/fwmgr/entities/events/v1", "firewall_management", (
+        ("ids", "array", "query"),
+    )),
+    ("get_firewall_fields", "GET", "/fwmgr/entities/firewall-fields/v1", "firewall_management", (
+        ("ids", "array", "query"),
+    )),
+    ("get_network_locations_details", "GET", "/fwmgr/entities/network-locations-details/v1", "firewall_management", (
+        ("ids", "array", "query"),
+    )),
+    ("update_network_locations_metadata", "POST", "/fwmgr/entities/network-locations-metadata/v1", "firewall_management", (
+        ("comment", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("update_network_locations_precedence", "POST", "/fwmgr/entities/network-locations-precedence/v1", "firewall_management", (
+        ("comment", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("get_network_locations", "GET", "/fwmgr/entities/network-locations/v1", "firewall_management", (
+        ("ids", "array", "query"),
+    )),
+    ("upsert_network_locations", "PUT", "/fwmgr/entities/network-locations/v1", "firewall_management", (
+        ("comment", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("create_network_locations", "POST", "/fwmgr/entities/network-locations/v1", "firewall_management", (
+        ("clone_id", "string", "query"),
+        ("add_fw_rules", "boolean", "query"),
+        ("comment", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("update_network_locations", "PATCH", "/fwmgr/entities/network-locations/v1", "firewall_management", (
+        ("comment", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("delete_network_locations", "DELETE", "/fwmgr/entities/network-locations/v1", "firewall_management", (
+        ("ids", "array", "query"),
+    )),
+    ("get_platforms", "GET", "/fwmgr/entities/platforms/v1", "firewall_management", (
+        ("ids", "array", "query"),
+    )),
+    ("get_policy_containers", "GET", "/fwmgr/entities/policies/v1", "firewall_management", (
+        ("ids", "array", "query"),
+    )),
+    ("update_policy_container_v1", "PUT", "/fwmgr/entities/policies/v1", "firewall_management", (
+        ("body", None, "body"),
+    )),
+    ("update_policy_container", "PUT", "/fwmgr/entities/policies/v2", "firewall_management", (
+        ("body", None, "body"),
+    )),
+    ("get_rule_groups", "GET", "/fwmgr/entities/rule-groups/v1", "firewall_management", (
+        ("ids", "array", "query"),
+    )),
+    ("create_rule_group", "POST", "/fwmgr/entities/rule-groups/v1", "firewall_management", (
+        ("clone_id", "string", "query"),
+        ("library", "string", "query"),
+        ("comment", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("update_rule_group", "PATCH", "/fwmgr/entities/rule-groups/v1", "firewall_management", (
+        ("comment", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("delete_rule_groups", "DELETE", "/fwmgr/entities/rule-groups/v1", "firewall_management", (
+        ("ids", "array", "query"),
+        ("comment", "string", "query"),
+    )),
+    ("create_rule_group_validation", "POST", "/fwmgr/entities/rule-groups/validation/v1", "firewall_management", (
+        ("clone_id", "string", "query"),
+        ("library", "string", "query"),
+        ("comment", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("update_rule_group_validation", "PATCH", "/fwmgr/entities/rule-groups/validation/v1", "firewall_management", (
+        ("comment", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("get_rules", "GET", "/fwmgr/entities/rules/v1", "firewall_management", (
+        ("ids", "array", "query"),
+    )),
+    ("validate_filepath_pattern", "POST", "/fwmgr/entities/rules/validate-filepath/v1", "firewall_management", (
+        ("body", None, "body"),
+    )),
+    ("query_events", "GET", "/fwmgr/queries/events/v1", "firewall_management", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query_firewall_fields", "GET", "/fwmgr/queries/firewall-fields/v1", "firewall_management", (
+        ("platform_id", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query_network_locations", "GET", "/fwmgr/queries/network-locations/v1", "firewall_management", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query_platforms", "GET", "/fwmgr/queries/platforms/v1", "firewall_management", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query_policy_rules", "GET", "/fwmgr/queries/policy-rules/v1", "firewall_management", (
+        ("id", "string", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query_rule_groups", "GET", "/fwmgr/queries/rule-groups/v1", "firewall_management", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query_rules", "GET", "/fwmgr/queries/rules/v1", "firewall_management", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+)
+
+_firewall_policies_endpoints = (
+    ("queryCombinedFirewallPolicyMembers", "GET", "/policy/combined/firewall-members/v1", "firewall_policies", (
+        ("id", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("queryCombinedFirewallPolicies", "GET", "/policy/combined/firewall/v1", "firewall_policies", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("performFirewallPoliciesAction", "POST", "/policy/entities/firewall-actions/v1", "firewall_policies", (
+        ("action_name", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("setFirewallPoliciesPrecedence", "POST", "/policy/entities/firewall-precedence/v1", "firewall_policies", (
+        ("body", None, "body"),
+    )),
+    ("getFirewallPolicies", "GET", "/policy/entities/firewall/v1", "firewall_policies", (
+        ("ids", "array", "query"),
+    )),
+    ("createFirewallPolicies", "POST", "/policy/entities/firewall/v1", "firewall_policies", (
+        ("body", None, "body"),
+        ("clone_id", "string", "query"),
+    )),
+    ("updateFirewallPolicies", "PATCH", "/policy/entities/firewall/v1", "firewall_policies", (
+        ("body", None, "body"),
+    )),
+    ("deleteFirewallPolicies", "DELETE", "/policy/entities/firewall/v1", "firewall_policies", (
+        ("ids", "array", "query"),
+    )),
+    ("queryFirewallPolicyMembers", "GET", "/policy/queries/firewall-members/v1", "firewall_policies", (
+        ("id", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("queryFirewallPolicies", "GET", "/policy/queries/firewall/v1", "firewall_policies", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_foundry_logscale_endpoints = (
+    ("ListReposV1", "GET", "/loggingapi/combined/repos/v1", "foundry_logscale", (
+        ("check_test_data", "boolean", "query"),
+    )),
+    ("IngestDataAsyncV1", "POST", "/loggingapi/entities/data-ingestion/ingest-async/v1", "foundry_logscale", (
+        ("data_content", "string", "formData"),
+        ("data_file", "file", "formData"),
+        ("repo", "string", "formData"),
+        ("tag", "array", "formData"),
+        ("tag_source", "string", "formData"),
+        ("test_data", "boolean", "formData"),
+    )),
+    ("IngestDataV1", "POST", "/loggingapi/entities/data-ingestion/ingest/v1", "foundry_logscale", (
+        ("data_content", "string", "formData"),
+        ("data_file", "file", "formData"),
+        ("tag", "array", "formData"),
+        ("tag_source", "string", "formData"),
+        ("test_data", "boolean", "formData"),
+    )),
+    ("CreateFileV1", "POST", "/loggingapi/entities/lookup-files/v1", "foundry_logscale", (
+        ("X-CS-USERUUID", "string", "header"),
+        ("file", "file", "formData"),
+        ("name", "string", "formData"),
+        ("description", "string", "formData"),
+        ("id", "string", "formData"),
+        ("repo", "string", "formData"),
+    )),
+    ("UpdateFileV1", "PATCH", "/loggingapi/entities/lookup-files/v1", "foundry_logscale", (
+        ("X-CS-USERUUID", "string", "header"),
+        ("id", "string", "formData"),
+        ("description", "string", "formData"),
+        ("file", "file", "formData"),
+    )),
+    ("CreateSavedSearchesDynamicExecuteV1", "POST",
+     "/loggingapi/entities/saved-searches/execute-dynamic/v1", "foundry_logscale", (
+         ("app_id", "string", "query"),
+         ("include_schema_generation", "boolean", "query"),
+         ("include_test_data", "boolean", "query"),
+         ("infer_json_types", "boolean", "query"),
+         ("match_response_schema", "boolean", "query"),
+         ("metadata", "boolean", "query"),
+         ("mode", "string", "query"),
+         ("body", None, "body"),
+     )),
+    ("GetSavedSearchesExecuteV1", "GET", "/loggingapi/entities/saved-searches/execute/v1", "foundry_logscale", (
+        ("job_id", "string", "query"),
+        ("app_id", "string", "query"),
+        ("infer_json_types", "boolean", "query"),
+        ("job_status_only", "boolean", "query"),
+        ("limit", "string", "query"),
+        ("match_response_schema", "boolean", "query"),
+        ("metadata", "boolean", "query"),
+        ("offset", "string", "query"),
+    )),
+    ("CreateSavedSearchesExecuteV1", "POST", "/loggingapi/entities/saved-searches/execute/v1", "foundry_logscale", (
+        ("app_id", "string", "query"),
+        ("detailed", "boolean", "query"),
+        ("include_test_data", "boolean", "query"),
+        ("infer_json_types", "boolean", "query"),
+        ("match_response_schema", "boolean", "query"),
+        ("metadata", "boolean", "query"),
+        ("body", None, "body"),
+    )),
+    ("CreateSavedSearchesIngestV1", "POST", "/loggingapi/entities/saved-searches/ingest/v1", "foundry_logscale", (
+        ("app_id", "string", "query"),
+    )),
+    ("GetSavedSearchesJobResultsDownloadV1", "GET",
+     "/loggingapi/entities/saved-searches/job-results-download/v1", "foundry_logscale", (
+         ("job_id", "string", "query"),
+         ("infer_json_types", "boolean", "query"),
+         ("result_format", "string", "query"),
+     )),
+    ("ListViewV1", "GET", "/loggingapi/entities/views/v1", "foundry_logscale", (
+        ("check_test_data", "boolean", "query"),
+    )),
+)
+
+_host_group_endpoints = (
+    ("queryCombinedGroupMembers", "GET", "/devices/combined/host-group-members/v1", "host_group", (
+        ("id", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("queryCombinedHostGroups", "GET", "/devices/combined/host-groups/v1", "host_group", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("performGroupAction", "POST", "/devices/entities/host-group-actions/v1", "host_group", (
+        ("action_name", "string", "query"),
+        ("disable_hostname_check", "boolean", "query"),
+        ("body", None, "body"),
+    )),
+    ("getHostGroups", "GET", "/devices/entities/host-groups/v1", "host_group", (
+        ("ids", "array", "query"),
+    )),
+    ("createHostGroups", "POST", "/devices/entities/host-groups/v1", "host_group", (
+        ("body", None, "body"),
+    )),
+    ("updateHostGroups", "PATCH", "/devices/entities/host-groups/v1", "host_group", (
+        ("body", None, "body"),
+    )),
+    ("deleteHostGroups", "DELETE", "/devices/entities/host-groups/v1", "host_group", (
+        ("ids", "array", "query"),
+    )),
+    ("queryGroupMembers", "GET", "/devices/queries/host-group-members/v1", "host_group", (
+        ("id", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("queryHostGroups", "GET", "/devices/queries/host-groups/v1", "host_group", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_hosts_endpoints = (
+    ("CombinedHiddenDevicesByFilter", "GET", "/devices/combined/devices-hidden/v1", "hosts", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("fields", "string", "query"),
+    )),
+    ("QueryDeviceLoginHistory", "POST", "/devices/combined/devices/login-history/v1", "hosts", (
+        ("body", None, "body"),
+    )),
+    ("QueryDeviceLoginHistoryV2", "POST", "/devices/combined/devices/login-history/v2", "hosts", (
+        ("body", None, "body"),
+    )),
+    ("QueryGetNetworkAddressHistoryV1", "POST", "/devices/combined/devices/network-address-history/v1", "hosts", (
+        ("body", None, "body"),
+    )),
+    ("CombinedDevicesByFilter", "GET", "/devices/combined/devices/v1", "hosts", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("fields", "string", "query"),
+    )),
+    ("PerformActionV2", "POST", "/devices/entities/devices-actions/v2", "hosts", (
+        ("action_name", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("UpdateDeviceTags", "PATCH", "/devices/entities/devices/tags/v1", "hosts", (
+        ("body", None, "body"),
+    )),
+    ("GetDeviceDetails", "POST", "/devices/entities/devices/v2", "hosts", (
+        ("body", None, "body"),
+    )),
+    ("GetDeviceDetailsV1", "GET", "/devices/entities/devices/v1", "hosts", (
+        ("ids", "array", "query"),
+    )),
+    ("GetDeviceDetailsV2", "GET", "/devices/entities/devices/v2", "hosts", (
+        ("ids", "array", "query"),
+    )),
+    ("PostDeviceDetailsV2", "POST", "/devices/entities/devices/v2", "hosts", (
+        ("body", None, "body"),
+    )),
+    ("entities_perform_action", "POST", "/devices/entities/group-actions/v1", "hosts", (
+        ("ids", "array", "query"),
+        ("action_name", "string", "query"),
+        ("disable_hostname_check", "boolean", "query"),
+        ("body", None, "body"),
+    )),
+    ("GetOnlineState_V1", "GET", "/devices/entities/online-state/v1", "hosts", (
+        ("ids", "array", "query"),
+    )),
+    ("QueryHiddenDevices", "GET", "/devices/queries/devices-hidden/v1", "hosts", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("QueryDevicesByFilterScroll", "GET", "/devices/queries/devices-scroll/v1", "hosts", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("QueryDevicesByFilter", "GET", "/devices/queries/devices/v1", "hosts", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+)
+
+_host_migration_endpoints = (
+    ("HostMigrationAggregatesV1", "POST", "/host-migration/aggregates/host-migrations/v1", "host_migration", (
+        ("body", None, "body"),
+    )),
+    ("MigrationAggregatesV1", "POST", "/host-migration/aggregates/migrations/v1", "host_migration", (
+        ("body", None, "body"),
+    )),
+    ("HostMigrationsActionsV1", "POST", "/host-migration/entities/host-migrations-actions/v1", "host_migration", (
+        ("id", "string", "query"),
+        ("action_name", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("GetHostMigrationsV1", "POST", "/host-migration/entities/host-migrations/GET/v1", "host_migration", (
+        ("body", None, "body"),
+    )),
+    ("GetMigrationDestinationsV1", "POST", "/host-migration/entities/migration-destinations/GET/v1", "host_migration", (
+        ("body", None, "body"),
+    )),
+    ("MigrationsActionsV1", "POST", "/host-migration/entities/migrations-actions/v1", "host_migration", (
+        ("action_name", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("GetMigrationsV1", "GET", "/host-migration/entities/migrations/v1", "host_migration", (
+        ("ids", "array", "query"),
+    )),
+    ("CreateMigrationV1", "POST", "/host-migration/entities/migrations/v1", "host_migration", (
+        ("body", None, "body"),
+    )),
+    ("GetHostMigrationIDsV1", "GET", "/host-migration/queries/host-migrations/v1", "host_migration", (
+        ("id", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("GetMigrationIDsV1", "GET", "/host-migration/queries/migrations/v1", "host_migration", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+)
+
+_identity_protection_endpoints = (
+    ("GetSensorAggregates", "POST", "/identity-protection/aggregates/devices/GET/v1", "identity_protection", (
+        ("body", None, "body"),
+    )),
+    ("post_graphql", "POST", "/identity-protection/combined/graphql/v1", "identity_protection", (
+        ("Authorization", "string", "header"),
+    )),
+    ("GetSensorDetails", "POST", "/identity-protection/entities/devices/GET/v1", "identity_protection", (
+        ("body", None, "body"),
+    )),
+    ("get_policy_rules", "GET", "/identity-protection/entities/policy-rules/v1", "identity_protection", (
+        ("Authorization", "string", "header"),
+        ("ids", "array", "query"),
+    )),
+    ("post_policy_rules", "POST", "/identity-protection/entities/policy-rules/v1", "identity_protection", (
+        ("Authorization", "string", "header"),
+        ("body", None, "body"),
+    )),
+    ("delete_policy_rules", "DELETE", "/identity-protection/entities/policy-rules/v1", "identity_protection", (
+        ("Authorization", "string", "header"),
+        ("ids", "array", "query"),
+    )),
+    ("QuerySensorsByFilter", "GET", "/identity-protection/queries/devices/v1", "identity_protection", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("get_policy_rules_query", "GET", "/identity-protection/queries/policy-rules/v1", "identity_protection", (
+        ("Authorization", "string", "header"),
+        ("enabled", "boolean", "query"),
+        ("simulation_mode", "boolean", "query"),
+        ("name", "string", "query"),
+    )),
+)
+
+_image_assessment_policies_endpoints = (
+    ("ReadPolicies", "GET", "/container-security/entities/image-assessment-policies/v1", "image_assessment_policies", (
+    )),
+    ("CreatePolicies", "POST", "/container-security/entities/image-assessment-policies/v1", "image_assessment_policies", (
+        ("body", None, "body"),
+    )),
+    ("UpdatePolicies", "PATCH", "/container-security/entities/image-assessment-policies/v1", "image_assessment_policies", (
+        ("id", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("DeletePolicy", "DELETE", "/container-security/entities/image-assessment-policies/v1", "image_assessment_policies", (
+        ("id", "string", "query"),
+    )),
+    ("ReadPolicyExclusions", "GET",
+     "/container-security/entities/image-assessment-policy-exclusions/v1", "image_assessment_policies", (
+     )),
+    ("UpdatePolicyExclusions", "POST",
+     "/container-security/entities/image-assessment-policy-exclusions/v1", "image_assessment_policies", (
+         ("body", None, "body"),
+     )),
+    ("ReadPolicyGroups", "GET",
+     "/container-security/entities/image-assessment-policy-groups/v1", "image_assessment_policies", (
+     )),
+    ("CreatePolicyGroups", "POST",
+     "/container-security/entities/image-assessment-policy-groups/v1", "image_assessment_policies", (
+         ("body", None, "body"),
+     )),
+    ("UpdatePolicyGroups", "PATCH",
+     "/container-security/entities/image-assessment-policy-groups/v1", "image_assessment_policies", (
+         ("id", "string", "query"),
+         ("body", None, "body"),
+     )),
+    ("DeletePolicyGroup", "DELETE",
+     "/container-security/entities/image-assessment-policy-groups/v1", "image_assessment_policies", (
+         ("id", "string", "query"),
+     )),
+    ("UpdatePolicyPrecedence", "POST",
+     "/container-security/entities/image-assessment-policy-precedence/v1", "image_assessment_policies", (
+         ("body", None, "body"),
+     )),
+)
+
+_incidents_endpoints = (
+    ("CrowdScore", "GET", "/incidents/combined/crowdscores/v1", "incidents", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("GetBehaviors", "POST", "/incidents/entities/behaviors/GET/v1", "incidents", (
+        ("body", None, "body"),
+    )),
+    ("PerformIncidentAction", "POST", "/incidents/entities/incident-actions/v1", "incidents", (
+        ("update_detects", "boolean", "query"),
+        ("overwrite_detects", "boolean", "query"),
+        ("body", None, "body"),
+    )),
+    ("GetIncidents", "POST", "/incidents/entities/incidents/GET/v1", "incidents", (
+        ("body", None, "body"),
+    )),
+    ("QueryBehaviors", "GET", "/incidents/queries/behaviors/v1", "incidents", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("QueryIncidents", "GET", "/incidents/queries/incidents/v1", "incidents", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+    )),
+)
+
+_intelligence_indicator_graph_endpoints = (
+    ("SearchIndicators", "POST", "/intelligence/combined/indicators/v1", "intelligence_indicator_graph", (
+        ("limit", "integer", "query"),
+        ("offset", "string", "query"),
+        ("body", None, "body"),
+    )),
+)
+
+_installation_tokens_endpoints = (
+    ("audit_events_read", "GET", "/installation-tokens/entities/audit-events/v1", "installation_tokens", (
+        ("ids", "array", "query"),
+    )),
+    ("customer_settings_read", "GET", "/installation-tokens/entities/customer-settings/v1", "installation_tokens", (
+    )),
+    ("customer_settings_update", "PATCH", "/installation-tokens/entities/customer-settings/v1", "installation_tokens", (
+        ("body", None, "body"),
+    )),
+    ("tokens_read", "GET", "/installation-tokens/entities/tokens/v1", "installation_tokens", (
+        ("ids", "array", "query"),
+    )),
+    ("tokens_create", "POST", "/installation-tokens/entities/tokens/v1", "installation_tokens", (
+        ("body", None, "body"),
+    )),
+    ("tokens_update", "PATCH", "/installation-tokens/entities/tokens/v1", "installation_tokens", (
+        ("ids", "array", "query"),
+        ("body", None, "body"),
+    )),
+    ("tokens_delete", "DELETE", "/installation-tokens/entities/tokens/v1", "installation_tokens", (
+        ("ids", "array", "query"),
+    )),
+    ("audit_events_query", "GET", "/installation-tokens/queries/audit-events/v1", "installation_tokens", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("tokens_query", "GET", "/installation-tokens/queries/tokens/v1", "installation_tokens", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+)
+
+_intelligence_feeds_endpoints = (
+    ("DownloadFeedArchive", "GET", "/indicator-feed/entities/feed-download/v1", "intelligence_feeds", (
+        ("feed_item_id", "string", "query"),
+    )),
+    ("ListFeedTypes", "GET", "/indicator-feed/entities/feed/v1", "intelligence_feeds", (
+    )),
+    ("QueryFeedArchives", "GET", "/indicator-feed/queries/feed/v1", "intelligence_feeds", (
+        ("feed_name", "string", "query"),
+        ("feed_interval", "string", "query"),
+        ("since", "string", "query"),
+    )),
+)
+
+_intel_endpoints = (
+    ("QueryIntelActorEntities", "GET", "/intel/combined/actors/v1", "intel", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("fields", "array", "query"),
+    )),
+    ("QueryIntelIndicatorEntities", "GET", "/intel/combined/indicators/v1", "intel", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("include_deleted", "boolean", "query"),
+        ("include_relations", "boolean", "query"),
+    )),
+    ("QueryIntelReportEntities", "GET", "/intel/combined/reports/v1", "intel", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("fields", "array", "query"),
+    )),
+    ("GetIntelActorEntities", "GET", "/intel/entities/actors/v1", "intel", (
+        ("ids", "array", "query"),
+        ("fields", "array", "query"),
+    )),
+    ("GetIntelIndicatorEntities", "POST", "/intel/entities/indicators/GET/v1", "intel", (
+        ("body", None, "body"),
+    )),
+    ("GetMalwareMitreReport", "GET", "/intel/entities/malware-mitre-reports/v1", "intel", (
+        ("id", "string", "query"),
+        ("format", "string", "query"),
+    )),
+    ("GetMalwareEntities", "GET", "/intel/entities/malware/v1", "intel", (
+        ("ids", "array", "query"),
+    )),
+    ("GetMitreReport", "GET", "/intel/entities/mitre-reports/v1", "intel", (
+        ("actor_id", "string", "query"),
+        ("format", "string", "query"),
+    )),
+    ("PostMitreAttacks", "POST", "/intel/entities/mitre/v1", "intel", (
+        ("body", None, "body"),
+    )),
+    ("GetIntelReportPDF", "GET", "/intel/entities/report-files/v1", "intel", (
+        ("id", "string", "query"),
+        ("ids", "string", "query"),
+    )),
+    ("GetIntelReportEntities", "GET", "/intel/entities/reports/v1", "intel", (
+        ("ids", "array", "query"),
+        ("fields", "array", "query"),
+    )),
+    ("GetIntelRuleFile", "GET", "/intel/entities/rules-files/v1", "intel", (
+        ("Accept", "string", "header"),
+        ("id", "integer", "query"),
+        ("format", "string", "query"),
+    )),
+    ("GetLatestIntelRuleFile", "GET", "/intel/entities/rules-latest-files/v1", "intel", (
+        ("Accept", "string", "header"),
+        ("If-None-Match", "string", "header"),
+        ("If-Modified-Since", "string", "header"),
+        ("type", "string", "query"),
+        ("format", "string", "query"),
+    )),
+    ("GetIntelRuleEntities", "GET", "/intel/entities/rules/v1", "intel", (
+        ("ids", "array", "query"),
+    )),
+    ("GetVulnerabilities", "POST", "/intel/entities/vulnerabilities/GET/v1", "intel", (
+        ("body", None, "body"),
+    )),
+    ("QueryIntelActorIds", "GET", "/intel/queries/actors/v1", "intel", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+    )),
+    ("QueryIntelIndicatorIds", "GET", "/intel/queries/indicators/v1", "intel", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("include_deleted", "boolean", "query"),
+        ("include_relations", "boolean", "query"),
+    )),
+    ("QueryMalware", "GET", "/intel/queries/malware/v1", "intel", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+    )),
+    ("QueryMitreAttacksForMalware", "GET", "/intel/queries/mitre-malware/v1", "intel", (
+        ("ids", "array", "query"),
+    )),
+    ("QueryMitreAttacks", "GET", "/intel/queries/mitre/v1", "intel", (
+        ("id", "string", "query"),
+        ("ids", "array", "query"),
+    )),
+    ("QueryIntelReportIds", "GET", "/intel/queries/reports/v1", "intel", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+    )),
+    ("QueryIntelRuleIds", "GET", "/intel/queries/rules/v1", "intel", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("name", "array", "query"),
+        ("type", "string", "query"),
+        ("description", "array", "query"),
+        ("tags", "array", "query"),
+        ("min_created_date", "integer", "query"),
+        ("max_created_date", "string", "query"),
+        ("q", "string", "query"),
+    )),
+    ("QueryVulnerabilities", "GET", "/intel/queries/vulnerabilities/v1", "intel", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+    )),
+)
+
+_ioa_exclusions_endpoints = (
+    ("getIOAExclusionsV1", "GET", "/policy/entities/ioa-exclusions/v1", "ioa_exclusions", (
+        ("ids", "array", "query"),
+    )),
+    ("createIOAExclusionsV1", "POST", "/policy/entities/ioa-exclusions/v1", "ioa_exclusions", (
+        ("body", None, "body"),
+    )),
+    ("updateIOAExclusionsV1", "PATCH", "/policy/entities/ioa-exclusions/v1", "ioa_exclusions", (
+        ("body", None, "body"),
+    )),
+    ("deleteIOAExclusionsV1", "DELETE", "/policy/entities/ioa-exclusions/v1", "ioa_exclusions", (
+        ("ids", "array", "query"),
+        ("comment", "string", "query"),
+    )),
+    ("queryIOAExclusionsV1", "GET", "/policy/queries/ioa-exclusions/v1", "ioa_exclusions", (
+        ("filter", "string", "query"),
+        ("ifn_regex", "string", "query"),
+        ("cl_regex", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_ioc_endpoints = (
+    ("indicator_get_device_count_v1", "GET", "/iocs/aggregates/indicators/device-count/v1", "ioc", (
+        ("type", "string", "query"),
+        ("value", "string", "query"),
+    )),
+    ("indicator_aggregate_v1", "POST", "/iocs/aggregates/indicators/v1", "ioc", (
+        ("filter", "string", "query"),
+        ("from_parent", "boolean", "query"),
+        ("body", None, "body"),
+    )),
+    ("indicator_combined_v1", "GET", "/iocs/combined/indicator/v1", "ioc", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("after", "string", "query"),
+        ("from_parent", "boolean", "query"),
+    )),
+    ("action_get_v1", "GET", "/iocs/entities/actions/v1", "ioc", (
+        ("ids", "array", "query"),
+    )),
+    ("GetIndicatorsReport", "POST", "/iocs/entities/indicators-reports/v1", "ioc", (
+        ("body", None, "body"),
+    )),
+    ("indicator_get_v1", "GET", "/iocs/entities/indicators/v1", "ioc", (
+        ("ids", "array", "query"),
+    )),
+    ("indicator_create_v1", "POST", "/iocs/entities/indicators/v1", "ioc", (
+        ("retrodetects", "boolean", "query"),
+        ("ignore_warnings", "boolean", "query"),
+        ("body", None, "body"),
+    )),
+    ("indicator_update_v1", "PATCH", "/iocs/entities/indicators/v1", "ioc", (
+        ("retrodetects", "boolean", "query"),
+        ("ignore_warnings", "boolean", "query"),
+        ("body", None, "body"),
+    )),
+    ("indicator_delete_v1", "DELETE", "/iocs/entities/indicators/v1", "ioc", (
+        ("filter", "string", "query"),
+        ("ids", "array", "query"),
+        ("comment", "string", "query"),
+        ("from_parent", "boolean", "query"),
+    )),
+    ("action_query_v1", "GET", "/iocs/queries/actions/v1", "ioc", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("indicator_get_devices_ran_on_v1", "GET", "/iocs/queries/indicators/devices/v1", "ioc", (
+        ("type", "string", "query"),
+        ("value", "string", "query"),
+        ("limit", "string", "query"),
+        ("offset", "string", "query"),
+    )),
+    ("indicator_get_processes_ran_on_v1", "GET", "/iocs/queries/indicators/processes/v1", "ioc", (
+        ("type", "string", "query"),
+        ("value", "string", "query"),
+        ("device_id", "string", "query"),
+        ("limit", "string", "query"),
+        ("offset", "string", "query"),
+    )),
+    ("indicator_search_v1", "GET", "/iocs/queries/indicators/v1", "ioc", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("after", "string", "query"),
+        ("from_parent", "boolean", "query"),
+    )),
+    ("ioc_type_query_v1", "GET", "/iocs/queries/ioc-types/v1", "ioc", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("platform_query_v1", "GET", "/iocs/queries/platforms/v1", "ioc", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("severity_query_v1", "GET", "/iocs/queries/severities/v1", "ioc", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+)
+
+_iocs_endpoints = (
+    ("DevicesCount", "GET", "/indicators/aggregates/devices-count/v1", "iocs", (
+        ("type", "string", "query"),
+        ("value", "string", "query"),
+    )),
+    ("GetIOC", "GET", "/indicators/entities/iocs/v1", "iocs", (
+        ("type", "string", "query"),
+        ("value", "string", "query"),
+    )),
+    ("CreateIOC", "POST", "/indicators/entities/iocs/v1", "iocs", (
+        ("body", None, "body"),
+    )),
+    ("UpdateIOC", "PATCH", "/indicators/entities/iocs/v1", "iocs", (
+        ("body", None, "body"),
+        ("type", "string", "query"),
+        ("value", "string", "query"),
+    )),
+    ("DeleteIOC", "DELETE", "/indicators/entities/iocs/v1", "iocs", (
+        ("type", "string", "query"),
+        ("value", "string", "query"),
+    )),
+    ("DevicesRanOn", "GET", "/indicators/queries/devices/v1", "iocs", (
+        ("type", "string", "query"),
+        ("value", "string", "query"),
+        ("limit", "string", "query"),
+        ("offset", "string", "query"),
+    )),
+    ("QueryIOCs", "GET", "/indicators/queries/iocs/v1", "iocs", (
+        ("types", "string", "query"),
+        ("values", "string", "query"),
+        ("from.expiration_timestamp", "string", "query"),
+        ("to.expiration_timestamp", "string", "query"),
+        ("policies", "string", "query"),
+        ("sources", "string", "query"),
+        ("share_levels", "string", "query"),
+        ("created_by", "string", "query"),
+        ("deleted_by", "string", "query"),
+        ("include_deleted", "string", "query"),
+    )),
+    ("ProcessesRanOn", "GET", "/indicators/queries/processes/v1", "iocs", (
+        ("type", "string", "query"),
+        ("value", "string", "query"),
+        ("device_id", "string", "query"),
+        ("limit", "string", "query"),
+        ("offset", "string", "query"),
+    )),
+    ("entities_processes", "GET", "/processes/entities/processes/v1", "iocs", (
+        ("ids", "array", "query"),
+    )),
+)
+
+_kubernetes_protection_endpoints = (
+    ("ReadClustersByDateRangeCount", "GET",
+     "/container-security/aggregates/clusters/count-by-date/v1", "kubernetes_protection", (
+     )),
+    ("ReadClustersByKubernetesVersionCount", "GET",
+     "/container-security/aggregates/clusters/count-by-kubernetes-version/v1", "kubernetes_protection", (
+         ("filter", "string", "query"),
+     )),
+    ("ReadClustersByStatusCount", "GET",
+     "/container-security/aggregates/clusters/count-by-status/v1", "kubernetes_protection", (
+         ("filter", "string", "query"),
+     )),
+    ("ReadClusterCount", "GET", "/container-security/aggregates/clusters/count/v1", "kubernetes_protection", (
+        ("filter", "string", "query"),
+    )),
+    ("ReadContainersByDateRangeCount", "GET",
+     "/container-security/aggregates/containers/count-by-date/v1", "kubernetes_protection", (
+         ("filter", "string", "query"),
+     )),
+    ("ReadContainerCountByRegistry", "GET",
+     "/container-security/aggregates/containers/count-by-registry/v1", "kubernetes_protection", (
+         ("under_assessment", "boolean", "query"),
+         ("limit", "integer", "query"),
+     )),
+    ("FindContainersCountAffectedByZeroDayVulnerabilities", "GET",
+     "/container-security/aggregates/containers/count-by-zero-day/v1", "kubernetes_protection", (
+     )),
+    ("ReadVulnerableContainerImageCount", "GET",
+     "/container-security/aggregates/containers/count-vulnerable-images/v1", "kubernetes_protection", (
+         ("filter", "string", "query"),
+     )),
+    ("ReadContainerCount", "GET", "/container-security/aggregates/containers/count/v1", "kubernetes_protection", (
+        ("filter", "string", "query"),
+    )),
+    ("FindContainersByContainerRunTimeVersion", "GET",
+     "/container-security/aggregates/containers/find-by-runtimeversion/v1", "kubernetes_protection", (
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+         ("sort", "string", "query"),
+         ("filter", "string", "query"),
+     )),
+    ("GroupContainersByManaged", "GET",
+     "/container-security/aggregates/containers/group-by-managed/v1", "kubernetes_protection", (
+         ("filter", "string", "query"),
+     )),
+    ("ReadContainerImageDetectionsCountByDate", "GET",
+     "/container-security/aggregates/containers/image-detections-count-by-date/v1", "kubernetes_protection", (
+         ("filter", "string", "query"),
+     )),
+    ("ReadContainerImagesByState", "GET",
+     "/container-security/aggregates/containers/images-by-state/v1", "kubernetes_protection", (
+         ("filter", "string", "query"),
+     )),
+    ("ReadContainersSensorCoverage", "GET",
+     "/container-security/aggregates/containers/sensor-coverage/v1", "kubernetes_protection", (
+         ("filter", "string", "query"),
+     )),
+    ("ReadContainerVulnerabilitiesBySeverityCount", "GET",
+     "/container-security/aggregates/containers/vulnerability-count-by-severity/v1", "kubernetes_protection", (
+         ("filter", "string", "query"),
+     )),
+    ("ReadDeploymentsByDateRangeCount", "GET",
+     "/container-security/aggregates/deployments/count-by-date/v1", "kubernetes_protection", (
+     )),
+    ("ReadDeploymentCount", "GET", "/container-security/aggregates/deployments/count/v1", "kubernetes_protection", (
+        ("filter", "string", "query"),
+    )),
+    ("ReadClusterEnrichment", "GET",
+     "/container-security/aggregates/enrichment/clusters/entities/v1", "kubernetes_protection", (
+         ("cluster_id", "array", "query"),
+         ("filter", "string", "query"),
+     )),
+    ("ReadContainerEnrichment", "GET",
+     "/container-security/aggregates/enrichment/containers/entities/v1", "kubernetes_protection", (
+         ("container_id", "array", "query"),
+         ("filter", "string", "query"),
+     )),
+    ("ReadDeploymentEnrichment", "GET",
+     "/container-security/aggregates/enrichment/deployments/entities/v1", "kubernetes_protection", (
+         ("deployment_id", "array", "query"),
+         ("filter", "string", "query"),
+     )),
+    ("ReadNodeEnrichment", "GET", "/container-security/aggregates/enrichment/nodes/entities/v1", "kubernetes_protection", (
+        ("node_name", "array", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("ReadPodEnrichment", "GET", "/container-security/aggregates/enrichment/pods/entities/v1", "kubernetes_protection", (
+        ("pod_id", "array", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("ReadDistinctContainerImageCount", "GET",
+     "/container-security/aggregates/images/count-by-distinct/v1", "kubernetes_protection", (
+         ("filter", "string", "query"),
+     )),
+    ("ReadContainerImagesByMostUsed", "GET", "/container-security/aggregates/images/most-used/v1", "kubernetes_protection", (
+        ("filter", "string", "query"),
+    )),
+    ("ReadKubernetesIomByDateRange", "GET",
+     "/container-security/aggregates/kubernetes-ioms/count-by-date/v1", "kubernetes_protection", (
+         ("filter", "string", "query"),
+     )),
+    ("ReadKubernetesIomCount", "GET", "/container-security/aggregates/kubernetes-ioms/count/v1", "kubernetes_protection", (
+        ("filter", "string", "query"),
+    )),
+    ("ReadNamespacesByDateRangeCount", "GET",
+     "/container-security/aggregates/namespaces/count-by-date/v1", "kubernetes_protection", (
+     )),
+    ("ReadNamespaceCount", "GET", "/container-security/aggregates/namespaces/count/v1", "kubernetes_protection", (
+        ("filter", "string", "query"),
+    )),
+    ("ReadNodesByCloudCount", "GET", "/container-security/aggregates/nodes/count-by-cloud/v1", "kubernetes_protection", (
+        ("filter", "string", "query"),
+    )),
+    ("ReadNodesByContainerEngineVersionCount", "GET",
+     "/container-security/aggregates/nodes/count-by-container-engine-version/v1", "kubernetes_protection", (
+         ("filter", "string", "query"),
+     )),
+    ("ReadNodesByDateRangeCount", "GET", "/container-security/aggregates/nodes/count-by-date/v1", "kubernetes_protection", (
+        ("filter", "string", "query"),
+    )),
+    ("ReadNodeCount", "GET", "/container-security/aggregates/nodes/count/v1", "kubernetes_protection", (
+        ("filter", "string", "query"),
+    )),
+    ("ReadPodsByDateRangeCount", "GET", "/container-security/aggregates/pods/count-by-date/v1", "kubernetes_protection", (
+    )),
+    ("ReadPodCount", "GET", "/container-security/aggregates/pods/count/v1", "kubernetes_protection", (
+        ("filter", "string", "query"),
+    )),
+    ("ReadClusterCombined", "GET", "/container-security/combined/clusters/v1", "kubernetes_protection", (
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("ReadClusterCombinedV2", "GET", "/container-security/combined/clusters/v2", "kubernetes_protection", (
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("include_counts", "boolean", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("ReadRunningContainerImages", "GET", "/container-security/combined/container-images/v1", "kubernetes_protection", (
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("ReadContainerCombined", "GET", "/container-security/combined/containers/v1", "kubernetes_protection", (
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("ReadDeploymentCombined", "GET", "/container-security/combined/deployments/v1", "kubernetes_protection", (
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("SearchAndReadKubernetesIomEntities", "GET", "/container-security/combined/kubernetes-ioms/v1", "kubernetes_protection", (
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("ReadNodeCombined", "GET", "/container-security/combined/nodes/v1", "kubernetes_protection", (
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("ReadPodCombined", "GET", "/container-security/combined/pods/v1", "kubernetes_protection", (
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("ReadKubernetesIomEntities", "GET", "/container-security/entities/kubernetes-ioms/v1", "kubernetes_protection", (
+        ("ids", "array", "query"),
+    )),
+    ("SearchKubernetesIoms", "GET", "/container-security/queries/kubernetes-ioms/v1", "kubernetes_protection", (
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("GetAWSAccountsMixin0", "GET", "/kubernetes-protection/entities/accounts/aws/v1", "kubernetes_protection", (
+        ("ids", "array", "query"),
+        ("is_horizon_acct", "string", "query"),
+        ("status", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("CreateAWSAccount", "POST", "/kubernetes-protection/entities/accounts/aws/v1", "kubernetes_protection", (
+        ("body", None, "body"),
+    )),
+    ("UpdateAWSAccount", "PATCH", "/kubernetes-protection/entities/accounts/aws/v1", "kubernetes_protection", (
+        ("ids", "array", "query"),
+        ("region", "string", "query"),
+    )),
+    ("DeleteAWSAccountsMixin0", "DELETE", "/kubernetes-protection/entities/accounts/aws/v1", "kubernetes_protection", (
+        ("ids", "array", "query"),
+    )),
+    ("ListAzureAccounts", "GET", "/kubernetes-protection/entities/accounts/azure/v1", "kubernetes_protection", (
+        ("ids", "array", "query"),
+        ("subscription_id", "array", "query"),
+        ("status", "string", "query"),
+        ("is_horizon_acct", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("CreateAzureSubscription", "POST", "/kubernetes-protection/entities/accounts/azure/v1", "kubernetes_protection", (
+        ("body", None, "body"),
+    )),
+    ("DeleteAzureSubscription", "DELETE", "/kubernetes-protection/entities/accounts/azure/v1", "kubernetes_protection", (
+        ("ids", "array", "query"),
+    )),
+    ("GetLocations", "GET", "/kubernetes-protection/entities/cloud-locations/v1", "kubernetes_protection", (
+        ("clouds", "array", "query"),
+    )),
+    ("GetCombinedCloudClusters", "GET", "/kubernetes-protection/entities/cloud_cluster/v1", "kubernetes_protection", (
+        ("locations", "array", "query"),
+        ("ids", "array", "query"),
+        ("cluster_service", "array", "query"),
+        ("cluster_status", "array", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("GetAzureTenantConfig", "GET", "/kubernetes-protection/entities/config/azure/v1", "kubernetes_protection", (
+        ("ids", "array", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("GetStaticScripts", "GET", "/kubernetes-protection/entities/gen/scripts/v1", "kubernetes_protection", (
+    )),
+    ("GetHelmValuesYaml", "GET", "/kubernetes-protection/entities/integration/agent/v1", "kubernetes_protection", (
+        ("cluster_name", "string", "query"),
+        ("is_self_managed_cluster", "boolean", "query"),
+    )),
+    ("RegenerateAPIKey", "POST", "/kubernetes-protection/entities/integration/api-key/v1", "kubernetes_protection", (
+    )),
+    ("GetClusters", "GET", "/kubernetes-protection/entities/kubernetes/clusters/v1", "kubernetes_protection", (
+        ("cluster_names", "array", "query"),
+        ("status", "array", "query"),
+        ("account_ids", "array", "query"),
+        ("locations", "array", "query"),
+        ("cluster_service", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("TriggerScan", "POST", "/kubernetes-protection/entities/scan/trigger/v1", "kubernetes_protection", (
+        ("scan_type", "string", "query"),
+    )),
+    ("PatchAzureServicePrincipal", "PATCH",
+     "/kubernetes-protection/entities/service-principal/azure/v1", "kubernetes_protection", (
+         ("id", "string", "query"),
+         ("client_id", "string", "query"),
+     )),
+    ("GetAzureTenantIDs", "GET", "/kubernetes-protection/entities/tenants/azure/v1", "kubernetes_protection", (
+        ("ids", "array", "query"),
+        ("status", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+    ("GetAzureInstallScript", "GET", "/kubernetes-protection/entities/user-script/azure/v1", "kubernetes_protection", (
+        ("id", "string", "query"),
+        ("subscription_id", "array", "query"),
+    )),
+)
+
+_malquery_endpoints = (
+    ("GetMalQueryQuotasV1", "GET", "/malquery/aggregates/quotas/v1", "malquery", (
+    )),
+    ("PostMalQueryFuzzySearchV1", "POST", "/malquery/combined/fuzzy-search/v1", "malquery", (
+        ("body", None, "body"),
+    )),
+    ("GetMalQueryDownloadV1", "GET", "/malquery/entities/download-files/v1", "malquery", (
+        ("ids", "array", "query"),
+    )),
+    ("GetMalQueryMetadataV1", "GET", "/malquery/entities/metadata/v1", "malquery", (
+        ("ids", "array", "query"),
+    )),
+    ("GetMalQueryRequestV1", "GET", "/malquery/entities/requests/v1", "malquery", (
+        ("ids", "array", "query"),
+    )),
+    ("GetMalQueryEntitiesSamplesFetchV1", "GET", "/malquery/entities/samples-fetch/v1", "malquery", (
+        ("ids", "string", "query"),
+    )),
+    ("PostMalQueryEntitiesSamplesMultidownloadV1", "POST", "/malquery/entities/samples-multidownload/v1", "malquery", (
+        ("body", None, "body"),
+    )),
+    ("PostMalQueryExactSearchV1", "POST", "/malquery/queries/exact-search/v1", "malquery", (
+        ("body", None, "body"),
+    )),
+    ("PostMalQueryHuntV1", "POST", "/malquery/queries/hunt/v1", "malquery", (
+        ("body", None, "body"),
+    )),
+)
+
+_message_center_endpoints = (
+    ("AggregateCases", "POST", "/message-center/aggregates/cases/GET/v1", "message_center", (
+        ("body", None, "body"),
+    )),
+    ("GetCaseActivityByIds", "POST", "/message-center/entities/case-activities/GET/v1", "message_center", (
+        ("body", None, "body"),
+    )),
+    ("CaseAddActivity", "POST", "/message-center/entities/case-activity/v1", "message_center", (
+        ("body", None, "body"),
+    )),
+    ("CaseDownloadAttachment", "GET", "/message-center/entities/case-attachment/v1", "message_center", (
+        ("id", "string", "query"),
+    )),
+    ("CaseAddAttachment", "POST", "/message-center/entities/case-attachment/v1", "message_center", (
+        ("case_id", "string", "formData"),
+        ("user_uuid", "string", "formData"),
+        ("file", "file", "formData"),
+    )),
+    ("CreateCase", "POST", "/message-center/entities/case/v1", "message_center", (
+        ("body", None, "body"),
+    )),
+    ("UpdateCase", "PATCH", "/message-center/entities/case/v1", "message_center", (
+        ("body", None, "body"),
+    )),
+    ("CreateCaseV2", "POST", "/message-center/entities/case/v2", "message_center", (
+        ("body", None, "body"),
+    )),
+    ("GetCaseEntitiesByIDs", "POST", "/message-center/entities/cases/GET/v1", "message_center", (
+        ("body", None, "body"),
+    )),
+    ("QueryActivityByCaseID", "GET", "/message-center/queries/case-activities/v1", "message_center", (
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+        ("case_id", "string", "query"),
+    )),
+    ("QueryCasesIdsByFilter", "GET", "/message-center/queries/cases/v1", "message_center", (
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+    )),
+)
+
+_ml_exclusions_endpoints = (
+    ("getMLExclusionsV1", "GET", "/policy/entities/ml-exclusions/v1", "ml_exclusions", (
+        ("ids", "array", "query"),
+    )),
+    ("createMLExclusionsV1", "POST", "/policy/entities/ml-exclusions/v1", "ml_exclusions", (
+        ("body", None, "body"),
+    )),
+    ("updateMLExclusionsV1", "PATCH", "/policy/entities/ml-exclusions/v1", "ml_exclusions", (
+        ("body", None, "body"),
+    )),
+    ("deleteMLExclusionsV1", "DELETE", "/policy/entities/ml-exclusions/v1", "ml_exclusions", (
+        ("ids", "array", "query"),
+        ("comment", "string", "query"),
+    )),
+    ("queryMLExclusionsV1", "GET", "/policy/queries/ml-exclusions/v1", "ml_exclusions", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_mobile_enrollment_endpoints = (
+    ("RequestDeviceEnrollmentV3", "POST", "/enrollments/entities/details/v3", "mobile_enrollment", (
+        ("action_name", "string", "query"),
+        ("filter", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("RequestDeviceEnrollmentV4", "POST", "/enrollments/entities/details/v4", "mobile_enrollment", (
+        ("action_name", "string", "query"),
+        ("filter", "string", "query"),
+        ("body", None, "body"),
+    )),
+)
+
+_mssp_endpoints = (
+    ("getChildrenV2", "POST", "/mssp/entities/children/GET/v2", "mssp", (
+        ("body", None, "body"),
+    )),
+    ("getChildren", "GET", "/mssp/entities/children/v1", "mssp", (
+        ("ids", "array", "query"),
+    )),
+    ("getCIDGroupMembersByV1", "GET", "/mssp/entities/cid-group-members/v1", "mssp", (
+        ("cid_group_ids", "array", "query"),
+    )),
+    ("addCIDGroupMembers", "POST", "/mssp/entities/cid-group-members/v1", "mssp", (
+        ("body", None, "body"),
+    )),
+    ("deleteCIDGroupMembersV1", "DELETE", "/mssp/entities/cid-group-members/v1", "mssp", (
+        ("body", None, "body"),
+    )),
+    ("getCIDGroupMembersBy", "GET", "/mssp/entities/cid-group-members/v2", "mssp", (
+        ("ids", "array", "query"),
+    )),
+    ("deleteCIDGroupMembers", "DELETE", "/mssp/entities/cid-group-members/v1", "mssp", (
+        ("body", None, "body"),
+    )),
+    ("getCIDGroupMembersByV2", "GET", "/mssp/entities/cid-group-members/v2", "mssp", (
+        ("ids", "array", "query"),
+    )),
+    ("deleteCIDGroupMembersV2", "DELETE", "/mssp/entities/cid-group-members/v2", "mssp", (
+        ("body", None, "body"),
+    )),
+    ("getCIDGroupByIdV1", "GET", "/mssp/entities/cid-groups/v1", "mssp", (
+        ("cid_group_ids", "array", "query"),
+    )),
+    ("createCIDGroups", "POST", "/mssp/entities/cid-groups/v1", "mssp", (
+        ("body", None, "body"),
+    )),
+    ("deleteCIDGroups", "DELETE", "/mssp/entities/cid-groups/v1", "mssp", (
+        ("cid_group_ids", "array", "query"),
+    )),
+    ("updateCIDGroups", "PATCH", "/mssp/entities/cid-groups/v1", "mssp", (
+        ("body", None, "body"),
+    )),
+    ("getCIDGroupById", "GET", "/mssp/entities/cid-groups/v2", "mssp", (
+        ("ids", "array", "query"),
+    )),
+    ("getCIDGroupByIdV2", "GET", "/mssp/entities/cid-groups/v2", "mssp", (
+        ("ids", "array", "query"),
+    )),
+    ("getRolesByID", "GET", "/mssp/entities/mssp-roles/v1", "mssp", (
+        ("ids", "array", "query"),
+    )),
+    ("addRole", "POST", "/mssp/entities/mssp-roles/v1", "mssp", (
+        ("body", None, "body"),
+    )),
+    ("deletedRoles", "DELETE", "/mssp/entities/mssp-roles/v1", "mssp", (
+        ("body", None, "body"),
+    )),
+    ("getUserGroupMembersByIDV1", "GET", "/mssp/entities/user-group-members/v1", "mssp", (
+        ("user_group_ids", "array", "query"),
+    )),
+    ("addUserGroupMembers", "POST", "/mssp/entities/user-group-members/v1", "mssp", (
+        ("body", None, "body"),
+    )),
+    ("deleteUserGroupMembers", "DELETE", "/mssp/entities/user-group-members/v1", "mssp", (
+        ("body", None, "body"),
+    )),
+    ("getUserGroupMembersByID", "GET", "/mssp/entities/user-group-members/v2", "mssp", (
+        ("ids", "array", "query"),
+    )),
+    ("getUserGroupMembersByIDV2", "GET", "/mssp/entities/user-group-members/v2", "mssp", (
+        ("ids", "array", "query"),
+    )),
+    ("getUserGroupsByIDV1", "GET", "/mssp/entities/user-groups/v1", "mssp", (
+        ("user_group_ids", "array", "query"),
+    )),
+    ("createUserGroups", "POST", "/mssp/entities/user-groups/v1", "mssp", (
+        ("body", None, "body"),
+    )),
+    ("deleteUserGroups", "DELETE", "/mssp/entities/user-groups/v1", "mssp", (
+        ("user_group_ids", "array", "query"),
+    )),
+    ("updateUserGroups", "PATCH", "/mssp/entities/user-groups/v1", "mssp", (
+        ("body", None, "body"),
+    )),
+    ("getUserGroupsByID", "GET", "/mssp/entities/user-groups/v2", "mssp", (
+        ("ids", "array", "query"),
+    )),
+    ("getUserGroupsByIDV2", "GET", "/mssp/entities/user-groups/v2", "mssp", (
+        ("ids", "array", "query"),
+    )),
+    ("queryChildren", "GET", "/mssp/queries/children/v1", "mssp", (
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("queryCIDGroupMembers", "GET", "/mssp/queries/cid-group-members/v1", "mssp", (
+        ("cid", "string", "query"),
+        ("sort", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("queryCIDGroups", "GET", "/mssp/queries/cid-groups/v1", "mssp", (
+        ("name", "string", "query"),
+        ("sort", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("queryRoles", "GET", "/mssp/queries/mssp-roles/v1", "mssp", (
+        ("user_group_id", "string", "query"),
+        ("cid_group_id", "string", "query"),
+        ("role_id", "string", "query"),
+        ("sort", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("queryUserGroupMembers", "GET", "/mssp/queries/user-group-members/v1", "mssp", (
+        ("user_uuid", "string", "query"),
+        ("sort", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("queryUserGroups", "GET", "/mssp/queries/user-groups/v1", "mssp", (
+        ("name", "string", "query"),
+        ("sort", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+    )),
+)
+
+_ngsiem_endpoints = (
+    ("UploadLookupV1", "POST", "/humio/api/v1/repositories/{repository}/files", "ngsiem", (
+        ("repository", "string", "path"),
+        ("file", "file", "formData"),
+    )),
+    ("GetLookupV1", "GET", "/humio/api/v1/repositories/{repository}/files/{filename}", "ngsiem", (
+        ("repository", "string", "path"),
+        ("filename", "string", "path"),
+    )),
+    ("GetLookupFromPackageWithNamespaceV1", "GET",
+     "/humio/api/v1/repositories/{repository}/files/{namespace}/{package}/{filename}", "ngsiem", (
+         ("repository", "string", "path"),
+         ("namespace", "string", "path"),
+         ("package", "string", "path"),
+         ("filename", "string", "path"),
+     )),
+    ("GetLookupFromPackageV1", "GET", "/humio/api/v1/repositories/{repository}/files/{package}/{filename}", "ngsiem", (
+        ("repository", "string", "path"),
+        ("package", "string", "path"),
+        ("filename", "string", "path"),
+    )),
+    ("StartSearchV1", "POST", "/humio/api/v1/repositories/{repository}/queryjobs", "ngsiem", (
+        ("repository", "string", "path"),
+        ("body", None, "body"),
+    )),
+    ("GetSearchStatusV1", "GET", "/humio/api/v1/repositories/{repository}/queryjobs/{id}", "ngsiem", (
+        ("repository", "string", "path"),
+        ("id", "string", "path"),
+    )),
+    ("StopSearchV1", "DELETE", "/humio/api/v1/repositories/{repository}/queryjobs/{id}", "ngsiem", (
+        ("repository", "string", "path"),
+        ("id", "string", "path"),
+    )),
+)
+
+_oauth2_endpoints = (
+    ("oauth2RevokeToken", "POST", "/oauth2/revoke", "oauth2", (
+        ("client_id", "string", "formData"),
+        ("token", "string", "formData"),
+    )),
+    ("oauth2AccessToken", "POST", "/oauth2/token", "oauth2", (
+        ("client_id", "string", "formData"),
+        ("client_secret", "string", "formData"),
+        ("member_cid", "string", "formData"),
+    )),
+)
+
+_ods_endpoints = (
+    ("aggregate_query_scan_host_metadata", "POST", "/ods/aggregates/scan-hosts/v1", "ods", (
+        ("body", None, "body"),
+    )),
+    ("aggregate_scans", "POST", "/ods/aggregates/scans/v1", "ods", (
+        ("body", None, "body"),
+    )),
+    ("aggregate_scheduled_scans", "POST", "/ods/aggregates/scheduled-scans/v1", "ods", (
+        ("body", None, "body"),
+    )),
+    ("get_malicious_files_by_ids", "GET", "/ods/entities/malicious-files/v1", "ods", (
+        ("ids", "array", "query"),
+    )),
+    ("cancel_scans", "POST", "/ods/entities/scan-control-actions/cancel/v1", "ods", (
+        ("body", None, "body"),
+    )),
+    ("get_scan_host_metadata_by_ids", "GET", "/ods/entities/scan-hosts/v1", "ods", (
+        ("ids", "array", "query"),
+    )),
+    ("get_scans_by_scan_ids", "GET", "/ods/entities/scans/v1", "ods", (
+        ("ids", "array", "query"),
+    )),
+    ("create_scan", "POST", "/ods/entities/scans/v1", "ods", (
+        ("body", None, "body"),
+    )),
+    ("get_scans_by_scan_ids_v2", "GET", "/ods/entities/scans/v2", "ods", (
+        ("ids", "array", "query"),
+    )),
+    ("get_scheduled_scans_by_scan_ids", "GET", "/ods/entities/scheduled-scans/v1", "ods", (
+        ("ids", "array", "query"),
+    )),
+    ("schedule_scan", "POST", "/ods/entities/scheduled-scans/v1", "ods", (
+        ("body", None, "body"),
+    )),
+    ("delete_scheduled_scans", "DELETE", "/ods/entities/scheduled-scans/v1", "ods", (
+        ("ids", "array", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("query_malicious_files", "GET", "/ods/queries/malicious-files/v1", "ods", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("query_scan_host_metadata", "GET", "/ods/queries/scan-hosts/v1", "ods", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("query_scans", "GET", "/ods/queries/scans/v1", "ods", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("query_scheduled_scans", "GET", "/ods/queries/scheduled-scans/v1", "ods", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_overwatch_dashboard_endpoints = (
+    ("AggregatesDetectionsGlobalCounts", "GET",
+     "/overwatch-dashboards/aggregates/detections-global-counts/v1", "overwatch_dashboard", (
+         ("filter", "string", "query"),
+     )),
+    ("AggregatesEventsCollections", "POST",
+     "/overwatch-dashboards/aggregates/events-collections/GET/v1", "overwatch_dashboard", (
+         ("body", None, "body"),
+     )),
+    ("AggregatesEvents", "POST", "/overwatch-dashboards/aggregates/events/GET/v1", "overwatch_dashboard", (
+        ("body", None, "body"),
+    )),
+    ("AggregatesIncidentsGlobalCounts", "GET",
+     "/overwatch-dashboards/aggregates/incidents-global-counts/v1", "overwatch_dashboard", (
+         ("filter", "string", "query"),
+     )),
+    ("AggregatesOWEventsGlobalCounts", "GET",
+     "/overwatch-dashboards/aggregates/ow-events-global-counts/v1", "overwatch_dashboard", (
+         ("filter", "string", "query"),
+     )),
+)
+
+_prevention_policies_endpoints = (
+    ("queryCombinedPreventionPolicyMembers", "GET", "/policy/combined/prevention-members/v1", "prevention_policies", (
+        ("id", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("queryCombinedPreventionPolicies", "GET", "/policy/combined/prevention/v1", "prevention_policies", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("performPreventionPoliciesAction", "POST", "/policy/entities/prevention-actions/v1", "prevention_policies", (
+        ("action_name", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("setPreventionPoliciesPrecedence", "POST", "/policy/entities/prevention-precedence/v1", "prevention_policies", (
+        ("body", None, "body"),
+    )),
+    ("getPreventionPolicies", "GET", "/policy/entities/prevention/v1", "prevention_policies", (
+        ("ids", "array", "query"),
+    )),
+    ("createPreventionPolicies", "POST", "/policy/entities/prevention/v1", "prevention_policies", (
+        ("body", None, "body"),
+    )),
+    ("updatePreventionPolicies", "PATCH", "/policy/entities/prevention/v1", "prevention_policies", (
+        ("body", None, "body"),
+    )),
+    ("deletePreventionPolicies", "DELETE", "/policy/entities/prevention/v1", "prevention_policies", (
+        ("ids", "array", "query"),
+    )),
+    ("queryPreventionPolicyMembers", "GET", "/policy/queries/prevention-members/v1", "prevention_policies", (
+        ("id", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("queryPreventionPolicies", "GET", "/policy/queries/prevention/v1", "prevention_policies", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_quarantine_endpoints = (
+    ("ActionUpdateCount", "GET", "/quarantine/aggregates/action-update-count/v1", "quarantine", (
+        ("filter", "string", "query"),
+    )),
+    ("GetAggregateFiles", "POST", "/quarantine/aggregates/quarantined-files/GET/v1", "quarantine", (
+        ("body", None, "body"),
+    )),
+    ("GetQuarantineFiles", "POST", "/quarantine/entities/quarantined-files/GET/v1", "quarantine", (
+        ("body", None, "body"),
+    )),
+    ("UpdateQuarantinedDetectsByIds", "PATCH", "/quarantine/entities/quarantined-files/v1", "quarantine", (
+        ("body", None, "body"),
+    )),
+    ("QueryQuarantineFiles", "GET", "/quarantine/queries/quarantined-files/v1", "quarantine", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+    )),
+    ("UpdateQfByQuery", "PATCH", "/quarantine/queries/quarantined-files/v1", "quarantine", (
+        ("body", None, "body"),
+    )),
+)
+
+_quick_scan_endpoints = (
+    ("GetScansAggregates", "POST", "/scanner/aggregates/scans/GET/v1", "quick_scan", (
+        ("body", None, "body"),
+    )),
+    ("GetScans", "GET", "/scanner/entities/scans/v1", "quick_scan", (
+        ("ids", "array", "query"),
+    )),
+    ("ScanSamples", "POST", "/scanner/entities/scans/v1", "quick_scan", (
+        ("body", None, "body"),
+    )),
+    ("QuerySubmissionsMixin0", "GET", "/scanner/queries/scans/v1", "quick_scan", (
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_quick_scan_pro_endpoints = (
+    ("UploadFileQuickScanPro", "POST", "/quickscanpro/entities/files/v1", "quick_scan_pro", (
+        ("file", "file", "formData"),
+        ("scan", "boolean", "formData"),
+    )),
+    ("UploadFileMixin0Mixin94", "POST", "/quickscanpro/entities/files/v1", "quick_scan_pro", (
+        ("file", "file", "formData"),
+        ("scan", "boolean", "formData"),
+    )),
+    ("DeleteFile", "DELETE", "/quickscanpro/entities/files/v1", "quick_scan_pro", (
+        ("ids", "array", "query"),
+    )),
+    ("GetScanResult", "GET", "/quickscanpro/entities/scans/v1", "quick_scan_pro", (
+        ("ids", "array", "query"),
+    )),
+    ("LaunchScan", "POST", "/quickscanpro/entities/scans/v1", "quick_scan_pro", (
+        ("body", None, "body"),
+    )),
+    ("DeleteScanResult", "DELETE", "/quickscanpro/entities/scans/v1", "quick_scan_pro", (
+        ("ids", "array", "query"),
+    )),
+    ("QueryScanResults", "GET", "/quickscanpro/queries/scans/v1", "quick_scan_pro", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_real_time_response_endpoints = (
+    ("RTR_AggregateSessions", "POST", "/real-time-response/aggregates/sessions/GET/v1", "real_time_response", (
+        ("body", None, "body"),
+    )),
+    ("BatchActiveResponderCmd", "POST",
+     "/real-time-response/combined/batch-active-responder-command/v1", "real_time_response", (
+         ("timeout", "integer", "query"),
+         ("timeout_duration", "string", "query"),
+         ("host_timeout_duration", "string", "query"),
+         ("body", None, "body"),
+     )),
+    ("BatchCmd", "POST", "/real-time-response/combined/batch-command/v1", "real_time_response", (
+        ("timeout", "integer", "query"),
+        ("timeout_duration", "string", "query"),
+        ("host_timeout_duration", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("BatchGetCmdStatus", "GET", "/real-time-response/combined/batch-get-command/v1", "real_time_response", (
+        ("timeout", "integer", "query"),
+        ("timeout_duration", "string", "query"),
+        ("batch_get_cmd_req_id", "string", "query"),
+    )),
+    ("BatchGetCmd", "POST", "/real-time-response/combined/batch-get-command/v1", "real_time_response", (
+        ("timeout", "integer", "query"),
+        ("timeout_duration", "string", "query"),
+        ("host_timeout_duration", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("BatchInitSessions", "POST", "/real-time-response/combined/batch-init-session/v1", "real_time_response", (
+        ("timeout", "integer", "query"),
+        ("timeout_duration", "string", "query"),
+        ("host_timeout_duration", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("BatchRefreshSessions", "POST", "/real-time-response/combined/batch-refresh-session/v1", "real_time_response", (
+        ("timeout", "integer", "query"),
+        ("timeout_duration", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("RTR_CheckActiveResponderCommandStatus", "GET",
+     "/real-time-response/entities/active-responder-command/v1", "real_time_response", (
+         ("cloud_request_id", "string", "query"),
+         ("sequence_id", "integer", "query"),
+     )),
+    ("RTR_ExecuteActiveResponderCommand", "POST",
+     "/real-time-response/entities/active-responder-command/v1", "real_time_response", (
+         ("body", None, "body"),
+     )),
+    ("RTR_CheckCommandStatus", "GET", "/real-time-response/entities/command/v1", "real_time_response", (
+        ("cloud_request_id", "string", "query"),
+        ("sequence_id", "integer", "query"),
+    )),
+    ("RTR_ExecuteCommand", "POST", "/real-time-response/entities/command/v1", "real_time_response", (
+        ("body", None, "body"),
+    )),
+    ("RTR_GetExtractedFileContents", "GET", "/real-time-response/entities/extracted-file-contents/v1", "real_time_response", (
+        ("session_id", "string", "query"),
+        ("sha256", "string", "query"),
+        ("filename", "string", "query"),
+    )),
+    ("RTR_ListFiles", "GET", "/real-time-response/entities/file/v1", "real_time_response", (
+        ("session_id", "string", "query"),
+    )),
+    ("RTR_DeleteFile", "DELETE", "/real-time-response/entities/file/v1", "real_time_response", (
+        ("ids", "string", "query"),
+        ("session_id", "string", "query"),
+    )),
+    ("RTR_ListFilesV2", "GET", "/real-time-response/entities/file/v2", "real_time_response", (
+        ("session_id", "string", "query"),
+    )),
+    ("RTR_DeleteFileV2", "DELETE", "/real-time-response/entities/file/v2", "real_time_response", (
+        ("ids", "string", "query"),
+        ("session_id", "string", "query"),
+    )),
+    ("RTR_ListQueuedSessions", "POST", "/real-time-response/entities/queued-sessions/GET/v1", "real_time_response", (
+        ("body", None, "body"),
+    )),
+    ("RTR_DeleteQueuedSession", "DELETE", "/real-time-response/entities/queued-sessions/command/v1", "real_time_response", (
+        ("session_id", "string", "query"),
+        ("cloud_request_id", "string", "query"),
+    )),
+    ("RTR_PulseSession", "POST", "/real-time-response/entities/refresh-session/v1", "real_time_response", (
+        ("body", None, "body"),
+    )),
+    ("RTR_ListSessions", "POST", "/real-time-response/entities/sessions/GET/v1", "real_time_response", (
+        ("body", None, "body"),
+    )),
+    ("RTR_InitSession", "POST", "/real-time-response/entities/sessions/v1", "real_time_response", (
+        ("timeout", "integer", "query"),
+        ("timeout_duration", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("RTR_DeleteSession", "DELETE", "/real-time-response/entities/sessions/v1", "real_time_response", (
+        ("session_id", "string", "query"),
+    )),
+    ("RTR_ListAllSessions", "GET", "/real-time-response/queries/sessions/v1", "real_time_response", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+)
+
+_real_time_response_admin_endpoints = (
+    ("BatchAdminCmd", "POST", "/real-time-response/combined/batch-admin-command/v1", "real_time_response_admin", (
+        ("timeout", "integer", "query"),
+        ("timeout_duration", "string", "query"),
+        ("host_timeout_duration", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("RTR_CheckAdminCommandStatus", "GET", "/real-time-response/entities/admin-command/v1", "real_time_response_admin", (
+        ("cloud_request_id", "string", "query"),
+        ("sequence_id", "integer", "query"),
+    )),
+    ("RTR_ExecuteAdminCommand", "POST", "/real-time-response/entities/admin-command/v1", "real_time_response_admin", (
+        ("body", None, "body"),
+    )),
+    ("RTR_GetFalconScripts", "GET", "/real-time-response/entities/falcon-scripts/v1", "real_time_response_admin", (
+        ("ids", "array", "query"),
+    )),
+    ("RTR_GetPut_Files", "GET", "/real-time-response/entities/put-files/v1", "real_time_response_admin", (
+        ("ids", "array", "query"),
+    )),
+    ("RTR_CreatePut_Files", "POST", "/real-time-response/entities/put-files/v1", "real_time_response_admin", (
+        ("file", "file", "formData"),
+        ("description", "string", "formData"),
+        ("name", "string", "formData"),
+        ("comments_for_audit_log", "string", "formData"),
+    )),
+    ("RTR_DeletePut_Files", "DELETE", "/real-time-response/entities/put-files/v1", "real_time_response_admin", (
+        ("ids", "string", "query"),
+    )),
+    ("RTR_GetPut_FilesV2", "GET", "/real-time-response/entities/put-files/v2", "real_time_response_admin", (
+        ("ids", "array", "query"),
+    )),
+    ("RTR_GetScripts", "GET", "/real-time-response/entities/scripts/v1", "real_time_response_admin", (
+        ("ids", "array", "query"),
+    )),
+    ("RTR_CreateScripts", "POST", "/real-time-response/entities/scripts/v1", "real_time_response_admin", (
+        ("file", "file", "formData"),
+        ("description", "string", "formData"),
+        ("name", "string", "formData"),
+        ("comments_for_audit_log", "string", "formData"),
+        ("permission_type", "string", "formData"),
+        ("content", "string", "formData"),
+        ("platform", "array", "formData"),
+    )),
+    ("RTR_UpdateScripts", "PATCH", "/real-time-response/entities/scripts/v1", "real_time_response_admin", (
+        ("id", "string", "formData"),
+        ("file", "file", "formData"),
+        ("description", "string", "formData"),
+        ("name", "string", "formData"),
+        ("comments_for_audit_log", "string", "formData"),
+        ("permission_type", "string", "formData"),
+        ("content", "string", "formData"),
+        ("platform", "array", "formData"),
+    )),
+    ("RTR_DeleteScripts", "DELETE", "/real-time-response/entities/scripts/v1", "real_time_response_admin", (
+        ("ids", "string", "query"),
+    )),
+    ("RTR_GetScriptsV2", "GET", "/real-time-response/entities/scripts/v2", "real_time_response_admin", (
+        ("ids", "array", "query"),
+    )),
+    ("RTR_ListFalconScripts", "GET", "/real-time-response/queries/falcon-scripts/v1", "real_time_response_admin", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("RTR_ListPut_Files", "GET", "/real-time-response/queries/put-files/v1", "real_time_response_admin", (
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("RTR_ListScripts", "GET", "/real-time-response/queries/scripts/v1", "real_time_response_admin", (
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_real_time_response_audit_endpoints = (
+    ("RTRAuditSessions", "GET", "/real-time-response-audit/combined/sessions/v1", "real_time_response_audit", (
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("limit", "string", "query"),
+        ("offset", "string", "query"),
+        ("with_command_info", "boolean", "query"),
+    )),
+)
+
+_recon_endpoints = (
+    ("AggregateNotificationsExposedDataRecordsV1", "POST",
+     "/recon/aggregates/notifications-exposed-data-records/GET/v1", "recon", (
+         ("body", None, "body"),
+     )),
+    ("AggregateNotificationsV1", "POST", "/recon/aggregates/notifications/GET/v1", "recon", (
+        ("body", None, "body"),
+    )),
+    ("PreviewRuleV1", "POST", "/recon/aggregates/rules-preview/GET/v1", "recon", (
+        ("body", None, "body"),
+    )),
+    ("GetActionsV1", "GET", "/recon/entities/actions/v1", "recon", (
+        ("ids", "array", "query"),
+    )),
+    ("CreateActionsV1", "POST", "/recon/entities/actions/v1", "recon", (
+        ("body", None, "body"),
+    )),
+    ("UpdateActionV1", "PATCH", "/recon/entities/actions/v1", "recon", (
+        ("body", None, "body"),
+    )),
+    ("DeleteActionV1", "DELETE", "/recon/entities/actions/v1", "recon", (
+        ("id", "string", "query"),
+    )),
+    ("GetFileContentForExportJobsV1", "GET", "/recon/entities/export-files/v1", "recon", (
+        ("id", "string", "query"),
+    )),
+    ("GetExportJobsV1", "GET", "/recon/entities/exports/v1", "recon", (
+        ("ids", "array", "query"),
+    )),
+    ("CreateExportJobsV1", "POST", "/recon/entities/exports/v1", "recon", (
+        ("body", None, "body"),
+    )),
+    ("DeleteExportJobsV1", "DELETE", "/recon/entities/exports/v1", "recon", (
+        ("ids", "array", "query"),
+    )),
+    ("GetNotificationsDetailedTranslatedV1", "GET", "/recon/entities/notifications-detailed-translated/v1", "recon", (
+        ("ids", "array", "query"),
+    )),
+    ("GetNotificationsDetailedV1", "GET", "/recon/entities/notifications-detailed/v1", "recon", (
+        ("ids", "array", "query"),
+    )),
+    ("GetNotificationsExposedDataRecordsV1", "GET", "/recon/entities/notifications-exposed-data-records/v1", "recon", (
+        ("ids", "array", "query"),
+    )),
+    ("GetNotificationsTranslatedV1", "GET", "/recon/entities/notifications-translated/v1", "recon", (
+        ("ids", "array", "query"),
+    )),
+    ("GetNotificationsV1", "GET", "/recon/entities/notifications/v1", "recon", (
+        ("ids", "array", "query"),
+    )),
+    ("UpdateNotificationsV1", "PATCH", "/recon/entities/notifications/v1", "recon", (
+        ("body", None, "body"),
+    )),
+    ("DeleteNotificationsV1", "DELETE", "/recon/entities/notifications/v1", "recon", (
+        ("ids", "array", "query"),
+    )),
+    ("GetRulesV1", "GET", "/recon/entities/rules/v1", "recon", (
+        ("ids", "array", "query"),
+    )),
+    ("CreateRulesV1", "POST", "/recon/entities/rules/v1", "recon", (
+        ("body", None, "body"),
+    )),
+    ("UpdateRulesV1", "PATCH", "/recon/entities/rules/v1", "recon", (
+        ("body", None, "body"),
+    )),
+    ("DeleteRulesV1", "DELETE", "/recon/entities/rules/v1", "recon", (
+        ("ids", "array", "query"),
+        ("notificationsDeletionRequested", "boolean", "query"),
+    )),
+    ("QueryActionsV1", "GET", "/recon/queries/actions/v1", "recon", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+    )),
+    ("QueryNotificationsExposedDataRecordsV1", "GET", "/recon/queries/notifications-exposed-data-records/v1", "recon", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+    )),
+    ("QueryNotificationsV1", "GET", "/recon/queries/notifications/v1", "recon", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+    )),
+    ("QueryRulesV1", "GET", "/recon/queries/rules/v1", "recon", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("secondarySort", "string", "query"),
+    )),
+)
+
+_report_executions_endpoints = (
+    ("report_executions_download_get", "GET", "/reports/entities/report-executions-download/v1", "report_executions", (
+        ("ids", "string", "query"),
+    )),
+    ("report_executions_retry", "POST", "/reports/entities/report-executions-retry/v1", "report_executions", (
+        ("body", None, "body"),
+    )),
+    ("report_executions_get", "GET", "/reports/entities/report-executions/v1", "report_executions", (
+        ("ids", "array", "query"),
+    )),
+    ("report_executions_query", "GET", "/reports/queries/report-executions/v1", "report_executions", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+)
+
+_response_policies_endpoints = (
+    ("queryCombinedRTResponsePolicyMembers", "GET", "/policy/combined/response-members/v1", "response_policies", (
+        ("id", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("queryCombinedRTResponsePolicies", "GET", "/policy/combined/response/v1", "response_policies", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("performRTResponsePoliciesAction", "POST", "/policy/entities/response-actions/v1", "response_policies", (
+        ("action_name", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("setRTResponsePoliciesPrecedence", "POST", "/policy/entities/response-precedence/v1", "response_policies", (
+        ("body", None, "body"),
+    )),
+    ("getRTResponsePolicies", "GET", "/policy/entities/response/v1", "response_policies", (
+        ("ids", "array", "query"),
+    )),
+    ("createRTResponsePolicies", "POST", "/policy/entities/response/v1", "response_policies", (
+        ("body", None, "body"),
+    )),
+    ("updateRTResponsePolicies", "PATCH", "/policy/entities/response/v1", "response_policies", (
+        ("body", None, "body"),
+    )),
+    ("deleteRTResponsePolicies", "DELETE", "/policy/entities/response/v1", "response_policies", (
+        ("ids", "array", "query"),
+    )),
+    ("queryRTResponsePolicyMembers", "GET", "/policy/queries/response-members/v1", "response_policies", (
+        ("id", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("queryRTResponsePolicies", "GET", "/policy/queries/response/v1", "response_policies", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_sample_uploads_endpoints = (
+    ("ArchiveListV1", "GET", "/archives/entities/archive-files/v1", "sample_uploads", (
+        ("id", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "string", "query"),
+    )),
+    ("ArchiveGetV1", "GET", "/archives/entities/archives/v1", "sample_uploads", (
+        ("id", "string", "query"),
+        ("include_files", "boolean", "query"),
+    )),
+    ("ArchiveUploadV1", "POST", "/archives/entities/archives/v1", "sample_uploads", (
+        ("body", None, "body"),
+        ("name", "string", "query"),
+        ("password", "string", "query"),
+        ("is_confidential", "boolean", "query"),
+        ("comment", "string", "query"),
+    )),
+    ("ArchiveDeleteV1", "DELETE", "/archives/entities/archives/v1", "sample_uploads", (
+        ("id", "string", "query"),
+    )),
+    ("ArchiveUploadV2", "POST", "/archives/entities/archives/v2", "sample_uploads", (
+        ("file", "file", "formData"),
+        ("password", "string", "formData"),
+        ("name", "string", "formData"),
+        ("is_confidential", "boolean", "formData"),
+        ("comment", "string", "formData"),
+    )),
+    ("ExtractionListV1", "GET", "/archives/entities/extraction-files/v1", "sample_uploads", (
+        ("id", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "string", "query"),
+    )),
+    ("ExtractionGetV1", "GET", "/archives/entities/extractions/v1", "sample_uploads", (
+        ("id", "string", "query"),
+        ("include_files", "boolean", "query"),
+    )),
+    ("ExtractionCreateV1", "POST", "/archives/entities/extractions/v1", "sample_uploads", (
+        ("body", None, "body"),
+    )),
+    ("GetSampleV3", "GET", "/samples/entities/samples/v3", "sample_uploads", (
+        ("ids", "string", "query"),
+        ("password_protected", "boolean", "query"),
+    )),
+    ("UploadSampleV3", "POST", "/samples/entities/samples/v3", "sample_uploads", (
+        ("sample", "file", "formData"),
+        ("file_name", "string", "formData"),
+        ("comment", "string", "formData"),
+        ("is_confidential", "boolean", "formData"),
+    )),
+    ("DeleteSampleV3", "DELETE", "/samples/entities/samples/v3", "sample_uploads", (
+        ("ids", "string", "query"),
+    )),
+)
+
+_scheduled_reports_endpoints = (
+    ("scheduled_reports_launch", "POST", "/reports/entities/scheduled-reports/execution/v1", "scheduled_reports", (
+        ("body", None, "body"),
+    )),
+    ("scheduled_reports_get", "GET", "/reports/entities/scheduled-reports/v1", "scheduled_reports", (
+        ("ids", "array", "query"),
+    )),
+    ("scheduled_reports_query", "GET", "/reports/queries/scheduled-reports/v1", "scheduled_reports", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+)
+
+_sensor_download_endpoints = (
+    ("GetCombinedSensorInstallersByQuery", "GET", "/sensors/combined/installers/v1", "sensor_download", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("GetCombinedSensorInstallersByQueryV2", "GET", "/sensors/combined/installers/v2", "sensor_download", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("DownloadSensorInstallerById", "GET", "/sensors/entities/download-installer/v1", "sensor_download", (
+        ("id", "string", "query"),
+    )),
+    ("DownloadSensorInstallerByIdV2", "GET", "/sensors/entities/download-installer/v2", "sensor_download", (
+        ("id", "string", "query"),
+    )),
+    ("GetSensorInstallersEntities", "GET", "/sensors/entities/installers/v1", "sensor_download", (
+        ("ids", "array", "query"),
+    )),
+    ("GetSensorInstallersEntitiesV2", "GET", "/sensors/entities/installers/v2", "sensor_download", (
+        ("ids", "array", "query"),
+    )),
+    ("GetSensorInstallersCCIDByQuery", "GET", "/sensors/queries/installers/ccid/v1", "sensor_download", (
+    )),
+    ("GetSensorInstallersByQuery", "GET", "/sensors/queries/installers/v1", "sensor_download", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("GetSensorInstallersByQueryV2", "GET", "/sensors/queries/installers/v2", "sensor_download", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+)
+
+_sensor_update_policies_endpoints = (
+    ("revealUninstallToken", "POST", "/policy/combined/reveal-uninstall-token/v1", "sensor_update_policies", (
+        ("body", None, "body"),
+    )),
+    ("queryCombinedSensorUpdateBuilds", "GET", "/policy/combined/sensor-update-builds/v1", "sensor_update_policies", (
+        ("platform", "string", "query"),
+        ("stage", "array", "query"),
+    )),
+    ("queryCombinedSensorUpdateKernels", "GET", "/policy/combined/sensor-update-kernels/v1", "sensor_update_policies", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("queryCombinedSensorUpdatePolicyMembers", "GET", "/policy/combined/sensor-update-members/v1", "sensor_update_policies", (
+        ("id", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("queryCombinedSensorUpdatePolicies", "GET", "/policy/combined/sensor-update/v1", "sensor_update_policies", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("queryCombinedSensorUpdatePoliciesV2", "GET", "/policy/combined/sensor-update/v2", "sensor_update_policies", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("performSensorUpdatePoliciesAction", "POST", "/policy/entities/sensor-update-actions/v1", "sensor_update_policies", (
+        ("action_name", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("setSensorUpdatePoliciesPrecedence", "POST", "/policy/entities/sensor-update-precedence/v1", "sensor_update_policies", (
+        ("body", None, "body"),
+    )),
+    ("getSensorUpdatePolicies", "GET", "/policy/entities/sensor-update/v1", "sensor_update_policies", (
+        ("ids", "array", "query"),
+    )),
+    ("createSensorUpdatePolicies", "POST", "/policy/entities/sensor-update/v1", "sensor_update_policies", (
+        ("body", None, "body"),
+    )),
+    ("updateSensorUpdatePolicies", "PATCH", "/policy/entities/sensor-update/v1", "sensor_update_policies", (
+        ("body", None, "body"),
+    )),
+    ("deleteSensorUpdatePolicies", "DELETE", "/policy/entities/sensor-update/v1", "sensor_update_policies", (
+        ("ids", "array", "query"),
+    )),
+    ("getSensorUpdatePoliciesV2", "GET", "/policy/entities/sensor-update/v2", "sensor_update_policies", (
+        ("ids", "array", "query"),
+    )),
+    ("createSensorUpdatePoliciesV2", "POST", "/policy/entities/sensor-update/v2", "sensor_update_policies", (
+        ("body", None, "body"),
+    )),
+    ("updateSensorUpdatePoliciesV2", "PATCH", "/policy/entities/sensor-update/v2", "sensor_update_policies", (
+        ("body", None, "body"),
+    )),
+    ("querySensorUpdateKernelsDistinct", "GET", "/policy/queries/sensor-update-kernels/{}/v1", "sensor_update_policies", (
+        ("distinct-field", "string", "path"),
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("querySensorUpdatePolicyMembers", "GET", "/policy/queries/sensor-update-members/v1", "sensor_update_policies", (
+        ("id", "string", "query"),
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("querySensorUpdatePolicies", "GET", "/policy/queries/sensor-update/v1", "sensor_update_policies", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_sensor_usage_endpoints = (
+    ("GetSensorUsageWeekly", "GET", "/billing-dashboards-usage/aggregates/weekly-average/v1", "sensor_usage", (
+        ("filter", "string", "query"),
+    )),
+)
+
+_sensor_visibility_exclusions_endpoints = (
+    ("getSensorVisibilityExclusionsV1", "GET", "/policy/entities/sv-exclusions/v1", "sensor_visibility_exclusions", (
+        ("ids", "array", "query"),
+    )),
+    ("createSVExclusionsV1", "POST", "/policy/entities/sv-exclusions/v1", "sensor_visibility_exclusions", (
+        ("body", None, "body"),
+    )),
+    ("updateSensorVisibilityExclusionsV1", "PATCH", "/policy/entities/sv-exclusions/v1", "sensor_visibility_exclusions", (
+        ("body", None, "body"),
+    )),
+    ("deleteSensorVisibilityExclusionsV1", "DELETE", "/policy/entities/sv-exclusions/v1", "sensor_visibility_exclusions", (
+        ("ids", "array", "query"),
+        ("comment", "string", "query"),
+    )),
+    ("querySensorVisibilityExclusionsV1", "GET", "/policy/queries/sv-exclusions/v1", "sensor_visibility_exclusions", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_serverless_vulnerabilities_endpoints = (
+    ("GetCombinedVulnerabilitiesSARIF", "GET", "/lambdas/combined/vulnerabilities/sarif/v1", "serverless_vulnerabilities", (
+        ("filter", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_spotlight_evaluation_logic_endpoints = (
+    ("combinedQueryEvaluationLogic", "GET", "/spotlight/combined/evaluation-logic/v1", "spotlight_evaluation_logic", (
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("getEvaluationLogic", "GET", "/spotlight/entities/evaluation-logic/v1", "spotlight_evaluation_logic", (
+        ("ids", "array", "query"),
+    )),
+    ("queryEvaluationLogic", "GET", "/spotlight/queries/evaluation-logic/v1", "spotlight_evaluation_logic", (
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_spotlight_vulnerabilities_endpoints = (
+    ("combinedQueryVulnerabilities", "GET", "/spotlight/combined/vulnerabilities/v1", "spotlight_vulnerabilities", (
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("facet", "array", "query"),
+    )),
+    ("getRemediationsV2", "GET", "/spotlight/entities/remediations/v2", "spotlight_vulnerabilities", (
+        ("ids", "array", "query"),
+    )),
+    ("getVulnerabilities", "GET", "/spotlight/entities/vulnerabilities/v2", "spotlight_vulnerabilities", (
+        ("ids", "array", "query"),
+    )),
+    ("queryVulnerabilities", "GET", "/spotlight/queries/vulnerabilities/v1", "spotlight_vulnerabilities", (
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("getRemediations", "GET", "/spotlight/entities/remediations/v2", "spotlight_vulnerabilities", (
+        ("ids", "array", "query"),
+    )),
+)
+
+_tailored_intelligence_endpoints = (
+    ("GetEventsBody", "GET", "/ti/events/entities/events-full-body/v2", "tailored_intelligence", (
+        ("id", "string", "query"),
+    )),
+    ("GetEventsEntities", "POST", "/ti/events/entities/events/GET/v2", "tailored_intelligence", (
+        ("body", None, "body"),
+    )),
+    ("QueryEvents", "GET", "/ti/events/queries/events/v2", "tailored_intelligence", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+    )),
+    ("GetRulesEntities", "POST", "/ti/rules/entities/rules/GET/v2", "tailored_intelligence", (
+        ("body", None, "body"),
+    )),
+    ("QueryRules", "GET", "/ti/rules/queries/rules/v2", "tailored_intelligence", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+    )),
+)
+
+_threatgraph_endpoints = (
+    ("combined_edges_get", "GET", "/threatgraph/combined/edges/v1", "threatgraph", (
+        ("ids", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "string", "query"),
+        ("edge_type", "string", "query"),
+        ("direction", "string", "query"),
+        ("scope", "string", "query"),
+        ("nano", "boolean", "query"),
+    )),
+    ("combined_ran_on_get", "GET", "/threatgraph/combined/ran-on/v1", "threatgraph", (
+        ("value", "string", "query"),
+        ("type", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "string", "query"),
+        ("nano", "boolean", "query"),
+    )),
+    ("combined_summary_get", "GET", "/threatgraph/combined/{}/summary/v1", "threatgraph", (
+        ("vertex_type", "string", "path"),
+        ("ids", "array", "query"),
+        ("scope", "string", "query"),
+        ("nano", "boolean", "query"),
+    )),
+    ("entities_vertices_get", "GET", "/threatgraph/entities/{}/v1", "threatgraph", (
+        ("vertex_type", "string", "path"),
+        ("ids", "array", "query"),
+        ("scope", "string", "query"),
+        ("nano", "boolean", "query"),
+    )),
+    ("entities_vertices_getv2", "GET", "/threatgraph/entities/{}/v2", "threatgraph", (
+        ("vertex_type", "string", "path"),
+        ("ids", "array", "query"),
+        ("scope", "string", "query"),
+        ("nano", "boolean", "query"),
+    )),
+    ("queries_edgetypes_get", "GET", "/threatgraph/queries/edge-types/v1", "threatgraph", (
+    )),
+)
+
+_unidentified_containers_endpoints = (
+    ("ReadUnidentifiedContainersByDateRangeCount", "GET",
+     "/container-security/aggregates/unidentified-containers/count-by-date/v1", "unidentified_containers", (
+         ("filter", "string", "query"),
+     )),
+    ("ReadUnidentifiedContainersCount", "GET",
+     "/container-security/aggregates/unidentified-containers/count/v1", "unidentified_containers", (
+         ("filter", "string", "query"),
+     )),
+    ("SearchAndReadUnidentifiedContainers", "GET",
+     "/container-security/combined/unidentified-containers/v1", "unidentified_containers", (
+         ("filter", "string", "query"),
+         ("sort", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+     )),
+)
+
+_user_management_endpoints = (
+    ("aggregateUsersV1", "POST", "/user-management/aggregates/users/v1", "user_management", (
+        ("body", None, "body"),
+    )),
+    ("combinedUserRolesV1", "GET", "/user-management/combined/user-roles/v1", "user_management", (
+        ("user_uuid", "string", "query"),
+        ("cid", "string", "query"),
+        ("direct_only", "boolean", "query"),
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("CombinedUserRolesV2", "GET", "/user-management/combined/user-roles/v2", "user_management", (
+        ("user_uuid", "string", "query"),
+        ("cid", "string", "query"),
+        ("direct_only", "boolean", "query"),
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("entitiesRolesV1", "GET", "/user-management/entities/roles/v1", "user_management", (
+        ("cid", "string", "query"),
+        ("ids", "array", "query"),
+    )),
+    ("userActionV1", "POST", "/user-management/entities/user-actions/v1", "user_management", (
+        ("body", None, "body"),
+    )),
+    ("userRolesActionV1", "POST", "/user-management/entities/user-role-actions/v1", "user_management", (
+        ("body", None, "body"),
+    )),
+    ("retrieveUsersGETV1", "POST", "/user-management/entities/users/GET/v1", "user_management", (
+        ("body", None, "body"),
+    )),
+    ("createUserV1", "POST", "/user-management/entities/users/v1", "user_management", (
+        ("validate_only", "boolean", "query"),
+        ("body", None, "body"),
+    )),
+    ("updateUserV1", "PATCH", "/user-management/entities/users/v1", "user_management", (
+        ("user_uuid", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("deleteUserV1", "DELETE", "/user-management/entities/users/v1", "user_management", (
+        ("user_uuid", "string", "query"),
+    )),
+    ("queriesRolesV1", "GET", "/user-management/queries/roles/v1", "user_management", (
+        ("cid", "string", "query"),
+        ("user_uuid", "string", "query"),
+        ("action", "string", "query"),
+    )),
+    ("queryUserV1", "GET", "/user-management/queries/users/v1", "user_management", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("GetRoles", "GET", "/user-roles/entities/user-roles/v1", "user_management", (
+        ("ids", "array", "query"),
+    )),
+    ("GrantUserRoleIds", "POST", "/user-roles/entities/user-roles/v1", "user_management", (
+        ("user_uuid", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("RevokeUserRoleIds", "DELETE", "/user-roles/entities/user-roles/v1", "user_management", (
+        ("user_uuid", "string", "query"),
+        ("ids", "array", "query"),
+    )),
+    ("GetAvailableRoleIds", "GET", "/user-roles/queries/user-role-ids-by-cid/v1", "user_management", (
+    )),
+    ("GetUserRoleIds", "GET", "/user-roles/queries/user-role-ids-by-user-uuid/v1", "user_management", (
+        ("user_uuid", "string", "query"),
+    )),
+    ("RetrieveUser", "GET", "/users/entities/users/v1", "user_management", (
+        ("ids", "array", "query"),
+    )),
+    ("retrieveUser", "GET", "/users/entities/users/v1", "user_management", (
+        ("ids", "array", "query"),
+    )),
+    ("CreateUser", "POST", "/users/entities/users/v1", "user_management", (
+        ("body", None, "body"),
+    )),
+    ("UpdateUser", "PATCH", "/users/entities/users/v1", "user_management", (
+        ("user_uuid", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("DeleteUser", "DELETE", "/users/entities/users/v1", "user_management", (
+        ("user_uuid", "string", "query"),
+    )),
+    ("RetrieveEmailsByCID", "GET", "/users/queries/emails-by-cid/v1", "user_management", (
+    )),
+    ("RetrieveUserUUIDsByCID", "GET", "/users/queries/user-uuids-by-cid/v1", "user_management", (
+    )),
+    ("RetrieveUserUUID", "GET", "/users/queries/user-uuids-by-email/v1", "user_management", (
+        ("uid", "array", "query"),
+    )),
+)
+
+_workflows_endpoints = (
+    ("WorkflowActivitiesCombined", "GET", "/workflows/combined/activities/v1", "workflows", (
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("WorkflowActivitiesContentCombined", "GET", "/workflows/combined/activity-content/v1", "workflows", (
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("WorkflowDefinitionsCombined", "GET", "/workflows/combined/definitions/v1", "workflows", (
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("WorkflowExecutionsCombined", "GET", "/workflows/combined/executions/v1", "workflows", (
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("WorkflowTriggersCombined", "GET", "/workflows/combined/triggers/v1", "workflows", (
+        ("filter", "string", "query"),
+    )),
+    ("WorkflowDefinitionsExport", "GET", "/workflows/entities/definitions/export/v1", "workflows", (
+        ("id", "string", "query"),
+        ("sanitize", "boolean", "query"),
+    )),
+    ("WorkflowDefinitionsImport", "POST", "/workflows/entities/definitions/import/v1", "workflows", (
+        ("data_file", "file", "formData"),
+        ("name", "string", "query"),
+        ("validate_only", "boolean", "query"),
+    )),
+    ("WorkflowDefinitionsUpdate", "PUT", "/workflows/entities/definitions/v1", "workflows", (
+        ("validate_only", "boolean", "query"),
+        ("body", None, "body"),
+    )),
+    ("WorkflowExecuteInternal", "POST", "/workflows/entities/execute/internal/v1", "workflows", (
+        ("execution_cid", "array", "query"),
+        ("definition_id", "array", "query"),
+        ("name", "string", "query"),
+        ("key", "string", "query"),
+        ("depth", "integer", "query"),
+        ("batch_size", "integer", "query"),
+        ("source_event_url", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("WorkflowExecute", "POST", "/workflows/entities/execute/v1", "workflows", (
+        ("execution_cid", "array", "query"),
+        ("definition_id", "array", "query"),
+        ("name", "string", "query"),
+        ("key", "string", "query"),
+        ("depth", "integer", "query"),
+        ("source_event_url", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("WorkflowExecutionsAction", "POST", "/workflows/entities/execution-actions/v1", "workflows", (
+        ("action_name", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("WorkflowExecutionResults", "GET", "/workflows/entities/execution-results/v1", "workflows", (
+        ("ids", "array", "query"),
+    )),
+    ("WorkflowGetHumanInputV1", "GET", "/workflows/entities/human-inputs/v1", "workflows", (
+        ("ids", "array", "query"),
+    )),
+    ("WorkflowUpdateHumanInputV1", "PATCH", "/workflows/entities/human-inputs/v1", "workflows", (
+        ("id", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("WorkflowMockExecute", "POST", "/workflows/entities/mock-executions/v1", "workflows", (
+        ("execution_cid", "array", "query"),
+        ("definition_id", "string", "query"),
+        ("name", "string", "query"),
+        ("key", "string", "query"),
+        ("depth", "integer", "query"),
+        ("source_event_url", "string", "query"),
+        ("validate_only", "boolean", "query"),
+        ("body", None, "body"),
+    )),
+    ("WorkflowSystemDefinitionsDeProvision", "POST", "/workflows/system-definitions/deprovision/v1", "workflows", (
+        ("body", None, "body"),
+    )),
+    ("WorkflowSystemDefinitionsPromote", "POST", "/workflows/system-definitions/promote/v1", "workflows", (
+        ("body", None, "body"),
+    )),
+    ("WorkflowSystemDefinitionsProvision", "POST", "/workflows/system-definitions/provision/v1", "workflows", (
+        ("body", None, "body"),
+    )),
+)
+
+_zero_trust_assessment_endpoints = (
+    ("getAssessmentV1", "GET", "/zero-trust-assessment/entities/assessments/v1", "zero_trust_assessment", (
+        ("ids", "array", "query"),
+    )),
+    ("getAuditV1", "GET", "/zero-trust-assessment/entities/audit/v1", "zero_trust_assessment", (
+    )),
+    ("getAssessmentsByScoreV1", "GET", "/zero-trust-assessment/queries/assessments/v1", "zero_trust_assessment", (
+        ("filter", "string", "query"),
+        ("limit", "integer", "query"),
+        ("after", "string", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("getCombinedAssessmentsQuery", "GET", "/configuration-assessment/combined/assessments/v1", "public_assessments", (
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("facet", "array", "query"),
+    )),
+)
+
+_cloud_aws_registration_deprecated = (
+    ("cloud-registration-aws-get-accounts", "GET",
+     "/cloud-security-registration-aws/entities/account/v1", "cloud_aws_registration", (
+         ("ids", "array", "query"),
+     )),
+    ("cloud-registration-aws-create-account", "POST",
+     "/cloud-security-registration-aws/entities/account/v1", "cloud_aws_registration", (
+         ("body", None, "body"),
+     )),
+    ("cloud-registration-aws-update-account", "PATCH",
+     "/cloud-security-registration-aws/entities/account/v1", "cloud_aws_registration", (
+         ("body", None, "body"),
+     )),
+    ("cloud-registration-aws-delete-account", "DELETE",
+     "/cloud-security-registration-aws/entities/account/v1", "cloud_aws_registration", (
+         ("ids", "array", "query"),
+         ("organization-ids", "array", "query"),
+     )),
+    ("cloud-registration-aws-query-accounts", "GET",
+     "/cloud-security-registration-aws/queries/account/v1", "cloud_aws_registration", (
+         ("organization-ids", "array", "query"),
+         ("products", "array", "query"),
+         ("features", "array", "query"),
+         ("account-status", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+         ("group_by", "string", "query"),
+     )),
+)
+
+_cloud_azure_registration_deprecated = (
+    ("cloud-registration-azure-download-script", "POST",
+     "/cloud-security-registration-azure/entities/scripts/v1", "cloud_azure_registration", (
+         ("body", None, "body"),
+     )),
+)
+
+_cloud_oci_registration_deprecated = (
+    ("cloud-security-registration-oci-get-account", "GET",
+     "/cloud-security-registration-oci/combined/accounts/v1", "cloud_oci_registration", (
+         ("filter", "string", "query"),
+         ("sort", "string", "query"),
+         ("next_token", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+     )),
+    ("cloud-security-registration-oci-rotate-key", "POST",
+     "/cloud-security-registration-oci/entities/account-rotate-keys/v1", "cloud_oci_registration", (
+         ("body", None, "body"),
+     )),
+    ("cloud-security-registration-oci-validate-tenancy", "POST",
+     "/cloud-security-registration-oci/entities/account-validate/v1", "cloud_oci_registration", (
+         ("body", None, "body"),
+     )),
+    ("cloud-security-registration-oci-create-account", "POST",
+     "/cloud-security-registration-oci/entities/accounts/v1", "cloud_oci_registration", (
+         ("body", None, "body"),
+     )),
+    ("cloud-security-registration-oci-update-account", "PATCH",
+     "/cloud-security-registration-oci/entities/accounts/v1", "cloud_oci_registration", (
+         ("body", None, "body"),
+     )),
+    ("cloud-security-registration-oci-delete-account", "DELETE",
+     "/cloud-security-registration-oci/entities/accounts/v1", "cloud_oci_registration", (
+         ("ids", "array", "query"),
+     )),
+    ("cloud-security-registration-oci-download-script", "POST",
+     "/cloud-security-registration-oci/entities/scripts/v1", "cloud_oci_registration", (
+         ("body", None, "body"),
+     )),
+)
+
+_cloud_security_assets_deprecated = (
+    ("cloud-security-assets-combined-compliance-by-account", "GET",
+     "/cloud-security-assets/combined/compliance-controls/by-account-region-and-resource-type/v1", "cloud_security_assets", (
+         ("filter", "string", "query"),
+         ("sort", "string", "query"),
+         ("limit", "integer", "query"),
+         ("offset", "integer", "query"),
+         ("after", "string", "query"),
+         ("include_failing_iom_severity_counts", "boolean", "query"),
+     )),
+    ("cloud-security-assets-entities-get", "GET", "/cloud-security-assets/entities/resources/v1", "cloud_security_assets", (
+        ("ids", "array", "query"),
+    )),
+    ("cloud-security-assets-queries", "GET", "/cloud-security-assets/queries/resources/v1", "cloud_security_assets", (
+        ("after", "string", "query"),
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+    )),
+)
+
+_correlation_rules_deprecated = (
+    ("aggregates.rule-versions.post.v1", "POST", "/correlation-rules/aggregates/rule-versions/v1", "correlation_rules", (
+        ("ids", "array", "query"),
+        ("body", None, "body"),
+        ("filter", "string", "query"),
+    )),
+    ("combined.rules.get.v1", "GET", "/correlation-rules/combined/rules/v1", "correlation_rules", (
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("sort", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("combined.rules.get.v2", "GET", "/correlation-rules/combined/rules/v2", "correlation_rules", (
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("sort", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("entities.latest-rules.get.v1", "GET", "/correlation-rules/entities/latest-rules/v1", "correlation_rules", (
+        ("rule_ids", "array", "query"),
+    )),
+    ("entities.rule-versions_export.post.v1", "POST",
+     "/correlation-rules/entities/rule-versions/export/v1", "correlation_rules", (
+         ("body", None, "body"),
+     )),
+    ("entities.rule-versions_import.post.v1", "POST",
+     "/correlation-rules/entities/rule-versions/import/v1", "correlation_rules", (
+     )),
+    ("entities.rule-versions_publish.patch.v1", "PATCH",
+     "/correlation-rules/entities/rule-versions/publish/v1", "correlation_rules", (
+         ("body", None, "body"),
+     )),
+    ("entities.rule-versions.delete.v1", "DELETE", "/correlation-rules/entities/rule-versions/v1", "correlation_rules", (
+        ("ids", "array", "query"),
+    )),
+    ("entities.rules.get.v1", "GET", "/correlation-rules/entities/rules/v1", "correlation_rules", (
+        ("ids", "array", "query"),
+    )),
+    ("entities.rules.post.v1", "POST", "/correlation-rules/entities/rules/v1", "correlation_rules", (
+        ("body", None, "body"),
+    )),
+    ("entities.rules.patch.v1", "PATCH", "/correlation-rules/entities/rules/v1", "correlation_rules", (
+        ("body", None, "body"),
+    )),
+    ("entities.rules.delete.v1", "DELETE", "/correlation-rules/entities/rules/v1", "correlation_rules", (
+        ("ids", "array", "query"),
+    )),
+    ("entities.rules.get.v2", "GET", "/correlation-rules/entities/rules/v2", "correlation_rules", (
+        ("ids", "array", "query"),
+    )),
+    ("queries.rules.get.v1", "GET", "/correlation-rules/queries/rules/v1", "correlation_rules", (
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("sort", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("queries.rules.get.v2", "GET", "/correlation-rules/queries/rules/v2", "correlation_rules", (
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("sort", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+    )),
+)
+
+_certificate_based_exclusions_deprecated = (
+    ("cb-exclusions.get.v1", "GET", "/exclusions/entities/cert-based-exclusions/v1", "certificate_based_exclusions", (
+        ("ids", "array", "query"),
+    )),
+    ("cb-exclusions.create.v1", "POST", "/exclusions/entities/cert-based-exclusions/v1", "certificate_based_exclusions", (
+        ("body", None, "body"),
+    )),
+    ("cb-exclusions.update.v1", "PATCH", "/exclusions/entities/cert-based-exclusions/v1", "certificate_based_exclusions", (
+        ("body", None, "body"),
+    )),
+    ("cb-exclusions.delete.v1", "DELETE", "/exclusions/entities/cert-based-exclusions/v1", "certificate_based_exclusions", (
+        ("ids", "array", "query"),
+        ("comment", "string", "query"),
+    )),
+    ("certificates.get.v1", "GET", "/exclusions/entities/certificates/v1", "certificate_based_exclusions", (
+        ("ids", "string", "query"),
+    )),
+    ("cb-exclusions.query.v1", "GET", "/exclusions/queries/cert-based-exclusions/v1", "certificate_based_exclusions", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_custom_ioa_deprecated = (
+    ("get-patterns", "GET", "/ioarules/entities/pattern-severities/v1", "custom_ioa", (
+        ("ids", "array", "query"),
+    )),
+    ("get-platformsMixin0", "GET", "/ioarules/entities/platforms/v1", "custom_ioa", (
+        ("ids", "array", "query"),
+    )),
+    ("get-rule-groupsMixin0", "GET", "/ioarules/entities/rule-groups/v1", "custom_ioa", (
+        ("ids", "array", "query"),
+    )),
+    ("create-rule-groupMixin0", "POST", "/ioarules/entities/rule-groups/v1", "custom_ioa", (
+        ("body", None, "body"),
+    )),
+    ("update-rule-groupMixin0", "PATCH", "/ioarules/entities/rule-groups/v1", "custom_ioa", (
+        ("body", None, "body"),
+    )),
+    ("delete-rule-groupsMixin0", "DELETE", "/ioarules/entities/rule-groups/v1", "custom_ioa", (
+        ("comment", "string", "query"),
+        ("ids", "array", "query"),
+    )),
+    ("get-rule-types", "GET", "/ioarules/entities/rule-types/v1", "custom_ioa", (
+        ("ids", "array", "query"),
+    )),
+    ("get-rules-get", "POST", "/ioarules/entities/rules/GET/v1", "custom_ioa", (
+        ("body", None, "body"),
+    )),
+    ("get-rulesMixin0", "GET", "/ioarules/entities/rules/v1", "custom_ioa", (
+        ("ids", "array", "query"),
+    )),
+    ("create-rule", "POST", "/ioarules/entities/rules/v1", "custom_ioa", (
+        ("body", None, "body"),
+    )),
+    ("update-rules", "PATCH", "/ioarules/entities/rules/v1", "custom_ioa", (
+        ("body", None, "body"),
+    )),
+    ("delete-rules", "DELETE", "/ioarules/entities/rules/v1", "custom_ioa", (
+        ("rule_group_id", "string", "query"),
+        ("comment", "string", "query"),
+        ("ids", "array", "query"),
+    )),
+    ("update-rules-v2", "PATCH", "/ioarules/entities/rules/v2", "custom_ioa", (
+        ("body", None, "body"),
+    )),
+    ("query-patterns", "GET", "/ioarules/queries/pattern-severities/v1", "custom_ioa", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query-platformsMixin0", "GET", "/ioarules/queries/platforms/v1", "custom_ioa", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query-rule-groups-full", "GET", "/ioarules/queries/rule-groups-full/v1", "custom_ioa", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query-rule-groupsMixin0", "GET", "/ioarules/queries/rule-groups/v1", "custom_ioa", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query-rule-types", "GET", "/ioarules/queries/rule-types/v1", "custom_ioa", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query-rulesMixin0", "GET", "/ioarules/queries/rules/v1", "custom_ioa", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+)
+
+_d4c_registration_deprecated = (
+    ("GetCSPMAzureAccount", "GET", "/cloud-connect-azure/entities/account/v1", "d4c_registration", (
+        ("ids", "array", "query"),
+        ("scan-type", "string", "query"),
+    )),
+    ("CreateCSPMAzureAccount", "POST", "/cloud-connect-azure/entities/account/v1", "d4c_registration", (
+        ("body", None, "body"),
+    )),
+    ("UpdateCSPMAzureAccountClientID", "PATCH", "/cloud-connect-azure/entities/client-id/v1", "d4c_registration", (
+        ("id", "string", "query"),
+    )),
+    ("GetCSPMAzureUserScriptsAttachment", "GET",
+     "/cloud-connect-azure/entities/user-scripts-download/v1", "d4c_registration", (
+     )),
+    ("GetCSPMAzureUserScripts", "GET", "/cloud-connect-azure/entities/user-scripts/v1", "d4c_registration", (
+    )),
+    ("GetCSPMCGPAccount", "GET", "/cloud-connect-gcp/entities/account/v1", "d4c_registration", (
+        ("scan-type", "string", "query"),
+        ("ids", "array", "query"),
+    )),
+    ("CreateCSPMGCPAccount", "POST", "/cloud-connect-gcp/entities/account/v1", "d4c_registration", (
+        ("body", None, "body"),
+    )),
+    ("GetCSPMGCPUserScripts", "GET", "/cloud-connect-gcp/entities/user-scripts/v1", "d4c_registration", (
+    )),
+)
+
+_datascanner_deprecated = (
+    ("get-image-registry-credentials", "GET", "/data-security-dspm/entities/image-registry-credentials/v1", "datascanner", (
+    )),
+    ("get-data-scanner-tasks", "GET", "/data-security-dspm/entities/scanner-tasks/v1", "datascanner", (
+        ("X-Scanner-Id", "string", "header"),
+    )),
+    ("update-data-scanner-tasks", "PATCH", "/data-security-dspm/entities/scanner-tasks/v1", "datascanner", (
+        ("X-Scanner-Id", "string", "header"),
+        ("X-Machine-Id", "string", "header"),
+    )),
+)
+
+_device_content_deprecated = (
+    ("entities.states.v1", "GET", "/device-content/entities/states/v1", "device_content", (
+        ("ids", "array", "query"),
+    )),
+    ("queries.states.v1", "GET", "/device-content/queries/states/v1", "device_content", (
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("offset", "integer", "query"),
+        ("filter", "string", "query"),
+    )),
+)
+
+_discover_deprecated = (
+    ("combined-applications", "GET", "/discover/combined/applications/v1", "discover", (
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("facet", "array", "query"),
+    )),
+    ("combined-hosts", "GET", "/discover/combined/hosts/v1", "discover", (
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("facet", "array", "query"),
+    )),
+    ("get-accounts", "GET", "/discover/entities/accounts/v1", "discover", (
+        ("ids", "array", "query"),
+    )),
+    ("get-applications", "GET", "/discover/entities/applications/v1", "discover", (
+        ("ids", "array", "query"),
+    )),
+    ("get-hosts", "GET", "/discover/entities/hosts/v1", "discover", (
+        ("ids", "array", "query"),
+    )),
+    ("get-iot-hosts", "GET", "/discover/entities/iot-hosts/v1", "discover", (
+        ("ids", "array", "query"),
+    )),
+    ("get-logins", "GET", "/discover/entities/logins/v1", "discover", (
+        ("ids", "array", "query"),
+    )),
+    ("query-accounts", "GET", "/discover/queries/accounts/v1", "discover", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("query-applications", "GET", "/discover/queries/applications/v1", "discover", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("query-hosts", "GET", "/discover/queries/hosts/v1", "discover", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("query-iot-hosts", "GET", "/discover/queries/iot-hosts/v1", "discover", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("query-iot-hostsV2", "GET", "/discover/queries/iot-hosts/v2", "discover", (
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("query-logins", "GET", "/discover/queries/logins/v1", "discover", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+)
+
+_fdr_deprecated = (
+    ("fdrschema.combined.event.get", "GET", "/fdr/combined/schema-members/v1", "fdr", (
+    )),
+    ("fdrschema.entities.event.get", "GET", "/fdr/entities/schema-events/v1", "fdr", (
+        ("ids", "array", "query"),
+    )),
+    ("fdrschema.entities.field.get", "GET", "/fdr/entities/schema-fields/v1", "fdr", (
+        ("ids", "array", "query"),
+    )),
+    ("fdrschema.queries.event.get", "GET", "/fdr/queries/schema-events/v1", "fdr", (
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("fdrschema.queries.field.get", "GET", "/fdr/queries/schema-fields/v1", "fdr", (
+        ("limit", "integer", "query"),
+        ("offset", "integer", "query"),
+        ("filter", "string", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_firewall_management_deprecated = (
+    ("aggregate-events", "POST", "/fwmgr/aggregates/events/GET/v1", "firewall_management", (
+        ("body", None, "body"),
+    )),
+    ("aggregate-policy-rules", "POST", "/fwmgr/aggregates/policy-rules/GET/v1", "firewall_management", (
+        ("body", None, "body"),
+    )),
+    ("aggregate-rule-groups", "POST", "/fwmgr/aggregates/rule-groups/GET/v1", "firewall_management", (
+        ("body", None, "body"),
+    )),
+    ("aggregate-rules", "POST", "/fwmgr/aggregates/rules/GET/v1", "firewall_management", (
+        ("body", None, "body"),
+    )),
+    ("get-events", "GET", "/fwmgr/entities/events/v1", "firewall_management", (
+        ("ids", "array", "query"),
+    )),
+    ("get-firewall-fields", "GET", "/fwmgr/entities/firewall-fields/v1", "firewall_management", (
+        ("ids", "array", "query"),
+    )),
+    ("get-network-locations-details", "GET", "/fwmgr/entities/network-locations-details/v1", "firewall_management", (
+        ("ids", "array", "query"),
+    )),
+    ("update-network-locations-metadata", "POST", "/fwmgr/entities/network-locations-metadata/v1", "firewall_management", (
+        ("comment", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("update-network-locations-precedence", "POST", "/fwmgr/entities/network-locations-precedence/v1", "firewall_management", (
+        ("comment", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("get-network-locations", "GET", "/fwmgr/entities/network-locations/v1", "firewall_management", (
+        ("ids", "array", "query"),
+    )),
+    ("upsert-network-locations", "PUT", "/fwmgr/entities/network-locations/v1", "firewall_management", (
+        ("comment", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("create-network-locations", "POST", "/fwmgr/entities/network-locations/v1", "firewall_management", (
+        ("clone_id", "string", "query"),
+        ("add_fw_rules", "boolean", "query"),
+        ("comment", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("update-network-locations", "PATCH", "/fwmgr/entities/network-locations/v1", "firewall_management", (
+        ("comment", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("delete-network-locations", "DELETE", "/fwmgr/entities/network-locations/v1", "firewall_management", (
+        ("ids", "array", "query"),
+    )),
+    ("get-platforms", "GET", "/fwmgr/entities/platforms/v1", "firewall_management", (
+        ("ids", "array", "query"),
+    )),
+    ("get-policy-containers", "GET", "/fwmgr/entities/policies/v1", "firewall_management", (
+        ("ids", "array", "query"),
+    )),
+    ("update-policy-container-v1", "PUT", "/fwmgr/entities/policies/v1", "firewall_management", (
+        ("body", None, "body"),
+    )),
+    ("update-policy-container", "PUT", "/fwmgr/entities/policies/v2", "firewall_management", (
+        ("body", None, "body"),
+    )),
+    ("get-rule-groups", "GET", "/fwmgr/entities/rule-groups/v1", "firewall_management", (
+        ("ids", "array", "query"),
+    )),
+    ("create-rule-group", "POST", "/fwmgr/entities/rule-groups/v1", "firewall_management", (
+        ("clone_id", "string", "query"),
+        ("library", "string", "query"),
+        ("comment", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("update-rule-group", "PATCH", "/fwmgr/entities/rule-groups/v1", "firewall_management", (
+        ("comment", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("delete-rule-groups", "DELETE", "/fwmgr/entities/rule-groups/v1", "firewall_management", (
+        ("ids", "array", "query"),
+        ("comment", "string", "query"),
+    )),
+    ("create-rule-group-validation", "POST", "/fwmgr/entities/rule-groups/validation/v1", "firewall_management", (
+        ("clone_id", "string", "query"),
+        ("library", "string", "query"),
+        ("comment", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("update-rule-group-validation", "PATCH", "/fwmgr/entities/rule-groups/validation/v1", "firewall_management", (
+        ("comment", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("get-rules", "GET", "/fwmgr/entities/rules/v1", "firewall_management", (
+        ("ids", "array", "query"),
+    )),
+    ("validate-filepath-pattern", "POST", "/fwmgr/entities/rules/validate-filepath/v1", "firewall_management", (
+        ("body", None, "body"),
+    )),
+    ("query-events", "GET", "/fwmgr/queries/events/v1", "firewall_management", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query-firewall-fields", "GET", "/fwmgr/queries/firewall-fields/v1", "firewall_management", (
+        ("platform_id", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query-network-locations", "GET", "/fwmgr/queries/network-locations/v1", "firewall_management", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query-platforms", "GET", "/fwmgr/queries/platforms/v1", "firewall_management", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query-policy-rules", "GET", "/fwmgr/queries/policy-rules/v1", "firewall_management", (
+        ("id", "string", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query-rule-groups", "GET", "/fwmgr/queries/rule-groups/v1", "firewall_management", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("query-rules", "GET", "/fwmgr/queries/rules/v1", "firewall_management", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("after", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+)
+
+_hosts_deprecated = (
+    ("entities.perform_action", "POST", "/devices/entities/group-actions/v1", "hosts", (
+        ("ids", "array", "query"),
+        ("action_name", "string", "query"),
+        ("disable_hostname_check", "boolean", "query"),
+        ("body", None, "body"),
+    )),
+    ("GetOnlineState.V1", "GET", "/devices/entities/online-state/v1", "hosts", (
+        ("ids", "array", "query"),
+    )),
+)
+
+_identity_protection_deprecated = (
+    ("api.preempt.proxy.post.graphql", "POST", "/identity-protection/combined/graphql/v1", "identity_protection", (
+        ("Authorization", "string", "header"),
+    )),
+    ("api.preempt.proxy.get.policy-rules", "GET", "/identity-protection/entities/policy-rules/v1", "identity_protection", (
+        ("Authorization", "string", "header"),
+        ("ids", "array", "query"),
+    )),
+    ("api.preempt.proxy.post.policy-rules", "POST", "/identity-protection/entities/policy-rules/v1", "identity_protection", (
+        ("Authorization", "string", "header"),
+        ("body", None, "body"),
+    )),
+    ("api.preempt.proxy.delete.policy-rules", "DELETE",
+     "/identity-protection/entities/policy-rules/v1", "identity_protection", (
+         ("Authorization", "string", "header"),
+         ("ids", "array", "query"),
+     )),
+    ("api.preempt.proxy.get.policy-rules.query", "GET",
+     "/identity-protection/queries/policy-rules/v1", "identity_protection", (
+         ("Authorization", "string", "header"),
+         ("enabled", "boolean", "query"),
+         ("simulation_mode", "boolean", "query"),
+         ("name", "string", "query"),
+     )),
+    ("api_preempt_proxy_post_graphql", "POST", "/identity-protection/combined/graphql/v1", "identity_protection", (
+        ("Authorization", "string", "header"),
+    )),
+    ("api_preempt_proxy_get_policy_rules", "GET", "/identity-protection/entities/policy-rules/v1", "identity_protection", (
+        ("Authorization", "string", "header"),
+        ("ids", "array", "query"),
+    )),
+    ("api_preempt_proxy_post_policy_rules", "POST", "/identity-protection/entities/policy-rules/v1", "identity_protection", (
+        ("Authorization", "string", "header"),
+        ("body", None, "body"),
+    )),
+    ("api_preempt_proxy_delete_policy_rules", "DELETE",
+     "/identity-protection/entities/policy-rules/v1", "identity_protection", (
+         ("Authorization", "string", "header"),
+         ("ids", "array", "query"),
+     )),
+    ("api_preempt_proxy_get_policy_rules_query", "GET",
+     "/identity-protection/queries/policy-rules/v1", "identity_protection", (
+         ("Authorization", "string", "header"),
+         ("enabled", "boolean", "query"),
+         ("simulation_mode", "boolean", "query"),
+         ("name", "string", "query"),
+     )),
+)
+
+_installation_tokens_deprecated = (
+    ("audit-events-read", "GET", "/installation-tokens/entities/audit-events/v1", "installation_tokens", (
+        ("ids", "array", "query"),
+    )),
+    ("customer-settings-read", "GET", "/installation-tokens/entities/customer-settings/v1", "installation_tokens", (
+    )),
+    ("customer-settings-update", "PATCH", "/installation-tokens/entities/customer-settings/v1", "installation_tokens", (
+        ("body", None, "body"),
+    )),
+    ("tokens-read", "GET", "/installation-tokens/entities/tokens/v1", "installation_tokens", (
+        ("ids", "array", "query"),
+    )),
+    ("tokens-create", "POST", "/installation-tokens/entities/tokens/v1", "installation_tokens", (
+        ("body", None, "body"),
+    )),
+    ("tokens-update", "PATCH", "/installation-tokens/entities/tokens/v1", "installation_tokens", (
+        ("ids", "array", "query"),
+        ("body", None, "body"),
+    )),
+    ("tokens-delete", "DELETE", "/installation-tokens/entities/tokens/v1", "installation_tokens", (
+        ("ids", "array", "query"),
+    )),
+    ("audit-events-query", "GET", "/installation-tokens/queries/audit-events/v1", "installation_tokens", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("tokens-query", "GET", "/installation-tokens/queries/tokens/v1", "installation_tokens", (
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+)
+
+_ioc_deprecated = (
+    ("indicator.get.device_count.v1", "GET", "/iocs/aggregates/indicators/device-count/v1", "ioc", (
+        ("type", "string", "query"),
+        ("value", "string", "query"),
+    )),
+    ("indicator.aggregate.v1", "POST", "/iocs/aggregates/indicators/v1", "ioc", (
+        ("filter", "string", "query"),
+        ("from_parent", "boolean", "query"),
+        ("body", None, "body"),
+    )),
+    ("indicator.combined.v1", "GET", "/iocs/combined/indicator/v1", "ioc", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("after", "string", "query"),
+        ("from_parent", "boolean", "query"),
+    )),
+    ("action.get.v1", "GET", "/iocs/entities/actions/v1", "ioc", (
+        ("ids", "array", "query"),
+    )),
+    ("indicator.get.v1", "GET", "/iocs/entities/indicators/v1", "ioc", (
+        ("ids", "array", "query"),
+    )),
+    ("indicator.create.v1", "POST", "/iocs/entities/indicators/v1", "ioc", (
+        ("retrodetects", "boolean", "query"),
+        ("ignore_warnings", "boolean", "query"),
+        ("body", None, "body"),
+    )),
+    ("indicator.update.v1", "PATCH", "/iocs/entities/indicators/v1", "ioc", (
+        ("retrodetects", "boolean", "query"),
+        ("ignore_warnings", "boolean", "query"),
+        ("body", None, "body"),
+    )),
+    ("indicator.delete.v1", "DELETE", "/iocs/entities/indicators/v1", "ioc", (
+        ("filter", "string", "query"),
+        ("ids", "array", "query"),
+        ("comment", "string", "query"),
+        ("from_parent", "boolean", "query"),
+    )),
+    ("action.query.v1", "GET", "/iocs/queries/actions/v1", "ioc", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("indicator.get.devices_ran_on.v1", "GET", "/iocs/queries/indicators/devices/v1", "ioc", (
+        ("type", "string", "query"),
+        ("value", "string", "query"),
+        ("limit", "string", "query"),
+        ("offset", "string", "query"),
+    )),
+    ("indicator.get.processes_ran_on.v1", "GET", "/iocs/queries/indicators/processes/v1", "ioc", (
+        ("type", "string", "query"),
+        ("value", "string", "query"),
+        ("device_id", "string", "query"),
+        ("limit", "string", "query"),
+        ("offset", "string", "query"),
+    )),
+    ("indicator.search.v1", "GET", "/iocs/queries/indicators/v1", "ioc", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("after", "string", "query"),
+        ("from_parent", "boolean", "query"),
+    )),
+    ("ioc_type.query.v1", "GET", "/iocs/queries/ioc-types/v1", "ioc", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("platform.query.v1", "GET", "/iocs/queries/platforms/v1", "ioc", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+    ("severity.query.v1", "GET", "/iocs/queries/severities/v1", "ioc", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+)
+
+_iocs_deprecated = (
+    ("entities.processes", "GET", "/processes/entities/processes/v1", "iocs", (
+        ("ids", "array", "query"),
+    )),
+)
+
+_ods_deprecated = (
+    ("aggregate-query-scan-host-metadata", "POST", "/ods/aggregates/scan-hosts/v1", "ods", (
+        ("body", None, "body"),
+    )),
+    ("aggregate-scans", "POST", "/ods/aggregates/scans/v1", "ods", (
+        ("body", None, "body"),
+    )),
+    ("aggregate-scheduled-scans", "POST", "/ods/aggregates/scheduled-scans/v1", "ods", (
+        ("body", None, "body"),
+    )),
+    ("get-malicious-files-by-ids", "GET", "/ods/entities/malicious-files/v1", "ods", (
+        ("ids", "array", "query"),
+    )),
+    ("cancel-scans", "POST", "/ods/entities/scan-control-actions/cancel/v1", "ods", (
+        ("body", None, "body"),
+    )),
+    ("get-scan-host-metadata-by-ids", "GET", "/ods/entities/scan-hosts/v1", "ods", (
+        ("ids", "array", "query"),
+    )),
+    ("scans-report", "POST", "/ods/entities/scans-reports/v1", "ods", (
+        ("body", None, "body"),
+    )),
+    ("get-scans-by-scan-ids", "GET", "/ods/entities/scans/v1", "ods", (
+        ("ids", "array", "query"),
+    )),
+    ("create-scan", "POST", "/ods/entities/scans/v1", "ods", (
+        ("body", None, "body"),
+    )),
+    ("get-scans-by-scan-ids-v2", "GET", "/ods/entities/scans/v2", "ods", (
+        ("ids", "array", "query"),
+    )),
+    ("get-scheduled-scans-by-scan-ids", "GET", "/ods/entities/scheduled-scans/v1", "ods", (
+        ("ids", "array", "query"),
+    )),
+    ("schedule-scan", "POST", "/ods/entities/scheduled-scans/v1", "ods", (
+        ("body", None, "body"),
+    )),
+    ("delete-scheduled-scans", "DELETE", "/ods/entities/scheduled-scans/v1", "ods", (
+        ("ids", "array", "query"),
+        ("filter", "string", "query"),
+    )),
+    ("query-malicious-files", "GET", "/ods/queries/malicious-files/v1", "ods", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("query-scan-host-metadata", "GET", "/ods/queries/scan-hosts/v1", "ods", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("query-scans", "GET", "/ods/queries/scans/v1", "ods", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("query-scheduled-scans", "GET", "/ods/queries/scheduled-scans/v1", "ods", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_real_time_response_deprecated = (
+    ("RTR-AggregateSessions", "POST", "/real-time-response/aggregates/sessions/GET/v1", "real_time_response", (
+        ("body", None, "body"),
+    )),
+    ("RTR-CheckActiveResponderCommandStatus", "GET",
+     "/real-time-response/entities/active-responder-command/v1", "real_time_response", (
+         ("cloud_request_id", "string", "query"),
+         ("sequence_id", "integer", "query"),
+     )),
+    ("RTR-ExecuteActiveResponderCommand", "POST",
+     "/real-time-response/entities/active-responder-command/v1", "real_time_response", (
+         ("body", None, "body"),
+     )),
+    ("RTR-CheckCommandStatus", "GET", "/real-time-response/entities/command/v1", "real_time_response", (
+        ("cloud_request_id", "string", "query"),
+        ("sequence_id", "integer", "query"),
+    )),
+    ("RTR-ExecuteCommand", "POST", "/real-time-response/entities/command/v1", "real_time_response", (
+        ("body", None, "body"),
+    )),
+    ("RTR-GetExtractedFileContents", "GET", "/real-time-response/entities/extracted-file-contents/v1", "real_time_response", (
+        ("session_id", "string", "query"),
+        ("sha256", "string", "query"),
+        ("filename", "string", "query"),
+    )),
+    ("RTR-ListFiles", "GET", "/real-time-response/entities/file/v1", "real_time_response", (
+        ("session_id", "string", "query"),
+    )),
+    ("RTR-DeleteFile", "DELETE", "/real-time-response/entities/file/v1", "real_time_response", (
+        ("ids", "string", "query"),
+        ("session_id", "string", "query"),
+    )),
+    ("RTR-ListFilesV2", "GET", "/real-time-response/entities/file/v2", "real_time_response", (
+        ("session_id", "string", "query"),
+    )),
+    ("RTR-DeleteFileV2", "DELETE", "/real-time-response/entities/file/v2", "real_time_response", (
+        ("ids", "string", "query"),
+        ("session_id", "string", "query"),
+    )),
+    ("RTR-ListQueuedSessions", "POST", "/real-time-response/entities/queued-sessions/GET/v1", "real_time_response", (
+        ("body", None, "body"),
+    )),
+    ("RTR-DeleteQueuedSession", "DELETE", "/real-time-response/entities/queued-sessions/command/v1", "real_time_response", (
+        ("session_id", "string", "query"),
+        ("cloud_request_id", "string", "query"),
+    )),
+    ("RTR-PulseSession", "POST", "/real-time-response/entities/refresh-session/v1", "real_time_response", (
+        ("body", None, "body"),
+    )),
+    ("RTR-ListSessions", "POST", "/real-time-response/entities/sessions/GET/v1", "real_time_response", (
+        ("body", None, "body"),
+    )),
+    ("RTR-InitSession", "POST", "/real-time-response/entities/sessions/v1", "real_time_response", (
+        ("timeout", "integer", "query"),
+        ("timeout_duration", "string", "query"),
+        ("body", None, "body"),
+    )),
+    ("RTR-DeleteSession", "DELETE", "/real-time-response/entities/sessions/v1", "real_time_response", (
+        ("session_id", "string", "query"),
+    )),
+    ("RTR-ListAllSessions", "GET", "/real-time-response/queries/sessions/v1", "real_time_response", (
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+    )),
+)
+
+_real_time_response_admin_deprecated = (
+    ("RTR-CheckAdminCommandStatus", "GET", "/real-time-response/entities/admin-command/v1", "real_time_response_admin", (
+        ("cloud_request_id", "string", "query"),
+        ("sequence_id", "integer", "query"),
+    )),
+    ("RTR-ExecuteAdminCommand", "POST", "/real-time-response/entities/admin-command/v1", "real_time_response_admin", (
+        ("body", None, "body"),
+    )),
+    ("RTR-GetFalconScripts", "GET", "/real-time-response/entities/falcon-scripts/v1", "real_time_response_admin", (
+        ("ids", "array", "query"),
+    )),
+    ("RTR-GetPut-Files", "GET", "/real-time-response/entities/put-files/v1", "real_time_response_admin", (
+        ("ids", "array", "query"),
+    )),
+    ("RTR-CreatePut-Files", "POST", "/real-time-response/entities/put-files/v1", "real_time_response_admin", (
+        ("file", "file", "formData"),
+        ("description", "string", "formData"),
+        ("name", "string", "formData"),
+        ("comments_for_audit_log", "string", "formData"),
+    )),
+    ("RTR-DeletePut-Files", "DELETE", "/real-time-response/entities/put-files/v1", "real_time_response_admin", (
+        ("ids", "string", "query"),
+    )),
+    ("RTR-GetPut-FilesV2", "GET", "/real-time-response/entities/put-files/v2", "real_time_response_admin", (
+        ("ids", "array", "query"),
+    )),
+    ("RTR-GetScripts", "GET", "/real-time-response/entities/scripts/v1", "real_time_response_admin", (
+        ("ids", "array", "query"),
+    )),
+    ("RTR-CreateScripts", "POST", "/real-time-response/entities/scripts/v1", "real_time_response_admin", (
+        ("file", "file", "formData"),
+        ("description", "string", "formData"),
+        ("name", "string", "formData"),
+        ("comments_for_audit_log", "string", "formData"),
+        ("permission_type", "string", "formData"),
+        ("content", "string", "formData"),
+        ("platform", "array", "formData"),
+    )),
+    ("RTR-UpdateScripts", "PATCH", "/real-time-response/entities/scripts/v1", "real_time_response_admin", (
+        ("id", "string", "formData"),
+        ("file", "file", "formData"),
+        ("description", "string", "formData"),
+        ("name", "string", "formData"),
+        ("comments_for_audit_log", "string", "formData"),
+        ("permission_type", "string", "formData"),
+        ("content", "string", "formData"),
+        ("platform", "array", "formData"),
+    )),
+    ("RTR-DeleteScripts", "DELETE", "/real-time-response/entities/scripts/v1", "real_time_response_admin", (
+        ("ids", "string", "query"),
+    )),
+    ("RTR-GetScriptsV2", "GET", "/real-time-response/entities/scripts/v2", "real_time_response_admin", (
+        ("ids", "array", "query"),
+    )),
+    ("RTR-ListFalconScripts", "GET", "/real-time-response/queries/falcon-scripts/v1", "real_time_response_admin", (
+        ("filter", "string", "query"),
+        ("offset", "integer", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("RTR-ListPut-Files", "GET", "/real-time-response/queries/put-files/v1", "real_time_response_admin", (
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+    ("RTR-ListScripts", "GET", "/real-time-response/queries/scripts/v1", "real_time_response_admin", (
+        ("filter", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+        ("sort", "string", "query"),
+    )),
+)
+
+_report_executions_deprecated = (
+    ("report-executions-download.get", "GET", "/reports/entities/report-executions-download/v1", "report_executions", (
+        ("ids", "string", "query"),
+    )),
+    ("report-executions.retry", "POST", "/reports/entities/report-executions-retry/v1", "report_executions", (
+        ("body", None, "body"),
+    )),
+    ("report-executions.get", "GET", "/reports/entities/report-executions/v1", "report_executions", (
+        ("ids", "array", "query"),
+    )),
+    ("report-executions.query", "GET", "/reports/queries/report-executions/v1", "report_executions", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+)
+
+_scheduled_reports_deprecated = (
+    ("scheduled-reports.launch", "POST", "/reports/entities/scheduled-reports/execution/v1", "scheduled_reports", (
+        ("body", None, "body"),
+    )),
+    ("scheduled-reports.get", "GET", "/reports/entities/scheduled-reports/v1", "scheduled_reports", (
+        ("ids", "array", "query"),
+    )),
+    ("scheduled-reports.query", "GET", "/reports/queries/scheduled-reports/v1", "scheduled_reports", (
+        ("sort", "string", "query"),
+        ("filter", "string", "query"),
+        ("q", "string", "query"),
+        ("offset", "string", "query"),
+        ("limit", "integer", "query"),
+    )),
+)
+
+_zero_trust_assessment_deprecated = (
+    ("getComplianceV1", "GET", "/zero-trust-assessment/entities/audit/v1", "zero_trust_assessment", (
+    )),
+)
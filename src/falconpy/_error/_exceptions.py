@@ -180,3 +180,24 @@ class InvalidCredentialFormat(SDKError):
     """Credentials dictionary was provided as a datatype that will not convert to a dictionary."""
 
     _message = "Invalid credential format. This keyword must be provided as a dictionary."
+
+
+class DependencyNotInstalled(SDKError):
+    """An optional dependency required by the requested functionality is not installed."""
+
+    _message = "An optional dependency required for this functionality is not installed."
+    _code = 501
+
+
+class DownloadVerificationError(SDKError):
+    """The downloaded content does not match the expected SHA256."""
+
+    _message = "The downloaded file does not match the expected SHA256. The file has been removed."
+    _code = 502
+
+
+class DownloadIncompleteError(SDKError):
+    """The download could not be completed within the permitted number of resumed requests."""
+
+    _message = "The download could not be completed. Every resumed request was rejected or returned unexpected content."
+    _code = 502
@@ -0,0 +1,113 @@
+"""Event stream offset checkpoints.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import os
+from json import dump, load
+from threading import Lock
+from typing import Dict, Optional, Union
+
+
+class OffsetCheckpoint:
+    """This class represents the last consumed offset of each event stream partition.
+
+    Offsets are held in memory as events are consumed and written to a local JSON file
+    when saved, allowing a restarted consumer to resume each partition where it ended.
+    The file is replaced atomically so an interrupted save never leaves a partial file.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, path: Optional[Union[str, os.PathLike]] = None):
+        """Construct an instance of the OffsetCheckpoint class, loading any previously saved offsets.
+
+        Offsets are only held in memory when a path is not provided.
+        """
+        self._lock: Lock = Lock()
+        self._path: Optional[str] = os.fspath(path) if path else None
+        self._offsets: Dict[str, int] = {}
+        self._changed: bool = False
+        if self._path and os.path.exists(self._path):
+            with open(self._path, "r", encoding="utf-8") as checkpoint_file:
+                self._offsets = {str(key): int(value) for key, value in load(checkpoint_file).items()}
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def get(self, partition: Union[int, str]) -> Optional[int]:
+        """Return the last consumed offset for the partition."""
+        return self._offsets.get(str(partition), None)
+
+    def update(self, partition: Union[int, str], offset: int):
+        """Record the offset of a consumed event."""
+        with self._lock:
+            if offset > self._offsets.get(str(partition), -1):
+                self._offsets[str(partition)] = offset
+                self._changed = True
+
+    def save(self) -> bool:
+        """Write the offsets to the checkpoint file if they have changed since the last save.
+
+        Returns a boolean indicating if the file was written.
+        """
+        returned = False
+        with self._lock:
+            if self._path and self._changed:
+                temporary = f"{self._path}.tmp"
+                with open(temporary, "w", encoding="utf-8") as checkpoint_file:
+                    dump(self._offsets, checkpoint_file)
+                os.replace(temporary, self._path)
+                self._changed = False
+                returned = True
+
+        return returned
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def path(self) -> Optional[str]:
+        """Return the path of the checkpoint file."""
+        return self._path
+
+    @property
+    def offsets(self) -> Dict[str, int]:
+        """Return a copy of the last consumed offset for each partition."""
+        return {**self._offsets}
@@ -0,0 +1,370 @@
+"""Managed Event Streams consumer.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
+from urllib.parse import parse_qs, urlparse
+from requests import Response, Session
+from requests.exceptions import RequestException
+from ._offset_checkpoint import OffsetCheckpoint
+from .._constant import MAX_STREAM_RECONNECT_DELAY, STREAM_REFRESH_INTERVAL, STREAM_REFRESH_MARGIN
+from .._error import APIError
+from .._helper import random_string
+from .._util import JSONCodec
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..event_streams import EventStreams
+
+
+class StreamConsumer:  # pylint: disable=R0902
+    """This class represents a managed consumer of every available Event Streams partition.
+
+    Each partition is read on its own thread and connection, and events are placed on a
+    bounded queue. When the queue is full readers stop reading from their connection until
+    space is available, so events are never dropped under load. Active sessions are refreshed
+    in the background before they expire, and dropped connections are reopened from the
+    offset following the last event received.
+
+    Consumed offsets are checkpointed to a local file so a restarted consumer resumes each
+    partition where it ended. Events returned by get are considered consumed immediately,
+    while events returned by iteration are considered consumed once the next event is requested.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 service: Optional["EventStreams"] = None,
+                 app_id: Optional[str] = None,
+                 checkpoint: Optional[Union[str, OffsetCheckpoint]] = None,
+                 max_queue: int = 1000,
+                 event_format: str = "json",
+                 checkpoint_interval: float = 5.0,
+                 read_timeout: float = 60.0,
+                 **kwargs
+                 ):
+        """Construct an instance of the StreamConsumer class.
+
+        Keyword arguments
+        ----
+        service : EventStreams
+            Event Streams Service Class used to discover and refresh streams. When not provided,
+            one is created using any remaining keywords (client_id, client_secret, etc.).
+        app_id : str
+            Label that identifies this connection. 32 character alphanumeric. Defaults to a random value.
+        checkpoint : str or OffsetCheckpoint
+            Path to the offset checkpoint file. Offsets are only held in memory when not provided.
+        max_queue : int
+            Maximum number of received events waiting to be consumed. Defaults to 1000.
+        event_format : str
+            Format for streamed events. Either 'json' or 'flatjson'. Defaults to 'json'.
+        checkpoint_interval : float
+            Number of seconds between checkpoint file writes. Defaults to 5.
+        read_timeout : float
+            Number of seconds an idle connection is kept open before it is reopened. Defaults to 60.
+        """
+        if service is None:
+            from ..event_streams import EventStreams  # pylint: disable=C0415
+            service = EventStreams(**kwargs)
+        self._service = service
+        self._app_id: str = app_id or random_string(32)
+        self._checkpoint = checkpoint if isinstance(checkpoint, OffsetCheckpoint) else OffsetCheckpoint(checkpoint)
+        self._queue: "Queue[Tuple[str, Optional[int], Dict[str, Any]]]" = Queue(maxsize=max(int(max_queue), 1))
+        self._format: str = event_format
+        self._checkpoint_interval: float = checkpoint_interval
+        self._read_timeout: float = read_timeout
+        self._codec = JSONCodec.create(service.json_codec)
+        self._stopped: Event = Event()
+        self._stopped.set()
+        self._lock: Lock = Lock()
+        self._threads: List[Thread] = []
+        self._responses: Dict[str, Response] = {}
+        self._positions: Dict[str, Optional[int]] = {}
+        self._refresh_due: Dict[str, float] = {}
+        self._saved: float = monotonic()
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def start(self) -> "StreamConsumer":
+        """Discover the available streams and begin reading every partition.
+
+        Raises APIError when the available streams can not be retrieved.
+        """
+        if self.running:
+            return self
+        streams = self._discover()
+        self._stopped.clear()
+        self._threads = []
+        for partition, stream in streams.items():
+            self._positions[partition] = self._checkpoint.get(partition)
+            self._schedule_refresh(partition, stream)
+            self._threads.append(Thread(target=self._read_partition, args=(partition, stream),
+                                        name=f"falconpy-stream-{partition}", daemon=True
+                                        ))
+        self._threads.append(Thread(target=self._maintain, name="falconpy-stream-refresh", daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+        return self
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        """Stop reading, close every stream connection and save the consumed offsets.
+
+        Events still waiting in the queue are discarded and received again once the consumer restarts.
+        """
+        self._stopped.set()
+        with self._lock:
+            for response in self._responses.values():
+                response.close()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._checkpoint.save()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Return the next event, waiting up to timeout seconds for one to arrive.
+
+        The event is considered consumed when it is returned. Returns None when no event is available.
+        """
+        returned = None
+        item = self._next(timeout)
+        if item:
+            self._commit(item)
+            returned = item[2]
+
+        return returned
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Yield events as they arrive until the consumer is stopped."""
+        while not self._stopped.is_set():
+            item = self._next(0.5)
+            if item:
+                yield item[2]
+                self._commit(item)
+
+    def __enter__(self) -> "StreamConsumer":
+        """Start the consumer when entered as a context manager."""
+        return self.start()
+
+    def __exit__(self, *args):
+        """Stop the consumer when we exit the context."""
+        self.stop()
+
+    def _next(self, timeout: Optional[float]) -> Optional[Tuple[str, Optional[int], Dict[str, Any]]]:
+        """Retrieve the next queued event."""
+        try:
+            returned = self._queue.get(timeout=timeout)
+        except Empty:
+            returned = None
+
+        return returned
+
+    def _commit(self, item: Tuple[str, Optional[int], Dict[str, Any]]):
+        """Record the offset of a consumed event, saving the checkpoint when it is due."""
+        partition, offset, _ = item
+        if offset is not None:
+            self._checkpoint.update(partition, offset)
+        if monotonic() - self._saved >= self._checkpoint_interval:
+            self._save()
+
+    def _save(self):
+        """Write the checkpoint file."""
+        self._saved = monotonic()
+        try:
+            self._checkpoint.save()
+        except OSError as failed:
+            self._warn(f"Unable to save the event stream checkpoint: {failed}")
+
+    def _discover(self) -> Dict[str, Dict[str, Any]]:
+        """Retrieve the available streams, keyed by partition."""
+        result = self._service.list_available_streams(app_id=self._app_id, format=self._format, pythonic=False)
+        if result["status_code"] != 200:
+            errors = result["body"].get("errors") or [{}]
+            raise APIError(code=result["status_code"],
+                           message=errors[0].get("message", "Unable to retrieve the available event streams."),
+                           headers=result["headers"]
+                           )
+        returned = {}
+        for stream in result["body"].get("resources") or []:
+            query = parse_qs(urlparse(stream["dataFeedURL"]).query)
+            returned[query.get("partition", [str(len(returned))])[0]] = stream
+
+        return returned
+
+    def _schedule_refresh(self, partition: str, stream: Dict[str, Any]):
+        """Schedule the next refresh of the active session for the partition."""
+        interval = int(stream.get("refreshActiveSessionInterval") or STREAM_REFRESH_INTERVAL)
+        with self._lock:
+            self._refresh_due[partition] = monotonic() + max(interval - STREAM_REFRESH_MARGIN, interval / 2)
+
+    def _maintain(self):
+        """Refresh active sessions before they expire and periodically save the checkpoint."""
+        while not self._stopped.wait(self._maintenance_delay()):
+            for partition, due in list(self._refresh_due.items()):
+                if due <= monotonic():
+                    result = self._service.refresh_active_stream(partition=int(partition),
+                                                                 app_id=self._app_id,
+                                                                 pythonic=False
+                                                                 )
+                    if result["status_code"] == 200:
+                        self._schedule_refresh(partition, {})
+                    else:
+                        self._warn(f"Unable to refresh event stream partition {partition} "
+                                   f"({result['status_code']}), retrying.")
+                        with self._lock:
+                            self._refresh_due[partition] = monotonic() + MAX_STREAM_RECONNECT_DELAY
+            if monotonic() - self._saved >= self._checkpoint_interval:
+                self._save()
+
+    def _maintenance_delay(self) -> float:
+        """Return the number of seconds until the next refresh or checkpoint is due."""
+        due = [self._saved + self._checkpoint_interval, *self._refresh_due.values()]
+
+        return max(min(due) - monotonic(), 0.1)
+
+    def _read_partition(self, partition: str, stream: Optional[Dict[str, Any]]):
+        """Read the partition until the consumer is stopped, reconnecting when the stream ends."""
+        delay = 1
+        with Session() as session:
+            while not self._stopped.is_set():
+                try:
+                    if not stream:
+                        stream = self._discover().get(partition)
+                        self._schedule_refresh(partition, stream or {})
+                    if stream:
+                        self._consume(session, partition, stream)
+                        delay = 1
+                except (APIError, RequestException, ValueError) as failed:
+                    if not self._stopped.is_set():
+                        self._warn(f"Event stream partition {partition} interrupted: {failed}")
+                    delay = min(delay * 2, MAX_STREAM_RECONNECT_DELAY)
+                stream = None
+                self._stopped.wait(delay)
+
+    def _consume(self, session: Session, partition: str, stream: Dict[str, Any]):
+        """Open the partition feed and queue each event as it arrives."""
+        position = self._positions.get(partition)
+        response = session.get(stream["dataFeedURL"],
+                               params={"offset": position + 1} if position is not None else None,
+                               headers={"Authorization": f"Token {stream['sessionToken']['token']}",
+                                        "Accept": "application/json"
+                                        },
+                               stream=True,
+                               verify=self._service.ssl_verify,
+                               proxies=self._service.proxy,
+                               timeout=(connect_timeout(self._service.timeout), self._read_timeout)
+                               )
+        with self._lock:
+            self._responses[partition] = response
+        try:
+            if response.status_code != 200:
+                raise APIError(code=response.status_code, message=response.reason, headers=dict(response.headers))
+            for line in response.iter_lines(chunk_size=65536):
+                if not line.strip():
+                    continue
+                event = self._codec.loads(line)
+                offset = event.get("metadata", {}).get("offset")
+                if not self._enqueue((partition, offset, event)):
+                    break
+                if offset is not None:
+                    self._positions[partition] = offset
+        finally:
+            with self._lock:
+                self._responses.pop(partition, None)
+            response.close()
+
+    def _enqueue(self, item: Tuple[str, Optional[int], Dict[str, Any]]) -> bool:
+        """Place the event on the queue, waiting for space to become available.
+
+        Returns False if the consumer was stopped before the event could be queued.
+        """
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.5)
+                return True
+            except Full:
+                continue
+
+        return False
+
+    def _warn(self, message: str):
+        """Log a warning when logging is enabled."""
+        if self._service.log:
+            self._service.log.warning(message)
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def app_id(self) -> str:
+        """Return the label identifying this connection."""
+        return self._app_id
+
+    @property
+    def checkpoint(self) -> OffsetCheckpoint:
+        """Return the offset checkpoint."""
+        return self._checkpoint
+
+    @property
+    def partitions(self) -> List[str]:
+        """Return the partitions being read."""
+        return list(self._refresh_due)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of received events waiting to be consumed."""
+        return self._queue.qsize()
+
+    @property
+    def running(self) -> bool:
+        """Return a boolean indicating if the consumer is reading streams."""
+        return not self._stopped.is_set()
+
+
+def connect_timeout(timeout: Optional[Union[float, tuple]]) -> float:
+    """Return the connect timeout from a requests style timeout, defaulting to 30 seconds."""
+    returned = timeout[0] if isinstance(timeout, (tuple, list)) else timeout
+
+    return returned or 30
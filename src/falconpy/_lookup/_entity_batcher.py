@@ -0,0 +1,258 @@
+"""Micro-batching of single ID entity lookups.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Condition, Thread
+from typing import Any, Dict, Iterable, List, Optional, Union
+from .. import _endpoint
+from .._error import InvalidOperation
+from .._util._hydrate import entity_chunk_size, entity_ids_keyword, response_resources
+from .._util._index import resolve_operation
+
+
+class EntityBatcher:  # pylint: disable=R0902
+    """This class gathers single ID entity lookups from many threads into bulk entity requests.
+
+    Every ID requested within the linger window, or until the maximum batch size is reached,
+    is provided to a single request to the entity operation. The entities returned are
+    delivered to the futures of the callers that requested them. IDs requested multiple
+    times within the same batch are only sent once.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 service: Any,
+                 operation: str,
+                 id_key: str = "id",
+                 ids_keyword: Optional[str] = None,
+                 max_batch: Optional[int] = None,
+                 linger: float = 0.05,
+                 max_workers: int = 4,
+                 **kwargs
+                 ):
+        """Construct an instance of the EntityBatcher class.
+
+        Keyword arguments
+        ----
+        service : ServiceClass
+            Service Class used to perform the entity operation. (Example: Hosts)
+        operation : str
+            Operation ID or method name used to retrieve entities by ID. (Example: PostDeviceDetailsV2)
+            Method names must resolve to a single operation ID unless ids_keyword and max_batch are
+            provided, InvalidOperation is raised otherwise.
+        id_key : str
+            Name of the entity attribute containing the ID. Defaults to "id".
+        ids_keyword : str
+            Keyword used to provide the IDs to the entity operation. Defaults to the
+            keyword accepted by the entity operation. (Example: composite_ids)
+        max_batch : int
+            Maximum number of IDs provided to each request. Defaults to the maximum
+            accepted by the entity operation, or 100 when the maximum is not known.
+        linger : float
+            Number of seconds to wait for additional IDs before a request is performed. Defaults to 0.05.
+        max_workers : int
+            Maximum number of concurrent entity requests. Defaults to 4.
+        All other keywords are provided to every entity request.
+        """
+        self._service = service
+        self._request = getattr(service, operation)
+        self._id_key: str = id_key
+        if not max_batch or not ids_keyword:
+            # Method names are resolved to the operation they perform to find its maximum and IDs keyword.
+            details = resolve_operation(_endpoint.api_endpoints, operation, service)
+            if not details:
+                raise InvalidOperation(message=f"Unable to resolve {operation} to a single operation ID, "
+                                               "provide the operation ID instead."
+                                       )
+            ids_keyword = ids_keyword if ids_keyword else entity_ids_keyword(details.operation_id)
+            max_batch = max_batch if max_batch else entity_chunk_size(details.operation_id)
+        self._ids_keyword: str = ids_keyword
+        self._max_batch: int = max(int(max_batch), 1)
+        self._linger: float = max(float(linger), 0.0)
+        self._max_workers: int = max(int(max_workers), 1)
+        self._keywords: Dict[str, Any] = kwargs
+        self._condition: Condition = Condition()
+        self._pending: "OrderedDict[str, List[Future]]" = OrderedDict()
+        self._window_start: float = 0.0
+        self._flushing: bool = False
+        self._closed: bool = False
+        self._dispatcher: Optional[Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._counters: Dict[str, int] = {"requested": 0, "batches": 0, "entities": 0, "failed": 0}
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def get(self, entity_id: str) -> "Future[Optional[Dict[str, Any]]]":
+        """Request the entity for the provided ID, returning a future.
+
+        The future result is the entity, or None when the entity was not returned. The future
+        raises APIError when the entity request fails.
+        """
+        returned: Future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Entity lookups cannot be requested after the batcher is closed.")
+            self._start()
+            if not self._pending:
+                self._window_start = time.monotonic()
+            self._pending.setdefault(entity_id, []).append(returned)
+            self._counters["requested"] += 1
+            if len(self._pending) == 1 or len(self._pending) >= self._max_batch:
+                self._condition.notify()
+
+        return returned
+
+    def get_many(self, entity_ids: Iterable[str]) -> List["Future[Optional[Dict[str, Any]]]"]:
+        """Request the entities for the provided IDs, returning a future for each ID."""
+        return [self.get(entity_id) for entity_id in entity_ids]
+
+    def flush(self):
+        """Perform requests for every pending ID without waiting for the linger window to end."""
+        with self._condition:
+            self._flushing = bool(self._pending)
+            self._condition.notify()
+
+    def close(self):
+        """Perform requests for every pending ID, wait for them to complete and stop the batcher."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            dispatcher = self._dispatcher
+        if dispatcher:
+            dispatcher.join()
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        """Allow for entry as a context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Complete every pending lookup when exiting the context manager."""
+        self.close()
+
+    def _start(self):
+        """Start the dispatcher and request workers when the first ID is requested."""
+        if self._dispatcher is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="lookup")
+            self._dispatcher = Thread(target=self._dispatch, name="lookup-dispatch", daemon=True)
+            self._dispatcher.start()
+
+    def _dispatch(self):
+        """Gather pending IDs into batches and submit them to the request workers."""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                while len(self._pending) < self._max_batch and not self._closed and not self._flushing:
+                    remaining = self._window_start + self._linger - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch = OrderedDict(self._pending.popitem(last=False)
+                                    for _ in range(min(len(self._pending), self._max_batch))
+                                    )
+                self._window_start = time.monotonic()
+                self._flushing = self._flushing and bool(self._pending)
+            self._executor.submit(self._lookup, batch)
+
+    def _lookup(self, batch: "OrderedDict[str, List[Future]]"):
+        """Retrieve the entities for a batch of IDs and deliver them to the waiting futures."""
+        try:
+            found = {entity.get(self._id_key, None): entity
+                     for entity in response_resources(self._request(**{**self._keywords, self._ids_keyword: list(batch)}))
+                     }
+        except Exception as failed:  # pylint: disable=W0703  # Delivered to every caller in the batch
+            self._record(batches=1, failed=len(batch))
+            for futures in batch.values():
+                for future in futures:
+                    if future.set_running_or_notify_cancel():
+                        future.set_exception(failed)
+            return
+
+        self._record(batches=1, entities=len(found))
+        for entity_id, futures in batch.items():
+            for future in futures:
+                if future.set_running_or_notify_cancel():
+                    future.set_result(found.get(entity_id, None))
+
+    def _record(self, **increments: int):
+        """Increment the specified counters."""
+        with self._condition:
+            for counter, value in increments.items():
+                self._counters[counter] += value
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def service(self) -> Any:
+        """Return the Service Class used to perform entity requests."""
+        return self._service
+
+    @property
+    def max_batch(self) -> int:
+        """Return the maximum number of IDs provided to each request."""
+        return self._max_batch
+
+    @property
+    def linger(self) -> float:
+        """Return the number of seconds to wait for additional IDs before a request is performed."""
+        return self._linger
+
+    @property
+    def pending(self) -> int:
+        """Return the number of IDs waiting to be requested."""
+        return len(self._pending)
+
+    @property
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Return the number of IDs requested, requests performed, entities returned and failed lookups."""
+        with self._condition:
+            returned = dict(self._counters)
+        returned["average_batch"] = round(returned["requested"] / returned["batches"], 2) if returned["batches"] else 0.0
+
+        return returned
@@ -0,0 +1,76 @@
+"""Batched host lookups.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from typing import Optional
+from ._entity_batcher import EntityBatcher
+from .._auth_object import FalconInterface
+
+
+class HostLookup(EntityBatcher):
+    """This class retrieves host details for single agent IDs using batched PostDeviceDetailsV2 requests.
+
+    Example
+    ----
+    lookup = HostLookup(auth_object=auth)
+    hostname = lookup.get(aid).result()["hostname"]
+    """
+
+    def __init__(self,
+                 auth_object: Optional[FalconInterface] = None,
+                 linger: float = 0.05,
+                 max_workers: int = 4,
+                 **kwargs
+                 ):
+        """Construct an instance of the HostLookup class.
+
+        Keyword arguments
+        ----
+        auth_object : FalconInterface
+            Authentication object used to create the Hosts Service Class. When not provided,
+            one is created using any remaining keywords (client_id, client_secret, etc.).
+        linger : float
+            Number of seconds to wait for additional agent IDs before a request is performed. Defaults to 0.05.
+        max_workers : int
+            Maximum number of concurrent requests. Defaults to 4.
+        """
+        from ..hosts import Hosts  # pylint: disable=C0415
+        super().__init__(Hosts(auth_object=auth_object, **kwargs),
+                         "PostDeviceDetailsV2",
+                         id_key="device_id",
+                         linger=linger,
+                         max_workers=max_workers
+                         )
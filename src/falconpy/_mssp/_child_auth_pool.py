@@ -0,0 +1,145 @@
+"""MSSP child authentication pool.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional, TYPE_CHECKING
+from .._auth_object import FalconInterface, RateLimiter
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..oauth2 import OAuth2
+
+
+class ChildAuthPool:
+    """This class represents a bounded, least recently used pool of child CID authentication objects.
+
+    Child authentication objects are created using the parent credentials and the child CID, and
+    share the parent connection pool, token store and rate limit scheduler. Each child receives its
+    own token and rate limit budget. Tokens are generated when first used and reused until the child
+    is evicted from the pool. Evicted children may still be in use by other threads, so their tokens
+    are not revoked and are left to expire. When a token store is used, the evicted token remains in
+    the store and is reused if the child CID is requested again.
+    """
+
+    def __init__(self,
+                 parent: FalconInterface,
+                 max_size: int = 64,
+                 rate_limiter: Optional[RateLimiter] = None
+                 ):
+        """Create an empty pool for the provided parent authentication object."""
+        self._parent = parent
+        self._max_size = max(int(max_size), 1)
+        self._rate_limiter = rate_limiter
+        self._children: "OrderedDict[str, OAuth2]" = OrderedDict()
+        self._lock = Lock()
+        self._created = 0
+        self._evicted = 0
+
+    def get(self, member_cid: str) -> "OAuth2":
+        """Return the authentication object for the child CID, creating it when it is not pooled."""
+        with self._lock:
+            returned = self._children.get(member_cid)
+            if returned is not None:
+                self._children.move_to_end(member_cid)
+            else:
+                returned = self._create(member_cid)
+                self._children[member_cid] = returned
+                self._created += 1
+                while len(self._children) > self._max_size:
+                    self._children.popitem(last=False)
+                    self._evicted += 1
+
+        return returned
+
+    def close(self):
+        """Revoke the tokens of every pooled child and empty the pool.
+
+        Revoked tokens are removed from the token store. Tokens of evicted children are not revoked.
+        Tokens shared through a token store are only revoked when the parent revokes on logout.
+        """
+        with self._lock:
+            children = list(self._children.values())
+            self._children.clear()
+        for child in children:
+            token_value = child.token_value
+            if token_value and (child.revoke_on_logout or not child.token_store):
+                # Revoke without altering state, the shared connection pool remains open.
+                child.revoke(token_value, alter_state=True)
+                if child.token_store:
+                    # Remove the revoked token from the store so it is not loaded by another process.
+                    child.token_store.discard(child.token_key, token_value)
+
+    def _create(self, member_cid: str) -> "OAuth2":
+        """Create an authentication object for the child CID using the parent configuration."""
+        from ..oauth2 import OAuth2  # pylint: disable=C0415
+        parent = self._parent
+        return OAuth2(client_id=parent.creds.get("client_id"),
+                      client_secret=parent.creds.get("client_secret"),
+                      member_cid=member_cid,
+                      base_url=parent.base_url,
+                      ssl_verify=parent.ssl_verify,
+                      proxy=parent.proxy,
+                      timeout=parent.timeout,
+                      user_agent=parent.user_agent,
+                      renew_window=parent.renew_window,
+                      pythonic=parent.pythonic,
+                      connection_pool=parent.connection_pool,
+                      rate_limit=self._rate_limiter,
+                      token_store=parent.token_store,
+                      json_codec=parent.json_codec,
+                      response_cache=parent.response_cache,
+                      request_coalescer=parent.request_coalescer,
+                      revoke_on_logout=parent.revoke_on_logout
+                      )
+
+    def __len__(self) -> int:
+        """Return the number of pooled children."""
+        return len(self._children)
+
+    def __contains__(self, member_cid: str) -> bool:
+        """Return a boolean indicating if the child CID is pooled."""
+        return member_cid in self._children
+
+    @property
+    def max_size(self) -> int:
+        """Return the maximum number of pooled children."""
+        return self._max_size
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Return the number of children pooled, created and evicted."""
+        return {"pooled": len(self._children), "created": self._created, "evicted": self._evicted}
@@ -0,0 +1,213 @@
+"""MSSP multi-tenant fan-out executor.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union, TYPE_CHECKING
+from ._child_auth_pool import ChildAuthPool
+from .._auth_object import FalconInterface, RateLimiter
+from .._util._hydrate import response_resources
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..oauth2 import OAuth2
+    from .._service_class import ServiceClass
+
+
+class MSSPFanOut:
+    """This class runs an operation against every child CID of a Flight Control (MSSP) parent concurrently.
+
+    Children are provided as a list of child CIDs, a CID group, or retrieved from the parent using
+    queryChildren. Child authentication objects are held in a bounded least recently used pool and
+    share the parent connection pool. Every child has its own rate limit budget within a shared
+    rate limit scheduler. Results are yielded as they complete, tagged with the child CID.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 auth_object: Optional[FalconInterface] = None,
+                 max_workers: int = 8,
+                 max_tokens: int = 64,
+                 rate_limit: Optional[Union[RateLimiter, Dict[str, Union[int, float]], bool]] = True,
+                 **kwargs
+                 ):
+        """Construct an instance of the MSSPFanOut class.
+
+        Keyword arguments
+        ----
+        auth_object : FalconInterface
+            Parent authentication object. When not provided, one is created using any
+            remaining keywords (client_id, client_secret, base_url, etc.).
+        max_workers : int
+            Maximum number of children processed concurrently. Defaults to 8.
+        max_tokens : int
+            Maximum number of child authentication objects retained. Defaults to 64.
+        rate_limit : RateLimiter, dict or bool
+            Rate limit scheduler shared by every child. Defaults to the scheduler used by
+            the parent authentication object, or a new scheduler when the parent does not use one.
+            Provide False to disable rate limiting for children.
+        """
+        if auth_object is None:
+            from ..oauth2 import OAuth2  # pylint: disable=C0415
+            auth_object = OAuth2(**kwargs)
+        self._parent = auth_object
+        self._max_workers = max(int(max_workers), 1)
+        if rate_limit is True and auth_object.rate_limiter:
+            rate_limit = auth_object.rate_limiter
+        self._pool = ChildAuthPool(auth_object, max_tokens, RateLimiter.create(rate_limit))
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def children(self, **kwargs) -> List[str]:
+        """Return every child CID linked to the parent, keywords are provided to queryChildren."""
+        from ..mssp import FlightControl  # pylint: disable=C0415
+        kwargs["limit"] = kwargs.get("limit", 1000)
+        returned = []
+        for page in FlightControl(auth_object=self._parent).paginate("query_children", **kwargs):
+            returned.extend(response_resources(page))
+
+        return returned
+
+    def group_members(self, cid_group_ids: Union[str, List[str]]) -> List[str]:
+        """Return the child CIDs that are members of the provided CID groups."""
+        from ..mssp import FlightControl  # pylint: disable=C0415
+        result = FlightControl(auth_object=self._parent).get_cid_group_members_by(ids=cid_group_ids)
+        returned = []
+        for group in response_resources(result):
+            returned.extend(cid for cid in group.get("cids", None) or [] if cid not in returned)
+
+        return returned
+
+    def run(self,
+            operation: Union[str, Callable[["OAuth2", str], Any]],
+            children: Optional[Iterable[str]] = None,
+            cid_group: Optional[Union[str, List[str]]] = None,
+            service: Optional[Type["ServiceClass"]] = None,
+            **kwargs
+            ) -> Iterator[Tuple[str, Any]]:
+        """Run the operation against every child, yielding a tuple of the child CID and result as each completes.
+
+        Keyword arguments
+        ----
+        operation : str or callable
+            Method name or operation ID of the provided Service Class, or a callable that
+            accepts the child authentication object and child CID.
+        children : list of str
+            Child CIDs to process. Defaults to the members of cid_group, or every child of the parent.
+        cid_group : str or list of str
+            CID group IDs whose members are processed when children are not provided.
+        service : ServiceClass
+            Service Class used to perform a named operation. (Example: Hosts)
+        All other keywords are provided to a named operation.
+
+        Exceptions raised for a child stop any children that have not started and are raised.
+        """
+        if children is None:
+            children = self.group_members(cid_group) if cid_group else self.children()
+        task = self._task(operation, service, kwargs)
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="child") as executor:
+            pending: Set[Future] = set()
+            try:
+                for member_cid in children:
+                    pending.add(executor.submit(self._run_child, task, member_cid))
+                    if len(pending) >= self._max_workers * 2:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        yield from (future.result() for future in done)
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from (future.result() for future in done)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def collect(self, operation: Union[str, Callable[["OAuth2", str], Any]], **kwargs) -> Dict[str, Any]:
+        """Run the operation against every child and return the results by child CID."""
+        return dict(self.run(operation, **kwargs))
+
+    def close(self):
+        """Revoke the tokens of every pooled child."""
+        self._pool.close()
+
+    def __enter__(self):
+        """Allow for entry as a context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Revoke child tokens when exiting the context manager."""
+        self.close()
+
+    def _run_child(self, task: Callable[["OAuth2", str], Any], member_cid: str) -> Tuple[str, Any]:
+        """Perform the task using the child authentication object."""
+        return member_cid, task(self._pool.get(member_cid), member_cid)
+
+    @staticmethod
+    def _task(operation: Union[str, Callable[["OAuth2", str], Any]],
+              service: Optional[Type["ServiceClass"]],
+              keywords: Dict[str, Any]
+              ) -> Callable[["OAuth2", str], Any]:
+        """Return a callable performing the operation for a child."""
+        if callable(operation):
+            return operation
+        if service is None:
+            raise ValueError("A Service Class must be provided to perform a named operation.")
+
+        def _perform(child_auth: "OAuth2", _: str) -> Any:
+            return getattr(service(auth_object=child_auth), operation)(**keywords)
+
+        return _perform
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def auth_object(self) -> FalconInterface:
+        """Return the parent authentication object."""
+        return self._parent
+
+    @property
+    def pool(self) -> ChildAuthPool:
+        """Return the pool of child authentication objects."""
+        return self._pool
+
+    @property
+    def max_workers(self) -> int:
+        """Return the maximum number of children processed concurrently."""
+        return self._max_workers
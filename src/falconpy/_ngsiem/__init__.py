@@ -35,7 +35,11 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-from ._hec import HEC, IngestPayload, IngestConfig, SessionManager
+from ._hec import HEC, IngestPayload, IngestConfig, IngestBatch, IngestCompressor, SessionManager
+from ._ingest_producer import IngestProducer
+from ._ingest_spool import IngestSpool
+from ._search_runner import SearchJob, SearchRunner
 from ._hec import HEC as HTTPEventCollector  # pylint: disable=W0404
 
-__all__ = ["HTTPEventCollector", "HEC", "IngestPayload", "IngestConfig", "SessionManager"]
+__all__ = ["HTTPEventCollector", "HEC", "IngestPayload", "IngestConfig", "IngestBatch", "IngestCompressor",
+           "IngestProducer", "IngestSpool", "SessionManager", "SearchJob", "SearchRunner"]
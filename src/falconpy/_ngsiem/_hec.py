@@ -35,12 +35,14 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from gzip import open as gzip_open
 from logging import Logger, getLogger, FileHandler
+from threading import Lock
 from time import sleep
-from typing import Dict, Union, List, Iterable, Any
+from typing import Dict, Union, List, Iterable, Iterator, Any, BinaryIO, Optional
 from requests import Response, Session
 from requests.exceptions import (
     ReadTimeout,
@@ -49,12 +51,16 @@ from requests.exceptions import (
     SSLError,
     ConnectionError as RequestConnectionError
     )
+from ._ingest_batch import IngestBatch
+from ._ingest_compressor import IngestCompressor
 from ._ingest_config import IngestConfig
 from ._ingest_payload import IngestPayload
+from ._ingest_producer import IngestProducer
 from ._session_manager import SessionManager
+from .._constant import INGEST_CLOSE_TIMEOUT, RAW_INGEST_CHUNK_SIZE
 from .._enum import IngestFormat
 from .._log import LogFacility
-from .._util import sanitize_dictionary
+from .._util import sanitize_dictionary, JSONCodec
 from .._version import _VERSION, _HEC_VERSION
 
 
@@ -78,6 +84,9 @@ class HEC:  # pylint: disable=R0902,R0904
     _last_message: str = None
     _log_facility: LogFacility = LogFacility()
     _session_manager: SessionManager = None
+    _json_codec: JSONCodec = None
+    _compressor: IngestCompressor = IngestCompressor()
+    _producer: IngestProducer = None
 
     def __init__(self,
                  api_key: str,
@@ -115,11 +124,36 @@ class HEC:  # pylint: disable=R0902,R0904
             Enable debugging. Defaults to False.
         sanitize_log: (boolean)
             Sanitize the bearer token from API logs. Defaults to True.
+        json_codec: (JSONCodec or string)
+            JSON library used to encode events and decode responses.
+                Allowed values = "orjson", "ujson" or "json". Defaults to the fastest installed library.
+        batch_max_bytes: (integer)
+            Maximum size in bytes of a batched request. Defaults to 1000000.
+        batch_max_events: (integer)
+            Maximum number of events within a batched request. Defaults to 1000.
+        batch_max_linger: (float)
+            Maximum number of seconds an event waits for its batch to fill. Defaults to 1.
+        compression: (string)
+            Compress transmissions using the specified Content-Encoding. Defaults to None (disabled).
+                Allowed values = "gzip" or "zstd" (requires the zstandard package)
+                Raises ValueError for any other value.
+        compression_level: (integer)
+            Compression level. Defaults to 6 for gzip and 3 for zstd.
+        queue_max_events: (integer)
+            Maximum number of events held in memory by enqueue. Defaults to 100000.
+        spill_path: (string)
+            Location of the file used to hold enqueued events that do not fit in memory or
+            could not be sent. Defaults to None (enqueue waits for space).
+        sender_count: (integer)
+            Number of background threads sending enqueued events. Defaults to 2.
         """
         self.ingest_config = IngestConfig(api_key, api_url_key, **kwargs)
         self.session_manager = SessionManager(kwargs.get("thread_count", None),
                                               kwargs.get("retry_count", 3)
                                               )
+        self.json_codec = kwargs.get("json_codec", None)
+        self.compressor = IngestCompressor(kwargs.get("compression", None), kwargs.get("compression_level", None))
+        self._producer_lock = Lock()
         if debug:
             self.log_facility = LogFacility(getLogger(__name__),
                                             None,
@@ -138,6 +172,10 @@ class HEC:  # pylint: disable=R0902,R0904
     def __exit__(self, *args):
         """Context manager exit."""
         self.log_activity(args[1])
+        if self.producer:
+            self.close(INGEST_CLOSE_TIMEOUT)
+        if self.compression:
+            self.log_activity(self.compression_summary)
 
     def format_event(self,
                      evt: Union[Dict[str, Any], IngestPayload]
@@ -146,15 +184,125 @@ class HEC:  # pylint: disable=R0902,R0904
         returned = None
         if isinstance(evt, IngestPayload):
             evt.timeunit = self.ingest_timeunit
-            returned = evt.to_json(self.raw_ingest)
+            returned = evt.to_json(self.raw_ingest, codec=self.json_codec)
         else:
-            returned = IngestPayload(**evt, timeunit=self.ingest_timeunit).to_json(self.raw_ingest)
+            returned = IngestPayload(**evt, timeunit=self.ingest_timeunit)
+            returned = returned.to_json(self.raw_ingest, codec=self.json_codec)
+
+        return returned
+
+    def encode_event(self, evt: Union[Dict[str, Any], IngestPayload]) -> bytes:
+        """Format the event and encode it for transmission."""
+        returned = self.format_event(evt)
+        if isinstance(returned, str):
+            returned = returned.encode("utf-8")
+        else:
+            returned = self.json_codec.dumps(returned)
+
+        return returned
+
+    def batch_events(self, events: Iterable[Union[Dict[str, Any], IngestPayload]]) -> Iterator[IngestBatch]:
+        """Pack formatted events into batches capped by size, event count and linger time.
+
+        Events are consumed from the iterable as batches are requested. The linger time
+        is checked as each event arrives, flushing a batch whose first event has waited too long.
+        """
+        batch = IngestBatch()
+        for event in events:
+            encoded = self.encode_event(event)
+            if not batch.fits(encoded, self.batch_max_bytes):
+                yield batch
+                batch = IngestBatch(batch.number + 1)
+            batch.add(encoded)
+            if batch.count >= self.batch_max_events or batch.age >= self.batch_max_linger:
+                yield batch
+                batch = IngestBatch(batch.number + 1)
+        if batch.count:
+            yield batch
+
+    def send_batch(self, batch: IngestBatch) -> Dict[str, Union[int, str]]:
+        """Send a batch of events in a single request and return the batch status."""
+        self.log_activity(f"BATCH {batch.number}: Submitting {batch.count} events ({batch.size} bytes)")
+        response = self._retry_event(batch.payload)
+        status_code, message = self.last_status, self.last_message
+        if response is not None:
+            status_code, message = response.status_code, self.json_codec.loads(response.content)
+            self.track_result(status_code, message)
+        self.log_activity(f"BATCH {batch.number}: STATUS CODE {status_code}")
+
+        return {
+            "batch": batch.number,
+            "events": batch.count,
+            "bytes": batch.size,
+            "status_code": status_code,
+            "message": message
+        }
+
+    def send_event_batches(self,
+                           events: Iterable[Union[Dict[str, Any], IngestPayload]]
+                           ) -> List[Dict[str, Union[int, str]]]:
+        """Send events packed into batches concurrently, returning the status of each batch.
+
+        No more than two batches per thread are held in memory at a time.
+        """
+        returned = []
+        with ThreadPoolExecutor(max_workers=self.thread_count,
+                                thread_name_prefix="thread"
+                                ) as executor:
+            in_flight = deque()
+            for batch in self.batch_events(events):
+                in_flight.append(executor.submit(self.send_batch, batch))
+                if len(in_flight) >= self.thread_count * 2:
+                    returned.append(in_flight.popleft().result())
+            returned.extend(future.result() for future in in_flight)
+        self.log_activity(f"EVENT BATCHES: {sum(status['events'] for status in returned)} "
+                          f"events sent in {len(returned)} batches"
+                          )
+
+        return returned
+
+    def enqueue(self, event: Union[Dict[str, Any], IngestPayload]):
+        """Queue an event to be sent in batches by background sender threads.
+
+        The producer is started with the first event. Events are spilled to the spill file,
+        when one is configured, if the buffer is full or the collector is unavailable.
+        """
+        if not self.producer:
+            with self._producer_lock:
+                if not self.producer:
+                    self.producer = IngestProducer(self,
+                                                   self.queue_max_events,
+                                                   self.spill_path,
+                                                   self.sender_count
+                                                   )
+        self.producer.enqueue(event)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for enqueued events to be sent, returning a boolean indicating if every event was sent."""
+        returned = True
+        if self.producer:
+            returned = self.producer.flush(timeout)
+
+        return returned
+
+    def close(self, timeout: Optional[float] = INGEST_CLOSE_TIMEOUT) -> bool:
+        """Flush enqueued events and stop the producer, returning a boolean indicating if every event was sent.
+
+        Enqueued events are waited for until the timeout expires, or indefinitely when the timeout is None.
+        """
+        returned = True
+        if self.producer:
+            with self._producer_lock:
+                producer = self.producer
+                self.producer = None
+            returned = producer.close(timeout)
+            self.log_activity(f"PRODUCER CLOSED: {producer.counters}")
 
         return returned
 
     def slice_raw_data(self, data: str) -> List[str]:
         """Slice raw data into manageable chunks."""
-        max_chunk_size = 10_240_000
+        max_chunk_size = RAW_INGEST_CHUNK_SIZE
         data_length = len(data)
         created = []
         start = 0
@@ -183,52 +331,92 @@ class HEC:  # pylint: disable=R0902,R0904
         except (FileNotFoundError, OSError) as not_found:
             raise SystemExit("Specified raw file not found.") from not_found
 
+    def read_raw_chunks(self,
+                        ingest_file: BinaryIO,
+                        max_chunk_size: int = RAW_INGEST_CHUNK_SIZE
+                        ) -> Iterator[bytes]:
+        """Read raw data incrementally, yielding newline aligned chunks no larger than max_chunk_size.
+
+        Lines longer than max_chunk_size are split across chunks.
+        """
+        buffer = bytearray()
+        finished = False
+        while buffer or not finished:
+            # Fill the buffer using small reads to limit the size of temporary copies.
+            while not finished and len(buffer) < max_chunk_size:
+                block = ingest_file.read(min(1_048_576, max_chunk_size - len(buffer)))
+                finished = not block
+                buffer += block
+            if not buffer:
+                break
+            split_index = -1 if finished else buffer.rfind(b"\n")
+            end = split_index + 1 if split_index != -1 else len(buffer)
+            with memoryview(buffer) as view:
+                chunk = bytes(view[:end])
+            del buffer[:end]
+            records = chunk.count(b"\n")
+            self.log_activity(f"Created batch of {records} records")
+            yield chunk
+
     def send_event_file(self, event_file: str) -> int:
-        """Upload a file of events, this method leverages the raw endpoint."""
+        """Upload a file of events, this method leverages the raw endpoint.
+
+        The file is decompressed and read incrementally while chunks are sent, with no more
+        chunks in memory than there are threads.
+        """
         self.log_activity(f"EVENT FILE: {event_file}")
-        if self.detect_gzip(event_file):
-            with gzip_open(event_file, "rt") as gzip_file:
-                batches = self.slice_raw_data("".join(list(gzip_file.readlines())))
-        else:
-            with open(event_file, "r", encoding="utf-8") as ingest_file:
-                batches = self.slice_raw_data(ingest_file.read())
-        with ThreadPoolExecutor(max_workers=self.thread_count,
-                                thread_name_prefix="thread"
-                                ) as executor:
-            for batch in batches:
-                self.log_activity(f"Submitting batch of {batch['count']} records")
-            futures = {executor.submit(self._retry_event, batch["data"]) for batch in batches}
-            for future in futures:
-                if not future.result():
-                    self.log_activity([f"STATUS CODE: {self.last_status}",
-                                       f"RESPONSE: {self.last_message}"
-                                       ])
-                else:
-                    self.track_result(future.result().status_code, future.result().json())
-                    self.log_activity([f"STATUS CODE: {future.result().status_code}",
-                                       f"RESPONSE HEADERS: {future.result().headers}",
-                                       f"RESPONSE: {future.result().json()}"
-                                       ])
+        opener = gzip_open if self.detect_gzip(event_file) else open
+        with opener(event_file, "rb") as ingest_file:
+            with ThreadPoolExecutor(max_workers=self.thread_count,
+                                    thread_name_prefix="thread"
+                                    ) as executor:
+                in_flight = deque()
+                for chunk in self.read_raw_chunks(ingest_file):
+                    if len(in_flight) >= self.thread_count:
+                        self._track_raw_response(in_flight.popleft().result())
+                    in_flight.append(executor.submit(self._retry_event, chunk))
+                while in_flight:
+                    self._track_raw_response(in_flight.popleft().result())
 
         return self.last_status
 
+    def _track_raw_response(self, response: Response):
+        """Record and log the response received for a chunk of raw data."""
+        if not response:
+            self.log_activity([f"STATUS CODE: {self.last_status}",
+                               f"RESPONSE: {self.last_message}"
+                               ])
+        else:
+            self.track_result(response.status_code, self.json_codec.loads(response.content))
+            self.log_activity([f"STATUS CODE: {response.status_code}",
+                               f"RESPONSE HEADERS: {response.headers}",
+                               f"RESPONSE: {self.last_message}"
+                               ])
+
     def _retry_event(self, evt: Union[Dict[str, Any], str]) -> Response:
         response = None
         error_condition = None
         ingest_to = self.ingest_url
-        raw = None
         if self.raw_ingest:
             ingest_to = self.raw_ingest_url
-            raw = evt
+            payload = evt
+            evt = None
+        elif isinstance(evt, bytes):
+            # Batches are encoded before they are submitted.
+            payload = evt
             evt = None
+        else:
+            # Events are encoded once and reused for every retry.
+            payload = self.json_codec.dumps(evt)
+        # Payloads are compressed once on the sending thread and reused for every retry.
+        payload = self.compressor.compress(payload)
         for transmission_count in range(1, self.retry_count+1):
             try:
                 response = next(self.session_manager).post(ingest_to,
                                                            headers=self.hec_headers,
-                                                           json=evt,
                                                            verify=True,
                                                            timeout=self.ingest_timeout,
-                                                           data=raw
+                                                           data=payload
                                                            )
                 break
 
@@ -245,10 +433,10 @@ class HEC:  # pylint: disable=R0902,R0904
 
         if transmission_count == self.retry_count:
             if error_condition == "TIMEOUT":
-                self.log_activity(f"REQUEST TIMEOUT: {evt if evt else 'Raw file import'}")
+                self.log_activity(f"REQUEST TIMEOUT: {evt if evt else 'Raw or batch import'}")
                 self.track_result(500, "TIMEOUT ERROR: Check connectivity or increase timeout")
             else:
-                self.log_activity(f"REQUEST FAILED: {evt if evt else 'Raw file import'}")
+                self.log_activity(f"REQUEST FAILED: {evt if evt else 'Raw or batch import'}")
                 self.log_activity(f"FAILURE REASON: {error_condition}")
                 self.track_result(500, f"REQUEST FAILURE: {error_condition}")
 
@@ -263,7 +451,7 @@ class HEC:  # pylint: disable=R0902,R0904
         self.log_activity([f"REQUEST HEADERS: {header_log}", f"EVENT PROCESSED: {event}"])
         response = self._retry_event(event)
         if response:
-            self.track_result(response.status_code, response.json())
+            self.track_result(response.status_code, self.json_codec.loads(response.content))
             self.log_activity([f"RESPONSE CODE: {self.last_status}",
                                f"RESPONSE HEADERS: {response.headers}",
                                f"RESPONSE TEXT: {self.last_message}"
@@ -302,11 +490,19 @@ class HEC:  # pylint: disable=R0902,R0904
 
     def send_event_list(self,
                         event_list: List[Union[Dict[str, Any], IngestPayload]],
-                        show_progress: bool = False
+                        show_progress: bool = False,
+                        batch: bool = False
                         ) -> Union[int, Iterable[int]]:
-        """Asynchronously send a list of events, returning the number of successful submissions."""
+        """Asynchronously send a list of events, returning the number of successful submissions.
+
+        When batch is enabled, events are packed into batched requests instead of being sent individually.
+        """
         self.log_activity("EVENT LIST: BEGIN PROCESSING")
-        if show_progress:
+        if batch:
+            returned = sum(status["events"] for status in self.send_event_batches(event_list)
+                           if status["status_code"] == 200
+                           )
+        elif show_progress:
             returned = self.process_list_with_progress(event_list)
         else:
             returned = self.process_list(event_list)
@@ -373,6 +569,13 @@ class HEC:  # pylint: disable=R0902,R0904
                            f"RAW INGEST: {'Enabled' if self.raw_ingest else 'Disabled'}",
                            f"REQUEST TIMEOUT: {self.ingest_config.ingest_timeout} seconds",
                            f"REQUEST RETRY COUNT: {self.retry_count} attempts",
+                           f"BATCH LIMITS: {self.batch_max_events} events / {self.batch_max_bytes} bytes"
+                           f" / {self.batch_max_linger} seconds",
+                           f"COMPRESSION: {self.compression.upper() if self.compression else 'Disabled'}"
+                           f"{f' (level {self.compressor.level})' if self.compression else ''}",
+                           self.compression_summary,
+                           f"PRODUCER: {self.queue_max_events} events / {self.sender_count} senders"
+                           f" / spill {self.spill_path if self.spill_path else 'Disabled'}",
                            f"ASYNC SESSION COUNT: {len(self.session_manager)}",
                            f"ASYNC THREAD COUNT: {self.thread_count} threads"
                            ])
@@ -473,6 +676,66 @@ class HEC:  # pylint: disable=R0902,R0904
         """Set the raw ingest mode."""
         self.ingest_config.raw_ingest = value
 
+    @property
+    def batch_max_bytes(self) -> int:
+        """Maximum size of a batched request in bytes."""
+        return self.ingest_config.batch_max_bytes
+
+    @batch_max_bytes.setter
+    def batch_max_bytes(self, value: int):
+        """Set the maximum size of a batched request."""
+        self.ingest_config.batch_max_bytes = value
+
+    @property
+    def batch_max_events(self) -> int:
+        """Maximum number of events within a batched request."""
+        return self.ingest_config.batch_max_events
+
+    @batch_max_events.setter
+    def batch_max_events(self, value: int):
+        """Set the maximum number of events within a batched request."""
+        self.ingest_config.batch_max_events = value
+
+    @property
+    def batch_max_linger(self) -> float:
+        """Maximum number of seconds an event waits for its batch to fill."""
+        return self.ingest_config.batch_max_linger
+
+    @batch_max_linger.setter
+    def batch_max_linger(self, value: float):
+        """Set the maximum number of seconds an event waits for its batch to fill."""
+        self.ingest_config.batch_max_linger = value
+
+    @property
+    def queue_max_events(self) -> int:
+        """Maximum number of events held in memory by enqueue."""
+        return self.ingest_config.queue_max_events
+
+    @queue_max_events.setter
+    def queue_max_events(self, value: int):
+        """Set the maximum number of events held in memory by enqueue."""
+        self.ingest_config.queue_max_events = value
+
+    @property
+    def spill_path(self) -> str:
+        """Location of the file holding enqueued events that could not be held in memory or sent."""
+        return self.ingest_config.spill_path
+
+    @spill_path.setter
+    def spill_path(self, value: str):
+        """Set the location of the spill file."""
+        self.ingest_config.spill_path = value
+
+    @property
+    def sender_count(self) -> int:
+        """Number of background threads sending enqueued events."""
+        return self.ingest_config.sender_count
+
+    @sender_count.setter
+    def sender_count(self, value: int):
+        """Set the number of background threads sending enqueued events."""
+        self.ingest_config.sender_count = value
+
     # ____ ____ _    _    ____ ____ ___ ____ ____
     # |    |  | |    |    |___ |     |  |  | |__/
     # |___ |__| |___ |___ |___ |___  |  |__| |  \
@@ -587,6 +850,36 @@ class HEC:  # pylint: disable=R0902,R0904
         """Set the default thread count."""
         self.session_manager.thread_count = value
 
+    @property
+    def json_codec(self) -> JSONCodec:
+        """Return the JSON codec used to encode events and decode responses."""
+        return self._json_codec
+
+    @json_codec.setter
+    def json_codec(self, value: Union[JSONCodec, str]):
+        """Set the JSON codec, accepts a codec or the name of a JSON library."""
+        self._json_codec = JSONCodec.create(value)
+
+    @property
+    def producer(self) -> IngestProducer:
+        """Return the background producer, None until an event is enqueued."""
+        return self._producer
+
+    @producer.setter
+    def producer(self, value: IngestProducer):
+        """Set the background producer."""
+        self._producer = value
+
+    @property
+    def compressor(self) -> IngestCompressor:
+        """Return the compressor applied to transmissions."""
+        return self._compressor
+
+    @compressor.setter
+    def compressor(self, value: IngestCompressor):
+        """Set the compressor applied to transmissions."""
+        self._compressor = value
+
     #  _____ _______ _______ _     _ _______ _______ ______         _______
     #    |   |  |  | |  |  | |     |    |    |_____| |_____] |      |______
     #  __|__ |  |  | |  |  | |_____|    |    |     | |_____] |_____ |______
@@ -620,7 +913,39 @@ class HEC:  # pylint: disable=R0902,R0904
     @property
     def hec_headers(self) -> Dict[str, str]:
         """Authorization headers."""
-        return {
+        returned = {
             "Authorization": f"Bearer {self.ingest_key}",
             "Content-Type": self.ingest_format
             }
+        if self.compression:
+            returned["Content-Encoding"] = self.compression
+
+        return returned
+
+    @property
+    def compression(self) -> str:
+        """Content-Encoding applied to transmissions, None when compression is disabled."""
+        return self.compressor.encoding
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of enqueued events held in memory."""
+        return self.producer.queue_depth if self.producer else 0
+
+    @property
+    def spill_bytes(self) -> int:
+        """Number of bytes within the spill file waiting to be sent."""
+        return self.producer.spill_bytes if self.producer else 0
+
+    @property
+    def send_latency(self) -> float:
+        """Average number of seconds taken to send a batch of enqueued events."""
+        return self.producer.send_latency if self.producer else 0.0
+
+    @property
+    def compression_summary(self) -> str:
+        """Compressed and uncompressed byte counters."""
+        return (f"BYTES SENT: {self.compressor.compressed_bytes} compressed / "
+                f"{self.compressor.uncompressed_bytes} uncompressed "
+                f"(ratio {self.compressor.ratio:.2f})"
+                )
@@ -0,0 +1,93 @@
+"""HTTP Event Collector ingest batch.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from time import monotonic
+from typing import List
+
+
+class IngestBatch:
+    """This class represents a batch of encoded events sent to the collector in a single request."""
+
+    def __init__(self, number: int = 1):
+        """Create an empty batch."""
+        self._number = number
+        self._events: List[bytes] = []
+        self._size = 0
+        self._created = monotonic()
+
+    def add(self, encoded: bytes):
+        """Add an encoded event to the batch."""
+        if not self._events:
+            self._created = monotonic()
+        self._size += len(encoded) + (1 if self._events else 0)
+        self._events.append(encoded)
+
+    def fits(self, encoded: bytes, max_bytes: int) -> bool:
+        """Return a boolean indicating if the encoded event fits within the size limit.
+
+        An empty batch accepts any event so that oversized events are still sent.
+        """
+        return not self._events or self._size + len(encoded) + 1 <= max_bytes
+
+    def __len__(self) -> int:
+        """Return the number of events within the batch."""
+        return len(self._events)
+
+    @property
+    def number(self) -> int:
+        """Return the sequence number of the batch."""
+        return self._number
+
+    @property
+    def count(self) -> int:
+        """Return the number of events within the batch."""
+        return len(self._events)
+
+    @property
+    def size(self) -> int:
+        """Return the size of the batch payload in bytes."""
+        return self._size
+
+    @property
+    def age(self) -> float:
+        """Return the number of seconds since the first event was added."""
+        return monotonic() - self._created
+
+    @property
+    def payload(self) -> bytes:
+        """Return the newline delimited batch payload."""
+        return b"\n".join(self._events)
@@ -0,0 +1,121 @@
+"""HTTP Event Collector payload compression.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from gzip import compress as gzip_compress
+from importlib import import_module
+from threading import Lock, local
+from typing import Optional, Union
+from .._error import DependencyNotInstalled
+
+
+class IngestCompressor:
+    """This class represents the compression applied to HEC transmissions.
+
+    Supported methods are "gzip" and "zstd" (requires the zstandard package). Compression is
+    disabled when a method is not specified, and ValueError is raised when the method is not
+    supported. Byte counters track the size of payloads before and after compression.
+    """
+
+    DEFAULT_LEVELS = {"gzip": 6, "zstd": 3}
+
+    def __init__(self, method: Optional[str] = None, level: Optional[int] = None):
+        """Create an instance of the compressor, importing zstandard when it is requested."""
+        self._method = str(method).lower() if method else None
+        if self._method and self._method not in self.DEFAULT_LEVELS:
+            raise ValueError(f"Unsupported compression method: {method}. "
+                             f"Allowed values are {', '.join(self.DEFAULT_LEVELS)}."
+                             )
+        self._level = int(level) if level is not None else self.DEFAULT_LEVELS.get(self._method)
+        self._lock = Lock()
+        self._local = local()
+        self._uncompressed = 0
+        self._compressed = 0
+        self._zstd = None
+        if self._method == "zstd":
+            try:
+                self._zstd = import_module("zstandard")
+            except ImportError as not_installed:
+                raise DependencyNotInstalled(message="The zstandard package is required for zstd compression."
+                                             ) from not_installed
+
+    def compress(self, payload: Union[str, bytes]) -> Union[str, bytes]:
+        """Compress the payload, returning it unchanged when compression is disabled."""
+        returned = payload
+        if self._method:
+            if isinstance(payload, str):
+                payload = payload.encode("utf-8")
+            if self._method == "gzip":
+                returned = gzip_compress(payload, compresslevel=self._level, mtime=0)
+            else:
+                # Compressors can not be shared between threads.
+                if not hasattr(self._local, "compressor"):
+                    self._local.compressor = self._zstd.ZstdCompressor(level=self._level)
+                returned = self._local.compressor.compress(payload)
+            with self._lock:
+                self._uncompressed += len(payload)
+                self._compressed += len(returned)
+
+        return returned
+
+    @property
+    def encoding(self) -> Optional[str]:
+        """Return the Content-Encoding header value, or None when compression is disabled."""
+        return self._method
+
+    @property
+    def level(self) -> Optional[int]:
+        """Return the compression level."""
+        return self._level
+
+    @property
+    def uncompressed_bytes(self) -> int:
+        """Return the number of bytes submitted for compression."""
+        return self._uncompressed
+
+    @property
+    def compressed_bytes(self) -> int:
+        """Return the number of bytes sent after compression."""
+        return self._compressed
+
+    @property
+    def ratio(self) -> float:
+        """Return the compression ratio achieved so far."""
+        returned = 0.0
+        if self._compressed:
+            returned = self._uncompressed / self._compressed
+
+        return returned
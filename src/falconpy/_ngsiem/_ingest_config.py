@@ -39,9 +39,10 @@ from typing import Union
 from .._enum import IngestFormat, IngestBaseURL
 
 
-class IngestConfig:
+class IngestConfig:  # pylint: disable=R0902
     """This class represents the HEC configuration."""
 
+    # pylint: disable=R0913
     def __init__(self,
                  ingest_key,
                  ingest_url_key,
@@ -50,6 +51,12 @@ class IngestConfig:
                  ingest_timeout: int = 5,
                  ingest_timeunit: str = "nanoseconds",
                  raw_ingest: bool = False,
+                 batch_max_bytes: int = 1_000_000,
+                 batch_max_events: int = 1_000,
+                 batch_max_linger: float = 1.0,
+                 queue_max_events: int = 100_000,
+                 spill_path: str = None,
+                 sender_count: int = 2,
                  **_
                  ):
         """Create an instance of the ingest configuration class."""
@@ -63,6 +70,12 @@ class IngestConfig:
         self._ingest_timeout = ingest_timeout
         self._ingest_timeunit = ingest_timeunit
         self._raw_ingest = raw_ingest
+        self._batch_max_bytes = batch_max_bytes
+        self._batch_max_events = batch_max_events
+        self._batch_max_linger = batch_max_linger
+        self._queue_max_events = queue_max_events
+        self._spill_path = spill_path
+        self._sender_count = sender_count
 
     @property
     def ingest_base_url(self) -> str:
@@ -153,3 +166,63 @@ class IngestConfig:
     def raw_ingest(self, value: bool):
         """Set the raw ingest flag."""
         self._raw_ingest = value
+
+    @property
+    def batch_max_bytes(self) -> int:
+        """Return the maximum size of a batched request in bytes."""
+        return self._batch_max_bytes
+
+    @batch_max_bytes.setter
+    def batch_max_bytes(self, value: int):
+        """Set the maximum size of a batched request."""
+        self._batch_max_bytes = int(value)
+
+    @property
+    def batch_max_events(self) -> int:
+        """Return the maximum number of events within a batched request."""
+        return self._batch_max_events
+
+    @batch_max_events.setter
+    def batch_max_events(self, value: int):
+        """Set the maximum number of events within a batched request."""
+        self._batch_max_events = int(value)
+
+    @property
+    def batch_max_linger(self) -> float:
+        """Return the maximum number of seconds an event waits for its batch to fill."""
+        return self._batch_max_linger
+
+    @batch_max_linger.setter
+    def batch_max_linger(self, value: float):
+        """Set the maximum number of seconds an event waits for its batch to fill."""
+        self._batch_max_linger = float(value)
+
+    @property
+    def queue_max_events(self) -> int:
+        """Return the maximum number of events held in memory by the producer."""
+        return self._queue_max_events
+
+    @queue_max_events.setter
+    def queue_max_events(self, value: int):
+        """Set the maximum number of events held in memory by the producer."""
+        self._queue_max_events = int(value)
+
+    @property
+    def spill_path(self) -> str:
+        """Return the location of the producer spill file."""
+        return self._spill_path
+
+    @spill_path.setter
+    def spill_path(self, value: str):
+        """Set the location of the producer spill file."""
+        self._spill_path = value
+
+    @property
+    def sender_count(self) -> int:
+        """Return the number of producer sender threads."""
+        return self._sender_count
+
+    @sender_count.setter
+    def sender_count(self, value: int):
+        """Set the number of producer sender threads."""
+        self._sender_count = int(value)
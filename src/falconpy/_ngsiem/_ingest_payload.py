@@ -35,33 +35,29 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-import re
-from csv import DictWriter
-from datetime import datetime, timezone
+from csv import writer as csv_writer
 from io import StringIO
-from inspect import getmembers
-from json import dumps
-from typing import Dict, List, Union
+from time import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 from .._enum import TimeUnit
-from .._version import version
+from .._util import JSONCodec
+
+# Event members in serialization order, the time unit and custom properties follow.
+_EVENT_FIELDS = ("category", "host", "kind", "module", "timestamp", "type")
+_RESERVED_KEYS = frozenset(_EVENT_FIELDS + ("custom", "fields", "timeunit"))
+_TIMEUNIT_VALUES = {unit.name: unit.value for unit in TimeUnit}
+_TIMEUNIT_NAMES = {unit.value: unit.name.lower() for unit in TimeUnit}
+_STRIP_LIST = str.maketrans("", "", "'[]")
 
 
 class IngestPayload:  # pylint: disable=R0902
     """Class to represent a JSON formatted ingest payload."""
 
-    _host: str = "UNKNOWN"
-    _source: str = version(agent_string=True)
-    _sourcetype: str = "json-hec"
-    _kind: str = "event"
-    _module: str = "crowdstrike-falconpy-hec"
-    _type: List[str] = ["info"]
-    _category: List[str] = ["host"]
-    _timestamp: int = None
-    _timeunit: str = None
-    _custom: Dict[str, Union[str, int, dict, list]] = {}
-    _fields: Dict[str, Union[str, int, dict, list]] = {}
-
-    # pylint: disable=R0912,R0913
+    __slots__ = ("_host", "_kind", "_module", "_type", "_category",
+                 "_timestamp", "_timeunit", "_custom", "_fields"
+                 )
+
+    # pylint: disable=R0913
     def __init__(self,
                  host: str = None,
                  kind: str = None,
@@ -75,123 +71,152 @@ class IngestPayload:  # pylint: disable=R0902
                  **kwargs
                  ):
         """Create an instance of the class."""
-        if host:
-            self.host = host
-        if kind:
-            self.kind = kind
-        if module:
-            self.module = module
-        if event_type:
-            if isinstance(event_type, list):
-                self.type = event_type
-            else:
-                self.type.clear()
-                self.type.append(event_type)
-        if category:
-            if isinstance(category, list):
-                self.category = category
-            else:
-                self.category.clear()
-                self.category.append(category)
-        if timestamp:
-            self.timestamp = timestamp
+        self._host = host or "UNKNOWN"
+        self._kind = kind or "event"
+        self._module = module or "crowdstrike-falconpy-hec"
+        self._type = self.listed(event_type, "info")
+        self._category = self.listed(category, "host")
+        self._timestamp = timestamp or None
+        self._timeunit = None
         if timeunit:
             self.timeunit = timeunit
-        if custom:
-            self.custom = custom
-        else:
-            self.custom = {}
-        if fields:
-            self.fields = fields
+        self._custom = custom or {}
+        self._fields = fields or {}
         for provided_key, provided_value in kwargs.items():
-            if provided_key not in [key[0] for key in getmembers(self) if "_" not in key[0]]:
-                self.custom[provided_key] = provided_value
-
-    def to_json(self, raw: bool = False, nowrap: bool = False) -> Union[Dict[str, Union[str, int, dict, list]], str]:
-        """Convert the class to a JSON compliant dictionary or JSON string."""
-        returned = {}
-        items = [key[0] for key in getmembers(self) if "_" not in key[0]]
-        event = {
-            item_key: getattr(self, item_key)
-            for item_key in items if item_key not in ["fields", "custom", "timeunit"]
+            if provided_key not in _RESERVED_KEYS:
+                self._custom[provided_key] = provided_value
+
+    @classmethod
+    def from_records(cls,
+                     records: Iterable[Union[Dict[str, Any], "IngestPayload"]],
+                     timeunit: Optional[str] = None
+                     ) -> Iterator["IngestPayload"]:
+        """Create payloads from an iterable of dictionaries, yielding each payload as it is created.
+
+        Dictionary keys match the keywords accepted by the constructor, and the time unit is applied
+        to records that do not provide one. Existing payloads are yielded unchanged.
+        """
+        for record in records:
+            if isinstance(record, IngestPayload):
+                yield record
+            elif timeunit and "timeunit" not in record:
+                yield cls(**record, timeunit=timeunit)
+            else:
+                yield cls(**record)
+
+    @staticmethod
+    def listed(value: Union[str, List[str]], default: str) -> List[str]:
+        """Return the value as a new list, or a list containing the default when not provided."""
+        returned = [default]
+        if value:
+            returned = value if isinstance(value, list) else [value]
+
+        return returned
+
+    @staticmethod
+    def flatten(value: Any) -> str:
+        """Remove list formatting from the string representation of a value."""
+        return str(value).translate(_STRIP_LIST)
+
+    def event(self) -> Dict[str, Any]:
+        """Return the event dictionary, including the time unit and custom properties."""
+        returned = {
+            "category": self._category,
+            "host": self._host,
+            "kind": self._kind,
+            "module": self._module,
+            "timestamp": self.timestamp,
+            "type": self._type,
+            "timeunit": _TIMEUNIT_NAMES[self.timeunit]
         }
-        for unit in TimeUnit:
-            if unit.value == self.timeunit:
-                event["timeunit"] = unit.name.lower()
-        for key, value in self.custom.items():
-            event[key] = value
-
-        returned["event"] = event
-        if not raw:
-            # Raw payloads cannot specify the fields dictionary
-            if getattr(self, "fields"):
-                returned["fields"] = self.fields
+        returned.update(self._custom)
 
-        if nowrap:
-            returned = returned["event"]
+        return returned
+
+    def to_json(self,
+                raw: bool = False,
+                nowrap: bool = False,
+                codec: Optional[JSONCodec] = None
+                ) -> Union[Dict[str, Union[str, int, dict, list]], str]:
+        """Convert the class to a JSON compliant dictionary or JSON string.
+
+        Raw payloads are encoded using the provided codec, or the fastest available JSON library.
+        """
+        returned = self.event()
+        if not nowrap:
+            returned = {"event": returned}
+            if not raw and self._fields:
+                # Raw payloads cannot specify the fields dictionary
+                returned["fields"] = self._fields
 
         if raw:
             # Convert to a JSON string for raw payloads
-            returned = dumps(returned)
+            returned = JSONCodec.create(codec).dumps(returned).decode("utf-8")
 
         return returned
 
     def to_xml(self, raw: bool = False, nowrap: bool = False) -> str:
         """Convert the class to XML."""
-        returned = ""
-        fields = ""
-        start_items = [key[0] for key in getmembers(self) if "_" not in key[0]]
-        items = []
-        for item in start_items:
-            if item not in ["timeunit", "fields", "custom"]:
-                items.append(item)
-        for item in items:
-            text = re.sub(r"['\[\]]", "", str(getattr(self, item)))
-            returned = f"{returned}<{item}>{text}</{item}>"
-        for unit in TimeUnit:
-            if unit.value == self.timeunit:
-                returned = f"{returned}<timeunit>{unit.name.lower()}</timeunit>"
-        for key, value in self.custom.items():
-            text = re.sub(r"['\[\]]", "", str(value))
-            returned = f"{returned}<{key}>{text}</{key}>"
-        if not raw:
-            for key, value in self.fields.items():
-                text = re.sub(r"['\[\]]", "", str(value))
-                fields = f"<fields><{key}>{text}</{key}></field>"
+        returned = "".join(f"<{key}>{self.flatten(value)}</{key}>" for key, value in self.event().items())
         if not nowrap:
             returned = f"<event>{returned}</event>"
-            returned = f"{returned}{fields}"
+            if not raw and self._fields:
+                fields = "".join(f"<{key}>{self.flatten(value)}</{key}>" for key, value in self._fields.items())
+                returned = f"{returned}<fields>{fields}</fields>"
 
         return returned
 
     def to_csv(self) -> str:
         """Convert the class to CSV."""
         # CSV only provides raw content, and does not support event wrapping or additional fields.
-        start_items = [key[0] for key in getmembers(self) if "_" not in key[0]]
-        items = []
-        for item in start_items:
-            if item not in ["fields", "custom"]:
-                items.append(item)
-        returned = StringIO()
-        writer = DictWriter(returned, fieldnames=items)
-        row = {item: getattr(self, item) for item in items}
+        row = {
+            "category": self._category,
+            "host": self._host,
+            "kind": self._kind,
+            "module": self._module,
+            "timestamp": self.timestamp,
+            "timeunit": _TIMEUNIT_NAMES[self.timeunit],
+            "type": self._type
+        }
+        header = list(row)
         for key, value in row.items():
             if isinstance(value, list):
-                new_value = re.sub(r"['\[\]]", "", str(value)).replace(",", "~")
-                row[key] = new_value
-        for unit in TimeUnit:
-            if unit.value == self.timeunit:
-                row["timeunit"] = unit.name.lower()
-        for key, value in self.custom.items():
-            new_value = re.sub(r"['\[\]]", "", str(value)).replace(",", "~")
-            row[key] = new_value
-            items.append(key)
-
-        writer.writeheader()
-        writer.writerow(row)
+                row[key] = self.flatten(value).replace(",", "~")
+        for key, value in self._custom.items():
+            row[key] = self.flatten(value).replace(",", "~")
+            header.append(key)
+        returned = StringIO()
+        writer = csv_writer(returned)
+        writer.writerow(header)
+        writer.writerow([row[key] for key in header])
 
         return returned.getvalue()
 
+    def to_yaml(self,
+                raw: bool = False,
+                nowrap: bool = False,
+                codec: Optional[JSONCodec] = None
+                ) -> str:
+        """Convert the class to YAML.
+
+        Keys and values are written as JSON flow scalars and sequences, which are valid YAML.
+        """
+        dumps = JSONCodec.create(codec).dumps
+
+        def block(mapping: Dict[str, Any], indent: str) -> str:
+            return "".join(f"{indent}{dumps(str(key)).decode('utf-8')}: {dumps(value).decode('utf-8')}\n"
+                           for key, value in mapping.items()
+                           )
+
+        if nowrap:
+            returned = block(self.event(), "")
+        else:
+            returned = f"event:\n{block(self.event(), '  ')}"
+            if not raw and self._fields:
+                returned = f"{returned}fields:\n{block(self._fields, '  ')}"
+
+        return returned
+
     @property
     def host(self) -> str:
         """Return the host property."""
@@ -246,18 +271,18 @@ class IngestPayload:  # pylint: disable=R0902
     def timeunit(self) -> int:
         """Return the timestamp time unit."""
         if not self._timeunit:
-            self._timeunit = TimeUnit["NANOSECONDS"].value
+            self._timeunit = TimeUnit.NANOSECONDS.value
         return self._timeunit
 
     @timeunit.setter
     def timeunit(self, value: str):
-        self._timeunit = TimeUnit[value.upper()].value
+        self._timeunit = _TIMEUNIT_VALUES[value.upper()]
 
     @property
     def timestamp(self) -> int:
         """Return the timestamp property."""
         if not self._timestamp:
-            self._timestamp = int(datetime.now(timezone.utc).timestamp() * self.timeunit)
+            self._timestamp = int(time() * self.timeunit)
         return self._timestamp
 
     @timestamp.setter
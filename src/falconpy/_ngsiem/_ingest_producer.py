@@ -0,0 +1,286 @@
+"""HTTP Event Collector background producer.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from collections import deque
+from threading import Condition, Lock, Thread
+from time import monotonic
+from typing import Any, Dict, List, Optional, Union
+from ._ingest_batch import IngestBatch
+from ._ingest_payload import IngestPayload
+from ._ingest_spool import IngestSpool
+from .._constant import INGEST_CLOSE_TIMEOUT, MAX_INGEST_RETRY_DELAY
+
+
+class IngestProducer:  # pylint: disable=R0902
+    """This class sends queued events to the collector in batches using background sender threads.
+
+    Events are held within a bounded in-memory buffer. When a spill file is provided, events that
+    do not fit within the buffer, or that are queued while the collector is unavailable, are appended
+    to the spill file and sent once the collector recovers. Without a spill file, enqueue waits for
+    buffer space and events are held in memory while the collector is unavailable.
+    """
+
+    def __init__(self,
+                 collector: Any,
+                 max_events: int = 100_000,
+                 spill_path: Optional[str] = None,
+                 sender_count: int = 2
+                 ):
+        """Create the producer and start the sender threads."""
+        self._collector = collector
+        self._max_events = max(int(max_events), 1)
+        self._spool = IngestSpool(spill_path) if spill_path else None
+        self._queue = deque()
+        self._condition = Condition()
+        self._replaying = Lock()
+        self._in_flight = 0
+        self._flushing = 0
+        self._closing = False
+        self._failures = 0
+        self._retry_at = 0.0
+        self._counters = {"enqueued": 0, "sent": 0, "spilled": 0, "dropped": 0}
+        self._latency = [0.0, 0]
+        self._senders = [Thread(target=self._send_loop, name=f"hec-sender-{number}", daemon=True)
+                         for number in range(max(int(sender_count), 1))
+                         ]
+        for sender in self._senders:
+            sender.start()
+
+    def enqueue(self, event: Union[Dict[str, Any], IngestPayload]):
+        """Add an event to the buffer, spilling it to disk when the buffer is full or the collector is unavailable."""
+        with self._condition:
+            self._counters["enqueued"] += 1
+            spill = self._spool is not None and (len(self._queue) >= self._max_events or self.unavailable)
+            if not spill:
+                self._condition.wait_for(lambda: len(self._queue) < self._max_events or self._closing)
+                self._queue.append(event)
+                if len(self._queue) == 1 or len(self._queue) >= self._collector.batch_max_events:
+                    self._condition.notify_all()
+        if spill:
+            self._spill([self._collector.encode_event(event)])
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for buffered events to be sent, returning a boolean indicating if every event was sent.
+
+        When a timeout is provided, spilled events are waited for until they are sent or the timeout expires.
+        Without a timeout, the wait ends once remaining events are held in the spill file while the collector
+        is unavailable.
+        """
+        with self._condition:
+            self._flushing += 1
+            self._condition.notify_all()
+            try:
+                self._condition.wait_for(lambda: self._drained(timeout is None), timeout)
+            finally:
+                self._flushing -= 1
+
+            return not self._queue and not self._in_flight and not self.spill_bytes
+
+    def close(self, timeout: Optional[float] = INGEST_CLOSE_TIMEOUT) -> bool:
+        """Flush and stop the sender threads, spilling events that could not be sent.
+
+        Events are waited for until the timeout expires, or indefinitely when the timeout is None.
+        Failed requests are not retried once closing starts. Without a spill file, events that
+        could not be sent are dropped.
+
+        Returns a boolean indicating if every event was sent.
+        """
+        deadline = monotonic() + timeout if timeout is not None else None
+        returned = self.flush(timeout)
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        for sender in self._senders:
+            sender.join(max(deadline - monotonic(), 0) if deadline is not None else None)
+        with self._condition:
+            remaining = list(self._queue)
+            self._queue.clear()
+        if remaining:
+            if self._spool:
+                self._spill([self._encode(event) for event in remaining])
+            else:
+                self._counters["dropped"] += len(remaining)
+        if self._spool:
+            self._spool.close()
+
+        return returned
+
+    def _encode(self, event: Union[Dict[str, Any], IngestPayload, bytes]) -> bytes:
+        """Encode an event, events returned to the buffer after a failed request are already encoded."""
+        return event if isinstance(event, bytes) else self._collector.encode_event(event)
+
+    def _drained(self, spilled: bool = False) -> bool:
+        """Return a boolean indicating if there is nothing left to send, optionally accepting spilled events."""
+        return not self._queue and not self._in_flight and (not self.spill_bytes or (spilled and self.unavailable))
+
+    def _replayable(self) -> bool:
+        """Return a boolean indicating if spilled events should be sent."""
+        return bool(self.spill_bytes) and not self.unavailable and not self._replaying.locked()
+
+    def _take(self) -> Optional[List[Union[Dict[str, Any], IngestPayload]]]:
+        """Wait for events to send, returning an empty list when spilled events should be sent or None when closing."""
+        batch_max_events = self._collector.batch_max_events
+        with self._condition:
+            while not self._closing:
+                delay = self._retry_at - monotonic()
+                if self._queue and delay > 0 and not self._spool:
+                    # Hold events in memory until the collector is retried.
+                    self._condition.wait(delay)
+                elif self._queue:
+                    if delay <= 0 and not self._flushing and len(self._queue) < batch_max_events:
+                        # Wait for the batch to fill, up to the linger time.
+                        self._condition.wait_for(lambda: len(self._queue) >= batch_max_events
+                                                 or self._flushing or self._closing,
+                                                 self._collector.batch_max_linger
+                                                 )
+                        if not self._queue or self._closing:
+                            continue
+                    events = [self._queue.popleft() for _ in range(min(len(self._queue), batch_max_events))]
+                    self._in_flight += len(events)
+                    self._condition.notify_all()
+                    return events
+                elif self._replayable():
+                    return []
+                else:
+                    self._condition.wait(delay if delay > 0 else self._collector.batch_max_linger)
+
+        return None
+
+    def _send_loop(self):
+        """Send events from the buffer and the spill file until the producer is closed."""
+        while True:
+            events = self._take()
+            if events is None:
+                break
+            if events:
+                try:
+                    encoded = [self._encode(event) for event in events]
+                    if self._spool and self.unavailable:
+                        self._spill(encoded)
+                    else:
+                        self._deliver(encoded)
+                finally:
+                    with self._condition:
+                        self._in_flight -= len(events)
+                        self._condition.notify_all()
+            else:
+                self._replay()
+
+    def _deliver(self, encoded: List[bytes], spilled: bool = False) -> bool:
+        """Send encoded events in batches, returning a boolean indicating if every batch was accepted."""
+        batches = [IngestBatch()]
+        for line in encoded:
+            if not batches[-1].fits(line, self._collector.batch_max_bytes):
+                batches.append(IngestBatch(batches[-1].number + 1))
+            batches[-1].add(line)
+        for index, batch in enumerate(batches):
+            started = monotonic()
+            status = self._collector.send_batch(batch)
+            with self._condition:
+                self._latency[0] += monotonic() - started
+                self._latency[1] += 1
+                if status["status_code"] == 200:
+                    self._counters["sent"] += batch.count
+                    self._failures = 0
+                    continue
+                self._failures += 1
+                self._retry_at = monotonic() + min(2 ** self._failures, MAX_INGEST_RETRY_DELAY)
+            if not spilled:
+                undelivered = encoded[sum(previous.count for previous in batches[:index]):]
+                if self._spool:
+                    self._spill(undelivered)
+                else:
+                    with self._condition:
+                        if self._closing:
+                            # Requests are not retried once the producer is closing.
+                            self._counters["dropped"] += len(undelivered)
+                        else:
+                            # Return the events to the front of the buffer to be retried.
+                            self._queue.extendleft(reversed(undelivered))
+            return False
+
+        return True
+
+    def _replay(self):
+        """Send spilled events while the collector is available, one sender at a time."""
+        if self._replaying.acquire(blocking=False):  # pylint: disable=R1732
+            try:
+                while not self._closing and not self.unavailable and not self._queue:
+                    block = self._spool.read(self._collector.batch_max_bytes, self._collector.batch_max_events)
+                    if not block or not self._deliver(block.splitlines(), spilled=True):
+                        break
+                    self._spool.commit(len(block))
+                    with self._condition:
+                        self._condition.notify_all()
+            finally:
+                self._replaying.release()
+
+    def _spill(self, encoded: List[bytes]):
+        """Append encoded events to the spill file."""
+        self._spool.append(encoded)
+        with self._condition:
+            self._counters["spilled"] += len(encoded)
+            self._condition.notify_all()
+
+    @property
+    def unavailable(self) -> bool:
+        """Return a boolean indicating if the collector is waiting to be retried after a failed request."""
+        return monotonic() < self._retry_at
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of events within the in-memory buffer."""
+        return len(self._queue)
+
+    @property
+    def spill_bytes(self) -> int:
+        """Return the number of bytes within the spill file waiting to be sent."""
+        return self._spool.pending if self._spool else 0
+
+    @property
+    def send_latency(self) -> float:
+        """Return the average number of seconds taken to send a batch, including retries."""
+        return self._latency[0] / self._latency[1] if self._latency[1] else 0.0
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        """Return the number of events enqueued, sent, spilled and dropped when closed, with the producer statistics."""
+        return {**self._counters,
+                "queue_depth": self.queue_depth,
+                "spill_bytes": self.spill_bytes,
+                "send_latency": self.send_latency
+                }
@@ -0,0 +1,158 @@
+"""HTTP Event Collector spill file.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import os
+from threading import Lock
+from typing import List
+
+
+class IngestSpool:
+    """This class represents an append-only file of newline delimited events waiting to be sent.
+
+    Events are read from the start of the file and the file is truncated once every event has
+    been sent. The offset of the events already sent is recorded in a sidecar file (path.offset)
+    as they are committed, so content remaining from a previous session is sent first without
+    resending the events it had committed. Events that were read but not committed before an
+    interruption are sent again.
+    """
+
+    def __init__(self, path: str):
+        """Open the spill file for appending, resuming from the offset committed by a previous session."""
+        self._path = path
+        self._lock = Lock()
+        self._handle = open(path, "ab")  # pylint: disable=R1732
+        self._size = self._handle.tell()
+        self._offset = self._load_offset()
+
+    def append(self, lines: List[bytes]) -> int:
+        """Append encoded events to the file and return the number of bytes written."""
+        data = b"".join(line + b"\n" for line in lines)
+        with self._lock:
+            self._handle.write(data)
+            self._handle.flush()
+            self._size += len(data)
+
+        return len(data)
+
+    def read(self, max_bytes: int, max_lines: int) -> bytes:
+        """Read the next newline aligned block of events without removing them from the file.
+
+        Blocks are capped by size and event count, a single event larger than max_bytes is returned whole.
+        """
+        returned = b""
+        with self._lock:
+            if self._offset < self._size:
+                with open(self._path, "rb") as reader:
+                    reader.seek(self._offset)
+                    returned = reader.read(min(max_bytes, self._size - self._offset))
+                    while b"\n" not in returned and self._offset + len(returned) < self._size:
+                        returned += reader.read(max_bytes)
+        end = -1
+        for _ in range(max_lines):
+            position = returned.find(b"\n", end + 1)
+            if position == -1:
+                break
+            end = position
+        if end != -1:
+            returned = returned[:end + 1]
+
+        return returned
+
+    def commit(self, count: int):
+        """Mark bytes returned by read as sent, truncating the file when it has been fully sent."""
+        with self._lock:
+            self._offset += count
+            if self._offset >= self._size:
+                self._handle.seek(0)
+                self._handle.truncate()
+                self._offset = 0
+                self._size = 0
+                self._remove_offset()
+            else:
+                self._save_offset()
+
+    def close(self):
+        """Close the spill file, removing it when every event has been sent."""
+        with self._lock:
+            self._handle.close()
+            if self._offset >= self._size:
+                os.remove(self._path)
+                self._remove_offset()
+
+    def _load_offset(self) -> int:
+        """Return the offset committed by a previous session, or zero when there is none."""
+        returned = 0
+        try:
+            with open(self.offset_path, "rb") as reader:
+                returned = int(reader.read() or 0)
+        except (OSError, ValueError):
+            pass
+        if not 0 <= returned <= self._size:
+            # The spill file was truncated after the offset was saved.
+            returned = 0
+            self._remove_offset()
+
+        return returned
+
+    def _save_offset(self):
+        """Record the committed offset, replacing the previous record atomically."""
+        temporary = f"{self.offset_path}.tmp"
+        with open(temporary, "wb") as writer:
+            writer.write(str(self._offset).encode())
+        os.replace(temporary, self.offset_path)
+
+    def _remove_offset(self):
+        """Remove the committed offset record."""
+        try:
+            os.remove(self.offset_path)
+        except FileNotFoundError:
+            pass
+
+    @property
+    def path(self) -> str:
+        """Return the location of the spill file."""
+        return self._path
+
+    @property
+    def offset_path(self) -> str:
+        """Return the location of the file recording the committed offset."""
+        return f"{self._path}.offset"
+
+    @property
+    def pending(self) -> int:
+        """Return the number of bytes waiting to be sent."""
+        return self._size - self._offset
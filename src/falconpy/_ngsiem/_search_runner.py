@@ -0,0 +1,395 @@
+"""NGSIEM search runner.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from queue import Queue
+from threading import BoundedSemaphore, Event
+from time import monotonic
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
+from .._error import APIError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..ngsiem import NGSIEM
+
+# Status codes that are retried when polling a search
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class SearchJob:  # pylint: disable=R0902
+    """This class represents a single NGSIEM repository search managed by a SearchRunner.
+
+    The search is started when iteration begins and events are yielded as they arrive. The
+    search is always stopped when iteration ends, including when the caller stops early.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, runner: "SearchRunner", repository: str, **kwargs):
+        """Construct an instance of the SearchJob class.
+
+        Keyword arguments are provided to NGSIEM.start_search.
+        """
+        self._runner = runner
+        self._repository = repository
+        self._keywords = kwargs
+        self._cancelled = Event()
+        self._search_id: Optional[str] = None
+        self._metadata: Dict[str, Any] = {}
+        self._done = False
+        self._polls = 0
+        self._event_count = 0
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Start the search and yield events as they arrive."""
+        with self._runner.slot():
+            if self._cancelled.is_set():
+                return
+            self._start()
+            try:
+                yield from self._poll()
+            finally:
+                self.stop()
+
+    def cancel(self):
+        """Request that a running search stops at the next poll."""
+        self._cancelled.set()
+
+    def stop(self):
+        """Stop the search if it has been started."""
+        if self._search_id:
+            self._runner.service.stop_search(repository=self._repository,
+                                             search_id=self._search_id,
+                                             pythonic=False
+                                             )
+            self._search_id = None
+
+    def _start(self):
+        """Start the search and retrieve the search ID."""
+        result = self._runner.service.start_search(repository=self._repository, pythonic=False, **self._keywords)
+        body = result.get("body") or {}
+        if result["status_code"] not in (200, 201) or not body.get("id"):
+            errors = body.get("errors") or [{}]
+            raise APIError(code=result["status_code"],
+                           message=errors[0].get("message", "Unable to start the search."),
+                           headers=result.get("headers")
+                           )
+        self._search_id = body["id"]
+
+    def _status(self) -> Optional[Dict[str, Any]]:
+        """Retrieve the search status, returning None when a retryable error is received."""
+        self._polls += 1
+        result = self._runner.service.get_search_status(repository=self._repository,
+                                                        search_id=self._search_id,
+                                                        pythonic=False
+                                                        )
+        returned = None
+        if result["status_code"] == 200:
+            returned = result["body"]
+        elif result["status_code"] not in RETRY_STATUS_CODES:
+            errors = result.get("body", {}).get("errors") or [{}]
+            raise APIError(code=result["status_code"],
+                           message=errors[0].get("message", "Unable to retrieve the search status."),
+                           headers=result.get("headers")
+                           )
+
+        return returned
+
+    def _poll(self) -> Iterator[Dict[str, Any]]:
+        """Poll the search using adaptive intervals, yielding events that have not been yielded."""
+        seen = set()
+        started = monotonic()
+        interval = self._runner.min_interval
+        progress = None
+        failures = 0
+        while not self._cancelled.is_set():
+            status = self._status()
+            if status is None:
+                failures += 1
+                if failures > self._runner.retry_count:
+                    raise APIError(code=503, message="The search status could not be retrieved.")
+                interval = min(interval * self._runner.backoff, self._runner.max_interval)
+            else:
+                failures = 0
+                self._metadata = status.get("metaData") or {}
+                self._done = bool(status.get("done"))
+                new_events = []
+                if self._done or not self._metadata.get("isAggregate"):
+                    # Aggregate results are recalculated on every poll and are only returned when complete.
+                    new_events = self._new_events(status.get("events") or [], seen)
+                yield from new_events
+                if self._done:
+                    break
+                current = (self._metadata.get("workDone"), self._metadata.get("eventCount"))
+                interval = self._interval(interval, bool(new_events) or current != progress)
+                progress = current
+            if self._runner.timeout and monotonic() - started + interval > self._runner.timeout:
+                raise APIError(code=408, message="The search did not complete within the timeout.")
+            self._cancelled.wait(interval)
+
+    def _interval(self, interval: float, changed: bool) -> float:
+        """Return the next poll interval.
+
+        Progress returns the interval to the suggested poll delay, otherwise the interval backs off.
+        """
+        suggested = self._metadata.get("pollAfter")
+        returned = min(interval * self._runner.backoff, self._runner.max_interval)
+        if changed:
+            returned = suggested / 1000 if suggested else self._runner.min_interval
+        return max(self._runner.min_interval, min(returned, self._runner.max_interval))
+
+    def _new_events(self, events: List[Dict[str, Any]], seen: set) -> List[Dict[str, Any]]:
+        """Return events that have not been yielded, identified by event ID or position.
+
+        Events without an @id are identified by their position, which assumes every status
+        response returns the events found so far in the order they were first returned.
+        """
+        returned = []
+        for position, event in enumerate(events):
+            key = event.get("@id", position)
+            if key not in seen:
+                seen.add(key)
+                returned.append(event)
+        self._event_count += len(returned)
+
+        return returned
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def repository(self) -> str:
+        """Return the repository searched."""
+        return self._repository
+
+    @property
+    def search_id(self) -> Optional[str]:
+        """Return the ID of the running search."""
+        return self._search_id
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Return the metadata from the last search status."""
+        return self._metadata
+
+    @property
+    def done(self) -> bool:
+        """Return a boolean indicating if the search has completed."""
+        return self._done
+
+    @property
+    def polls(self) -> int:
+        """Return the number of status requests made."""
+        return self._polls
+
+    @property
+    def event_count(self) -> int:
+        """Return the number of events yielded."""
+        return self._event_count
+
+
+class SearchRunner:  # pylint: disable=R0902
+    """This class runs NGSIEM repository searches, polling each search and streaming new events.
+
+    Searches are polled using intervals driven by the progress reported by the search and back off
+    while a search is not progressing. Each status request returns every event found so far, and
+    only events that have not already been yielded are returned. Events are identified by their
+    @id, or by their position within the results (which assumes results are returned in a
+    consistent order) when an @id is not provided. Running searches are limited by a
+    concurrency cap shared by every search started from the runner, and searches are always stopped.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 service: Optional["NGSIEM"] = None,
+                 max_concurrent: int = 4,
+                 min_interval: float = 0.25,
+                 max_interval: float = 5.0,
+                 backoff: float = 1.5,
+                 timeout: Optional[float] = None,
+                 retry_count: int = 3,
+                 **kwargs
+                 ):
+        """Construct an instance of the SearchRunner class.
+
+        Keyword arguments
+        ----
+        service : NGSIEM
+            NGSIEM Service Class used to run searches. When not provided, one is created
+            using any remaining keywords (client_id, client_secret, etc.).
+        max_concurrent : int
+            Maximum number of searches running at the same time. Defaults to 4.
+        min_interval : float
+            Minimum number of seconds between status requests. Defaults to 0.25.
+        max_interval : float
+            Maximum number of seconds between status requests. Defaults to 5.
+        backoff : float
+            Multiplier applied to the interval while a search is not progressing. Defaults to 1.5.
+        timeout : float
+            Maximum number of seconds a search may run. Defaults to None (no limit).
+        retry_count : int
+            Number of consecutive rate limit or server errors tolerated when polling. Defaults to 3.
+        """
+        if service is None:
+            from ..ngsiem import NGSIEM  # pylint: disable=C0415
+            service = NGSIEM(**kwargs)
+        self._service = service
+        self._max_concurrent = max(int(max_concurrent), 1)
+        self._slots = BoundedSemaphore(self._max_concurrent)
+        self._min_interval = float(min_interval)
+        self._max_interval = max(float(max_interval), self._min_interval)
+        self._backoff = max(float(backoff), 1.0)
+        self._timeout = timeout
+        self._retry_count = retry_count
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def search(self, repository: str, **kwargs) -> SearchJob:
+        """Create a search, started when iterated, that yields events as they arrive.
+
+        Keyword arguments are provided to NGSIEM.start_search (query_string, start, end, etc.).
+        """
+        return SearchJob(self, repository, **kwargs)
+
+    def run(self,
+            searches: Union[Dict[str, Dict[str, Any]], Iterable[Dict[str, Any]]]
+            ) -> Iterator[Tuple[Union[str, int], Dict[str, Any]]]:
+        """Run searches concurrently, yielding a tuple of the search name and event as events arrive.
+
+        Searches are provided as a dictionary of search keywords by name, or a list of search keywords
+        named by position. Each search requires a repository keyword. Remaining searches are stopped
+        when iteration ends or a search fails.
+        """
+        named = searches.items() if isinstance(searches, dict) else enumerate(searches)
+        jobs = {name: self.search(**keywords) for name, keywords in named}
+        results: "Queue[Tuple[Union[str, int], Any]]" = Queue()
+        finished = object()
+
+        def consume(name: Union[str, int], job: SearchJob):
+            try:
+                for event in job:
+                    results.put((name, event))
+            except Exception as error:  # pylint: disable=W0718
+                results.put((name, error))
+            finally:
+                results.put((name, finished))
+
+        with ThreadPoolExecutor(max_workers=self._max_concurrent, thread_name_prefix="search") as executor:
+            for name, job in jobs.items():
+                executor.submit(consume, name, job)
+            remaining = len(jobs)
+            try:
+                while remaining:
+                    name, item = results.get()
+                    if item is finished:
+                        remaining -= 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield name, item
+            finally:
+                for job in jobs.values():
+                    job.cancel()
+
+    def collect(self,
+                searches: Union[Dict[str, Dict[str, Any]], Iterable[Dict[str, Any]]]
+                ) -> Dict[Union[str, int], List[Dict[str, Any]]]:
+        """Run searches concurrently and return the events found by each search by name."""
+        named = searches.items() if isinstance(searches, dict) else enumerate(searches)
+        searches = dict(named)
+        returned = {name: [] for name in searches}
+        for name, event in self.run(searches):
+            returned[name].append(event)
+
+        return returned
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one of the running search slots."""
+        with self._slots:
+            yield
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def service(self) -> "NGSIEM":
+        """Return the NGSIEM Service Class used to run searches."""
+        return self._service
+
+    @property
+    def max_concurrent(self) -> int:
+        """Return the maximum number of searches running at the same time."""
+        return self._max_concurrent
+
+    @property
+    def min_interval(self) -> float:
+        """Return the minimum number of seconds between status requests."""
+        return self._min_interval
+
+    @property
+    def max_interval(self) -> float:
+        """Return the maximum number of seconds between status requests."""
+        return self._max_interval
+
+    @property
+    def backoff(self) -> float:
+        """Return the multiplier applied to the interval while a search is not progressing."""
+        return self._backoff
+
+    @property
+    def timeout(self) -> Optional[float]:
+        """Return the maximum number of seconds a search may run."""
+        return self._timeout
+
+    @property
+    def retry_count(self) -> int:
+        """Return the number of consecutive retryable errors tolerated when polling."""
+        return self._retry_count
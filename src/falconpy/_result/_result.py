@@ -35,16 +35,27 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-from typing import Dict, Union, Optional, List, Tuple
+from typing import Any, Dict, Union, Optional, List, Tuple
 from requests.structures import CaseInsensitiveDict
 from ._meta import Meta
 from ._errors import Errors
 from ._headers import Headers
 from ._resources import Resources, BinaryFile, RawBody, ResponseComponent
 
+# Bodies containing any of these keys are not standard API responses and are returned as received.
+_RAW_BODY_KEYS = ("access_token", "batch_id", "combined", "data")
+
 
 class BaseResult:
-    """Base class for all result objects."""
+    """Base class for all result objects.
+
+    Response components (headers, meta, resources, errors and raw) are created
+    from the received headers and body the first time they are accessed.
+    """
+
+    __slots__ = ("_pos", "status_code", "_received", "_parsed", "_headers", "_meta", "_resources",
+                 "_errors", "_raw", "_batch_id", "_batch_get_cmd_req_id"
+                 )
 
     # _______ _______ _______ _     _  _____  ______  _______
     # |  |  | |______    |    |_____| |     | |     \ |______
@@ -60,21 +71,31 @@ class BaseResult:
 
         # Configure defaults
         self.status_code = status_code  # Will default to 0
-        self.headers = Headers()
-        self.meta = Meta()
-        self.resources = Resources([])
-        self.errors = Errors()
-        self.raw = RawBody()
-        # RTR Batch session init and batch responses only
-        self.batch_id = None
-        self.batch_get_cmd_req_id = None
+        # The received headers and body are retained until the response components are requested.
+        self._received: Optional[Tuple[Dict[str, Union[str, int, float]], Any]] = None
+        self._parsed: bool = False
 
         if status_code and headers and body:
-            self.status_code = status_code
-            _headers = headers
+            self._received = (headers, body)
+
+    def _parse(self):
+        """Create the response components from the received headers and body."""
+        self._parsed = True
+        self._headers = Headers()
+        self._meta = Meta()
+        self._resources = Resources([])
+        self._errors = Errors()
+        self._raw = RawBody()
+        # RTR Batch session init and batch responses only
+        self._batch_id = None
+        self._batch_get_cmd_req_id = None
+
+        if self._received:
+            _headers, body = self._received
+            self._received = None
             if isinstance(_headers, CaseInsensitiveDict):
-                _headers = dict(headers)
-            self.headers = Headers(_headers)
+                _headers = dict(_headers)
+            self._headers = Headers(_headers)
             self._parse_body(body_rcv=body)
 
     def _parse_body(self, body_rcv: Dict[str, Union[str, dict, list, int, float, bytes]]):
@@ -214,6 +235,105 @@ class BaseResult:
             "body": _body
         })
 
+    # Response components are created when first accessed and can be replaced once created.
+    @property
+    def headers(self) -> Headers:
+        """Return the headers component."""
+        if not self._parsed:
+            self._parse()
+        return self._headers
+
+    @headers.setter
+    def headers(self, value: Headers):
+        """Replace the headers component."""
+        if not self._parsed:
+            self._parse()
+        self._headers = value
+
+    @property
+    def meta(self) -> Meta:
+        """Return the meta component."""
+        if not self._parsed:
+            self._parse()
+        return self._meta
+
+    @meta.setter
+    def meta(self, value: Meta):
+        """Replace the meta component."""
+        if not self._parsed:
+            self._parse()
+        self._meta = value
+
+    @property
+    def resources(self) -> Union[Resources, BinaryFile, ResponseComponent]:
+        """Return the resources component."""
+        if not self._parsed:
+            self._parse()
+        return self._resources
+
+    @resources.setter
+    def resources(self, value: Union[Resources, BinaryFile, ResponseComponent]):
+        """Replace the resources component."""
+        if not self._parsed:
+            self._parse()
+        self._resources = value
+
+    @property
+    def errors(self) -> Errors:
+        """Return the errors component."""
+        if not self._parsed:
+            self._parse()
+        return self._errors
+
+    @errors.setter
+    def errors(self, value: Errors):
+        """Replace the errors component."""
+        if not self._parsed:
+            self._parse()
+        self._errors = value
+
+    @property
+    def raw(self) -> RawBody:
+        """Return the raw body component."""
+        if not self._parsed:
+            self._parse()
+        return self._raw
+
+    @raw.setter
+    def raw(self, value: RawBody):
+        """Replace the raw body component."""
+        if not self._parsed:
+            self._parse()
+        self._raw = value
+
+    @property
+    def batch_id(self) -> Optional[str]:
+        """Return the RTR batch ID."""
+        if not self._parsed:
+            self._parse()
+        return self._batch_id
+
+    @batch_id.setter
+    def batch_id(self, value: Optional[str]):
+        """Set the RTR batch ID."""
+        if not self._parsed:
+            self._parse()
+        self._batch_id = value
+
+    @property
+    def batch_get_cmd_req_id(self) -> Optional[str]:
+        """Return the RTR batch get command request ID."""
+        if not self._parsed:
+            self._parse()
+        return self._batch_get_cmd_req_id
+
+    @batch_get_cmd_req_id.setter
+    def batch_get_cmd_req_id(self, value: Optional[str]):
+        """Set the RTR batch get command request ID."""
+        if not self._parsed:
+            self._parse()
+        self._batch_get_cmd_req_id = value
+
     @property
     def data(self) -> list:
         """Return the contents of the data property from the underlying Resources object."""
@@ -223,6 +343,8 @@ class BaseResult:
 class Result(BaseResult):
     """CrowdStrike API response representation class."""
 
+    __slots__ = ()
+
     def __init__(self,
                  status_code: Optional[int] = None,
                  headers: Optional[Dict[str, str]] = None,
@@ -407,6 +529,9 @@ class Result(BaseResult):
 
         Used by internal methods for returning contents back to the user.
         """
+        if not self._parsed and self._received and isinstance(self._received[1], dict):
+            # Create the dictionary directly from the received body without creating response components.
+            return self._received_dictionary()
         if not self.binary:
             _body = self.raw.data if self.raw else {}
             _headers = {}
@@ -439,3 +564,32 @@ class Result(BaseResult):
             _returned = bytes(self.resources)
 
         return _returned
+
+    def _received_dictionary(self) -> dict:
+        """Return the full dictionary representation of a received JSON body.
+
+        Resource and error lists are provided as received, they are not copied.
+        """
+        _headers, body = self._received
+        _resources = body.get("resources", None)
+        if any(body.get(key, None) for key in _RAW_BODY_KEYS) or _resources is None or isinstance(_resources, dict):
+            # Authentication, RTR batch, GraphQL and other raw payloads are returned as received.
+            _body = dict(body)
+        else:
+            _meta = body.get("meta", {})
+            _errors = body.get("errors", [])
+            _resources = _resources if isinstance(_resources, list) else []
+            _errors = _errors if isinstance(_errors, list) else []
+            _body = {}
+            if _meta or _resources or _errors:
+                _body = {
+                    "meta": dict(_meta) if _meta else {},
+                    "resources": _resources,
+                    "errors": _errors
+                }
+
+        return {
+            "status_code": int(self.status_code),
+            "headers": dict(_headers),
+            "body": _body
+        }
@@ -37,5 +37,6 @@ For more information, please refer to <https://unlicense.org>
 """
 from ._base_service_class import BaseServiceClass
 from ._service_class import ServiceClass
+from ._async_service_class import AsyncServiceClass, async_service_class
 
-__all__ = ["BaseServiceClass", "ServiceClass"]
+__all__ = ["BaseServiceClass", "ServiceClass", "AsyncServiceClass", "async_service_class"]
@@ -0,0 +1,203 @@
+"""Asynchronous Service Class base class.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import functools
+import inspect
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Type, Union
+from ._service_class import ServiceClass
+from .._auth_object import AsyncFalconInterface, FalconInterface
+from .._util import async_paginate, async_hydrate, entity_chunk_size, entity_ids_keyword, service_override_payload
+
+
+class AsyncServiceClass(ServiceClass):
+    """This is the Falconpy asynchronous Service Class base class.
+
+    Asynchronous Service Classes use an AsyncFalconInterface as their auth_object by default.
+    Every API operation returns an awaitable, allowing many requests to be in flight on a
+    single event loop. Asynchronous versions of any Service Class can be created using
+    the async_service_class function, or imported directly (e.g. AsyncHosts).
+
+    Upload files are streamed from their source when the request is performed. Downloads
+    requested using download_to are received completely before they are written, so large
+    files should be downloaded using the synchronous Service Class, which streams and resumes.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self: "AsyncServiceClass",
+                 auth_object: Optional[FalconInterface] = None,
+                 default_auth_object_class: Optional[Type[FalconInterface]] = AsyncFalconInterface,
+                 **kwargs
+                 ):
+        """Asynchronous Service Class base constructor.
+
+        Accepts the same keywords as ServiceClass. Authentication is performed when
+        the first request is awaited.
+        """
+        super().__init__(auth_object=auth_object,
+                         default_auth_object_class=default_auth_object_class,
+                         **kwargs
+                         )
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    async def login(self) -> dict:  # pylint: disable=W0236
+        """Login to the CrowdStrike API by requesting a new token."""
+        return await awaitable_result(self.auth_object.login())
+
+    async def logout(self) -> dict:  # pylint: disable=W0236
+        """Logout from the CrowdStrike API by revoking the current token."""
+        return await awaitable_result(self.auth_object.logout())
+
+    # pylint: disable=W0236
+    async def override(self,
+                       method: str,
+                       route: str,
+                       parameters: dict = None,
+                       body: dict = None,
+                       data: Union[dict, bytes] = None,
+                       files: list = None,
+                       expand_result: bool = False
+                       ) -> Any:
+        """Allow any asynchronous Service Class to make requests to manually specified routes."""
+        if self.log:
+            # Log the operation we're performing if enabled.
+            self.log.debug("OPERATION: %s", "Manual")
+        keywords = service_override_payload(caller=self,
+                                            meth=method,
+                                            rte=route,
+                                            body_p=body,
+                                            param_p=parameters,
+                                            file_p=files,
+                                            data_p=data,
+                                            exp=expand_result
+                                            )
+        if self.asynchronous:
+            returned = await self.auth_object.request(**keywords)
+        else:
+            returned = super().override(method, route, parameters, body, data, files, expand_result)
+
+        return returned
+
+    def paginate(self, operation: str, prefetch: bool = False, **kwargs) -> AsyncIterator[Any]:
+        """Iterate asynchronously through every page of results returned by a query operation.
+
+        Accepts the same arguments as ServiceClass.paginate. Use with async for.
+        """
+        return async_paginate(self._operation_method(operation), self._operation_details(operation), kwargs, prefetch)
+
+    def hydrate(self,
+                query_operation: str,
+                entity_operation: str,
+                chunk_size: Optional[int] = None,
+                max_workers: int = 4,
+                entity_keywords: Optional[Dict[str, Any]] = None,
+                ids_keyword: Optional[str] = None,
+                **kwargs
+                ) -> AsyncIterator[Any]:
+        """Retrieve the entities for every ID returned by a query operation asynchronously.
+
+        Accepts the same arguments as ServiceClass.hydrate. Use with async for.
+        """
+        entity_method = self._operation_method(entity_operation)
+        if not chunk_size or not ids_keyword:
+            operation_id = self._operation_id(entity_operation)
+            chunk_size = chunk_size if chunk_size else entity_chunk_size(operation_id)
+            ids_keyword = ids_keyword if ids_keyword else entity_ids_keyword(operation_id)
+
+        return async_hydrate(self.paginate(query_operation, prefetch=True, **kwargs),
+                             entity_method, chunk_size, max_workers, entity_keywords, ids_keyword
+                             )
+
+    async def __aenter__(self):
+        """Allow for entry as an asynchronous context manager."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Discard our token when we exit the context."""
+        await self.logout()
+
+
+async def awaitable_result(result: Any) -> Any:
+    """Await the result provided if necessary and return it."""
+    if inspect.isawaitable(result):
+        result = await result
+
+    return result
+
+
+def awaitable_operation(method: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+    """Wrap a Service Class operation so it may always be awaited.
+
+    Operations return an awaitable when performed by an asynchronous interface, but may
+    return a result directly (such as a validation failure) without performing a request.
+    """
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        return await awaitable_result(method(*args, **kwargs))
+
+    return wrapper
+
+
+_ASYNC_CLASSES: Dict[Type[ServiceClass], Type[AsyncServiceClass]] = {}
+
+
+def async_service_class(service_class: Type[ServiceClass]) -> Type[AsyncServiceClass]:
+    """Return the asynchronous version of the provided Service Class.
+
+    Every public operation defined by the Service Class (including aliases) is
+    wrapped so that it returns an awaitable.
+    """
+    returned = _ASYNC_CLASSES.get(service_class)
+    if returned is None:
+        wrapped: Dict[Callable[..., Any], Callable[..., Awaitable[Any]]] = {}
+        namespace = {"__doc__": f"Asynchronous version of the {service_class.__name__} Service Class.",
+                     "__module__": __name__
+                     }
+        for parent in reversed(service_class.__mro__[:service_class.__mro__.index(ServiceClass)]):
+            for name, member in vars(parent).items():
+                if not name.startswith("_") and inspect.isfunction(member):
+                    # Aliases share the same wrapper as the operation they point to.
+                    namespace[name] = wrapped.setdefault(member, awaitable_operation(member))
+        returned = type(f"Async{service_class.__name__}", (AsyncServiceClass, service_class), namespace)
+        _ASYNC_CLASSES[service_class] = returned
+
+    return returned
@@ -40,8 +40,16 @@ from abc import ABC, abstractmethod
 from logging import Logger, getLogger
 from typing import Dict, Type, Union, Optional
 from .._constant import MAX_DEBUG_RECORDS
-from .._auth_object import FalconInterface, UberInterface
+from .._auth_object import (
+    ConnectionPool,
+    FalconInterface,
+    RateLimitBucket,
+    RequestCoalescerScope,
+    ResponseCacheScope,
+    UberInterface
+    )
 from .._error import FunctionalityNotImplemented
+from .._util import JSONCodec
 
 
 class BaseServiceClass(ABC):
@@ -241,6 +249,68 @@ class BaseServiceClass(ABC):
     def user_agent(self, _):
         raise FunctionalityNotImplemented
 
+    @property
+    def connection_pool(self) -> Optional[ConnectionPool]:
+        """Provide the pooled HTTP session from the auth_object."""
+        try:
+            _returned = self.auth_object.connection_pool
+        except AttributeError:
+            # Custom authentication objects may not provide connection pooling.
+            _returned = None
+
+        return _returned
+
+    @property
+    def json_codec(self) -> Optional[JSONCodec]:
+        """Provide the JSON codec from the auth_object."""
+        try:
+            _returned = self.auth_object.json_codec
+        except AttributeError:
+            # Custom authentication objects use the default codec.
+            _returned = None
+
+        return _returned
+
+    @property
+    def asynchronous(self) -> bool:
+        """Provide the asynchronous request status from the auth_object."""
+        try:
+            _returned = self.auth_object.asynchronous
+        except AttributeError:
+            _returned = False
+
+        return _returned
+
+    @property
+    def rate_limit(self) -> Optional[RateLimitBucket]:
+        """Provide the rate limit budget from the auth_object."""
+        try:
+            _returned = self.auth_object.rate_limit
+        except AttributeError:
+            _returned = None
+
+        return _returned
+
+    @property
+    def cache_scope(self) -> Optional[ResponseCacheScope]:
+        """Provide the response cache scope from the auth_object."""
+        try:
+            _returned = self.auth_object.cache_scope
+        except AttributeError:
+            _returned = None
+
+        return _returned
+
+    @property
+    def coalescer_scope(self) -> Optional[RequestCoalescerScope]:
+        """Provide the request coalescing scope from the auth_object."""
+        try:
+            _returned = self.auth_object.coalescer_scope
+        except AttributeError:
+            _returned = None
+
+        return _returned
+
     # Mutable
     @property
     def debug_record_count(self) -> int:
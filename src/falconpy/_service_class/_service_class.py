@@ -35,10 +35,13 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-from typing import Dict, Type, Optional, Union
+from typing import Any, Dict, Iterator, Type, Optional, Union
 from ._base_service_class import BaseServiceClass
 from .._auth_object import FalconInterface
 from .._util import log_class_startup, perform_request, service_override_payload, deprecated_class
+from .._util import Operation, resolve_operation, paginate, hydrate, entity_chunk_size, entity_ids_keyword
+from .._error import InvalidOperation
+from .. import _endpoint
 from ..oauth2 import OAuth2
 from .._result import Result
 from .._endpoint import class_deprecation_mapping
@@ -122,6 +125,24 @@ class ServiceClass(BaseServiceClass):
             Amount of time (in seconds) between now and the token expiration before
             a refresh of the token is performed. Default: 120, Max: 1200
             Values over 1200 will be reset to the maximum.
+        connection_pool : ConnectionPool or dict
+            Pooled HTTP session shared by all requests made with this object, or
+            a dictionary of pool settings used to create one.
+        rate_limit : RateLimiter, dict or bool
+            Enables rate limit aware pacing and retries of throttled requests. Disabled by default.
+        background_refresh : bool
+            Refresh the token in a background thread before it becomes stale. Disabled by default.
+        token_store : TokenStore, str or bool
+            Shares tokens with other processes using the same credentials. Disabled by default.
+        json_codec : JSONCodec or str
+            JSON library used to encode request bodies and decode responses.
+            Defaults to the fastest installed library.
+        response_cache : ResponseCache, dict or bool
+            Caches responses to idempotent operations. Disabled by default.
+        request_coalescer : RequestCoalescer, dict or bool
+            Shares identical in-flight idempotent requests between threads. Disabled by default.
+        revoke_on_logout : bool
+            Revoke tokens shared through the token store when logging out. Disabled by default.
 
         Arguments
         ----
@@ -171,8 +192,9 @@ class ServiceClass(BaseServiceClass):
                 setattr(self, f"_override_{item}", kwargs.get(item))
 
         # Service Classes automatically log themselves in upon instantiation
-        # if no authentication status is present.
-        if not self.token_status:
+        # if no authentication status is present. Asynchronous interfaces
+        # authenticate when their first request is awaited.
+        if not self.token_status and not self.asynchronous:
             self.login()
 
         # Detect if object authentication is being used to instantiate this class.
@@ -235,6 +257,102 @@ class ServiceClass(BaseServiceClass):
                                                           exp=expand_result
                                                           ))
 
+    def paginate(self, operation: str, prefetch: bool = False, **kwargs) -> Iterator[Any]:
+        """Iterate through every page of results returned by a query operation.
+
+        Pages are requested as they are consumed. The pagination style (offset, after or
+        next_token) is determined from the operation parameters and the pagination
+        metadata returned by the API. Iteration ends when all results have been received
+        or a request fails. The failed response is returned as the final page.
+
+        Keyword arguments
+        ----
+        operation : str
+            Operation ID or method name of the query to perform. (Example: QueryDevicesByFilterScroll)
+        prefetch : bool
+            Request the next page in the background while the current page is processed.
+        All other keywords are provided to the operation for every page.
+
+        Returns
+        ----
+        generator
+            Generator yielding the response received for each page.
+        """
+        return paginate(self._operation_method(operation), self._operation_details(operation), kwargs, prefetch)
+
+    def hydrate(self,
+                query_operation: str,
+                entity_operation: str,
+                chunk_size: Optional[int] = None,
+                max_workers: int = 4,
+                entity_keywords: Optional[Dict[str, Any]] = None,
+                ids_keyword: Optional[str] = None,
+                **kwargs
+                ) -> Iterator[Any]:
+        """Retrieve the entities for every ID returned by a query operation.
+
+        ID pages are retrieved from the query operation and split into chunks, which are
+        provided to the entity operation by a pool of worker threads while the next ID page
+        is retrieved. Entities are yielded in the order the IDs were received.
+        Raises APIError when a request fails. Raises InvalidOperation when the entity
+        operation is a method name that does not resolve to a single operation ID,
+        unless chunk_size and ids_keyword are provided.
+
+        Keyword arguments
+        ----
+        query_operation : str
+            Operation ID or method name of the query. (Example: QueryDevicesByFilterScroll)
+        entity_operation : str
+            Operation ID or method name used to retrieve entities by ID. (Example: PostDeviceDetailsV2)
+        chunk_size : int
+            Number of IDs provided to each entity request. Defaults to the maximum
+            accepted by the entity operation, or 100 when the maximum is not known.
+        max_workers : int
+            Maximum number of concurrent entity requests. Defaults to 4.
+        entity_keywords : dict
+            Additional keywords provided to every entity request.
+        ids_keyword : str
+            Keyword used to provide the IDs to the entity operation. Defaults to the
+            keyword accepted by the entity operation. (Example: composite_ids)
+        All other keywords are provided to the query operation for every page.
+
+        Returns
+        ----
+        generator
+            Generator yielding each entity retrieved.
+        """
+        entity_method = self._operation_method(entity_operation)
+        if not chunk_size or not ids_keyword:
+            operation_id = self._operation_id(entity_operation)
+            chunk_size = chunk_size if chunk_size else entity_chunk_size(operation_id)
+            ids_keyword = ids_keyword if ids_keyword else entity_ids_keyword(operation_id)
+
+        return hydrate(self.paginate(query_operation, prefetch=True, **kwargs),
+                       entity_method, chunk_size, max_workers, entity_keywords, ids_keyword
+                       )
+
+    def _operation_method(self, operation: str) -> Any:
+        """Return the method for the operation specified, raising InvalidOperation if it does not exist."""
+        returned = getattr(self, operation, None) if not operation.startswith("_") else None
+        if not callable(returned):
+            raise InvalidOperation
+
+        return returned
+
+    def _operation_details(self, operation: str) -> Optional[Operation]:
+        """Return the indexed details for an operation ID or the method that performs it."""
+        return resolve_operation(_endpoint.api_endpoints, operation, self)
+
+    def _operation_id(self, operation: str) -> str:
+        """Return the operation ID for an operation ID or method name, raising InvalidOperation if it can not be resolved."""
+        returned = self._operation_details(operation)
+        if not returned:
+            raise InvalidOperation(message=f"Unable to resolve {operation} to a single operation ID, "
+                                           "provide the operation ID instead."
+                                   )
+
+        return returned.operation_id
+
     def __enter__(self):
         """Allow for entry as a context manager."""
         return self
@@ -62,6 +62,13 @@ from ._functions import (
     _ALLOWED_METHODS
 )
 from ._service import service_override_payload
+from ._codec import JSONCodec, json_library
+from ._download import DownloadTarget, download_response, download_digest
+from ._upload import MultipartEncoder, UploadSource, upload_payloads
+from ._async import async_perform_request
+from ._index import Operation, operation_index, find_operation, resolve_operation
+from ._paginate import Paginator, paginate, async_paginate
+from ._hydrate import hydrate, async_hydrate, entity_chunk_size, entity_ids_keyword
 from ._uber import (
     create_uber_header_payload,
     handle_body_payload_ids,
@@ -79,5 +86,9 @@ __all__ = ["create_uber_header_payload", "handle_body_payload_ids", "scrub_targe
            "_ALLOWED_METHODS", "login_payloads", "logout_payloads", "sanitize_dictionary",
            "calc_content_return", "log_class_startup", "service_override_payload",
            "deprecated_operation", "deprecated_class", "review_provided_credentials",
-           "params_to_keywords"
+           "params_to_keywords", "async_perform_request", "Operation", "operation_index",
+           "find_operation", "resolve_operation", "Paginator", "paginate", "async_paginate",
+           "hydrate", "async_hydrate", "entity_chunk_size", "entity_ids_keyword", "JSONCodec", "json_library",
+           "DownloadTarget", "download_response", "download_digest", "MultipartEncoder",
+           "UploadSource", "upload_payloads"
            ]
@@ -0,0 +1,176 @@
+"""Internal asynchronous request functions.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from __future__ import annotations
+import os
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+from ._functions import api_redirects, body_payloads, log_api_payloads, prepare_request, process_response
+from ._download import download_response
+from ._upload import UploadSource
+from .._api_request import APIRequest
+from .._error import APIError, NoContentWarning, SDKError
+from .._result import Result
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .._auth_object import AsyncFalconInterface
+
+
+def async_perform_request(endpoint: str = "",
+                          headers: dict = None,
+                          interface: AsyncFalconInterface = None,
+                          **kwargs
+                          ) -> Awaitable[Union[Dict[str, Union[int, dict, list]], bytes, Result]]:
+    """Prepare the requested CrowdStrike OAuth2 API operation and return an awaitable that performs it.
+
+    Accepts the same keywords as perform_request. The request is prepared immediately,
+    and upload files are streamed when the returned awaitable is performed, so file objects
+    must remain open until the request completes. Downloads are received completely before
+    they are written to the download destination.
+
+    Keyword arguments:
+    interface: AsyncFalconInterface - Asynchronous interface used to authenticate and perform the request.
+    """
+    pythonic = kwargs.get("pythonic", False)
+    headers = headers if headers is not None else {}
+    try:
+        api, returned = prepare_request(endpoint, headers, kwargs)
+        if api.perform:
+            # Upload files are streamed from their source when the request is performed.
+            files = upload_files(api.files)
+            returned = _perform(interface, api, headers, files, pythonic)
+        else:
+            returned = _completed(returned)
+    except SDKError as bad_request:
+        returned = _completed(bad_request.result)
+
+    return returned
+
+
+async def _completed(result: Any) -> Any:
+    """Return an already available result as an awaitable."""
+    return result
+
+
+async def _perform(interface: AsyncFalconInterface,
+                   api: APIRequest,
+                   headers: Dict[str, str],
+                   files: Optional[List[Tuple[str, Tuple[str, Union[bytes, UploadSource], Optional[str]]]]],
+                   pythonic: bool
+                   ) -> Union[Dict[str, Union[int, dict, list]], bytes, Result]:
+    """Perform the prepared request."""
+    try:
+        if headers.get("Authorization", "").startswith("Bearer") and interface.refreshable:
+            # Tokens are refreshed here instead of when the request headers were created.
+            headers.update(await interface.async_auth_headers())
+        # Log our payloads if debugging is enabled
+        log_api_payloads(api, headers)
+        request_args = {
+            "headers": headers,
+            "params": api.param_payload,
+            **body_payloads(api, headers),
+            "files": files,
+            "verify": api.verify,
+            "allow_redirects": api_redirects(api),
+            "proxies": api.proxy,
+            "timeout": api.timeout,
+            "stream": api.stream
+        }
+        if api.rate_limit:
+            # Pace the request and retry throttled responses
+            response = await api.rate_limit.perform_async(interface.connection_pool.request,
+                                                          api.method.upper(),
+                                                          api.endpoint,
+                                                          log_util=api.log_util,
+                                                          **request_args
+                                                          )
+        else:
+            response = await interface.connection_pool.request(api.method.upper(), api.endpoint, **request_args)
+        returned = None
+        if api.download_to is not None:
+            # The complete response has already been received, write it to the requested destination.
+            response, returned = download_response(api, lambda **_: response, headers, pythonic)
+        if returned is None:
+            returned = process_response(api, response, pythonic)
+
+    except NoContentWarning as no_content_received:
+        returned = no_content_received.result
+
+    except APIError:
+        # Should only receive this in pythonic mode
+        raise
+
+    except SDKError as bad_request:
+        returned = bad_request.result
+
+    except Exception as havoc:  # pylint: disable=W0703
+        # General catch-all for anything coming out of the HTTP client.
+        if pythonic:
+            raise havoc
+
+        returned = SDKError(message=f"{str(havoc)}", headers=api.debug_headers).result
+
+    return returned
+
+
+def upload_files(files: Optional[Union[Dict[str, Any], List[Tuple[str, Any]]]]
+                 ) -> Optional[List[Tuple[str, Tuple[str, Union[bytes, UploadSource], Optional[str]]]]]:
+    """Normalize a requests style files payload, streaming the contents of any file objects or paths.
+
+    Returns a list of (field, (filename, content, content type)) tuples. Paths and seekable file objects
+    are returned as an UploadSource, so their contents are streamed instead of read into memory.
+    """
+    returned = None
+    if files:
+        returned = []
+        for field, value in (files.items() if isinstance(files, dict) else files):
+            filename, content, content_type = None, value, None
+            if isinstance(value, (tuple, list)):
+                filename = value[0]
+                content = value[1] if len(value) > 1 else b""
+                content_type = value[2] if len(value) > 2 else None
+            if isinstance(content, os.PathLike):
+                filename = filename or os.path.basename(os.fspath(content))
+            elif hasattr(content, "read") and not filename:
+                filename = os.path.basename(str(getattr(content, "name", field)))
+            if UploadSource.streamable(content):
+                content = UploadSource(content)
+            elif hasattr(content, "read"):
+                # Content that can not be repositioned is read once so that it may be sent again.
+                content = content.read()
+            returned.append((field, (str(filename or field), content, content_type)))
+
+    return returned
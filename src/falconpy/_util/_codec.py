@@ -0,0 +1,154 @@
+"""JSON codec class.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from functools import lru_cache
+from importlib import import_module
+from json import dumps as json_dumps, loads as json_loads
+try:
+    from simplejson import JSONDecodeError
+except (ImportError, ModuleNotFoundError):  # Support import as a module
+    from json.decoder import JSONDecodeError
+from typing import Any, Callable, Optional, Tuple, Union
+from .._error import DependencyNotInstalled
+
+# Supported JSON libraries, in order of preference.
+JSON_BACKENDS: Tuple[str, ...] = ("orjson", "ujson", "json")
+
+
+class JSONCodec:
+    """This class represents the JSON encoder and decoder used by an interface.
+
+    Responses are decoded directly from the received bytes and request bodies are encoded
+    to bytes. The fastest installed library (orjson, then ujson) is used unless a specific
+    library is requested, falling back to the standard library json module.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, backend: Optional[str] = None):
+        """Construct an instance of the JSONCodec class.
+
+        Keyword arguments
+        ----
+        backend : str
+            JSON library to use. Allowed values: "orjson", "ujson" or "json".
+            Defaults to the fastest installed library.
+        """
+        self._backend: Optional[str] = None
+        if isinstance(backend, str) and backend.lower() in JSON_BACKENDS:
+            self._backend = backend.lower()
+            # Confirm a specifically requested library is installed.
+            json_library(self._backend)
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def loads(self, content: Union[bytes, bytearray, str]) -> Any:
+        """Decode a JSON document, raising JSONDecodeError when the content is not valid JSON."""
+        try:
+            returned = self._library[1](content)
+        except JSONDecodeError:
+            raise
+        except ValueError as bad_json:
+            # Decode failures are reported using the same exception regardless of library.
+            raise JSONDecodeError(str(bad_json), "", 0) from bad_json
+
+        return returned
+
+    def dumps(self, payload: Any) -> bytes:
+        """Encode a payload as a UTF-8 JSON document."""
+        try:
+            returned = self._library[2](payload)
+        except (TypeError, OverflowError):
+            # Values the faster libraries cannot represent (such as very large integers)
+            # are handed to the standard library, which raises if they are not serializable.
+            returned = json_dumps(payload).encode("utf-8")
+
+        return returned
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def _library(self) -> Tuple[str, Callable[[Any], Any], Callable[[Any], bytes]]:
+        """Return the name, decoder and encoder for the selected library."""
+        return json_library(self._backend)
+
+    @property
+    def backend(self) -> str:
+        """Return the name of the JSON library in use."""
+        return self._library[0]
+
+    @classmethod
+    def create(cls, provided: Optional[Union["JSONCodec", str]] = None) -> "JSONCodec":
+        """Return the provided codec, or a new codec using the named library."""
+        returned = provided
+        if not isinstance(provided, JSONCodec):
+            returned = cls(provided)
+
+        return returned
+
+
+@lru_cache(maxsize=None)
+def json_library(name: Optional[str] = None) -> Tuple[str, Callable[[Any], Any], Callable[[Any], bytes]]:
+    """Import the requested JSON library, or the fastest installed library when not specified.
+
+    Returns a tuple of the library name, decoder and encoder. Libraries are imported when first used.
+    """
+    returned = ("json", json_loads, lambda payload: json_dumps(payload).encode("utf-8"))
+    for backend in [name] if name else JSON_BACKENDS[:-1]:
+        try:
+            library = import_module(backend)
+        except ImportError as not_installed:
+            if name:
+                raise DependencyNotInstalled(message=f"The {name} package is not installed."
+                                             ) from not_installed
+            continue
+        if backend == "orjson":
+            returned = (backend,
+                        library.loads,
+                        lambda payload, dump=library.dumps, opt=library.OPT_NON_STR_KEYS: dump(payload, option=opt)
+                        )
+        elif backend == "ujson":
+            returned = (backend, library.loads, lambda payload, dump=library.dumps: dump(payload).encode("utf-8"))
+        break
+
+    return returned
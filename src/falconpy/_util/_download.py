@@ -0,0 +1,237 @@
+"""Streaming download handlers.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import os
+from hashlib import sha256
+from typing import Any, BinaryIO, Callable, Dict, Optional, Tuple, Union
+from requests import Response
+from requests.exceptions import ChunkedEncodingError, ConnectionError as RequestsConnectionError
+from .._api_request import APIRequest
+from .._constant import DOWNLOAD_CHUNK_SIZE, DOWNLOAD_DIGEST_PARAMETERS, MAX_DOWNLOAD_RESUMES
+from .._error import DownloadIncompleteError, DownloadVerificationError
+from .._result import Result
+
+
+class DownloadTarget:
+    """This class represents the destination of a streaming download.
+
+    Paths are written to a partial file (path.part) that is renamed once the download completes,
+    allowing a later download of the same file to resume where an interrupted download ended.
+    File objects are written in place and can only be resumed when they are seekable.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, destination: Union[str, os.PathLike, BinaryIO], chunk_size: int = DOWNLOAD_CHUNK_SIZE):
+        """Construct an instance of the DownloadTarget class, opening the destination for writing."""
+        self._chunk_size: int = chunk_size
+        self._digest = sha256()
+        self._size: int = 0
+        self._path: Optional[str] = None
+        self._start: Optional[int] = None
+        if isinstance(destination, (str, os.PathLike)):
+            self._path = os.fspath(destination)
+            self._handle: BinaryIO = open(f"{self._path}.part", "ab+")  # pylint: disable=R1732
+            self._start = 0
+            # Content received by an earlier interrupted download is included in the digest.
+            self._handle.seek(0)
+            for chunk in iter(lambda: self._handle.read(self._chunk_size), b""):
+                self._digest.update(chunk)
+                self._size += len(chunk)
+        else:
+            self._handle = destination
+            if destination.seekable():
+                self._start = destination.tell()
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def write(self, response: Response):
+        """Write the response content to the destination in fixed size chunks."""
+        for chunk in response.iter_content(chunk_size=self._chunk_size):
+            if chunk:
+                self._handle.write(chunk)
+                self._digest.update(chunk)
+                self._size += len(chunk)
+
+    def restart(self):
+        """Discard any content already written to the destination."""
+        if self._size:
+            self._handle.seek(self._start)
+            self._handle.truncate()
+        self._digest = sha256()
+        self._size = 0
+
+    def complete(self, expected_sha256: Optional[str] = None):
+        """Finalize the download, confirming the content matches the expected SHA256 when provided."""
+        if expected_sha256 and expected_sha256 != self.sha256:
+            self.close()
+            if self._path:
+                os.remove(f"{self._path}.part")
+            raise DownloadVerificationError(
+                message=f"The downloaded file SHA256 ({self.sha256}) does not match the expected SHA256 "
+                        f"({expected_sha256}). The file has been removed."
+                )
+        self._handle.flush()
+        if self._path:
+            self.close()
+            os.replace(f"{self._path}.part", self._path)
+
+    def close(self):
+        """Close the destination when we opened it, retaining any partial content."""
+        if self._path and not self._handle.closed:
+            self._handle.close()
+            if not self._size:
+                os.remove(f"{self._path}.part")
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def size(self) -> int:
+        """Return the number of bytes written to the destination."""
+        return self._size
+
+    @property
+    def sha256(self) -> str:
+        """Return the SHA256 of the content written to the destination."""
+        return self._digest.hexdigest()
+
+    @property
+    def resumable(self) -> bool:
+        """Return a boolean indicating if an interrupted download can be resumed."""
+        return self._start is not None
+
+    @property
+    def name(self) -> Optional[str]:
+        """Return the name of the destination."""
+        return self._path if self._path else getattr(self._handle, "name", None)
+
+
+def content_range_start(response: Response) -> int:
+    """Return the first byte position of a partial response, or zero when it is not a partial response."""
+    returned = 0
+    if response.status_code == 206:
+        try:
+            returned = int(response.headers.get("Content-Range", "").split(" ", 1)[1].split("-", 1)[0])
+        except (IndexError, ValueError):
+            returned = -1
+
+    return returned
+
+
+def download_response(api: APIRequest,
+                      request: Callable[..., Response],
+                      headers: Dict[str, str],
+                      pythonic: bool = False
+                      ) -> Tuple[Response, Optional[Union[Dict[str, Any], Result]]]:
+    """Perform the request, streaming the response into the requested download destination.
+
+    Interrupted transfers are resumed using HTTP Range requests and the SHA256 of the content
+    is calculated as it is written. Returns the final response along with the download result.
+    The result is None when the response does not contain the file so it can be processed normally.
+    An error result is returned when every attempt is rejected or restarted without receiving the file.
+    """
+    target = DownloadTarget(api.download_to)
+    returned = None
+    try:
+        for attempt in range(MAX_DOWNLOAD_RESUMES + 1):
+            request_headers = headers
+            if target.size:
+                # Only request the content we have not already received.
+                request_headers = {**headers, "Range": f"bytes={target.size}-"}
+            response = request(headers=request_headers)
+            if response.status_code == 416 and target.size:
+                # The partial content cannot be resumed, start over.
+                response.close()
+                target.restart()
+                continue
+            if not 200 <= response.status_code < 300:
+                break
+            if content_range_start(response) != target.size:
+                # The API returned the complete file (or an unexpected range), discard what we have.
+                target.restart()
+                if response.status_code == 206:
+                    response.close()
+                    continue
+            try:
+                target.write(response)
+            except (ChunkedEncodingError, RequestsConnectionError) as interrupted:
+                if attempt == MAX_DOWNLOAD_RESUMES or not target.resumable:
+                    raise
+                api.log_warning(f"WARNING: Download interrupted ({interrupted}), resuming at byte {target.size}.")
+                continue
+            target.complete(api.download_sha256)
+            if api.log_util:
+                api.log_util.debug("DOWNLOAD: %s bytes written to %s", target.size, target.name)
+            body = {"meta": {}, "resources": [{"file": target.name, "size": target.size, "sha256": target.sha256}],
+                    "errors": []
+                    }
+            returned = Result(200, response.headers, body)
+            if not pythonic:
+                returned = returned.full_return
+            break
+        else:
+            # Every attempt was rejected or restarted, the final response does not contain the file.
+            raise DownloadIncompleteError(headers=dict(response.headers))
+
+    except (DownloadVerificationError, DownloadIncompleteError) as bad_download:
+        returned = bad_download.result
+        api.log_error(bad_download.code, bad_download.message, returned)
+
+    finally:
+        target.close()
+
+    return response, returned
+
+
+def download_digest(operation_id: str, params: Optional[Dict[str, Any]], keywords: Dict[str, Any]) -> Optional[str]:
+    """Return the SHA256 a download is expected to match.
+
+    Uses the expected_sha256 keyword when provided, otherwise the operation parameter containing the file SHA256.
+    """
+    returned = keywords.get("expected_sha256", None)
+    if not returned and operation_id in DOWNLOAD_DIGEST_PARAMETERS:
+        returned = (params or {}).get(DOWNLOAD_DIGEST_PARAMETERS[operation_id], None)
+        if isinstance(returned, list):
+            returned = returned[0] if len(returned) == 1 else None
+
+    return returned if isinstance(returned, str) else None
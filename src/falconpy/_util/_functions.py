@@ -35,16 +35,16 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
+# pylint: disable=C0302
 from __future__ import annotations
 import base64
 import functools
 from warnings import warn
-from json import loads
 try:
     from simplejson import JSONDecodeError
 except (ImportError, ModuleNotFoundError):  # Support import as a module
     from json.decoder import JSONDecodeError
-from typing import Dict, Any, Union, Optional, List, TYPE_CHECKING
+from typing import Dict, Any, Callable, Union, Optional, List, Tuple, TYPE_CHECKING
 from copy import deepcopy
 from logging import Logger
 import requests
@@ -77,6 +77,10 @@ from .._error import (
     )
 from .._result import Result
 from .._version import version
+from ._index import find_operation
+from ._codec import JSONCodec
+from ._download import download_digest, download_response
+from ._upload import upload_payloads
 if TYPE_CHECKING:  # pragma: no cover
     from .._auth_object import FalconInterface
     from .._service_class import ServiceClass
@@ -209,6 +213,7 @@ def service_request(caller: ServiceClass = None, **kwargs) -> Union[Dict[str, Un
 
     Inbound caller argument should be a ServiceClass class or derivative.
     """
+    requester = kwargs.pop("requester", perform_request)
     if caller:
         # EAFP
         try:
@@ -235,6 +240,14 @@ def service_request(caller: ServiceClass = None, **kwargs) -> Union[Dict[str, Un
             debug_count: Optional[int] = caller.debug_record_count
         except AttributeError:
             debug_count = None
+
+        # Each optional feature is resolved separately, a caller lacking one still provides the others.
+        session: Optional[Any] = getattr(caller, "connection_pool", None)
+        rate_limit: Optional[Any] = getattr(caller, "rate_limit", None)
+        codec: Optional[JSONCodec] = getattr(caller, "json_codec", None)
+        cache: Optional[Any] = getattr(caller, "cache_scope", None)
+        coalescer: Optional[Any] = getattr(caller, "coalescer_scope", None)
+
         try:
             do_sanitize: Optional[bool] = caller.sanitize_log
         except AttributeError:
@@ -248,14 +261,19 @@ def service_request(caller: ServiceClass = None, **kwargs) -> Union[Dict[str, Un
         except AttributeError:
             kwargs["pythonic"] = None
     # pylint: disable=E0606
-    return perform_request(proxy=proxy,
-                           timeout=timeout,
-                           user_agent=user_agent,
-                           log_util=log_utility,
-                           debug_record_count=debug_count,
-                           sanitize=do_sanitize,
-                           **kwargs
-                           )
+    return requester(proxy=proxy,
+                     timeout=timeout,
+                     user_agent=user_agent,
+                     log_util=log_utility,
+                     debug_record_count=debug_count,
+                     sanitize=do_sanitize,
+                     session=session,
+                     rate_limit=rate_limit,
+                     codec=codec,
+                     cache=cache,
+                     coalescer=coalescer,
+                     **kwargs
+                     )
 
 
 # pylint: disable=R0912  # I don't disagree, but this will work for now.
@@ -264,8 +282,13 @@ def calc_content_return(resp: requests.Response,
                         auth: bool,
                         log: Logger,
                         pythonic_mode: bool,
+                        codec: Optional[JSONCodec] = None
                         ) -> Union[dict, bytes]:
-    """Calculate the returned content based upon the results from the call to requests."""
+    """Calculate the returned content based upon the results from the call to requests.
+
+    JSON content is decoded directly from the received bytes using the provided codec.
+    """
+    codec = JSONCodec.create(codec)
     returned = {}
     returned_content_type = resp.headers.get('content-type', None)
     if not returned_content_type:
@@ -273,26 +296,16 @@ def calc_content_return(resp: requests.Response,
     if log:
         log.debug("RECEIVED: Content returned in %s format", returned_content_type)
     if returned_content_type.startswith("application/json"):  # Issue 708
-        json_resp: Union[dict, Result] = {}
-        try:
-            json_resp = resp.json()
-        except JSONDecodeError:
-            # It says JSON in the headers but it came back to us as a binary string.
-            json_resp = loads(resp.content.decode("ascii"))
-        finally:
-            # Default behavior is to return results as a standardized dictionary.
-            returned = Result(status_code=resp.status_code,
-                              headers=resp.headers,
-                              body=json_resp
-                              ).full_return
+        # Default behavior is to return results as a standardized dictionary.
+        returned = Result(status_code=resp.status_code,
+                          headers=resp.headers,
+                          body=codec.loads(resp.content)
+                          ).full_return
     elif returned_content_type.startswith("text/plain"):
         # Assuming UTF-8 for now
-        returned = Result(resp.status_code,
-                          resp.headers,
-                          loads(resp.content.decode("utf-8"))
-                          ).full_return
+        returned = Result(resp.status_code, resp.headers, codec.loads(resp.content)).full_return
     elif contain:
-        returned = Result(resp.status_code, resp.headers, resp.json()).full_return
+        returned = Result(resp.status_code, resp.headers, codec.loads(resp.content)).full_return
     else:
         # Binary response
         if not resp.content:
@@ -370,120 +383,202 @@ def perform_request(endpoint: str = "",  # noqa: C901
     debug_record_count: int - Maximum number of records to log in debug logs
     authenticating: bool - This request is driving a token request
     stream: bool - Enabling streaming download.
+    session: ConnectionPool - Pooled connection to use for the request. Falls back to requests.request when not provided.
+    rate_limit: RateLimitBucket - Rate limit budget used to pace and retry the request. Disabled when not provided.
+    codec: JSONCodec - JSON codec used to encode the body payload and decode the response. Defaults to the fastest available.
+    operation: str - Operation ID of the request, used to identify cached responses.
+    cache: ResponseCacheScope - Response cache used for idempotent operations. Disabled when not provided.
+    coalescer: RequestCoalescerScope - Shares identical in-flight idempotent requests. Disabled when not provided.
+    download_to: str or file object - Stream the response into this file, resuming interrupted transfers.
+    download_sha256: str - SHA256 the downloaded content must match.
+    upload_progress: Callable - Called with the MultipartEncoder as each chunk of a streaming upload is sent.
     """
     # Shortcut for now
     pythonic = kwargs.get("pythonic", False)
+    api, returned = prepare_request(endpoint, headers, kwargs)
+
+    # Perform the request
+    if api.perform:
+        try:
+            # Log our payloads if debugging is enabled
+            log_api_payloads(api, headers)
+            # Use the pooled connection for this interface when one is available
+            requester = api.session.request if api.session else requests.request
+            if api.rate_limit:
+                # Pace the request and retry throttled responses
+                requester = functools.partial(api.rate_limit.perform, requester, log_util=api.log_util)
+            request = functools.partial(requester, api.method.upper(), endpoint, params=api.param_payload,
+                                        **upload_payloads(api, headers, body_payloads(api, headers)), verify=api.verify,
+                                        allow_redirects=api_redirects(api), proxies=api.proxy,
+                                        timeout=api.timeout, stream=api.stream
+                                        )
+            if api.download_to is not None:
+                # Stream the response into the requested destination
+                response, returned = download_response(api, request, headers, pythonic)
+            else:
+                response = fetch_response(api, request, headers)
+            if returned is None:
+                returned = process_response(api, response, pythonic)
+
+        except (SDKError, NoContentWarning):
+            # Already handled
+            raise
+
+        except Exception as havoc:  # pylint: disable=W0703
+            # General catch-all for anything coming          ____ ____ _ _      \\       o   o
+            # out of requests or the library itself.         |___ |--<  Y        ||      |\O/|
+            # Pass this error up to the parent try/catch                          \\      \Y/
+            # block residing within our decorator        _  _ ____ _  _ ____ ____         /W\
+            # (force_default) for handling.              |--| |--|  \/  [__] |___  !!   _|WWW|_
+            if pythonic:
+                # Oh wait, we're pythonic, lets generate
+                # a regular python error condition instead.
+                raise havoc
+
+            raise SDKError(message=f"{str(havoc)}", headers=api.debug_headers) from havoc
+
+    return returned
+
+
+def fetch_response(api: APIRequest, request: Callable[..., requests.Response], headers: dict) -> requests.Response:
+    """Perform the request, returning a cached response or sharing an identical in-flight request when enabled."""
+    fetch = functools.partial(request, headers=headers)
+    if api.cache and api.cache.cacheable(api):
+        # Return a cached response when available, revalidating expired responses
+        fetch = functools.partial(api.cache.perform, request, api, headers, log_util=api.log_util)
+    if api.coalescer and api.coalescer.coalescable(api):
+        # Wait for an identical request that is already being performed instead of sending another
+        fetch = functools.partial(api.coalescer.perform, fetch, api)
+
+    return fetch()
+
+
+def prepare_request(endpoint: str, headers: dict, kwargs: Dict[str, Any]) -> Tuple[APIRequest, Any]:
+    """Create the API request object, validate the body payload and finalize the request headers.
+
+    Returns the request and, when payload validation fails, the error result to return.
+    """
+    pythonic = kwargs.get("pythonic", False)
+    returned = None
     api: APIRequest = APIRequest(endpoint, kwargs)
     if not api.verify:
         ssl_disabled = SSLDisabledWarning()
         if pythonic:
-            warn(ssl_disabled.message, SSLDisabledWarning, stacklevel=2)
+            warn(ssl_disabled.message, SSLDisabledWarning, stacklevel=3)
         else:
             api.log_warning(msg=ssl_disabled.message)
 
-    if api.method.upper() in _ALLOWED_METHODS:
-        # Validate body payload
-        if api.body_validator:
-            try:
-                validate_payload(api.body_validator, api.body_payload, api.body_required)
-            except PayloadValidationError as err:
-                api.log_error(400, err.message, err.result)
-                returned = err.result
-                api.perform = False
-
-        # Perform the request
-        if api.perform:
-            if api.user_agent:
-                headers["User-Agent"] = api.user_agent
-            else:
-                # Force all requests to pass the User-Agent identifier
-                headers["User-Agent"] = _USER_AGENT
-            headers["CrowdStrike-SDK"] = _USER_AGENT
-            # Clean up query string booleans - Issue #1129
-            if api.param_payload:
-                for param, param_value in api.param_payload.items():
-                    if isinstance(param_value, bool):
-                        api.param_payload[param] = str(param_value).lower()
-            try:
-                allow_redirects = False
-                # Allow redirections during token authentication and revocation
-                for check_point in ["/oauth2/revoke", "/oauth2/token"]:
-                    if check_point in api.endpoint:
-                        allow_redirects = True
-                # Log our payloads if debugging is enabled
-                log_api_payloads(api, headers)
-                response = requests.request(api.method.upper(), endpoint, params=api.param_payload,
-                                            headers=headers, json=api.body_payload, data=api.data_payload,
-                                            files=api.files, verify=api.verify, allow_redirects=allow_redirects,
-                                            proxies=api.proxy, timeout=api.timeout, stream=api.stream
-                                            )
-
-                api.debug_headers = response.headers
-
-                if api.stream:
-                    if api.log_util:
-                        api.log_util.debug("STREAM: Download requested")
-                        api.log_util.debug(f"STREAM: {api.debug_headers}")
-                    # Return the requests.Response object instead of a FalconPy Result object
-                    return response
-
-                content_return, returning_content_type = calc_content_return(response,
-                                                                             api.container,
-                                                                             api.authenticating,
-                                                                             api.log_util,
-                                                                             pythonic
-                                                                             )
-                # Expanded results allow for status code and
-                # header checks on binary returns.
-                # Maintained for < v1.3 syntax compatibility
-                if api.expand_result:
-                    returned = Result(response.status_code, response.headers, content_return).tupled
-                else:
-                    returned = content_return
-
-                # Log our response if debugging is enabled
-                log_api_activity(content_return, returning_content_type, api)
-
-                # !!! EXPERIMENTAL !!!
-                # This functionality is new in v1.3.0 and still experimental, mileage may vary.
-                if pythonic:
-                    if isinstance(returned, bytes):
-                        returned = Result(response.status_code, response.headers, returned)
-                    else:
-                        returned = Result(full=returned)
-
-            except RegionSelectError as bad_region:
-                # More than likely they tried to autoselect to GovCloud
-                returned = bad_region.result
-                api.log_error(returned.get("status_code"), bad_region.message, returned)
-
-            except JSONDecodeError as json_decode_error:
-                # No response content, but a successful request was made
-                if "/identity-protection/combined/graphql/v1" in api.endpoint:  # pragma: no cover
-                    raise SDKError(message=f"{str(json_decode_error)}",
-                                   headers=api.debug_headers
-                                   ) from json_decode_error
-
-                api.log_warning("WARNING: No content was received for this request.")
-                raise NoContentWarning(headers=response.headers,
-                                       code=response.status_code
-                                       ) from json_decode_error
-
-            except Exception as havoc:  # pylint: disable=W0703
-                # General catch-all for anything coming          ____ ____ _ _      \\       o   o
-                # out of requests or the library itself.         |___ |--<  Y        ||      |\O/|
-                # Pass this error up to the parent try/catch                          \\      \Y/
-                # block residing within our decorator        _  _ ____ _  _ ____ ____         /W\
-                # (force_default) for handling.              |--| |--|  \/  [__] |___  !!   _|WWW|_
-                if pythonic:
-                    # Oh wait, we're pythonic, lets generate
-                    # a regular python error condition instead.
-                    raise havoc
-
-                raise SDKError(message=f"{str(havoc)}", headers=api.debug_headers) from havoc
-    else:
+    if api.method.upper() not in _ALLOWED_METHODS:
         raise InvalidMethod
 
+    # Validate body payload
+    if api.body_validator:
+        try:
+            validate_payload(api.body_validator, api.body_payload, api.body_required)
+        except PayloadValidationError as err:
+            api.log_error(400, err.message, err.result)
+            returned = err.result
+            api.perform = False
+
+    if api.perform:
+        if api.user_agent:
+            headers["User-Agent"] = api.user_agent
+        else:
+            # Force all requests to pass the User-Agent identifier
+            headers["User-Agent"] = _USER_AGENT
+        headers["CrowdStrike-SDK"] = _USER_AGENT
+        # Clean up query string booleans - Issue #1129
+        if api.param_payload:
+            for param, param_value in api.param_payload.items():
+                if isinstance(param_value, bool):
+                    api.param_payload[param] = str(param_value).lower()
+
+    return api, returned
+
+
+def body_payloads(api: APIRequest, headers: dict) -> Dict[str, Any]:
+    """Return the body and data payloads for the request.
+
+    Body payloads are encoded using the request codec and sent as data. Payloads requests
+    would not send as JSON (alongside data or files) are passed through unchanged.
+    """
+    if api.body_payload is None or api.data_payload or api.files:
+        return {"json": api.body_payload, "data": api.data_payload}
+
+    if not any(header.lower() == "content-type" for header in headers):
+        headers["Content-Type"] = "application/json"
+
+    return {"json": None, "data": JSONCodec.create(api.codec).dumps(api.body_payload)}
+
+
+def api_redirects(api: APIRequest) -> bool:
+    """Allow redirections during token authentication and revocation."""
+    allow_redirects = False
+    for check_point in ["/oauth2/revoke", "/oauth2/token"]:
+        if check_point in api.endpoint:
+            allow_redirects = True
+
+    return allow_redirects
+
+
+def process_response(api: APIRequest,
+                     response: requests.Response,
+                     pythonic: bool = False
+                     ) -> Union[Dict[str, Union[int, dict, list]], bytes, Result, requests.Response]:
+    """Convert the response received from the API into the format requested."""
+    api.debug_headers = response.headers
+
+    if api.stream and api.download_to is None:
+        if api.log_util:
+            api.log_util.debug("STREAM: Download requested")
+            api.log_util.debug(f"STREAM: {api.debug_headers}")
+        # Return the requests.Response object instead of a FalconPy Result object
+        return response
+
+    try:
+        content_return, returning_content_type = calc_content_return(response,
+                                                                     api.container,
+                                                                     api.authenticating,
+                                                                     api.log_util,
+                                                                     pythonic,
+                                                                     api.codec
+                                                                     )
+        # Expanded results allow for status code and
+        # header checks on binary returns.
+        # Maintained for < v1.3 syntax compatibility
+        if api.expand_result:
+            returned = Result(response.status_code, response.headers, content_return).tupled
+        else:
+            returned = content_return
+
+        # Log our response if debugging is enabled
+        log_api_activity(content_return, returning_content_type, api)
+
+        # !!! EXPERIMENTAL !!!
+        # This functionality is new in v1.3.0 and still experimental, mileage may vary.
+        if pythonic:
+            if isinstance(returned, bytes):
+                returned = Result(response.status_code, response.headers, returned)
+            else:
+                returned = Result(full=returned)
+
+    except RegionSelectError as bad_region:
+        # More than likely they tried to autoselect to GovCloud
+        returned = bad_region.result
+        api.log_error(returned.get("status_code"), bad_region.message, returned)
+
+    except JSONDecodeError as json_decode_error:
+        # No response content, but a successful request was made
+        if "/identity-protection/combined/graphql/v1" in api.endpoint:  # pragma: no cover
+            raise SDKError(message=f"{str(json_decode_error)}",
+                           headers=api.debug_headers
+                           ) from json_decode_error
+
+        api.log_warning("WARNING: No content was received for this request.")
+        raise NoContentWarning(headers=response.headers,
+                               code=response.status_code
+                               ) from json_decode_error
+
     return returned
 
 
@@ -596,34 +691,28 @@ def args_to_params(payload: dict,
     if epname != "Manual":  # pylint: disable=R1702
         if epname in operation_deprecation_mapping:
             deprecated_operation(pyth, log_utl, epname, operation_deprecation_mapping[epname])
+        eps = find_operation(endpoints, epname).params if passed_arguments else {}
         for arg in passed_arguments:
-            eps = [ep[5] for ep in endpoints if epname == ep[0]][0]
-            try:
-                argument = [param for param in eps if param["name"] == arg][0]
-                if argument:
-                    arg_name = argument["name"]
-                    if "type" in argument:  # Body payload parameters do not have a type field
-                        if argument["type"] == "array":
-                            if isinstance(passed_arguments[arg_name], (str)):
-                                passed_arguments[arg_name] = passed_arguments[arg_name].split(",")
-                        # Check for unnecessarily URLEncoded strings by finding an encoded ":", Issue #850
-                        if isinstance(passed_arguments[arg_name], str):
-                            if "%3A" in passed_arguments[arg_name]:
-                                msg = " ".join([arg_name,
-                                                "argument contains potentially urlencoded string of",
-                                                f"'{passed_arguments[arg_name]}'."
-                                                ])
-                                if pyth:
-                                    warn(msg, UnnecessaryEncodingUsed, stacklevel=5)
-                                else:
-                                    if log_utl:
-                                        log_utl.warning(msg)
-
-                        # More data type validation can go here
-                        payload[arg_name] = passed_arguments[arg_name]
-            except IndexError:
-                # Unrecognized argument
-                pass
+            arg_type = eps.get(arg, None)  # Unrecognized arguments are skipped
+            if arg_type:  # Body payload parameters do not have a type field
+                if arg_type == "array":
+                    if isinstance(passed_arguments[arg], (str)):
+                        passed_arguments[arg] = passed_arguments[arg].split(",")
+                # Check for unnecessarily URLEncoded strings by finding an encoded ":", Issue #850
+                if isinstance(passed_arguments[arg], str):
+                    if "%3A" in passed_arguments[arg]:
+                        msg = " ".join([arg,
+                                        "argument contains potentially urlencoded string of",
+                                        f"'{passed_arguments[arg]}'."
+                                        ])
+                        if pyth:
+                            warn(msg, UnnecessaryEncodingUsed, stacklevel=5)
+                        else:
+                            if log_utl:
+                                log_utl.warning(msg)
+
+                # More data type validation can go here
+                payload[arg] = passed_arguments[arg]
 
     # Clean up reserved word conversions when passing in an invalid raw payload
     if payload:
@@ -679,7 +768,7 @@ def process_service_request(calling_object: ServiceClass,  # pylint: disable=R09
         ** calling_object.headers,
         ** passed_headers
     }
-    target_endpoint = [ep for ep in endpoints if operation_id == ep[0]][0]
+    target_endpoint = find_operation(endpoints, operation_id)
     base_url = calling_object.base_url
     container = False
     # Check if this operation requires the custom container base URL.
@@ -689,7 +778,9 @@ def process_service_request(calling_object: ServiceClass,  # pylint: disable=R09
                 base_url = f"https://{ContainerBaseURL[base].value}"
                 container = True
     # Handle any provided PATH variables, should happen before query string argument abstraction.
-    target_url = handle_path_variables(passed=kwargs, route_url=f"{base_url}{target_endpoint[2]}")
+    target_url = f"{base_url}{target_endpoint.route}"
+    if target_endpoint.templated:
+        target_url = handle_path_variables(passed=kwargs, route_url=target_url)
     # Retrieve our keyword arguments
     passed_keywords = kwargs.get("keywords", {})  # Changed from None in v1.3.3
     passed_params = kwargs.get("params", None)
@@ -708,7 +799,8 @@ def process_service_request(calling_object: ServiceClass,  # pylint: disable=R09
         do_pythonic = passed_keywords.get("pythonic")
     new_keywords = {
         "caller": calling_object,
-        "method": target_endpoint[1],
+        "method": target_endpoint.method,
+        "operation": operation_id,
         "endpoint": target_url,
         "verify": calling_object.ssl_verify,
         "headers": joined_headers,
@@ -722,8 +814,14 @@ def process_service_request(calling_object: ServiceClass,  # pylint: disable=R09
         "container": container,
         "pythonic": do_pythonic,
         "perform": True,
-        "stream": kwargs.get("stream", False)
+        "stream": kwargs.get("stream", False),
+        "download_to": passed_keywords.get("download_to", None),
+        "download_sha256": download_digest(operation_id, parameter_payload, passed_keywords),
+        "upload_progress": passed_keywords.get("upload_progress", None)
     }
+    if calling_object.asynchronous:
+        # Asynchronous interfaces return an awaitable that performs the request.
+        new_keywords["requester"] = calling_object.auth_object.request
 
     return service_request(**new_keywords)
 
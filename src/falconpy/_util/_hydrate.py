@@ -0,0 +1,152 @@
+"""Query and hydrate pipeline helpers.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterator, Optional
+from ._paginate import unpack_response
+from .._constant import GLOBAL_API_MAX_RETURN, HYDRATE_CHUNK_SIZE
+from .._error import APIError
+
+# Maximum number of IDs accepted by each entity operation. Operations not listed accept HYDRATE_CHUNK_SIZE.
+ENTITY_CHUNK_SIZES: Dict[str, int] = {
+    "GetAWSAccounts": 5000,
+    "getChanges": 500,
+    "GetIntelIndicatorEntities": 1000,
+    "getRuleGroups": 500,
+    "GetVulnerabilities": 400,
+    "PostDeviceDetailsV2": 5000,
+    "PostEntitiesAlertsV1": 1000,
+    "PostEntitiesAlertsV2": 1000,
+    "retrieveUsersGETV1": 5000,
+    "WorkflowExecutionResults": 500
+}
+
+# Keyword used to provide IDs to each entity operation. Operations not listed accept "ids".
+ENTITY_IDS_KEYWORDS: Dict[str, str] = {
+    "PostEntitiesAlertsV2": "composite_ids"
+}
+
+
+def entity_chunk_size(operation_id: str) -> int:
+    """Return the maximum number of IDs accepted by an entity operation.
+
+    Falls back to HYDRATE_CHUNK_SIZE for operations without a known maximum.
+    """
+    return min(ENTITY_CHUNK_SIZES.get(operation_id, HYDRATE_CHUNK_SIZE), GLOBAL_API_MAX_RETURN)
+
+
+def entity_ids_keyword(operation_id: str) -> str:
+    """Return the keyword used to provide IDs to an entity operation."""
+    return ENTITY_IDS_KEYWORDS.get(operation_id, "ids")
+
+
+def response_resources(response: Any) -> list:
+    """Return the resources from a successful response, raising APIError when the request failed."""
+    status_code, headers, body = unpack_response(response)
+    if not 200 <= status_code < 300:
+        errors = body.get("errors", None) or [{}]
+        message = errors[0].get("message", None)
+        raise APIError(code=status_code, message=f"ERROR: {message}" if message else None, headers=headers)
+
+    return body.get("resources", None) or []
+
+
+def chunked(items: list, size: int) -> Iterator[list]:
+    """Split the provided list into chunks of the specified size."""
+    for position in range(0, len(items), size):
+        yield items[position:position + size]
+
+
+def hydrate(pages: Iterator[Any],
+            request: Callable[..., Any],
+            chunk_size: int,
+            max_workers: int = 4,
+            keywords: Optional[Dict[str, Any]] = None,
+            ids_keyword: str = "ids"
+            ) -> Iterator[Any]:
+    """Retrieve the entities for every page of IDs, yielding each entity in the order the IDs were received.
+
+    Entity requests for each chunk of IDs are performed concurrently by a pool of worker threads
+    while the next page of IDs is retrieved. IDs are provided using ids_keyword. Raises APIError
+    when a request fails.
+    """
+    keywords = keywords if keywords else {}
+    pending: Deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for page in pages:
+                for chunk in chunked(response_resources(page), chunk_size):
+                    pending.append(executor.submit(request, **{**keywords, ids_keyword: chunk}))
+                    # Keep enough requests queued to occupy every worker, without queuing the entire result set.
+                    while len(pending) > max_workers * 2 or (pending and pending[0].done()):
+                        yield from response_resources(pending.popleft().result())
+            while pending:
+                yield from response_resources(pending.popleft().result())
+        finally:
+            # Discard queued requests when iteration is stopped early or a request fails.
+            for queued in pending:
+                queued.cancel()
+
+
+async def async_hydrate(pages: AsyncIterator[Any],
+                        request: Callable[..., Awaitable[Any]],
+                        chunk_size: int,
+                        max_workers: int = 4,
+                        keywords: Optional[Dict[str, Any]] = None,
+                        ids_keyword: str = "ids"
+                        ) -> AsyncIterator[Any]:
+    """Retrieve the entities for every page of IDs, yielding each entity in the order the IDs were received.
+
+    Up to max_workers entity requests are performed concurrently. Raises APIError when a request fails.
+    """
+    import asyncio  # pylint: disable=C0415
+    keywords = keywords if keywords else {}
+    pending: Deque["asyncio.Future"] = deque()
+    try:
+        async for page in pages:
+            for chunk in chunked(response_resources(page), chunk_size):
+                pending.append(asyncio.ensure_future(request(**{**keywords, ids_keyword: chunk})))
+                while len(pending) >= max_workers or (pending and pending[0].done()):
+                    for entity in response_resources(await pending.popleft()):
+                        yield entity
+        while pending:
+            for entity in response_resources(await pending.popleft()):
+                yield entity
+    finally:
+        for queued in pending:
+            queued.cancel()
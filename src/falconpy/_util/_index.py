@@ -0,0 +1,150 @@
+"""FalconPy operation index.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from collections import OrderedDict
+from string import Formatter
+from threading import Lock
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+
+class Operation(NamedTuple):
+    """Precomputed details for a single API operation."""
+
+    operation_id: str
+    method: str
+    route: str
+    fields: Tuple[str, ...]
+    params: Dict[str, Optional[str]]
+
+    @property
+    def templated(self) -> bool:
+        """Return a boolean indicating if the route contains path variables."""
+        return bool(self.fields)
+
+
+def compile_operation(endpoint: Any) -> Operation:
+    """Convert a single endpoint definition or registry record into an Operation.
+
+    Parameters are mapped to their type. Body payload parameters do not have a type.
+    """
+    try:
+        parameters = endpoint.parameters  # Compact registry record
+    except AttributeError:
+        parameters = [(param["name"], param.get("type", None), param.get("in", None)) for param in endpoint[5]]
+    params: Dict[str, Optional[str]] = {}
+    for name, param_type, _ in parameters:
+        # The first definition of a parameter wins, matching the original list scan.
+        params.setdefault(name, param_type)
+    fields = tuple(field[1] for field in Formatter().parse(endpoint[2]) if field[1] is not None)
+
+    return Operation(endpoint[0], endpoint[1], endpoint[2], fields, params)
+
+
+def index_endpoints(endpoints: List[Any]) -> Dict[str, Operation]:
+    """Build an operation ID index for the provided endpoint list.
+
+    Operation IDs are not unique across every endpoint module, so the
+    first definition found within the list is the one that is indexed.
+    """
+    returned: Dict[str, Operation] = {}
+    for endpoint in endpoints:
+        if endpoint[0] not in returned:
+            returned[endpoint[0]] = compile_operation(endpoint)
+
+    return returned
+
+
+# Indexes are cached per endpoint list, most recently used last. Lists cannot be weakly
+# referenced, so the list is retained alongside its index to ensure the identity used as
+# the cache key is never reused, and the cache is bounded so discarded lists are released.
+# Endpoint lists are treated as immutable once indexed, a list that has been appended to or
+# had its final operation replaced is indexed again.
+_INDEX_CACHE: "OrderedDict[int, Tuple[List[Any], int, Any, Dict[str, Operation]]]" = OrderedDict()
+_INDEX_CACHE_SIZE = 512
+_INDEX_LOCK = Lock()
+
+
+def operation_index(endpoints: List[Any]) -> Dict[str, Operation]:
+    """Return the operation ID index for an endpoint list, building it on first use."""
+    key = id(endpoints)
+    last = endpoints[-1] if endpoints else None
+    with _INDEX_LOCK:
+        cached = _INDEX_CACHE.get(key)
+        if cached and cached[0] is endpoints and cached[1] == len(endpoints) and cached[2] is last:
+            _INDEX_CACHE.move_to_end(key)
+            return cached[3]
+    returned = index_endpoints(endpoints)
+    with _INDEX_LOCK:
+        _INDEX_CACHE[key] = (endpoints, len(endpoints), last, returned)
+        _INDEX_CACHE.move_to_end(key)
+        while len(_INDEX_CACHE) > _INDEX_CACHE_SIZE:
+            _INDEX_CACHE.popitem(last=False)
+
+    return returned
+
+
+def find_operation(endpoints: List[Any], operation_id: str) -> Operation:
+    """Retrieve an operation from an endpoint list.
+
+    Raises IndexError when the operation is not present, matching the
+    behavior of the list lookups this index replaces.
+    """
+    try:
+        return operation_index(endpoints)[operation_id]
+    except KeyError as not_found:
+        raise IndexError(f"Operation {operation_id} not found") from not_found
+
+
+def resolve_operation(endpoints: List[Any], operation: str, owner: Any = None) -> Optional[Operation]:
+    """Return the operation for an operation ID, or for the name of a method of owner that performs one.
+
+    Method names are resolved using the operation ID aliases the owner class defines for the same
+    method. (Example: QueryDevicesByFilterScroll = query_devices_by_filter_scroll) Returns None when
+    the method does not have exactly one operation ID alias.
+    """
+    index = operation_index(endpoints)
+    returned = index.get(operation, None)
+    if returned is None and owner is not None and not operation.startswith("_"):
+        owner_class = owner if isinstance(owner, type) else type(owner)
+        method = getattr(owner_class, operation, None)
+        if callable(method):
+            aliases = {name for parent in owner_class.__mro__ for name, value in vars(parent).items()
+                       if value is method and name in index
+                       }
+            returned = index[aliases.pop()] if len(aliases) == 1 else None
+
+    return returned
@@ -0,0 +1,183 @@
+"""Automatic pagination helpers.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, Tuple
+from ._index import Operation
+
+# Pagination keywords in order of preference. Operations that support both
+# after and offset pagination are paged using the after token.
+PAGINATION_KEYWORDS = ("after", "next_token", "offset")
+
+
+def pagination_keyword(operation: Optional[Operation]) -> Optional[str]:
+    """Return the pagination keyword supported by the operation.
+
+    Returns an empty string when the operation does not support pagination,
+    or None when the operation is not known and must be detected from the response.
+    """
+    returned = None
+    if operation:
+        returned = next((key for key in PAGINATION_KEYWORDS if key in operation.params), "")
+
+    return returned
+
+
+def unpack_response(response: Any) -> Tuple[int, Dict[str, Any], Dict[str, Any]]:
+    """Return the status code, headers and body from a dictionary or Result response."""
+    try:
+        response = response.full_return
+    except AttributeError:
+        pass  # Dictionary response
+    try:
+        returned = (response.get("status_code", 0), response.get("headers", {}), response.get("body", {}) or {})
+    except AttributeError:
+        # Binary and other non-JSON responses.
+        returned = (0, {}, {})
+
+    return returned
+
+
+def page_details(response: Any) -> Tuple[int, Dict[str, Any], int]:
+    """Return the status code, pagination branch and number of resources from a dictionary or Result."""
+    status_code, _, body = unpack_response(response)
+    try:
+        pagination = body.get("meta", {}).get("pagination", {}) or {}
+        resources = body.get("resources", None)
+    except AttributeError:
+        # Responses without a JSON body do not paginate.
+        pagination, resources = {}, None
+
+    return status_code, pagination, len(resources) if isinstance(resources, list) else 0
+
+
+class Paginator:
+    """This class tracks the position of a paginated query.
+
+    Offset (numeric), offset (token), after and next_token pagination styles are supported.
+    The style is determined from the operation parameters, or from the pagination
+    metadata of the first response when the operation is not known.
+    """
+
+    def __init__(self, operation: Optional[Operation], keywords: Dict[str, Any]):
+        """Construct an instance of the Paginator class."""
+        self._keywords: Dict[str, Any] = dict(keywords)
+        self._keyword: Optional[str] = pagination_keyword(operation)
+        self._received: int = 0
+
+    @property
+    def keywords(self) -> Dict[str, Any]:
+        """Return the keywords for the current page."""
+        return self._keywords
+
+    def advance(self, response: Any) -> Optional[Dict[str, Any]]:
+        """Update our position using the response for the current page.
+
+        Returns the keywords for the next page, or None when there are no more pages.
+        """
+        status_code, pagination, count = page_details(response)
+        self._received += count
+        if self._keyword is None:
+            self._keyword = next((key for key in PAGINATION_KEYWORDS if key in pagination), "")
+        total = pagination.get("total", None)
+        current = self._keywords.get(self._keyword, None)
+        position = pagination.get(self._keyword, None)
+        if self._keyword == "offset" and not (isinstance(position, str) and not position.isdigit()):
+            # Numeric offsets are calculated from the number of resources received.
+            position = int(current or 0) + count
+        returned = None
+        if 200 <= status_code < 300 and count and position and position != current:
+            if not isinstance(total, int) or self._received < total:
+                returned = {**self._keywords, self._keyword: position}
+                self._keywords = returned
+
+        return returned
+
+
+def paginate(request: Callable[..., Any],
+             operation: Optional[Operation],
+             keywords: Dict[str, Any],
+             prefetch: bool = False
+             ) -> Iterator[Any]:
+    """Perform the request for every page of results, yielding each response as it is received.
+
+    When prefetch is enabled the next page is requested in the background
+    while the current page is being processed.
+    """
+    pager = Paginator(operation, keywords)
+    if prefetch:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending: Optional[Future] = executor.submit(request, **pager.keywords)
+            while pending:
+                response = pending.result()
+                next_page = pager.advance(response)
+                pending = executor.submit(request, **next_page) if next_page is not None else None
+                yield response
+    else:
+        next_page = pager.keywords
+        while next_page is not None:
+            response = request(**next_page)
+            next_page = pager.advance(response)
+            yield response
+
+
+async def async_paginate(request: Callable[..., Awaitable[Any]],
+                         operation: Optional[Operation],
+                         keywords: Dict[str, Any],
+                         prefetch: bool = False
+                         ) -> AsyncIterator[Any]:
+    """Await the request for every page of results, yielding each response as it is received.
+
+    When prefetch is enabled the next page is requested as a task while the current page is being processed.
+    """
+    import asyncio  # pylint: disable=C0415
+    pager = Paginator(operation, keywords)
+    pending: Optional["asyncio.Future"] = asyncio.ensure_future(request(**pager.keywords))
+    try:
+        while pending:
+            response = await pending
+            pending = None
+            next_page = pager.advance(response)
+            if next_page is not None and prefetch:
+                pending = asyncio.ensure_future(request(**next_page))
+            yield response
+            if next_page is not None and not pending:
+                pending = asyncio.ensure_future(request(**next_page))
+    finally:
+        # Cancel the prefetched request when iteration is stopped early.
+        if pending:
+            pending.cancel()
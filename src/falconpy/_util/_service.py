@@ -65,5 +65,8 @@ def service_override_payload(caller: object,
         "log_util": caller.log,
         "debug_record_count": caller.debug_record_count,
         "sanitize": caller.sanitize_log,
-        "pythonic": caller.pythonic
+        "pythonic": caller.pythonic,
+        "session": caller.connection_pool,
+        "rate_limit": caller.rate_limit,
+        "codec": caller.json_codec
     }
@@ -37,6 +37,7 @@ For more information, please refer to <https://unlicense.org>
 """
 from typing import Tuple
 from ._functions import args_to_params, return_preferred_default
+from ._download import download_digest
 from .._constant import PREFER_IDS_IN_BODY, MOCK_OPERATIONS
 from .._enum import BaseURL, ContainerBaseURL
 
@@ -163,18 +164,13 @@ def uber_request_keywords(caller,
                           do_stream: bool                       # .       \/|\/
                           ) -> dict:                            # .        / \  o
     """Generate a properly formatted mapping of the keywords for this request."""
+    params = args_to_params(kwa.get("parameters", {}), kwa, caller.commands, oper, caller.log, caller.pythonic)
     return {
         "method": meth,
         "endpoint": tgt,
         "body": kwa.get("body", return_preferred_default(oper)),
         "data": kwa.get("data", return_preferred_default(oper)),
-        "params": args_to_params(kwa.get("parameters", {}),
-                                 kwa,
-                                 caller.commands,
-                                 oper,
-                                 caller.log,
-                                 caller.pythonic
-                                 ),
+        "params": params,
         "headers": create_uber_header_payload(caller.auth_headers, kwa),
         "files": kwa.get("files", return_preferred_default(oper, "list")),
         "verify": caller.ssl_verify,
@@ -187,5 +183,14 @@ def uber_request_keywords(caller,
         "debug_record_count": caller.debug_record_count,
         "sanitize": caller.sanitize_log,
         "pythonic": caller.pythonic,
-        "stream": do_stream
+        "stream": do_stream,
+        "session": caller.connection_pool,
+        "rate_limit": caller.rate_limit,
+        "codec": caller.json_codec,
+        "operation": oper,
+        "cache": caller.cache_scope,
+        "coalescer": caller.coalescer_scope,
+        "download_to": kwa.get("download_to", None),
+        "download_sha256": download_digest(oper, params, kwa),
+        "upload_progress": kwa.get("upload_progress", None)
     }
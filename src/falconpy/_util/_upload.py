@@ -0,0 +1,364 @@
+"""Streaming multipart upload encoder.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import io
+import mmap
+import os
+from time import monotonic
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from requests.utils import guess_filename
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
+from .._api_request import APIRequest
+from .._constant import UPLOAD_CHUNK_SIZE
+
+
+class RetainedFile(io.RawIOBase):
+    """This class provides read access to a file object without closing it when the upload completes."""
+
+    def __init__(self, file: BinaryIO):
+        """Construct an instance of the RetainedFile class."""
+        super().__init__()
+        self._file: BinaryIO = file
+        self.name = getattr(file, "name", None)
+
+    def readable(self) -> bool:
+        """Return a boolean indicating the file can be read."""
+        return True
+
+    def seekable(self) -> bool:
+        """Return a boolean indicating the file supports random access."""
+        return self._file.seekable()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Change the position of the file."""
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        """Return the current position of the file."""
+        return self._file.tell()
+
+    def fileno(self) -> int:
+        """Return the file descriptor, used to size the upload."""
+        return self._file.fileno()
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes from the file."""
+        return self._file.read(size)
+
+    def readinto(self, buffer: Any) -> int:
+        """Read bytes from the file into the provided buffer."""
+        chunk = self._file.read(len(buffer))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+class UploadSource:
+    """This class represents the content of a single file within a streaming upload.
+
+    Content is read from the path, file object or memory map in chunks each time it is sent.
+    File objects are read from their position when the upload was created. Asynchronous
+    uploads open the source for every attempt and release it once the request completes.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, source: Union[str, os.PathLike, BinaryIO, mmap.mmap]):
+        """Construct an instance of the UploadSource class, calculating the size of the content."""
+        self._source = source
+        self._start: int = 0
+        self._handle: Optional[BinaryIO] = None
+        if isinstance(source, (str, os.PathLike)):
+            self._source = os.fspath(source)
+            self._size: int = os.path.getsize(self._source)
+        elif isinstance(source, mmap.mmap):
+            self._size = len(source)
+        else:
+            self._start = source.tell()
+            self._size = source.seek(0, os.SEEK_END) - self._start
+            source.seek(self._start)
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def chunks(self, chunk_size: int = UPLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield the content of this source in chunks."""
+        if isinstance(self._source, mmap.mmap):
+            for position in range(0, self._size, chunk_size):
+                yield self._source[position:position + chunk_size]
+        elif isinstance(self._source, str):
+            with open(self._source, "rb") as handle:
+                yield from self._read(handle, chunk_size)
+        else:
+            self._source.seek(self._start)
+            yield from self._read(self._source, chunk_size)
+
+    def open(self) -> Union[bytes, BinaryIO]:
+        """Return the content to stream, opening paths and rewinding file objects."""
+        if isinstance(self._source, mmap.mmap):
+            returned = self._source[:self._size]
+        elif isinstance(self._source, str):
+            self._handle = open(self._source, "rb")  # pylint: disable=R1732
+            returned = self._handle
+        else:
+            self._source.seek(self._start)
+            try:
+                self._source.fileno()
+                # File objects are owned by the caller and remain open once the upload completes.
+                returned = RetainedFile(self._source)
+            except (AttributeError, OSError):
+                # In-memory buffers have no descriptor to size the upload with, and are already in memory.
+                returned = self._source.read(self._size)
+
+        return returned
+
+    def release(self):
+        """Close the file when it was opened from a path."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _read(self, handle: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+        """Read no more than the calculated size from the handle."""
+        remaining = self._size
+        while remaining > 0:
+            chunk = handle.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def size(self) -> int:
+        """Return the size of the content in bytes."""
+        return self._size
+
+    @staticmethod
+    def streamable(content: Any) -> bool:
+        """Return a boolean indicating if the content can be streamed from its source."""
+        returned = isinstance(content, (os.PathLike, mmap.mmap))
+        if not returned and hasattr(content, "read"):
+            try:
+                returned = content.seekable()
+            except (AttributeError, ValueError):
+                returned = False
+
+        return returned
+
+
+class MultipartEncoder:
+    """This class represents a multipart/form-data body that is streamed as it is sent.
+
+    Form fields and file parts are encoded the same way requests encodes them, but file
+    content provided as a path, file object or memory map is read in chunks while the
+    request is sent instead of being assembled in memory. Iterating the encoder always
+    starts from the beginning, allowing throttled requests to be retried.
+
+    The callback is called with the encoder after each chunk is sent, and the
+    bytes_read, elapsed and throughput properties may be used to report progress.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 fields: Optional[Union[Dict[str, Any], List[Tuple[str, Any]]]] = None,
+                 files: Optional[Union[Dict[str, Any], List[Tuple[str, Any]]]] = None,
+                 callback: Optional[Callable[["MultipartEncoder"], Any]] = None,
+                 chunk_size: int = UPLOAD_CHUNK_SIZE
+                 ):
+        """Construct an instance of the MultipartEncoder class.
+
+        Keyword arguments
+        ----
+        fields : dict or list
+            Form fields to include in the body, provided the same way as the requests data keyword.
+        files : dict or list
+            Files to include in the body, provided the same way as the requests files keyword.
+            File content may be bytes, a path (os.PathLike), a file object or a memory map.
+        callback : Callable
+            Called with this encoder after each chunk of the body is sent.
+        chunk_size : int
+            Maximum number of bytes read from a source at a time. Defaults to 65536.
+        """
+        self._boundary: str = choose_boundary()
+        self._callback = callback
+        self._chunk_size: int = chunk_size
+        self._parts: List[Union[bytes, UploadSource]] = []
+        self._bytes_read: int = 0
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+        for name, value in form_fields(fields):
+            field = RequestField(name=name, data=value)
+            field.make_multipart()
+            self._add_part(field, value)
+        for name, value in (files.items() if isinstance(files, dict) else files or []):
+            filename, content, content_type, part_headers = value, value, None, None
+            if isinstance(value, (tuple, list)):
+                filename, content = value[0], value[1]
+                content_type = value[2] if len(value) > 2 else None
+                part_headers = value[3] if len(value) > 3 else None
+            else:
+                filename = guess_filename(value) or name
+                if isinstance(value, os.PathLike):
+                    filename = os.path.basename(os.fspath(value))
+            if content is None:
+                continue
+            field = RequestField(name=name, data=b"", filename=filename, headers=part_headers)
+            field.make_multipart(content_type=content_type)
+            self._add_part(field, content)
+        self._append(f"--{self._boundary}--\r\n".encode("latin-1"))
+        self._size: int = sum(len(part) if isinstance(part, bytes) else part.size for part in self._parts)
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def _add_part(self, field: RequestField, content: Any):
+        """Add the encoded headers and content for a single form field or file."""
+        self._append(f"--{self._boundary}\r\n".encode("latin-1") + field.render_headers().encode("utf-8"))
+        if UploadSource.streamable(content):
+            self._parts.append(UploadSource(content))
+        elif hasattr(content, "read"):
+            # Content that can not be repositioned is read once so that it may be sent again.
+            self._append(content.read())
+        else:
+            self._append(content.encode("utf-8") if isinstance(content, str) else bytes(content))
+        self._append(b"\r\n")
+
+    def _append(self, content: bytes):
+        """Append encoded content, joining it to the previous part when possible."""
+        if self._parts and isinstance(self._parts[-1], bytes):
+            self._parts[-1] += content
+        else:
+            self._parts.append(content)
+
+    def _sent(self, chunk: bytes):
+        """Update our counters once a chunk has been sent."""
+        self._bytes_read += len(chunk)
+        if self._bytes_read >= self._size:
+            self._finished = monotonic()
+        if self._callback:
+            self._callback(self)
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield the encoded body in chunks, starting from the beginning."""
+        self._bytes_read = 0
+        self._started = monotonic()
+        self._finished = None
+        for part in self._parts:
+            for chunk in ([part] if isinstance(part, bytes) else part.chunks(self._chunk_size)):
+                yield chunk
+                self._sent(chunk)
+
+    def __len__(self) -> int:
+        """Return the total size of the encoded body."""
+        return self._size
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def content_type(self) -> str:
+        """Return the Content-Type header value for this body."""
+        return f"multipart/form-data; boundary={self._boundary}"
+
+    @property
+    def total(self) -> int:
+        """Return the total size of the encoded body in bytes."""
+        return self._size
+
+    @property
+    def bytes_read(self) -> int:
+        """Return the number of bytes sent so far."""
+        return self._bytes_read
+
+    @property
+    def elapsed(self) -> float:
+        """Return the number of seconds spent sending the body."""
+        returned = 0.0
+        if self._started is not None:
+            returned = (self._finished or monotonic()) - self._started
+
+        return returned
+
+    @property
+    def throughput(self) -> float:
+        """Return the average number of bytes sent per second."""
+        returned = 0.0
+        if self.elapsed > 0:
+            returned = self._bytes_read / self.elapsed
+
+        return returned
+
+
+def form_fields(fields: Optional[Union[Dict[str, Any], List[Tuple[str, Any]]]]) -> Iterator[Tuple[str, bytes]]:
+    """Yield form fields as name, value pairs the same way requests would encode them."""
+    for name, value in (fields.items() if isinstance(fields, dict) else fields or []):
+        values = [value] if isinstance(value, (str, bytes)) or not hasattr(value, "__iter__") else value
+        for item in values:
+            if item is not None:
+                yield name, item if isinstance(item, bytes) else str(item).encode("utf-8")
+
+
+def upload_payloads(api: APIRequest, headers: Dict[str, str], payloads: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the request payloads, streaming file uploads from their sources when possible.
+
+    File uploads are streamed when any file is provided as a path, file object or memory map,
+    or when an upload progress callback has been requested. Otherwise the payloads are returned
+    with the files unchanged.
+    """
+    returned = {**payloads, "files": api.files}
+    files = api.files.values() if isinstance(api.files, dict) else [file[1] for file in api.files or []]
+    contents = [file[1] if isinstance(file, (tuple, list)) and len(file) > 1 else file for file in files]
+    if api.files and (api.upload_progress or any(UploadSource.streamable(content) for content in contents)):
+        encoder = MultipartEncoder(api.data_payload, api.files, callback=api.upload_progress)
+        for header in [key for key in headers if key.lower() == "content-type"]:
+            headers.pop(header)
+        headers["Content-Type"] = encoder.content_type
+        returned = {"json": None, "data": encoder, "files": None}
+
+    return returned
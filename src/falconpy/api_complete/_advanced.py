@@ -36,7 +36,7 @@ OTHER DEALINGS IN THE SOFTWARE.
 For more information, please refer to <https://unlicense.org>
 """
 import functools
-from typing import Dict, Union, Callable
+from typing import Any, Dict, Iterator, Optional, Union, Callable
 from requests import Response
 from .._constant import ALLOWED_METHODS
 from .._util import (
@@ -48,7 +48,12 @@ from .._util import (
     handle_body_payload_ids,
     scrub_target,
     handle_container_operations,
-    uber_request_keywords
+    uber_request_keywords,
+    operation_index,
+    paginate,
+    hydrate,
+    entity_chunk_size,
+    entity_ids_keyword
     )
 from .._error import (
     InvalidOperation,
@@ -192,14 +197,14 @@ class APIHarnessV2(UberInterface):
                 kwargs["api_operation"] = args[0]
         except IndexError:
             pass  # They didn't specify an action, try for an override instead.
-        uber_command = [a for a in self.commands if a[0] == kwargs.get("api_operation", None)]
+        uber_command = operation_index(self.commands).get(kwargs.get("api_operation", None), None)
         if kwargs.get("override", None):
-            uber_command = [["Manual"] + kwargs["override"].split(",")]
+            uber_command = ["Manual"] + kwargs["override"].split(",")
         if uber_command:
             # Which API operation to perform.
-            operation = uber_command[0][0]
+            operation = uber_command[0]
             # Which HTTP method to execute
-            method = uber_command[0][1].upper()
+            method = uber_command[1].upper()
             # Check the headers. If we've not logged in yet, this will force our base_url
             # to point to the correct cloud region.
             _ = self.auth_headers
@@ -207,7 +212,7 @@ class APIHarnessV2(UberInterface):
             kwargs, url_base, container = handle_container_operations(kwargs, self.base_url)
             # Retrieve the endpoint from the command list and append to our base URL and
             # then perform any outstanding string replacements on the target endpoint URL.
-            target = scrub_target(operation, f"{url_base}{uber_command[0][2]}", kwargs)
+            target = scrub_target(operation, f"{url_base}{uber_command[2]}", kwargs)
             # Handle any IDs that are in the wrong payload
             kwargs = handle_body_payload_ids(kwargs)
             # Enable streaming if requested
@@ -244,3 +249,85 @@ class APIHarnessV2(UberInterface):
             raise InvalidOperation
 
         return returned
+
+    def paginate(self, api_operation: str, prefetch: bool = False, **kwargs) -> Iterator[Any]:
+        """Iterate through every page of results returned by an API operation.
+
+        Pages are requested as they are consumed. The pagination style (offset, after or
+        next_token) is determined from the operation parameters and the pagination
+        metadata returned by the API. Iteration ends when all results have been received
+        or a request fails. The failed response is returned as the final page.
+
+        Keyword arguments
+        ----
+        api_operation : str
+            API Operation ID to perform.
+        prefetch : bool (Default: False)
+            Request the next page in the background while the current page is processed.
+        All other keywords are provided to the command method for every page.
+
+        Returns
+        ----
+        generator
+            Generator yielding the response received for each page.
+        """
+        return paginate(functools.partial(self.command, api_operation),
+                        operation_index(self.commands).get(api_operation, None),
+                        kwargs,
+                        prefetch
+                        )
+
+    def hydrate(self,
+                query_operation: str,
+                entity_operation: str,
+                chunk_size: Optional[int] = None,
+                max_workers: int = 4,
+                entity_keywords: Optional[Dict[str, Any]] = None,
+                ids_keyword: Optional[str] = None,
+                **kwargs
+                ) -> Iterator[Any]:
+        """Retrieve the entities for every ID returned by a query operation.
+
+        ID pages are retrieved from the query operation and split into chunks, which are
+        provided to the entity operation by a pool of worker threads while the next ID page
+        is retrieved. Entities are yielded in the order the IDs were received.
+        Raises APIError when a request fails.
+
+        Keyword arguments
+        ----
+        query_operation : str
+            API Operation ID of the query. (Example: QueryDevicesByFilterScroll)
+        entity_operation : str
+            API Operation ID used to retrieve entities by ID. (Example: PostDeviceDetailsV2)
+        chunk_size : int (Default: Maximum accepted by the entity operation, or 100)
+            Number of IDs provided to each entity request.
+        max_workers : int (Default: 4)
+            Maximum number of concurrent entity requests.
+        entity_keywords : dict (Default: None)
+            Additional keywords provided to every entity request.
+        ids_keyword : str (Default: Keyword accepted by the entity operation, or "ids")
+            Keyword used to provide the IDs to the entity operation. IDs are provided
+            within the body payload when the keyword is not a query parameter.
+        All other keywords are provided to the query operation for every page.
+
+        Returns
+        ----
+        generator
+            Generator yielding each entity retrieved.
+        """
+        ids_keyword = ids_keyword if ids_keyword else entity_ids_keyword(entity_operation)
+        return hydrate(self.paginate(query_operation, prefetch=True, **kwargs),
+                       functools.partial(self._entity_request, entity_operation, ids_keyword),
+                       chunk_size if chunk_size else entity_chunk_size(entity_operation),
+                       max_workers,
+                       entity_keywords,
+                       ids_keyword
+                       )
+
+    def _entity_request(self, api_operation: str, ids_keyword: str, **kwargs) -> Any:
+        """Perform an entity operation, providing the IDs within the body payload when they are not a query parameter."""
+        operation = operation_index(self.commands).get(api_operation, None)
+        if operation and ids_keyword not in operation.params and "body" in operation.params:
+            kwargs["body"] = {**kwargs.get("body", {}), ids_keyword: kwargs.pop(ids_keyword)}
+
+        return self.command(api_operation, **kwargs)
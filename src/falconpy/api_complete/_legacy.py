@@ -57,7 +57,7 @@ from .._util import (
     )
 from .._enum import BaseURL, ContainerBaseURL, TokenFailReason
 from .._constant import PREFER_IDS_IN_BODY, MOCK_OPERATIONS
-from .._endpoint import api_endpoints
+from .. import _endpoint
 from .._log import LogFacility
 
 
@@ -144,7 +144,7 @@ class APIHarness:
         self.token_fail_reason = None
         self.token_status = None
         self.headers = lambda: {"Authorization": f"Bearer {self.token}"} if self.token else {}
-        self.commands = api_endpoints
+        self.commands = _endpoint.api_endpoints
         self.user_agent = user_agent  # Issue #365
         # Maximum renewal window is 20 minutes, Minimum is 2 minutes
         self.token_renew_window = max(min(renew_window, 1200), 120)  # in seconds
@@ -78,6 +78,8 @@ class FalconXSandbox(ServiceClass):
         name -- The name given to your download file. String.
         parameters -- Full parameters payload, not required if id is provided as a keyword.
         stream -- Enable streaming download of the returned file. Boolean.
+        download_to -- Path or file object the file is written to in fixed size chunks. Interrupted
+                       downloads are resumed. Provide expected_sha256 to verify the downloaded file.
 
         Arguments: When not specified, the first argument to this method is assumed to be 'id'.
                    All others are ignored.
@@ -117,6 +119,8 @@ class FalconXSandbox(ServiceClass):
         name -- The name given to your download file. String.
         parameters -- Full parameters payload, not required if id is provided as a keyword.
         stream -- Enable streaming download of the returned file. Boolean.
+        download_to -- Path or file object the file is written to in fixed size chunks. Interrupted
+                       downloads are resumed. Provide expected_sha256 to verify the downloaded file.
 
         Arguments: When not specified, the first argument to this method is assumed to be 'id'.
                    All others are ignored.
@@ -156,6 +160,8 @@ class FalconXSandbox(ServiceClass):
         name -- The name given to your download file. String.
         parameters -- Full parameters payload, not required if id is provided as a keyword.
         stream -- Enable streaming download of the returned file. Boolean.
+        download_to -- Path or file object the file is written to in fixed size chunks. Interrupted
+                       downloads are resumed. Provide expected_sha256 to verify the downloaded file.
 
         Arguments: When not specified, the first argument to this method is assumed to be 'id'.
                    All others are ignored.
@@ -195,6 +201,8 @@ class FalconXSandbox(ServiceClass):
         name -- The name given to your download file. String.
         parameters -- full parameters payload, not required if id is provided as a keyword.
         stream -- Enable streaming download of the returned file. Boolean.
+        download_to -- Path or file object the file is written to in fixed size chunks. Interrupted
+                       downloads are resumed. Provide expected_sha256 to verify the downloaded file.
 
         Arguments: When not specified, the first argument to this method is assumed to be 'id'.
                    All others are ignored.
@@ -451,7 +459,8 @@ class FalconXSandbox(ServiceClass):
 
         Keyword arguments:
         comment -- A descriptive comment to identify the file for other users. String.
-        file_data -- Content of the uploaded sample in binary format. Max file size is 256 MB.
+        file_data -- Content of the uploaded sample in binary format, or a path (os.PathLike),
+                     file object or memory map the sample is streamed from. Max file size is 256 MB.
                      'sample' and 'upfile' are also accepted as this parameter.
 
                      Accepted File Formats:
@@ -482,6 +491,7 @@ class FalconXSandbox(ServiceClass):
                            False = File can be seen by other CrowdStrike customers.
                            Defaults to True.
         parameters -- full parameters payload, not required if other keywords are provided.
+        upload_progress -- Callable provided the MultipartEncoder as each chunk of the upload is sent.
 
 
         This method only supports keywords for providing arguments.
@@ -525,6 +535,7 @@ class FalconXSandbox(ServiceClass):
             operation_id="UploadSampleV2",
             files=[("sample", (file_name, file_data))],  # Passed as a list of tuples
             data=file_extended,
+            keywords={"upload_progress": kwargs.get("upload_progress", None)},
             body=body  # Not used but maintained for backwards compatibility with method signature
             )
 
@@ -605,6 +616,8 @@ class FalconXSandbox(ServiceClass):
         password_protected -- Flag whether the sample should be zipped and password protected
                               with a value of "infected". Default value is "false".
         stream -- Enable streaming download of the returned file. Boolean.
+        download_to -- Path or file object the file is written to in fixed size chunks. Interrupted
+                       downloads are resumed. Provide expected_sha256 to verify the downloaded file.
 
         Arguments: When not specified, the first argument to this method is assumed to be 'ids'.
                    All others are ignored.
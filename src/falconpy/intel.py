@@ -490,6 +490,8 @@ class Intel(ServiceClass):
 
         Keyword arguments:
         format -- Choose the format you want the rule set in. Either zip or gzip. Defaults to zip.
+        download_to -- Path or file object the file is written to in fixed size chunks. Interrupted
+                       downloads are resumed. Provide expected_sha256 to verify the downloaded file.
         id -- One or more actor IDs. String or list of strings.
         parameters - full parameters payload, not required if id is provided as a keyword.
 
@@ -521,6 +523,8 @@ class Intel(ServiceClass):
         if_modified_since -- Download the latest rule set only if the rule was modified after this date.
                              http, ANSIC and RFC850 formats accepted. String.
         format -- Choose the format you want the rule set in. Either zip or gzip. Defaults to zip.
+        download_to -- Path or file object the file is written to in fixed size chunks. Interrupted
+                       downloads are resumed. Provide expected_sha256 to verify the downloaded file.
         parameters - full parameters payload, not required if other keywords are used.
         type -- The rule news report type. The following values are accepted:
                 common-event-format         snort-suricata-update
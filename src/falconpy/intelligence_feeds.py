@@ -67,6 +67,8 @@ class IntelligenceFeeds(ServiceClass):
         feed_item_id -- Feed object reference ID.
         parameters -- Full parameters payload dictionary. Not required if using other keywords.
         stream -- Enable streaming download of the returned file. Boolean.
+        download_to -- Path or file object the file is written to in fixed size chunks. Interrupted
+                       downloads are resumed. Provide expected_sha256 to verify the downloaded file.
 
         This method only supports keywords for providing arguments.
 
@@ -141,6 +141,8 @@ class MalQuery(ServiceClass):
         ids -- List of SHA256s to retrieve. String or list of strings.
         parameters -- Full parameters payload, not required if ids is provided as a keyword.
         stream -- Enable streaming download of the returned file. Boolean.
+        download_to -- Path or file object the file is written to in fixed size chunks. Interrupted
+                       downloads are resumed. Provide expected_sha256 to verify the downloaded file.
 
         Arguments: When not specified, the first argument to this method is assumed to be 'ids'.
                    All others are ignored.
@@ -229,6 +231,8 @@ class MalQuery(ServiceClass):
         ids -- Multi-download job ID. String.
         parameters -- full parameters payload, not required if ids is provided as a keyword.
         stream -- Enable streaming download of the returned file. Boolean.
+        download_to -- Path or file object the file is written to in fixed size chunks. Interrupted
+                       downloads are resumed. Provide expected_sha256 to verify the downloaded file.
 
         Arguments: When not specified, the first argument to this method is assumed to be 'ids'.
                    All others are ignored.
@@ -65,9 +65,10 @@ class NGSIEM(ServiceClass):
         """Upload file to NGSIEM.
 
         Keyword arguments:
-        lookup_file -- File to be uploaded. Binary data.  (CSV format)
+        lookup_file -- Path to the file to be uploaded, streamed from disk. (CSV format)
         repository -- Name of the repository. String.
         parameters -- Full parameters payload dictionary. Not required if using other keywords.
+        upload_progress -- Callable provided the MultipartEncoder as each chunk of the upload is sent.
 
         This method only supports keywords for providing arguments.
 
@@ -115,6 +116,8 @@ class NGSIEM(ServiceClass):
         filename -- Name of the lookup file. String.
         parameters -- Full parameters payload dictionary. Not required if using other keywords.
         stream -- Enable streaming download of the returned file. Boolean.
+        download_to -- Path or file object the file is written to in fixed size chunks. Interrupted
+                       downloads are resumed. Provide expected_sha256 to verify the downloaded file.
 
         This method only supports keywords for providing arguments.
 
@@ -162,6 +165,8 @@ class NGSIEM(ServiceClass):
         filename -- Name of lookup file. String.
         parameters -- Full parameters payload dictionary. Not required if using other keywords.
         stream -- Enable streaming download of the returned file. Boolean.
+        download_to -- Path or file object the file is written to in fixed size chunks. Interrupted
+                       downloads are resumed. Provide expected_sha256 to verify the downloaded file.
 
         This method only supports keywords for providing arguments.
 
@@ -214,6 +219,8 @@ class NGSIEM(ServiceClass):
         filename -- Name of lookup file. String.
         parameters -- Full parameters payload dictionary. Not required if using other keywords.
         stream -- Enable streaming download of the returned response. Boolean.
+        download_to -- Path or file object the file is written to in fixed size chunks. Interrupted
+                       downloads are resumed. Provide expected_sha256 to verify the downloaded file.
 
         This method only supports keywords for providing arguments.
 
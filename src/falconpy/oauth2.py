@@ -35,13 +35,14 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-# pylint: disable=R0902,R0913
-from typing import Dict, Optional, Union
-from ._auth_object import FalconInterface
+# pylint: disable=R0902,R0913,R0914,R0917
+from typing import Any, Dict, Optional, Union
+from ._auth_object import ConnectionPool, FalconInterface, RateLimiter, RequestCoalescer, ResponseCache, TokenStore
 from ._error import CannotRevokeToken
 from ._util import (
     confirm_base_url,
     generate_ok_result,
+    JSONCodec
     )
 from ._result import Result
 
@@ -82,7 +83,15 @@ class OAuth2(FalconInterface):
                  debug_record_count: Optional[int] = None,
                  sanitize_log: Optional[bool] = None,
                  pythonic: Optional[bool] = None,
-                 environment: Optional[Dict[str, str]] = None
+                 environment: Optional[Dict[str, str]] = None,
+                 connection_pool: Optional[Union[ConnectionPool, Dict[str, Union[int, bool]]]] = None,
+                 rate_limit: Optional[Union[RateLimiter, Dict[str, Union[int, float]], bool]] = None,
+                 background_refresh: Optional[bool] = False,
+                 token_store: Optional[Union[TokenStore, str, bool]] = None,
+                 json_codec: Optional[Union[JSONCodec, str]] = None,
+                 response_cache: Optional[Union[ResponseCache, Dict[str, Any], bool]] = None,
+                 request_coalescer: Optional[Union[RequestCoalescer, Dict[str, Any], bool]] = None,
+                 revoke_on_logout: Optional[bool] = False
                  ):
         """Construct an instance of the class.
 
@@ -113,6 +122,37 @@ class OAuth2(FalconInterface):
             Amount of time (in seconds) between now and the token expiration before
             a refresh of the token is performed. Default: 120, Max: 1200
             Values over 1200 will be reset to the maximum.
+        connection_pool : ConnectionPool or dict
+            Pooled HTTP session shared by all requests made with this object, or
+            a dictionary of pool settings (pool_connections, pool_maxsize,
+            pool_block, keep_alive) used to create one.
+        rate_limit : RateLimiter, dict or bool
+            Enables rate limit aware pacing and retries of throttled requests.
+            Provide True for the default settings, a dictionary of settings,
+            or an existing RateLimiter to share its budgets. Disabled by default.
+        background_refresh : bool
+            Refresh the token in a background thread before it becomes stale,
+            so requests never wait for a token refresh. Disabled by default.
+        token_store : TokenStore, str or bool
+            Shares tokens with other authentication objects and processes using
+            the same credentials. Provide True for the default token directory,
+            a directory path, or an existing TokenStore. Disabled by default.
+        json_codec : JSONCodec or str
+            JSON library used to encode request bodies and decode responses.
+            Provide a JSONCodec or the name of a library ("orjson", "ujson"
+            or "json"). Defaults to the fastest installed library.
+        response_cache : ResponseCache, dict or bool
+            Caches responses to idempotent operations. Provide True for the
+            default settings, a dictionary of settings (ttl, ttls, max_bytes),
+            or an existing ResponseCache. Disabled by default.
+        request_coalescer : RequestCoalescer, dict or bool
+            Shares identical in-flight idempotent requests between threads.
+            Provide True for the default settings, a dictionary of settings
+            (operations), or an existing RequestCoalescer. Disabled by default.
+        revoke_on_logout : bool
+            Revoke tokens shared through the token store when logging out.
+            By default only this object's handle is released and the shared
+            token is left to expire for other authentication objects.
 
         Arguments
         ----
@@ -138,7 +178,15 @@ class OAuth2(FalconInterface):
                          debug_record_count=debug_record_count,
                          sanitize_log=sanitize_log,
                          pythonic=pythonic,
-                         environment=environment
+                         environment=environment,
+                         connection_pool=connection_pool,
+                         rate_limit=rate_limit,
+                         background_refresh=background_refresh,
+                         token_store=token_store,
+                         json_codec=json_codec,
+                         response_cache=response_cache,
+                         request_coalescer=request_coalescer,
+                         revoke_on_logout=revoke_on_logout
                          )
 
     def logout(self) -> Union[Dict[str, Union[int, dict]], Result]:
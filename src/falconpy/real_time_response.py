@@ -634,6 +634,8 @@ class RealTimeResponse(ServiceClass):
         sha256 -- Extracted SHA256 value. String.
         filename -- Filename to use for the archive name and the file within the archive. String.
         stream -- Enabling streaming download for the requested file. Boolean.
+        download_to -- Path or file object the file is written to in fixed size chunks. Interrupted
+                       downloads are resumed. Provide expected_sha256 to verify the downloaded file.
         parameters -- full parameters payload, not required if ids is provided as a keyword.
 
         This method only supports keywords for providing arguments.
@@ -297,9 +297,11 @@ class RealTimeResponseAdmin(ServiceClass):
                 }
         files -- File to be uploaded. List of tuples. *REQUIRED*
                  Ex: [('file', ('file.ext', open('file.ext','rb').read(), 'application/script'))]
+                 File objects, paths (os.PathLike) and memory maps are streamed from their source.
         description -- File description. String.
         name -- File name (if different than actual file name). String.
         comments_for_audit_log -- Audit log comment. String.
+        upload_progress -- Callable provided the MultipartEncoder as each chunk of the upload is sent.
 
         This method only supports keywords for providing arguments.
 
@@ -318,7 +320,8 @@ class RealTimeResponseAdmin(ServiceClass):
             endpoints=Endpoints,
             operation_id="RTR_CreatePut_Files",
             data=data,
-            files=files
+            files=files,
+            keywords={"upload_progress": kwargs.get("upload_progress", None)}
             )
 
     @force_default(defaults=["parameters"], default_types=["dict"])
@@ -427,9 +430,11 @@ class RealTimeResponseAdmin(ServiceClass):
                 }
         files -- File to be uploaded. List of tuples. *REQUIRED*
                  Ex: [('file', ('file.ext', open('file.ext','rb').read(), 'application/script'))]
+                 File objects, paths (os.PathLike) and memory maps are streamed from their source.
         description -- File description. String.
         name -- File name (if different than actual file name). String.
         comments_for_audit_log -- Audit log comment. String.
+        upload_progress -- Callable provided the MultipartEncoder as each chunk of the upload is sent.
         permission_type -- Permission for the custom-script.
                            Valid permission values:
                              `private` - usable by only the user who uploaded it
@@ -456,7 +461,8 @@ class RealTimeResponseAdmin(ServiceClass):
             endpoints=Endpoints,
             operation_id="RTR_CreateScripts",
             data=data,
-            files=files
+            files=files,
+            keywords={"upload_progress": kwargs.get("upload_progress", None)}
             )
 
     @force_default(defaults=["parameters"], default_types=["dict"])
@@ -506,10 +512,12 @@ class RealTimeResponseAdmin(ServiceClass):
                 }
         files -- File to be uploaded. List of tuples. *REQUIRED*
                  Ex: [('file', ('file.ext', open('file.ext','rb').read(), 'application/script'))]
+                 File objects, paths (os.PathLike) and memory maps are streamed from their source.
         description -- File description. String.
         id -- Script ID to be updated. String.
         name -- File name (if different than actual file name). String.
         comments_for_audit_log -- Audit log comment. String.
+        upload_progress -- Callable provided the MultipartEncoder as each chunk of the upload is sent.
         permission_type -- Permission for the custom-script.
                            Valid permission values:
                              `private` - usable by only the user who uploaded it
@@ -536,7 +544,8 @@ class RealTimeResponseAdmin(ServiceClass):
             endpoints=Endpoints,
             operation_id="RTR_UpdateScripts",
             data=data,
-            files=files
+            files=files,
+            keywords={"upload_progress": kwargs.get("upload_progress", None)}
             )
 
     @force_default(defaults=["parameters"], default_types=["dict"])
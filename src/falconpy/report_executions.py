@@ -62,6 +62,8 @@ class ReportExecutions(ServiceClass):
 
         Keyword arguments:
         ids -- ID of the report entity to retrieve.
+        download_to -- Path or file object the file is written to in fixed size chunks. Interrupted
+                       downloads are resumed. Provide expected_sha256 to verify the downloaded file.
         parameters - full parameters payload, not required if ids is provided as a keyword.
 
         Arguments: When not specified, the first argument to this method is assumed to be 'ids'.
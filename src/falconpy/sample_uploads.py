@@ -173,6 +173,7 @@ class SampleUploads(ServiceClass):
                            Defaults to True.
         parameters -- full parameters payload, not required if using other keywords.
         password -- Archive password. String.
+        upload_progress -- Callable provided the MultipartEncoder as each chunk of the upload is sent.
 
         This method only supports keywords for providing arguments.
 
@@ -213,7 +214,8 @@ class SampleUploads(ServiceClass):
 
         Keyword arguments:
         comment -- A descriptive comment to identify the file for other users. String.
-        file_data -- Content of the uploaded archive in binary format.
+        file_data -- Content of the uploaded archive in binary format, or a path (os.PathLike),
+                     file object or memory map the archive is streamed from.
                      'archive' and 'file' are also accepted as this parameter.
         name -- Name of the archive. String. Required.
         file_type -- Archive file format. String. "zip", "7zip". Defaults to "zip".
@@ -224,6 +226,7 @@ class SampleUploads(ServiceClass):
                            Defaults to True.
         parameters -- full parameters payload, not required if using other keywords.
         password -- Archive password. String.
+        upload_progress -- Callable provided the MultipartEncoder as each chunk of the upload is sent.
 
         This method only supports keywords for providing arguments.
 
@@ -272,7 +275,8 @@ class SampleUploads(ServiceClass):
             operation_id="ArchiveUploadV2",
             body=body,
             files=file_tuple,
-            data=file_extended
+            data=file_extended,
+            keywords={"upload_progress": kwargs.get("upload_progress", None)}
             )
 
     @force_default(defaults=["parameters"], default_types=["dict"])
@@ -396,6 +400,8 @@ class SampleUploads(ServiceClass):
         password_protected -- Flag whether the sample should be zipped and password protected
                               with the pass of 'infected'. Defaults to False.
         stream -- Enable streaming download of the file. Boolean.
+        download_to -- Path or file object the file is written to in fixed size chunks. Interrupted
+                       downloads are resumed. Provide expected_sha256 to verify the downloaded file.
 
         Arguments: When not specified, the first argument to this method is assumed to be 'ids'.
                    All others are ignored.
@@ -429,7 +435,8 @@ class SampleUploads(ServiceClass):
 
         Keyword arguments:
         comment -- A descriptive comment to identify the file for other users. String.
-        file_data -- Content of the uploaded sample in binary format. Max file size is 256 MB.
+        file_data -- Content of the uploaded sample in binary format, or a path (os.PathLike),
+                     file object or memory map the sample is streamed from. Max file size is 256 MB.
                      'sample' and 'upfile' are also accepted as this parameter.
 
                      Accepted File Formats:
@@ -460,6 +467,7 @@ class SampleUploads(ServiceClass):
                            False = File can be seen by other CrowdStrike customers.
                            Defaults to True.
         parameters -- full parameters payload, not required if using other keywords.
+        upload_progress -- Callable provided the MultipartEncoder as each chunk of the upload is sent.
 
 
         This method only supports keywords for providing arguments.
@@ -504,6 +512,7 @@ class SampleUploads(ServiceClass):
             operation_id="UploadSampleV3",
             files=[("sample", (file_name, file_data))],  # Passed as a list of tuples
             data=file_extended,
+            keywords={"upload_progress": kwargs.get("upload_progress", None)},
             body=body  # Not used but maintained for backwards compatibility with method signature
             )
 
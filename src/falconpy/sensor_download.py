@@ -40,11 +40,24 @@ from typing import Dict, Union
 from requests import Response
 from ._util import generate_ok_result, force_default
 from ._util import handle_single_argument, process_service_request
+from ._util._paginate import unpack_response
 from ._result import Result
 from ._service_class import ServiceClass
 from ._endpoint._sensor_download import _sensor_download_endpoints as Endpoints
 
 
+def _download_successful(returned: Union[Dict[str, Union[int, dict]], Result]) -> Union[Dict[str, Union[int, dict]], Result]:
+    """Replace a successful download response with a download successful message of the same format."""
+    status_code, headers, _ = unpack_response(returned)
+    if status_code == 200 and isinstance(returned, Result):
+        # Pythonic results provide the message within the meta branch.
+        returned = Result(status_code, headers, {"meta": {"message": "Download successful"}, "resources": [], "errors": []})
+    elif status_code == 200:
+        returned = generate_ok_result(message="Download successful", headers=headers)
+
+    return returned
+
+
 class SensorDownload(ServiceClass):
     """The only requirement to instantiate an instance of this class is one of the following.
 
@@ -142,6 +155,8 @@ class SensorDownload(ServiceClass):
         file_name -- Name to use for saved file. Must be present to cause a file download.
         parameters - Full parameters payload, not required if id is provided as a keyword.
         stream -- Enable streaming download of the file. Boolean.
+        download_to -- Path or file object the file is written to in fixed size chunks. Interrupted
+                       downloads are resumed. Provide expected_sha256 to verify the downloaded file.
 
         Arguments: When not specified, the first argument to this method is assumed to be 'ids'.
                    All others are ignored.
@@ -153,6 +168,10 @@ class SensorDownload(ServiceClass):
         Swagger URL
         https://assets.falcon.crowdstrike.com/support/api/swagger.html#/sensor-download/DownloadSensorInstallerById
         """
+        if file_name and download_path:
+            os.makedirs(download_path, exist_ok=True)
+            # Stream the sensor into the aforementioned directory with the provided file name.
+            kwargs["download_to"] = os.path.join(download_path, file_name)
         returned = process_service_request(
                         calling_object=self,
                         endpoints=Endpoints,
@@ -161,13 +180,8 @@ class SensorDownload(ServiceClass):
                         params=handle_single_argument(args, parameters, "ids"),
                         stream=kwargs.get("stream", False)
                         )
-        if file_name and download_path and isinstance(returned, bytes):
-            os.makedirs(download_path, exist_ok=True)
-            # write the newly downloaded sensor into the
-            # aforementioned directory with provided file name
-            with open(os.path.join(download_path, file_name), "wb") as sensor:
-                sensor.write(returned)
-            returned = generate_ok_result(message="Download successful")
+        if file_name and download_path:
+            returned = _download_successful(returned)
 
         return returned
 
@@ -189,6 +203,8 @@ class SensorDownload(ServiceClass):
         file_name -- Name to use for saved file. Must be present to cause a file download.
         parameters -- Full parameters payload, not required if id is provided as a keyword.
         stream -- Enable streaming download of the file. Boolean.
+        download_to -- Path or file object the file is written to in fixed size chunks. Interrupted
+                       downloads are resumed. Provide expected_sha256 to verify the downloaded file.
 
         Arguments: When not specified, the first argument to this method is assumed to be 'ids'.
                    All others are ignored.
@@ -200,6 +216,10 @@ class SensorDownload(ServiceClass):
         Swagger URL
         https://assets.falcon.crowdstrike.com/support/api/swagger.html#/sensor-download/DownloadSensorInstallerByIdV2
         """
+        if file_name and download_path:
+            os.makedirs(download_path, exist_ok=True)
+            # Stream the sensor into the aforementioned directory with the provided file name.
+            kwargs["download_to"] = os.path.join(download_path, file_name)
         returned = process_service_request(
                         calling_object=self,
                         endpoints=Endpoints,
@@ -208,13 +228,8 @@ class SensorDownload(ServiceClass):
                         params=handle_single_argument(args, parameters, "ids"),
                         stream=kwargs.get("stream", False)
                         )
-        if file_name and download_path and isinstance(returned, bytes):
-            os.makedirs(download_path, exist_ok=True)
-            # write the newly downloaded sensor into the
-            # aforementioned directory with provided file name
-            with open(os.path.join(download_path, file_name), "wb") as sensor:
-                sensor.write(returned)
-            returned = generate_ok_result(message="Download successful")
+        if file_name and download_path:
+            returned = _download_successful(returned)
 
         return returned
 
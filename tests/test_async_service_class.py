@@ -0,0 +1,64 @@
+# test_async_service_class.py
+# This class tests the asynchronous Service Class and authentication interface
+import asyncio
+import os
+import sys
+import pytest
+# Authentication via the test_authorization.py
+from tests import test_authorization as Authorization
+# Asynchronous support requires the optional aiohttp package
+pytest.importorskip("aiohttp")
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import AsyncFalconInterface, AsyncServiceClass, AsyncHosts, Hosts, async_service_class
+
+auth = Authorization.TestAuthorization()
+auth.serviceAuth()
+AllowedResponses = [200, 201, 202, 400, 403, 404, 429]
+
+
+class TestAsyncServiceClass:
+    def async_query_and_detail(self):
+        async def run():
+            async with AsyncHosts(client_id=auth.config["falcon_client_id"],
+                                  client_secret=auth.config["falcon_client_secret"],
+                                  base_url=auth.config["falcon_base_url"]
+                                  ) as falcon:
+                id_list = await falcon.query_devices_by_filter(limit=5)
+                if id_list["status_code"] not in AllowedResponses:
+                    return False
+                results = await asyncio.gather(*[falcon.get_device_details(ids=device_id)
+                                                 for device_id in id_list["body"]["resources"]
+                                                 ])
+                return all(result["status_code"] in AllowedResponses for result in results)
+        return asyncio.run(run())
+
+    def async_shared_interface(self):
+        async def run():
+            interface = AsyncFalconInterface(client_id=auth.config["falcon_client_id"],
+                                             client_secret=auth.config["falcon_client_secret"],
+                                             base_url=auth.config["falcon_base_url"]
+                                             )
+            falcon = AsyncHosts(auth_object=interface)
+            result = await falcon.QueryDevicesByFilter(limit=1)
+            await interface.logout()
+            return bool(result["status_code"] in AllowedResponses)
+        return asyncio.run(run())
+
+    def test_async_query_and_detail(self):
+        assert self.async_query_and_detail()
+
+    def test_async_shared_interface(self):
+        assert self.async_shared_interface()
+
+    def test_async_class_creation(self):
+        assert bool(async_service_class(Hosts) is AsyncHosts and issubclass(AsyncHosts, AsyncServiceClass))
+
+    def test_async_unsupported_options(self):
+        # Options that are not available to asynchronous interfaces are rejected instead of ignored
+        with pytest.raises(ValueError):
+            AsyncHosts(client_id=auth.config["falcon_client_id"],
+                       client_secret=auth.config["falcon_client_secret"],
+                       token_store=True
+                       )
@@ -2,6 +2,9 @@
 # Tests different service class authentication styles
 import os
 import sys
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 # Authentication via the test_authorization.py
 from tests import test_authorization as Authorization
@@ -15,9 +18,16 @@ from falconpy import (
     version,
     InvalidCredentialFormat,
     Hosts,
-    Detects
+    Detects,
+    ConnectionPool,
+    RateLimiter,
+    FileTokenStore,
+    JSONCodec,
+    ResponseCache,
+    RequestCoalescer
     )
 from falconpy._util import confirm_base_region, confirm_base_url
+from falconpy._util._codec import JSONDecodeError
 from falconpy._version import _TITLE, _VERSION
 
 auth = Authorization.TestAuthorization()
@@ -348,3 +358,188 @@ class TestAuthentications:
             except InvalidCredentialFormat:
                 _success = True
         assert _success
+
+    def test_connection_pool(self):
+        pool = ConnectionPool(pool_maxsize=5)
+        test_object = Hosts(client_id=auth.config["falcon_client_id"],
+                            client_secret=auth.config["falcon_client_secret"],
+                            connection_pool=pool,
+                            debug=_DEBUG
+                            )
+        result = test_object.query_devices_by_filter(limit=1)
+        _success = bool(result["status_code"] in AllowedResponses and test_object.connection_pool.active)
+        test_object.auth_object.logout()
+        assert bool(_success and not pool.active)
+
+    def test_rate_limiter(self):
+        scheduler = RateLimiter(max_retries=2, backoff_base=0.1)
+        test_object = Hosts(auth_object=OAuth2(client_id=auth.config["falcon_client_id"],
+                                               client_secret=auth.config["falcon_client_secret"],
+                                               rate_limit=scheduler,
+                                               debug=_DEBUG
+                                               ))
+        result = test_object.query_devices_by_filter(limit=1)
+        _success = bool(result["status_code"] in AllowedResponses and test_object.rate_limit.limit)
+        test_object.auth_object.logout()
+        assert _success
+
+    def test_rate_limiter_safe_methods(self):
+        scheduler = RateLimiter()
+        assert bool(scheduler.retryable(429, "POST")
+                    and scheduler.retryable(503, "GET")
+                    and not scheduler.retryable(503, "POST")
+                    and not scheduler.retryable(500, "GET")
+                    )
+
+    def test_single_flight_refresh(self):
+        test_object = Hosts(auth_object=OAuth2(client_id=auth.config["falcon_client_id"],
+                                               client_secret=auth.config["falcon_client_secret"],
+                                               background_refresh=True,
+                                               debug=_DEBUG
+                                               ))
+        test_object.query_devices_by_filter(limit=1)
+        # Force the token to become stale so every thread attempts a refresh
+        test_object.auth_object.bearer_token.token_time -= test_object.auth_object.token_expiration
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: test_object.query_devices_by_filter(limit=1)["status_code"], range(16)))
+        _success = bool(all(code in AllowedResponses for code in results)
+                        and not test_object.token_stale
+                        and test_object.auth_object.background_refresh
+                        )
+        test_object.auth_object.logout()
+        assert _success
+
+    def test_failed_background_refresh(self):
+        test_object = OAuth2(client_id=auth.config["falcon_client_id"],
+                             client_secret=auth.config["falcon_client_secret"],
+                             background_refresh=True,
+                             debug=_DEBUG
+                             )
+        test_object.login()
+        token = test_object.token_value
+        # A failed refresh keeps the current token and retries the refresh after a backoff
+        test_object.creds = {"client_id": "invalid", "client_secret": "invalid"}
+        test_object._preemptive_refresh()
+        _success = bool(test_object.token_value == token
+                        and test_object.token_status == 201
+                        and test_object._refresh_failures == 1
+                        and test_object._refresh_timer.interval <= 1
+                        )
+        test_object.creds = {"client_id": auth.config["falcon_client_id"],
+                             "client_secret": auth.config["falcon_client_secret"]
+                             }
+        test_object.logout()
+        assert _success
+
+    def test_shared_token_store(self):
+        store = FileTokenStore(tempfile.mkdtemp())
+        first = OAuth2(client_id=auth.config["falcon_client_id"],
+                       client_secret=auth.config["falcon_client_secret"],
+                       token_store=store,
+                       revoke_on_logout=True,
+                       debug=_DEBUG
+                       )
+        first.login()
+        # A second object using the same credentials loads the stored token without logging in
+        second = Hosts(client_id=auth.config["falcon_client_id"],
+                       client_secret=auth.config["falcon_client_secret"],
+                       token_store=store,
+                       debug=_DEBUG
+                       )
+        _success = bool(second.auth_object.token_value == first.token_value)
+        first.logout()
+        assert bool(_success and not store.load(first._token_key))
+
+    def test_shared_token_store_logout(self):
+        store = FileTokenStore(tempfile.mkdtemp())
+        first = OAuth2(client_id=auth.config["falcon_client_id"],
+                       client_secret=auth.config["falcon_client_secret"],
+                       token_store=store,
+                       debug=_DEBUG
+                       )
+        first.login()
+        second = Hosts(client_id=auth.config["falcon_client_id"],
+                       client_secret=auth.config["falcon_client_secret"],
+                       token_store=store,
+                       debug=_DEBUG
+                       )
+        shared_token = second.auth_object.token_value
+        # Logging out only releases the first object's handle, the shared token is not revoked
+        _success = bool(first.logout()["status_code"] == 200 and not first.token_value)
+        result = second.query_devices_by_filter(limit=1)
+        _success = bool(_success and result["status_code"] in AllowedResponses)
+        assert bool(_success and store.load(first.token_key)["access_token"] == shared_token)
+
+    def test_lazy_imports(self):
+        # Service Classes and endpoint tables are only loaded when requested
+        check = ("import sys, falconpy; before = 'falconpy._endpoint._hosts' in sys.modules; "
+                 "helpers = 'falconpy._ngsiem' in sys.modules or 'asyncio' in sys.modules; "
+                 "from falconpy import Hosts; print(before, helpers, 'falconpy._endpoint._hosts' in sys.modules, "
+                 "'falconpy._endpoint._detects' in sys.modules)"
+                 )
+        result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True,
+                                env={**os.environ, "PYTHONPATH": os.path.abspath("src")}
+                                )
+        assert bool(result.stdout.strip() == "False False True False")
+
+    def test_json_codec(self):
+        codec = JSONCodec("json")
+        test_object = Hosts(client_id=auth.config["falcon_client_id"],
+                            client_secret=auth.config["falcon_client_secret"],
+                            json_codec=codec,
+                            debug=_DEBUG
+                            )
+        result = test_object.get_device_details(ids=test_object.query_devices_by_filter(limit=1)["body"]["resources"])
+        _success = bool(result["status_code"] in AllowedResponses and test_object.json_codec is codec)
+        # The default codec selects the fastest available library and round trips payloads as bytes
+        default = JSONCodec()
+        _success = bool(_success and default.loads(default.dumps({"ids": [1, 2]})) == {"ids": [1, 2]})
+        try:
+            default.loads(b"not json")
+            _success = False
+        except JSONDecodeError:
+            pass
+        test_object.auth_object.logout()
+        assert _success
+
+    def test_response_cache(self):
+        cache = ResponseCache(ttls={"PostDeviceDetailsV2": 60})
+        test_object = Hosts(client_id=auth.config["falcon_client_id"],
+                            client_secret=auth.config["falcon_client_secret"],
+                            response_cache=cache,
+                            debug=_DEBUG
+                            )
+        first = test_object.query_devices_by_filter(limit=1)
+        second = test_object.query_devices_by_filter(limit=1)
+        details = [test_object.get_device_details(ids=first["body"]["resources"]) for _ in range(2)]
+        _success = bool(first["status_code"] in AllowedResponses
+                        and second["body"] == first["body"]
+                        and details[0]["body"] == details[1]["body"]
+                        and cache.stats["hits"] >= 2
+                        )
+        cache.invalidate("QueryDevicesByFilter")
+        test_object.auth_object.logout()
+        assert _success
+
+    def test_request_coalescer(self):
+        coalescer = RequestCoalescer()
+        test_object = Hosts(client_id=auth.config["falcon_client_id"],
+                            client_secret=auth.config["falcon_client_secret"],
+                            request_coalescer=coalescer,
+                            debug=_DEBUG
+                            )
+        device_ids = test_object.query_devices_by_filter(limit=1)["body"]["resources"]
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(executor.map(lambda _: test_object.get_device_details(ids=device_ids), range(10)))
+        _success = bool(all(result["status_code"] in AllowedResponses for result in results)
+                        and len({id(result) for result in results}) == len(results)
+                        and coalescer.stats["performed"] + coalescer.stats["coalesced"] == 11
+                        and coalescer.in_flight == 0
+                        )
+        test_object.auth_object.logout()
+        assert _success
+
+    def test_request_coalescer_operations(self):
+        # POST operations that only retrieve entities are coalesced
+        coalescer = RequestCoalescer()
+        assert bool({"PostDeviceDetailsV2", "PostEntitiesAlertsV2"} <= coalescer.operations)
@@ -18,6 +18,7 @@ from falconpy import (
     IngestFormat,
     IngestConfig,
     IngestPayload,
+    IngestSpool,
     SessionManager
     )
 from datetime import datetime, timezone
@@ -80,6 +81,21 @@ class TestHTTPEventCollector:
 
         assert result>1
 
+    def test_batch_ingest(self):
+        batch_hec = HTTPEventCollector(api_key=HEC.ingest_key,
+                                       api_url_key=HEC.ingest_url_key,
+                                       ingest_region=BASE_REGION,
+                                       batch_max_events=2,
+                                       batch_max_bytes=1_000_000,
+                                       batch_max_linger=5,
+                                       debug=True
+                                       )
+        with batch_hec as hec:
+            statuses = hec.send_event_batches([simple_payload, IngestPayload(host="batch_test"), simple_payload])
+            result = hec.send_event_list([simple_payload, simple_payload], batch=True)
+
+        assert [status["events"] for status in statuses] == [2, 1] and result == 2
+
     def test_raw_ingest(self):
         error_check = True
         ingest_format_name = None
@@ -103,6 +119,95 @@ class TestHTTPEventCollector:
             error_check = False
         assert error_check
 
+    def test_compressed_ingest(self):
+        gzip_hec = HTTPEventCollector(api_key=HEC.ingest_key,
+                                      api_url_key=HEC.ingest_url_key,
+                                      ingest_region=BASE_REGION,
+                                      compression="gzip",
+                                      compression_level=9,
+                                      debug=True
+                                      )
+        with gzip_hec as hec:
+            result = hec.send_event_list([simple_payload, simple_payload], batch=True)
+            status = hec.send_event(simple_payload)
+
+        assert result == 2 and status in AllowedResponses and hec.hec_headers["Content-Encoding"] == "gzip" and hec.compressor.compressed_bytes > 0
+
+    def test_invalid_compression(self):
+        with pytest.raises(ValueError):
+            HTTPEventCollector(api_key=HEC.ingest_key,
+                               api_url_key=HEC.ingest_url_key,
+                               ingest_region=BASE_REGION,
+                               compression="brotli"
+                               )
+
+    def test_enqueue(self):
+        spill_file = f"{random_string(8)}.spool"
+        producer_hec = HTTPEventCollector(api_key=HEC.ingest_key,
+                                          api_url_key=HEC.ingest_url_key,
+                                          ingest_region=BASE_REGION,
+                                          queue_max_events=2,
+                                          spill_path=spill_file,
+                                          batch_max_linger=0.5,
+                                          debug=True
+                                          )
+        with producer_hec as hec:
+            for _ in range(5):
+                hec.enqueue(simple_payload)
+            depth = hec.queue_depth + hec.spill_bytes
+            delivered = hec.flush(30)
+            latency = hec.send_latency
+
+        assert depth and delivered and latency > 0 and not hec.producer and not os.path.exists(spill_file)
+
+    def test_spool_restart(self):
+        # Events committed before an interruption are not sent again by the next session
+        spill_file = f"{random_string(8)}.spool"
+        spool = IngestSpool(spill_file)
+        spool.append([b'{"event": 1}', b'{"event": 2}', b'{"event": 3}'])
+        spool.commit(len(spool.read(1024, 2)))
+        spool._handle.close()
+        restarted = IngestSpool(spill_file)
+        remaining = restarted.read(1024, 10)
+        restarted.commit(len(remaining))
+        restarted.close()
+
+        assert remaining == b'{"event": 3}\n' and not os.path.exists(spill_file) and not os.path.exists(f"{spill_file}.offset")
+
+    def test_close_unavailable(self):
+        # Without a spill file, events that can not be sent are dropped once the close timeout expires
+        unavailable_hec = HTTPEventCollector(api_key="invalid",
+                                             api_url_key=HEC.ingest_url_key,
+                                             ingest_region=BASE_REGION,
+                                             batch_max_linger=0.1,
+                                             retry_count=1,
+                                             debug=True
+                                             )
+        for _ in range(5):
+            unavailable_hec.enqueue(simple_payload)
+        producer = unavailable_hec.producer
+        started = datetime.now()
+        delivered = unavailable_hec.close(2)
+
+        assert not delivered and (datetime.now() - started).total_seconds() < 10 and producer.counters["dropped"] == 5
+
+    def test_raw_chunks(self):
+        with open("tests/5records.raw", "rb") as raw_file:
+            content = raw_file.read()
+            raw_file.seek(0)
+            chunks = list(HEC.read_raw_chunks(raw_file, max_chunk_size=400))
+
+        assert b"".join(chunks) == content and all(chunk.endswith(b"\n") for chunk in chunks) and len(chunks) > 1
+
+    def test_payload_records(self):
+        records = [{"host": "records_test", "message": "first"}, IngestPayload(host="records_test"), {"event_type": "second", "timeunit": "milliseconds"}]
+        payloads = list(IngestPayload.from_records(records, timeunit="seconds"))
+        yaml_version = payloads[0].to_yaml()
+
+        assert payloads[0].custom == {"message": "first"} and payloads[1] is records[1] and payloads[2].type == ["second"] \
+            and payloads[0].timeunit == 1 and payloads[2].timeunit == 1_000 and payloads[1].category is not payloads[2].category \
+            and yaml_version.startswith("event:\n") and '"message": "first"' in yaml_version
+
     def test_failures(self):
         bad_hec = HTTPEventCollector(api_key=API_KEY,
                                      api_url_key="7334$@",
@@ -148,6 +253,8 @@ class TestHTTPEventCollector:
         cxv_version = another_payload.to_csv()
         quick_hec = HTTPEventCollector(api_key=random_string(8), api_url_key=random_string(8), raw_ingest=True, thread_count=5)
         json_string = quick_hec.format_event(another_payload)
+        quick_hec.json_codec = "json"
+        json_string = quick_hec.format_event(another_payload)
         quick_sm = SessionManager()
         count = 0
         for _ in quick_sm:
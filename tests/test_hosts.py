@@ -11,7 +11,8 @@ from tests import test_authorization as Authorization
 # Import our sibling src folder into the path
 sys.path.append(os.path.abspath('src'))
 # Classes to test - manually imported from sibling folder
-from falconpy import Hosts
+from falconpy import Hosts, HostLookup, EntityBatcher, APIError, InvalidOperation
+from falconpy._util import entity_chunk_size, entity_ids_keyword
 
 auth = Authorization.TestAuthorization()
 config = auth.getConfigObject()
@@ -287,3 +288,67 @@ class TestHosts:
     def test_errors(self):
         """Pytest harness hook"""
         assert self.hosts_generate_errors() is True
+
+    def test_paginate(self):
+        """Pytest harness hook"""
+        pages = list(falcon.paginate("QueryDevicesByFilterScroll", prefetch=True, limit=2))
+        assert bool(pages and all(page["status_code"] in AllowedResponses for page in pages)) is True
+
+    def test_hydrate(self):
+        """Pytest harness hook"""
+        _success = True
+        try:
+            hosts = list(falcon.hydrate("QueryDevicesByFilterScroll", "PostDeviceDetailsV2", limit=5, max_workers=2))
+            _success = all("device_id" in host for host in hosts)
+        except APIError as api_error:
+            _success = bool(api_error.code in AllowedResponses)
+        assert _success is True
+
+    def test_operation_details(self):
+        """Pytest harness hook"""
+        # Method names resolve through their operation ID alias, methods aliased by several operations do not resolve
+        assert bool(falcon._operation_details("query_devices_by_filter_scroll").operation_id == "QueryDevicesByFilterScroll"
+                    and falcon._operation_details("get_device_details_v2").operation_id == "GetDeviceDetailsV2"
+                    and falcon._operation_details("PostDeviceDetailsV2").operation_id == "PostDeviceDetailsV2"
+                    and falcon._operation_details("get_device_details") is None
+                    ) is True
+
+    def test_entity_chunk_size(self):
+        """Pytest harness hook"""
+        # Entity operations use their own maximum and IDs keyword, others use the defaults
+        assert bool(entity_chunk_size("PostDeviceDetailsV2") == 5000
+                    and entity_chunk_size("GetVulnerabilities") == 400
+                    and entity_chunk_size("PostEntitiesAlertsV2") == 1000
+                    and entity_chunk_size("GetIntelIndicatorEntities") == 1000
+                    and entity_chunk_size("GetDeviceDetailsV2") == 100
+                    and entity_ids_keyword("PostEntitiesAlertsV2") == "composite_ids"
+                    and entity_ids_keyword("PostDeviceDetailsV2") == "ids"
+                    ) is True
+
+    def test_entity_batcher_method_name(self):
+        """Pytest harness hook"""
+        # Method names use the same maximum batch size as the operation they perform
+        by_method = EntityBatcher(falcon, "get_device_details_v2", id_key="device_id")
+        by_operation = EntityBatcher(falcon, "GetDeviceDetailsV2", id_key="device_id")
+        _success = bool(by_method.max_batch == by_operation.max_batch)
+        by_method.close()
+        by_operation.close()
+        # Method names that do not resolve to a single operation ID are rejected
+        with pytest.raises(InvalidOperation):
+            EntityBatcher(falcon, "get_device_details", id_key="device_id")
+        assert _success is True
+
+    def test_host_lookup(self):
+        """Pytest harness hook"""
+        _success = True
+        device_ids = falcon.query_devices_by_filter(limit=5)["body"]["resources"]
+        with HostLookup(auth_object=config, linger=0.1) as lookup:
+            futures = lookup.get_many(device_ids + device_ids)
+            try:
+                hosts = [future.result() for future in futures]
+                _success = bool(all(host["device_id"] in device_ids for host in hosts)
+                                and lookup.stats["batches"] <= 1
+                                )
+            except APIError as api_error:
+                _success = bool(api_error.code in AllowedResponses)
+        assert _success is True
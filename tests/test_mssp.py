@@ -8,7 +8,7 @@ from tests import test_authorization as Authorization
 # Import our sibling src folder into the path
 sys.path.append(os.path.abspath('src'))
 # Classes to test - manually imported from sibling folder
-from falconpy import FlightControl  # noqa: E402  pylint: disable=E0401
+from falconpy import FlightControl, Hosts, MSSPFanOut, OAuth2, ChildAuthPool, TokenStore  # noqa: E402  pylint: disable=E0401
 
 auth = Authorization.TestAuthorization()
 config = auth.getConfigObject()
@@ -63,3 +63,27 @@ class TestFlightControl:
 
     def test_Errors(self):
         assert self.serviceFlight_GenerateErrors() is True
+
+    def test_fan_out(self):
+        with MSSPFanOut(auth_object=config, max_workers=2, max_tokens=2) as fan_out:
+            children = fan_out.children()[:3]
+            results = fan_out.collect("query_devices_by_filter", children=children, service=Hosts, limit=1)
+            assert bool(sorted(results) == sorted(children)
+                        and all(result["status_code"] in AllowedResponses for result in results.values())
+                        and len(fan_out.pool) <= 2
+                        )
+
+    def test_child_pool_close(self):
+        # Revoked child tokens are removed from the shared token store
+        store = TokenStore()
+        parent = OAuth2(client_id=auth.config["falcon_client_id"],
+                        client_secret=auth.config["falcon_client_secret"],
+                        token_store=store
+                        )
+        pool = ChildAuthPool(parent, max_size=2)
+        children = [pool.get(child) for child in FlightControl(auth_object=parent).query_children(limit=2)["body"]["resources"]]
+        for child in children:
+            child.login()
+        pool.close()
+        assert bool(not len(pool) and all(store.load(child.token_key) is None for child in children))
+        parent.logout()
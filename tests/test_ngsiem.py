@@ -10,7 +10,7 @@ from tests import test_authorization as Authorization
 # Import our sibling src folder into the path
 sys.path.append(os.path.abspath('src'))
 # Classes to test - manually imported from sibling folder
-from falconpy import NGSIEM
+from falconpy import NGSIEM, SearchRunner, APIError
 
 auth = Authorization.TestAuthorization()
 config = auth.getConfigObject()
@@ -98,3 +98,45 @@ class TestNGSIEM:
 
     def test_all_functionality(self):
         assert self.run_all_tests() is True
+
+    def test_search_runner_stubbed(self):
+        class StubService:
+            def __init__(self):
+                self.polls = 0
+                self.stopped = []
+
+            def start_search(self, **kwargs):
+                return {"status_code": 200, "headers": {}, "body": {"id": "stub-search"}}
+
+            def get_search_status(self, **kwargs):
+                # Every poll returns all events found so far
+                self.polls += 1
+                events = [{"@id": f"event-{number}"} for number in range(self.polls * 2)]
+                return {"status_code": 200, "headers": {},
+                        "body": {"done": self.polls == 3, "events": events, "metaData": {"pollAfter": 1}}
+                        }
+
+            def stop_search(self, **kwargs):
+                self.stopped.append(kwargs["search_id"])
+                return {"status_code": 204, "headers": {}, "body": {}}
+
+        service = StubService()
+        job = SearchRunner(service, min_interval=0.01).search(repository="search-all", query_string="*")
+        events = [event["@id"] for event in job]
+        assert bool(events == [f"event-{number}" for number in range(6)]
+                    and job.done and job.polls == 3 and service.stopped == ["stub-search"]
+                    and not job.search_id
+                    )
+
+    def test_search_runner(self):
+        runner = SearchRunner(falcon, max_concurrent=2, timeout=120)
+        search = {"repository": "search-all", "query_string": "#event_simpleName=* | head(5)", "start": "1d", "is_live": False}
+        try:
+            results = runner.collect({"first": search, "second": search})
+            job = runner.search(**search)
+            events = list(job)
+            success = len(results) == 2 and job.done and job.event_count == len(events) and not job.search_id
+        except APIError as api_error:
+            success = api_error.code in AllowedResponses
+
+        assert success
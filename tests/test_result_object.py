@@ -777,3 +777,16 @@ class TestResults:
                     _success = True  # This op is fully deprecated
 
         assert _success
+
+    def test_lazy_result_components(self):
+        body = {"meta": {"pagination": {"total": 2}}, "resources": ["one", "two"], "errors": None}
+        lazy: Result = Result(status_code=200, headers={"someheader": "somevalue"}, body=body)
+        # The dictionary representation is identical whether or not the components have been created
+        before = lazy.full_return
+        _success = bool(lazy.total == 2 and lazy.data == ["one", "two"] and lazy.full_return == before)
+        try:
+            lazy.unexpected_attribute = True
+            _success = False
+        except AttributeError:
+            pass
+        assert bool(_success and before["body"]["errors"] == [])
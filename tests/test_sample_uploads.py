@@ -3,6 +3,7 @@ test_sample_uploads.py - This class tests the sample_uploads service class
 """
 import os
 import sys
+import pathlib
 import pytest
 import datetime
 import hashlib
@@ -39,6 +40,12 @@ class TestSampleUploads:
             response = falcon.upload_sample(file_name=SOURCE, sample=PAYLOAD)
         elif style.lower() == "upfile":
             response = falcon.upload_sample(file_name=SOURCE, upfile=PAYLOAD, comment="Whatever")
+        elif style.lower() == "path":
+            progress = []
+            response = falcon.upload_sample(file_name=SOURCE,
+                                            file_data=pathlib.Path(FILENAME),
+                                            upload_progress=lambda encoder: progress.append(encoder.bytes_read)
+                                            )
         else:
             response = falcon.upload_sample(parameters=params_payload, file_data=PAYLOAD, is_confidential=True)
         try:
@@ -152,6 +159,10 @@ class TestSampleUploads:
         """Pytest harness hook"""
         assert self.sample_upload_download_delete("upfile") is True
 
+    def test_all_functionality_path(self):
+        """Pytest harness hook"""
+        assert self.sample_upload_download_delete("path") is True
+
     @pytest.mark.skipif("laggar" in falcon.base_url, reason="US-GOV-1 testing disabled")
     def test_errors(self):
         """Pytest harness hook"""
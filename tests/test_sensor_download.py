@@ -1,8 +1,12 @@
+import io
 import os
 import sys
 import pytest
+from requests import Response
 from tests import test_authorization as Authorization
 from falconpy import SensorDownload
+from falconpy._api_request import APIRequest
+from falconpy._util import download_response
 
 sys.path.append(os.path.abspath('src'))
 AllowedResponses = [200, 401, 429]  # Adding rate-limiting as an allowed response for now
@@ -67,6 +71,57 @@ class TestSensorDownload():
         else:
             return False
 
+    def _download_sensor_file_pythonic(self):
+        sha_id = self._get_multiple_shas()[0]
+        pythonic_client = SensorDownload(auth_object=config, pythonic=True)
+        # Pythonic results are recognized as successful downloads
+        result = pythonic_client.download_sensor_installer_v2(id=sha_id, file_name="sensor_pythonic.rpm", download_path=".")
+        _success = bool(result.status_code == 200
+                        and result.meta.get_property("message") == "Download successful"
+                        and os.path.exists("sensor_pythonic.rpm")
+                        )
+        if os.path.exists("sensor_pythonic.rpm"):
+            os.remove("sensor_pythonic.rpm")
+
+        return _success
+
+    def _download_sensor_to(self):
+        sha_id = self._get_multiple_shas()[0]
+        # The installer SHA256 is verified as the file is written
+        resp = sensor_download_client.download_sensor_installer_v2(id=sha_id, download_to="sensor_stream.rpm")
+        _success = bool(resp["status_code"] == 200
+                        and resp["body"]["resources"][0]["sha256"] == sha_id
+                        and os.path.exists("sensor_stream.rpm")
+                        and not os.path.exists("sensor_stream.rpm.part")
+                        )
+        # A mismatched SHA256 removes the downloaded file
+        resp = sensor_download_client.download_sensor_installer_v2(id=sha_id,
+                                                                   download_to="sensor_stream.rpm",
+                                                                   expected_sha256="0" * 64
+                                                                   )
+        _success = bool(_success and resp["status_code"] == 502 and not os.path.exists("sensor_stream.rpm.part"))
+        os.remove("sensor_stream.rpm")
+
+        return _success
+
+    @staticmethod
+    def _download_resume_rejected():
+        # Every resumed request is rejected, an error result is returned instead of the final response
+        with open("sensor_resume.rpm.part", "wb") as partial:
+            partial.write(b"partial")
+
+        def rejected(headers):
+            response = Response()
+            response.status_code = 416 if "Range" in headers else 206
+            response.headers["Content-Range"] = "bytes 1-2/3"
+            response.raw = io.BytesIO(b"ab")
+            return response
+
+        _, result = download_response(APIRequest("/sensors/entities/download-installer/v2", {"download_to": "sensor_resume.rpm"}),
+                                         rejected, {}
+                                         )
+        return bool(result["status_code"] == 502 and not os.path.exists("sensor_resume.rpm.part"))
+
     @staticmethod
     def _get_metadata_for_filter():
         # Testing new parameter functionality
@@ -115,6 +170,15 @@ class TestSensorDownload():
     def test_download_windows_sensor_file_v2(self):
         assert self._download_sensor_file() is True
 
+    def test_download_windows_sensor_file_pythonic(self):
+        assert self._download_sensor_file_pythonic() is True
+
+    def test_download_sensor_to(self):
+        assert self._download_sensor_to() is True
+
+    def test_download_resume_rejected(self):
+        assert self._download_resume_rejected() is True
+
     def test_get_sha_window_sensor(self):
         assert self._get_metadata_for_filter() is True
 
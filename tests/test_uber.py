@@ -14,7 +14,8 @@ sys.path.append(os.path.abspath('src'))
 # Classes to test - manually imported from our sibling folder
 from falconpy import APIHarnessV2, APIError
 # Import perform_request from _util so we can test generating 405's directly
-from falconpy._util import perform_request, force_default
+from falconpy._util import perform_request, force_default, operation_index
+from falconpy._endpoint import api_endpoints
 
 
 AllowedResponses = [200, 400, 401, 403, 404, 405, 415, 418, 429]
@@ -401,3 +402,29 @@ class TestUber:
             _success = True
         assert _success
 
+
+    def test_operation_index(self):
+        _success = False
+        commands = [["first", "GET", "/one/{}/v1", "", "test", []], ["first", "POST", "/two/v1", "", "test", []]]
+        custom = operation_index(commands)
+        if custom["first"].method == "GET" and custom["first"].templated and custom is operation_index(commands):
+            if operation_index(api_endpoints) is operation_index(api_endpoints) and len(operation_index(api_endpoints)) > 1000:
+                _success = True
+        assert _success
+
+    def test_endpoint_registry(self):
+        # The compact registry must be regenerated (util/build_registry.py) when endpoint tables change
+        _success = True
+        for endpoint in api_endpoints:
+            definition = endpoint.definition
+            params = tuple((param["name"], param.get("type", None), param.get("in", None)) for param in definition[5])
+            if endpoint.parameters != params or [endpoint[pos] for pos in (0, 1, 2, 4)] != [definition[pos] for pos in (0, 1, 2, 4)]:
+                _success = False
+        assert _success
+
+    def test_paginate(self):
+        _success = False
+        pages = list(falcon.paginate("QueryDevicesByFilter", limit=1, filter="hostname:'does-not-exist'"))
+        if pages and pages[-1]["status_code"] in AllowedResponses:
+            _success = bool(list(falcon.paginate("NotAnOperation"))[0]["status_code"] == 418)
+        assert _success
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+r"""Endpoint registry builder for FalconPy.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+Compiles the endpoint tables within `_endpoint` into the compact registry
+used at runtime (`_endpoint/_registry_data.py`). Only the operation ID, HTTP
+method, route, collection and the name, type and location of each parameter
+are retained. Descriptions, enums and the remaining parameter details are
+read from the endpoint tables only when they are requested.
+
+Run this utility whenever an endpoint table is changed. Use --check to
+confirm the registry is current without writing it (exit code 1 if stale).
+
+Execute from the repository root:
+    util/build_registry.py
+    util/build_registry.py --check
+"""
+import json
+import os
+import sys
+from argparse import ArgumentParser, RawTextHelpFormatter
+from importlib import import_module
+
+HEADER = '''"""Compiled endpoint registry.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+# pylint: disable=C0302
+# This file is generated by util/build_registry.py from the endpoint tables. Do not edit it directly.
+# Operations are stored as (operation ID, method, route, collection, parameters) and
+# parameters as (name, type, location). Body payload parameters do not have a type.
+'''
+
+
+def literal(value) -> str:
+    """Return a value as a Python literal, using double quoted strings."""
+    return "None" if value is None else json.dumps(value)
+
+
+def compile_table(definitions: list) -> str:
+    """Return the compact source representation of an endpoint table."""
+    lines = []
+    for definition in definitions:
+        # Operations that do not fit on a single line continue on the next line using a visual indent.
+        indent = ""
+        header = f"    ({', '.join(literal(definition[pos]) for pos in (0, 1, 2, 4))}, ("
+        if len(header) > 127:
+            indent = " "
+            header = "\n".join([f"    ({literal(definition[0])}, {literal(definition[1])},",
+                                f"     {literal(definition[2])}, {literal(definition[4])}, ("
+                                ])
+        lines.append(header)
+        for param in definition[5]:
+            lines.append(f"{indent}        ({', '.join(literal(param.get(key, None)) for key in ('name', 'type', 'in'))}),")
+        lines.append(f"{indent}    )),")
+
+    return "\n".join(lines)
+
+
+def build_registry() -> str:
+    """Generate the source for the compiled registry module."""
+    endpoint = import_module("falconpy._endpoint")
+    registry = import_module("falconpy._endpoint._registry")
+    tables = list(endpoint._ENDPOINT_MODULES)  # pylint: disable=W0212
+    tables.extend(f"deprecated.{table}" for table in endpoint._DEPRECATED_MODULES)  # pylint: disable=W0212
+    source = [HEADER]
+    for table in tables:
+        definitions = getattr(import_module(f"falconpy._endpoint.{table}"), f"{table.rsplit('.', 1)[-1]}_endpoints")
+        source.append(f"{registry.registry_name(table)} = (\n{compile_table(definitions)}\n)\n")
+
+    return "\n".join(source)
+
+
+parser = ArgumentParser(description=__doc__, formatter_class=RawTextHelpFormatter)
+parser.add_argument("-p", "--path", help="Location of the FalconPy source (default: src)", default="src")
+parser.add_argument("-c", "--check", help="Confirm the registry is current without writing it", action="store_true")
+args = parser.parse_args()
+
+sys.path.insert(0, os.path.abspath(args.path))
+target = os.path.join(args.path, "falconpy", "_endpoint", "_registry_data.py")
+REGISTRY = build_registry()
+if args.check:
+    with open(target, "r", encoding="utf-8") as current:
+        if current.read() != REGISTRY:
+            print(f"{target} is out of date. Run util/build_registry.py to update it.")
+            sys.exit(1)
+    print(f"{target} is current.")
+else:
+    with open(target, "w", encoding="utf-8") as registry_file:
+        registry_file.write(REGISTRY)
+    print(f"{target} updated.")
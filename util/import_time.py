@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+r"""Import time benchmark for FalconPy.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+Measures the cost of importing FalconPy using `python -X importtime`.
+
+Each run is performed within a fresh interpreter. The median cumulative
+import time is reported along with the slowest modules and the number of
+endpoint tables loaded. Provide a limit to fail (exit code 1) when the
+median import time exceeds the specified number of milliseconds.
+
+Execute from the repository root:
+    util/import_time.py
+    util/import_time.py -s "from falconpy import Hosts" -l 250
+"""
+import json
+import os
+import subprocess
+import sys
+from argparse import ArgumentParser, RawTextHelpFormatter
+from statistics import median
+
+
+def parse_importtime(output: str) -> dict:
+    """Parse -X importtime output into a dictionary of module: (self, cumulative) in microseconds."""
+    timings = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative, module = line[len("import time:"):].split("|", 2)
+        timings[module.strip()] = (int(self_time), int(cumulative))
+
+    return timings
+
+
+def measure(statement: str, source: str) -> dict:
+    """Execute the statement in a new interpreter and return the parsed import timings."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [source, os.environ.get("PYTHONPATH")]))}
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            capture_output=True, text=True, env=env, check=True
+                            )
+
+    return parse_importtime(result.stderr)
+
+
+def summarize(runs: list, package: str, top: int) -> dict:
+    """Summarize a list of timing runs."""
+    totals = [sum(cumul for mod, (_, cumul) in run.items() if mod == package) / 1000 for run in runs]
+    modules = [mod for mod in runs[-1] if mod == package or mod.startswith(f"{package}.")]
+    slowest = sorted(((mod, median(run.get(mod, (0, 0))[0] for run in runs) / 1000) for mod in runs[-1]),
+                     key=lambda item: item[1], reverse=True
+                     )[:top]
+
+    return {
+        "median_ms": round(median(totals), 2),
+        "min_ms": round(min(totals), 2),
+        "max_ms": round(max(totals), 2),
+        "package_modules": len(modules),
+        "endpoint_modules": len([mod for mod in modules if f"{package}._endpoint." in mod]),
+        "slowest_modules": [{"module": mod, "self_ms": round(elapsed, 2)} for mod, elapsed in slowest]
+    }
+
+
+parser = ArgumentParser(description=__doc__, formatter_class=RawTextHelpFormatter)
+parser.add_argument("-s", "--statement", help="Import statement to measure (default: import falconpy)",
+                    default="import falconpy")
+parser.add_argument("-p", "--path", help="Location of the FalconPy source (default: src)", default="src")
+parser.add_argument("-r", "--runs", help="Number of runs to perform (default: 7)", type=int, default=7)
+parser.add_argument("-t", "--top", help="Number of slowest modules to list (default: 10)", type=int, default=10)
+parser.add_argument("-l", "--limit", help="Fail when the median exceeds this many milliseconds", type=float)
+parser.add_argument("-j", "--json", help="Output results as JSON", action="store_true")
+args = parser.parse_args()
+
+measure(args.statement, args.path)  # Warm the bytecode cache so compilation is not measured
+summary = summarize([measure(args.statement, args.path) for _ in range(max(args.runs, 1))], "falconpy", args.top)
+summary["statement"] = args.statement
+
+if args.json:
+    print(json.dumps(summary, indent=4))
+else:
+    print(f"{summary['statement']}")
+    print(f"Median: {summary['median_ms']}ms  Min: {summary['min_ms']}ms  Max: {summary['max_ms']}ms")
+    print(f"FalconPy modules loaded: {summary['package_modules']} ({summary['endpoint_modules']} endpoint modules)")
+    print("Slowest modules (self time):")
+    for item in summary["slowest_modules"]:
+        print(f"  {item['self_ms']:>8.2f}ms  {item['module']}")
+
+if args.limit and summary["median_ms"] > args.limit:
+    print(f"Median import time of {summary['median_ms']}ms exceeds the limit of {args.limit}ms.")
+    sys.exit(1)